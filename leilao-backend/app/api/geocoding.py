@@ -8,10 +8,11 @@ from fastapi import APIRouter, BackgroundTasks, HTTPException
 from typing import Optional
 import logging
 
-from app.services.async_geocoding_service import (
-    get_geocoding_service,
-    process_geocoding_background
-)
+from app.utils.lazy import lazy_import
+
+# async_geocoding_service importa supabase: carregado no primeiro uso
+get_geocoding_service = lazy_import("app.services.async_geocoding_service", "get_geocoding_service")
+process_geocoding_background = lazy_import("app.services.async_geocoding_service", "process_geocoding_background")
 
 logger = logging.getLogger(__name__)
 
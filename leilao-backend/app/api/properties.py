@@ -7,7 +7,11 @@ from typing import Optional, List
 from pydantic import BaseModel
 from datetime import datetime
 import os
-from supabase import create_client, Client
+
+from app.models.property import PropertyFilter, PropertyCategory, AuctionType
+from app.services.single_flight import get_single_flight, make_key
+from app.services.change_feed import MAX_CHANGES_PAGE
+from app.utils.lazy import LazyObject
 
 router = APIRouter(prefix="/api/properties", tags=["properties"])
 
@@ -15,20 +19,24 @@ router = APIRouter(prefix="/api/properties", tags=["properties"])
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_KEY")
 
-# Inicializa cliente Supabase apenas se as variáveis estiverem configuradas
-supabase: Optional[Client] = None
-if SUPABASE_URL and SUPABASE_KEY:
+
+def _create_supabase_client():
+    """Cria o cliente Supabase (None se as variáveis não estiverem configuradas)."""
+    import logging
+    logger = logging.getLogger(__name__)
+    if not (SUPABASE_URL and SUPABASE_KEY):
+        logger.warning("SUPABASE_URL ou SUPABASE_KEY não configurados. API pode não funcionar.")
+        return None
     try:
-        supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+        from supabase import create_client
+        return create_client(SUPABASE_URL, SUPABASE_KEY)
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Erro ao inicializar cliente Supabase: {e}")
-        supabase = None
-else:
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.warning("SUPABASE_URL ou SUPABASE_KEY não configurados. API pode não funcionar.")
+        return None
+
+
+# Cliente criado no primeiro request (o import do supabase é pesado)
+supabase = LazyObject(_create_supabase_client, name="supabase")
 
 # Modelos de resposta
 class PropertyResponse(BaseModel):
@@ -132,65 +140,86 @@ async def list_properties(
             detail="Direção de ordenação deve ser 'asc' ou 'desc'"
         )
     
-    # Monta query base
-    query = supabase.table('properties').select(
-        '*',
-        count='exact'
-    )
-    
-    # Aplica filtros
-    query = query.eq('is_active', True)
-    
+    # Normaliza filtros (também usados como chave de coalescência)
+    normalized_cat = None
     if category:
-        # Normaliza categoria
         from app.utils.normalizer import normalize_category
         normalized_cat = normalize_category(category)
-        query = query.eq('category', normalized_cat)
     
+    normalized_state = None
     if state:
-        # Normaliza estado
         from app.utils.normalizer import normalize_state
         normalized_state = normalize_state(state)
-        if normalized_state:
-            query = query.eq('state', normalized_state)
-    
-    if city:
-        query = query.ilike('city', f'%{city}%')
-    
-    if auction_type:
-        query = query.eq('auction_type', auction_type)
     
-    if auctioneer_id:
-        query = query.eq('auctioneer_id', auctioneer_id)
+    # city/search usam ilike, então maiúsculas/minúsculas não mudam o resultado
+    city = city.strip().lower() if city else None
+    search = search.strip().lower() if search else None
+    order = order.lower()
     
-    if min_value is not None:
-        query = query.gte('first_auction_value', min_value)
-    
-    if max_value is not None:
-        query = query.lte('first_auction_value', max_value)
-    
-    if min_discount is not None:
-        query = query.gte('discount_percentage', min_discount)
-    
-    if search:
-        query = query.ilike('title', f'%{search}%')
-    
-    # Aplica ordenação
-    query = query.order(sort_by, desc=(order.lower() == 'desc'))
-    
-    # Aplica paginação
-    offset = (page - 1) * page_size
-    query = query.range(offset, offset + page_size - 1)
-    
-    # Executa query
-    response = query.execute()
+    def run_query():
+        # Monta query base
+        query = supabase.table('properties').select(
+            '*',
+            count='exact'
+        )
+        
+        # Aplica filtros
+        query = query.eq('is_active', True)
+        
+        if normalized_cat:
+            query = query.eq('category', normalized_cat)
+        
+        if normalized_state:
+            query = query.eq('state', normalized_state)
+        
+        if city:
+            query = query.ilike('city', f'%{city}%')
+        
+        if auction_type:
+            query = query.eq('auction_type', auction_type)
+        
+        if auctioneer_id:
+            query = query.eq('auctioneer_id', auctioneer_id)
+        
+        if min_value is not None:
+            query = query.gte('first_auction_value', min_value)
+        
+        if max_value is not None:
+            query = query.lte('first_auction_value', max_value)
+        
+        if min_discount is not None:
+            query = query.gte('discount_percentage', min_discount)
+        
+        if search:
+            query = query.ilike('title', f'%{search}%')
+        
+        # Aplica ordenação
+        query = query.order(sort_by, desc=(order == 'desc'))
+        
+        # Aplica paginação
+        offset = (page - 1) * page_size
+        query = query.range(offset, offset + page_size - 1)
+        
+        # Executa query
+        response = query.execute()
+        return response.data, response.count or 0
+    
+    # Requests idênticos concorrentes compartilham a mesma consulta
+    key = make_key(
+        "properties.list",
+        case_insensitive=("state", "city", "category", "search"),
+        page=page, page_size=page_size, category=normalized_cat, state=normalized_state,
+        city=city, auction_type=auction_type, min_value=min_value, max_value=max_value,
+        min_discount=min_discount, auctioneer_id=auctioneer_id, sort_by=sort_by,
+        order=order, search=search,
+    )
+    data, total = await get_single_flight().do_sync(key, run_query)
     
     # Calcula total de páginas
-    total = response.count or 0
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
     
     return PaginatedResponse(
-        data=response.data,
+        data=data,
         total=total,
         page=page,
         page_size=page_size,
@@ -209,6 +238,11 @@ async def get_stats():
             detail="Supabase não configurado. Configure SUPABASE_URL e SUPABASE_KEY."
         )
     
+    # Sete consultas de agregação - requests concorrentes compartilham uma execução
+    return await get_single_flight().do_sync(make_key("properties.stats"), _compute_stats)
+
+def _compute_stats() -> StatsResponse:
+    """Executa as consultas de estatísticas no Supabase."""
     # Total de propriedades
     total_response = supabase.table('properties') \
         .select('id', count='exact') \
@@ -346,6 +380,94 @@ async def list_cities(state: Optional[str] = Query(None, description="Filtrar po
     
     return {"cities": sorted(list(cities))}
 
+@router.get("/near")
+async def list_properties_near(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude do ponto central"),
+    lng: float = Query(..., ge=-180, le=180, description="Longitude do ponto central"),
+    radius_km: float = Query(10, gt=0, le=500, description="Raio em km"),
+    
+    # Paginação
+    page: int = Query(1, ge=1, description="Número da página"),
+    page_size: int = Query(20, ge=1, le=100, description="Itens por página"),
+    
+    # Filtros (mesmos de PropertyFilter)
+    category: Optional[PropertyCategory] = Query(None, description="Filtrar por categoria"),
+    state: Optional[str] = Query(None, description="Filtrar por estado (sigla)"),
+    city: Optional[str] = Query(None, description="Filtrar por cidade"),
+    neighborhood: Optional[str] = Query(None, description="Filtrar por bairro"),
+    auction_type: Optional[AuctionType] = Query(None, description="Filtrar por tipo de leilão"),
+    min_value: Optional[float] = Query(None, description="Valor mínimo"),
+    max_value: Optional[float] = Query(None, description="Valor máximo"),
+    min_discount: Optional[float] = Query(None, description="Desconto mínimo (%)"),
+    auctioneer_id: Optional[str] = Query(None, description="Filtrar por leiloeiro"),
+    search: Optional[str] = Query(None, description="Termo de busca"),
+):
+    """
+    Lista imóveis dentro de um raio, ordenados pela distância (haversine).
+    """
+    from app.services import db
+    
+    filters = PropertyFilter(
+        state=state,
+        city=city,
+        neighborhood=neighborhood,
+        category=category,
+        auction_type=auction_type,
+        min_value=min_value,
+        max_value=max_value,
+        min_discount=min_discount,
+        auctioneer_id=auctioneer_id,
+        search_term=search,
+    )
+    
+    offset = (page - 1) * page_size
+    results, total = db.get_properties_near(
+        lat, lng, radius_km, filters=filters, skip=offset, limit=page_size
+    )
+    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+    
+    return {
+        "data": [
+            {**prop.model_dump(), "distance_km": round(distance, 3)}
+            for prop, distance in results
+        ],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "center": {"lat": lat, "lng": lng},
+        "radius_km": radius_km,
+    }
+
+@router.get("/changes")
+async def list_property_changes(
+    since: Optional[str] = Query(None, description="Cursor retornado na chamada anterior (vazio = início do log)"),
+    limit: int = Query(100, ge=1, le=MAX_CHANGES_PAGE, description="Máximo de alterações"),
+):
+    """
+    Change feed para sync incremental: inserts, updates, quedas de preço
+    e desativações em ordem de commit, paginados por cursor.
+
+    Repita a chamada com `since=next_cursor` enquanto `has_more` for true.
+    Se `reset_required` vier true o cursor saiu da janela retida e o
+    cliente deve refazer a carga completa.
+    """
+    from app.services import db
+
+    try:
+        changes, next_cursor, has_more, reset_required = db.get_changes(since, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erro ao buscar alterações: {str(e)}")
+
+    return {
+        "changes": changes,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+        "reset_required": reset_required,
+    }
+
 @router.get("/{property_id}")
 async def get_property(property_id: str):
     """
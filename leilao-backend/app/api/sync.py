@@ -6,7 +6,10 @@ from fastapi import APIRouter, BackgroundTasks, HTTPException
 from typing import Optional
 import logging
 
-from app.services.sync_service import get_sync_service, SyncReport
+from app.utils.lazy import lazy_import
+
+# sync_service importa supabase e os scrapers: carregado no primeiro uso
+get_sync_service = lazy_import("app.services.sync_service", "get_sync_service")
 
 logger = logging.getLogger(__name__)
 
@@ -1,12 +1,16 @@
 from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
 from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from typing import Optional, List
 from datetime import datetime
+import asyncio
 import json
+import time
 import logging
 import traceback
 import os
+import sys
 from dotenv import load_dotenv
 
 # Carregar .env ANTES de qualquer outra coisa
@@ -18,29 +22,49 @@ from app.models import (
     PropertyFilter,
     Auctioneer,
     AuctioneerCreate,
+    SavedSearchCreate,
 )
 from app.models.property import PropertyCategory, AuctionType
-from app.services import db, DeduplicationService
-from app.services.scraper_monitor import get_scraper_monitor, ScraperStatus
-from app.services.autonomous_scheduler import get_autonomous_scheduler
-from app.services.asaas_service import asaas_service
-from app.services.scraper_pipeline import scraper_pipeline
-from app.services.ai_normalizer import ai_normalizer
-from app.services.geocoding_service import geocoding_service
-from app import pipeline as pipeline_module
-from app.services.scraper_orchestrator import scraper_orchestrator
-from app.services.discovery_orchestrator import discovery_orchestrator
-from app.services.structure_validator import structure_validator
+from app.services import db, init_database, DeduplicationService
+from app.services.entitlement_cache import get_entitlement_cache
+from app.services.autocomplete_index import get_autocomplete_index, AUTOCOMPLETE_FIELDS
+from app.services.single_flight import get_single_flight, make_key
+from app.services.facets import SORT_FIELDS
+from app.services.saved_searches import get_saved_search_service
+from app.services.event_bus import get_event_bus, stream_events, TOPICS as EVENT_TOPICS
+from app.services.loop_monitor import get_loop_monitor, LOOP_BLOCK_DETECTOR
+from app.services.query_log import get_query_log, advise_indexes
+from app.services.metrics import MetricsMiddleware, get_metrics_registry, monitor_event_loop_lag, CONTENT_TYPE as METRICS_CONTENT_TYPE
 from app.api.properties import router as properties_router
 from app.api.sync import router as sync_router
 from app.api.geocoding import router as geocoding_router
-from app.services.background_geocoding import (
-    init_geocoding_service,
-    get_geocoding_service,
-    BackgroundGeocodingService
-)
-from app.utils.quality_auditor import get_quality_auditor
-from app.utils.image_blacklist import get_image_blacklist
+from app.utils.lazy import lazy_import
+
+# Subsistemas pesados (scrapers, Gemini, APScheduler, Supabase, psycopg)
+# são importados no primeiro uso, fora do caminho do cold start.
+# Orçamento verificado por scripts/benchmark_import_time.py.
+get_scraper_monitor = lazy_import("app.services.scraper_monitor", "get_scraper_monitor")
+ScraperStatus = lazy_import("app.services.scraper_monitor", "ScraperStatus")
+get_autonomous_scheduler = lazy_import("app.services.autonomous_scheduler", "get_autonomous_scheduler")
+asaas_service = lazy_import("app.services.asaas_service", "asaas_service")
+scraper_pipeline = lazy_import("app.services.scraper_pipeline", "scraper_pipeline")
+ai_normalizer = lazy_import("app.services.ai_normalizer", "ai_normalizer")
+geocoding_service = lazy_import("app.services.geocoding_service", "geocoding_service")
+pipeline_module = lazy_import("app.pipeline")
+scraper_orchestrator = lazy_import("app.services.scraper_orchestrator", "scraper_orchestrator")
+discovery_orchestrator = lazy_import("app.services.discovery_orchestrator", "discovery_orchestrator")
+structure_validator = lazy_import("app.services.structure_validator", "structure_validator")
+get_geocoding_service = lazy_import("app.services.background_geocoding", "get_geocoding_service")
+get_quality_auditor = lazy_import("app.utils.quality_auditor", "get_quality_auditor")
+get_image_blacklist = lazy_import("app.utils.image_blacklist", "get_image_blacklist")
+get_http_clients = lazy_import("app.utils.http_client", "get_http_clients")
+get_http_cache = lazy_import("app.utils.http_cache", "get_http_cache")
+get_extraction_cache = lazy_import("app.services.extraction_cache", "get_extraction_cache")
+get_selector_inducer = lazy_import("app.services.selector_induction", "get_selector_inducer")
+get_structured_extractor = lazy_import("app.services.structured_data", "get_structured_extractor")
+get_extraction_executor = lazy_import("app.utils.extraction_executor", "get_extraction_executor")
+get_fetch_strategy = lazy_import("app.utils.fetch_strategy", "get_fetch_strategy")
+browser_pool_module = lazy_import("app.services.browser_pool")
 
 logger = logging.getLogger(__name__)
 
@@ -59,10 +83,10 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
-dedup_service = DeduplicationService()
+# Latência por rota (GET /metrics)
+app.add_middleware(MetricsMiddleware)
 
-# Inicializar serviço de geocoding em background
-init_geocoding_service(db)
+dedup_service = DeduplicationService()
 
 # Registrar router de properties (Sprint 3 - API melhorada)
 app.include_router(properties_router)
@@ -87,6 +111,12 @@ async def health_check():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Métricas no formato de exposição do Prometheus."""
+    return PlainTextResponse(get_metrics_registry().render(), media_type=METRICS_CONTENT_TYPE)
+
+
 # ==================== Properties Endpoints ====================
 # NOTA: Os endpoints GET abaixo foram substituídos pelo router em app/api/properties.py
 # que oferece funcionalidades aprimoradas (ordenação, filtros, estatísticas)
@@ -220,7 +250,14 @@ async def create_auctioneer(auctioneer_data: AuctioneerCreate):
 @app.get("/api/stats")
 async def get_stats():
     """Obtém estatísticas gerais do sistema."""
-    return db.get_stats()
+    # Requests concorrentes compartilham a mesma agregação
+    return await get_single_flight().do_sync(make_key("stats"), db.get_stats)
+
+
+@app.get("/api/stats/coalescing")
+async def get_coalescing_stats():
+    """Métricas de coalescência (single-flight) de consultas idênticas."""
+    return get_single_flight().get_stats()
 
 
 @app.get("/api/stats/deduplication")
@@ -229,6 +266,44 @@ async def get_deduplication_stats():
     return dedup_service.get_deduplication_stats(db.properties)
 
 
+# ==================== Events (SSE) ====================
+
+@app.get("/api/events")
+async def stream_progress_events(
+    request: Request,
+    topics: Optional[str] = Query(None, description=f"Tópicos separados por vírgula ({', '.join(EVENT_TOPICS)}); vazio = todos"),
+):
+    """
+    Stream Server-Sent Events com o progresso de scraping, scheduler,
+    sync e geocoding (substitui o polling dos endpoints de status).
+    
+    Cada evento SSE tem como nome o tópico e como data um JSON com `type`
+    e o estado atual. Reconexões com Last-Event-ID recebem os eventos perdidos.
+    """
+    selected = [t.strip().lower() for t in topics.split(",") if t.strip()] if topics else list(EVENT_TOPICS)
+    unknown = [t for t in selected if t not in EVENT_TOPICS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Tópicos inválidos: {', '.join(unknown)}")
+    
+    last_event_id = request.headers.get("last-event-id")
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+    
+    return StreamingResponse(
+        stream_events(selected, last_event_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/events/stats")
+async def get_event_bus_stats():
+    """Métricas do event bus (eventos publicados, assinantes conectados)."""
+    return get_event_bus().get_stats()
+
+
 # ==================== Filter Options Endpoints ====================
 
 @app.get("/api/filters/states")
@@ -282,6 +357,91 @@ async def get_auction_types():
     return [at.value for at in AuctionType]
 
 
+@app.get("/api/autocomplete")
+async def autocomplete(
+    field: str = Query("city", description="Campo: city ou neighborhood"),
+    q: str = Query("", description="Prefixo digitado (sem distinção de acentos)"),
+    state: Optional[str] = Query(None, description="Filtrar por estado (UF)"),
+    city: Optional[str] = Query(None, description="Filtrar bairros por cidade"),
+    limit: int = Query(10, ge=1, le=50, description="Máximo de sugestões"),
+):
+    """
+    Sugestões de cidades/bairros por prefixo, ordenadas por número de imóveis.
+    Usa índice em memória (ver app/services/autocomplete_index.py).
+    """
+    if field not in AUTOCOMPLETE_FIELDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campo inválido. Válidos: {list(AUTOCOMPLETE_FIELDS)}"
+        )
+    
+    index = get_autocomplete_index()
+    items = index.search(field, q, state=state, city=city, limit=limit)
+    return {"field": field, "query": q, "items": items}
+
+
+# ==================== Search Endpoints ====================
+
+@app.get("/api/search")
+async def search_properties(
+    page: int = Query(1, ge=1, description="Número da página"),
+    page_size: int = Query(20, ge=1, le=100, description="Itens por página"),
+    state: Optional[str] = Query(None, description="Filtrar por estado (UF)"),
+    city: Optional[str] = Query(None, description="Filtrar por cidade"),
+    neighborhood: Optional[str] = Query(None, description="Filtrar por bairro"),
+    category: Optional[PropertyCategory] = Query(None, description="Filtrar por categoria"),
+    auction_type: Optional[AuctionType] = Query(None, description="Filtrar por tipo de leilão"),
+    min_value: Optional[float] = Query(None, description="Valor mínimo"),
+    max_value: Optional[float] = Query(None, description="Valor máximo"),
+    min_discount: Optional[float] = Query(None, description="Desconto mínimo (%)"),
+    auctioneer_id: Optional[str] = Query(None, description="Filtrar por leiloeiro"),
+    search: Optional[str] = Query(None, description="Termo de busca"),
+    sort_by: str = Query("discount_percentage", description=f"Ordenar por: {', '.join(SORT_FIELDS)}"),
+    sort_order: str = Query("desc", description="Ordem: asc ou desc"),
+):
+    """
+    Página de resultados + facetas (estado, cidade, categoria, tipo de leilão,
+    faixas de desconto e preço) sob os filtros aplicados, em uma única chamada.
+    """
+    if sort_by not in SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Campo de ordenação inválido. Válidos: {list(SORT_FIELDS)}")
+    if sort_order.lower() not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="Direção de ordenação deve ser 'asc' ou 'desc'")
+    
+    filters = PropertyFilter(
+        state=state,
+        city=city,
+        neighborhood=neighborhood,
+        category=category,
+        auction_type=auction_type,
+        min_value=min_value,
+        max_value=max_value,
+        min_discount=min_discount,
+        auctioneer_id=auctioneer_id,
+        search_term=search,
+    )
+    skip = (page - 1) * page_size
+    
+    # state/city usam "=" em search_with_facets: só bairro e busca textual (ILIKE)
+    key = make_key("search", case_insensitive=("neighborhood", "search_term"),
+                   page=page, page_size=page_size, sort_by=sort_by,
+                   sort_order=sort_order, **filters.model_dump(mode="json"))
+    properties, total, facets = await get_single_flight().do_sync(
+        key,
+        lambda: db.search_with_facets(filters, skip=skip, limit=page_size, sort_by=sort_by, sort_order=sort_order),
+    )
+    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+    
+    return {
+        "items": [p.model_dump() for p in properties],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "facets": facets,
+    }
+
+
 # ==================== Scraper Control Endpoints ====================
 
 @app.post("/api/scrapers/run/{auctioneer_id}")
@@ -366,7 +526,9 @@ async def bulk_import_all_auctioneers(max_per_auctioneer: int = 20):
             logger.info(f"Starting scraper: {config['name']}")
             scraper = config["scraper"]()
             method = getattr(scraper, config["method"])
-            result = method(**config["kwargs"])
+            # Scrapers síncronos (Playwright via run_sync, requests) rodam numa
+            # thread para não travar o event loop da API
+            result = await asyncio.to_thread(method, **config["kwargs"])
             
             # Handle different return types
             if hasattr(result, 'complete_properties'):
@@ -439,6 +601,12 @@ async def bulk_import_all_auctioneers(max_per_auctioneer: int = 20):
             for prop in properties:
                 db.add_property(prop)
             
+            # Alertas de buscas salvas para imóveis novos/com preço alterado
+            try:
+                await asyncio.to_thread(get_saved_search_service().process_properties, properties)
+            except Exception as e:
+                logger.error(f"Erro ao processar buscas salvas ({config['name']}): {e}")
+            
             results["properties_by_auctioneer"][config["name"]] = len(properties)
             results["total_properties_imported"] += len(properties)
             results["auctioneers_processed"] += 1
@@ -815,18 +983,62 @@ async def get_map_bounds():
 
 # ==================== Autonomous Scheduler Endpoints ====================
 
+def _warm_up():
+    """Inicializa o banco e o scheduler autônomo (executado em thread)."""
+    started = time.perf_counter()
+    try:
+        init_database()
+    except Exception as e:
+        logger.error(f"Erro ao inicializar o banco: {e}")
+    try:
+        get_autonomous_scheduler().start()
+    except Exception as e:
+        logger.error(f"Erro ao iniciar o scheduler autônomo: {e}")
+    logger.info(f"Warm-up concluído em {time.perf_counter() - started:.2f}s")
+
+
 @app.on_event("startup")
 async def startup_event():
-    """Start the autonomous scheduler on application startup."""
-    scheduler = get_autonomous_scheduler()
-    scheduler.start()
+    """
+    Start DB init and the autonomous scheduler in the background.
+    
+    The server accepts requests right away (fly.io scale-from-zero); other
+    requests await warm-up in wait_for_warm_up instead of blocking the loop
+    on the LazyObject lock while the worker thread imports the database.
+    """
+    app.state.warm_up = asyncio.create_task(asyncio.to_thread(_warm_up))
+    app.state.loop_lag_monitor = asyncio.create_task(monitor_event_loop_lag())
+    if LOOP_BLOCK_DETECTOR:
+        get_loop_monitor().start()
+
+
+# Respondem sem esperar o warm-up (health checks do fly.io, scrape do Prometheus)
+_WARM_UP_EXEMPT_PATHS = {"/healthz", "/health", "/metrics"}
+
+
+@app.middleware("http")
+async def wait_for_warm_up(request: Request, call_next):
+    """Segura o request (com await, sem travar o loop) até o warm-up terminar."""
+    warm_up = getattr(request.app.state, "warm_up", None)
+    if warm_up is not None and not warm_up.done() and request.url.path not in _WARM_UP_EXEMPT_PATHS:
+        # shield: request cancelado não cancela o warm-up; erros já são logados em _warm_up
+        await asyncio.shield(warm_up)
+    return await call_next(request)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Stop the autonomous scheduler on application shutdown."""
-    scheduler = get_autonomous_scheduler()
-    scheduler.stop()
+    app.state.loop_lag_monitor.cancel()
+    get_loop_monitor().stop()
+    if get_autonomous_scheduler.is_loaded:
+        get_autonomous_scheduler().stop()
+    if get_extraction_executor.is_loaded:
+        get_extraction_executor().shutdown()
+    # Os scrapers importam o pool direto: fecha se o módulo foi carregado
+    if "app.services.browser_pool" in sys.modules:
+        await browser_pool_module.close_browser_pool()
+    await get_http_clients().aclose()
 
 
 @app.get("/api/scheduler/status")
@@ -1261,6 +1473,7 @@ async def sync_caixa_properties(properties: List[dict], background_tasks: Backgr
     imported = 0
     updated = 0
     skipped = 0
+    saved_props = []
     
     # Geocoding agora é feito em background (assíncrono)
     # Imóveis são salvos com geocoding_status='pending' e serão processados posteriormente
@@ -1364,6 +1577,7 @@ async def sync_caixa_properties(properties: List[dict], background_tasks: Backgr
             else:
                 db.add_property(prop, upsert=False)
                 imported += 1
+            saved_props.append(prop)
             
             # Marca como pendente de geocoding usando Supabase diretamente (se disponível)
             # Isso permite adicionar campos que não estão no modelo Property
@@ -1397,6 +1611,13 @@ async def sync_caixa_properties(properties: List[dict], background_tasks: Backgr
     # Save to disk (no-op for SQLite, saves JSON for in-memory)
     db.save_to_disk()
     
+    # Alertas de buscas salvas (só imóveis novos ou com preço alterado geram notificação)
+    try:
+        notifications = await asyncio.to_thread(get_saved_search_service().process_properties, saved_props)
+    except Exception as e:
+        notifications = 0
+        logger.error(f"Erro ao processar buscas salvas: {e}")
+    
     # Agendar geocoding em background
     try:
         geocoding_service = get_geocoding_service()
@@ -1410,6 +1631,7 @@ async def sync_caixa_properties(properties: List[dict], background_tasks: Backgr
         "updated": updated,
         "skipped": skipped,
         "total_properties_now": len(db.properties) if hasattr(db, 'properties') else 0,
+        "saved_search_notifications": notifications,
         "message": "Sync rápido concluído. Imóveis salvos. Geocoding em processamento em background.",
         "geocoding_status": "scheduled"
     }
@@ -1476,6 +1698,170 @@ async def reset_audit_stats():
     return {"status": "ok", "message": "Estatísticas resetadas"}
 
 
+@app.get("/api/admin/loop-blocking")
+async def loop_blocking_report(limit: int = Query(20, ge=1, le=100)):
+    """
+    Pontos de chamada que bloquearam o event loop (detector em modo debug).
+    
+    Ativar com LOOP_BLOCK_DETECTOR=true ou POST /api/admin/loop-blocking/start.
+    """
+    return get_loop_monitor().get_report(limit=limit)
+
+
+@app.post("/api/admin/loop-blocking/start")
+async def start_loop_blocking_detector(threshold_ms: Optional[float] = Query(None, ge=10)):
+    """Inicia o detector de bloqueio do event loop."""
+    monitor = get_loop_monitor()
+    if threshold_ms is not None and not monitor.running:
+        monitor.threshold = threshold_ms / 1000
+        monitor.interval = monitor.threshold / 2
+    monitor.start()
+    return {"status": "running", "threshold_ms": monitor.threshold * 1000}
+
+
+@app.post("/api/admin/loop-blocking/stop")
+async def stop_loop_blocking_detector(reset: bool = False):
+    """Para o detector (mantém o relatório, a menos que reset=true)."""
+    monitor = get_loop_monitor()
+    monitor.stop()
+    if reset:
+        monitor.reset()
+    return {"status": "stopped"}
+
+
+@app.get("/api/admin/db/slow-queries")
+async def slow_queries(
+    limit: int = Query(20, ge=1, le=200),
+    order_by: str = Query("total_ms", pattern="^(total_ms|mean_ms|max_ms|calls|slow_calls)$"),
+    include_plans: bool = Query(True, description="Incluir planos EXPLAIN capturados"),
+):
+    """
+    Top-N statements do Postgres por fingerprint de SQL normalizado,
+    com os planos EXPLAIN (ANALYZE, BUFFERS) amostrados das queries lentas.
+    """
+    query_log = get_query_log()
+    top = query_log.top(limit=limit, order_by=order_by)
+    if include_plans:
+        plans = {}
+        for captured in query_log.plans():
+            plans.setdefault(captured["fingerprint"], captured)
+        for row in top:
+            row["plan"] = plans.get(row["fingerprint"])
+    return {"stats": query_log.get_stats(), "queries": top}
+
+
+@app.get("/api/admin/db/index-advice")
+async def index_advice():
+    """Sugestões de índices a partir dos planos das queries lentas."""
+    existing = await asyncio.to_thread(db.get_index_columns) if hasattr(db, 'get_index_columns') else {}
+    plans = get_query_log().plans()
+    return {"plans_analyzed": len(plans), "suggestions": advise_indexes(plans, existing)}
+
+
+@app.post("/api/admin/db/slow-queries/reset")
+async def reset_slow_queries():
+    """Zera o slow-query log."""
+    get_query_log().reset()
+    return {"status": "ok", "message": "Slow-query log resetado"}
+
+
+@app.get("/api/admin/http-clients")
+async def get_http_client_stats(limit: int = Query(50, ge=1, le=500)):
+    """
+    Clientes HTTP compartilhados: limites, cache de DNS e requests,
+    bytes e latência por host (hosts com mais requests primeiro).
+    """
+    return get_http_clients().get_stats(limit=limit)
+
+
+@app.post("/api/admin/http-clients/reset")
+async def reset_http_client_stats():
+    """Zera as estatísticas por host dos clientes HTTP."""
+    get_http_clients().reset_stats()
+    return {"status": "ok", "message": "Estatísticas HTTP resetadas"}
+
+
+@app.get("/api/admin/http-cache")
+async def get_http_cache_stats():
+    """Cache HTTP em disco: 304s, páginas sem mudança, bytes em disco e despejos."""
+    return get_http_cache().get_stats()
+
+
+@app.post("/api/admin/http-cache/prune")
+async def prune_http_cache(clear: bool = False):
+    """
+    Remove entradas expiradas e aplica o limite de tamanho do cache HTTP.
+    Com `clear=true` apaga o cache inteiro (a próxima execução baixa tudo).
+    """
+    cache = get_http_cache()
+    if clear:
+        await asyncio.to_thread(cache.clear)
+        return {"status": "ok", "message": "Cache HTTP apagado"}
+    removed = await asyncio.to_thread(cache.prune)
+    return {"status": "ok", "removed": removed}
+
+
+@app.get("/api/admin/extraction-cache")
+async def get_extraction_cache_stats():
+    """
+    Cache de extrações por hash do conteúdo: hits/misses e taxa de acerto
+    por leiloeiro (menor taxa primeiro).
+    """
+    return await asyncio.to_thread(get_extraction_cache().get_stats)
+
+
+@app.get("/api/admin/induced-selectors")
+async def get_induced_selectors():
+    """
+    Seletores CSS induzidos de extrações com IA: configurações salvas,
+    candidatos aguardando validação e extrações por seletor/falhas por leiloeiro.
+    """
+    return await asyncio.to_thread(get_selector_inducer().get_stats)
+
+
+@app.get("/api/admin/structured-data")
+async def get_structured_data_stats():
+    """
+    Extração por dados estruturados (JSON-LD, __NEXT_DATA__, estado inline,
+    microdata): páginas, hits e tipo de payload por leiloeiro.
+    """
+    return get_structured_extractor().get_stats()
+
+
+@app.get("/api/admin/extraction-executor")
+async def get_extraction_executor_stats():
+    """
+    Executor de extração (pool de processos): jobs no pool, no loop e em
+    thread, segundos de CPU e páginas por segundo por núcleo.
+    """
+    return get_extraction_executor().get_stats()
+
+
+@app.get("/api/admin/browser-pool")
+async def get_browser_pool_stats():
+    """
+    Pool de browsers dos scrapers Playwright: browsers vivos, contextos por
+    site, páginas reaproveitadas/recicladas, quedas e memória (RSS).
+    """
+    return await browser_pool_module.get_browser_pool_stats()
+
+
+@app.get("/api/admin/fetch-strategies")
+async def get_fetch_strategies():
+    """
+    Estratégia de fetch por domínio: camada de partida, taxa de sucesso e
+    latência de cada camada, sondagens e corridas (hedge) entre camadas.
+    """
+    return await asyncio.to_thread(get_fetch_strategy().get_stats)
+
+
+@app.delete("/api/admin/fetch-strategies")
+async def reset_fetch_strategies(domain: Optional[str] = None):
+    """Esquece a estratégia de um domínio (ou de todos); volta à ordem padrão."""
+    await asyncio.to_thread(get_fetch_strategy().reset, domain)
+    return {"status": "ok", "domain": domain}
+
+
 @app.post("/api/admin/audit-data")
 async def audit_and_fix_data(fix: bool = False):
     """
@@ -1725,33 +2111,48 @@ async def get_user_profile(user_id: str):
         logger.error(f"Erro ao buscar perfil: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _fetch_user_entitlement(cur, user_id: str) -> Optional[dict]:
+    """
+    Busca permissão + perfil do usuário em uma única query.
+    Retorna o payload de /api/user/check-access ou None se o usuário não existe.
+    """
+    cur.execute("""
+        SELECT can_view_property(id) AS can_view,
+               subscription_status, trial_views_used, trial_views_limit,
+               trial_end_date, subscription_end_date
+        FROM user_profiles WHERE id = %s::uuid
+    """, (user_id,))
+    profile = cur.fetchone()
+    if not profile:
+        return None
+    
+    return {
+        "can_view": profile["can_view"],
+        "status": profile["subscription_status"],
+        "trial_views_used": profile["trial_views_used"],
+        "trial_views_limit": profile["trial_views_limit"],
+        "trial_end_date": profile["trial_end_date"].isoformat() if profile["trial_end_date"] else None,
+        "subscription_end_date": profile["subscription_end_date"].isoformat() if profile["subscription_end_date"] else None
+    }
+
 @app.post("/api/user/check-access/{user_id}")
 async def check_user_access(user_id: str):
-    """Verifica se usuário pode visualizar imóveis"""
+    """Verifica se usuário pode visualizar imóveis (com cache TTL por usuário)"""
+    cache = get_entitlement_cache()
+    cached = cache.get(user_id)
+    if cached is not None:
+        return cached
+    
     try:
         with db._get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute("SELECT can_view_property(%s::uuid)", (user_id,))
-                can_view = cur.fetchone()[0]
-                
-                cur.execute("""
-                    SELECT subscription_status, trial_views_used, trial_views_limit,
-                           trial_end_date, subscription_end_date
-                    FROM user_profiles WHERE id = %s::uuid
-                """, (user_id,))
-                profile = cur.fetchone()
+                entitlement = _fetch_user_entitlement(cur, user_id)
         
-        if not profile:
+        if not entitlement:
             return {"can_view": False, "reason": "user_not_found"}
         
-        return {
-            "can_view": can_view,
-            "status": profile["subscription_status"],
-            "trial_views_used": profile["trial_views_used"],
-            "trial_views_limit": profile["trial_views_limit"],
-            "trial_end_date": profile["trial_end_date"].isoformat() if profile["trial_end_date"] else None,
-            "subscription_end_date": profile["subscription_end_date"].isoformat() if profile["subscription_end_date"] else None
-        }
+        cache.set(user_id, entitlement)
+        return entitlement
     except Exception as e:
         logger.error(f"Erro ao verificar acesso: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1772,11 +2173,106 @@ async def increment_user_view(user_id: str, property_id: str = Query(...)):
                 """, (user_id, property_id))
             conn.commit()
         
+        # Views do trial mudaram - permissão em cache não vale mais
+        get_entitlement_cache().invalidate(user_id)
+        
         return {"success": True}
     except Exception as e:
         logger.error(f"Erro ao incrementar view: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/user/view/{user_id}")
+async def check_and_increment_user_view(user_id: str, property_id: str = Query(...)):
+    """
+    Verifica acesso e registra a visualização em uma única chamada.
+    
+    Substitui o par check-access + increment-view no detalhe do imóvel:
+    uma conexão, uma transação. A view só é contabilizada se o usuário
+    puder visualizar. Retorna o payload de check-access já atualizado.
+    
+    A linha do perfil fica travada (SELECT ... FOR UPDATE) até o commit:
+    requests concorrentes do mesmo usuário esperam e checam já com a view
+    anterior contabilizada, então o trial não passa do limite.
+    """
+    cache = get_entitlement_cache()
+    try:
+        with db._get_connection() as conn:
+            with conn.cursor() as cur:
+                # Trava antes de checar: em READ COMMITTED a query seguinte
+                # (e can_view_property) já enxerga o que a anterior gravou
+                cur.execute("SELECT id FROM user_profiles WHERE id = %s::uuid FOR UPDATE", (user_id,))
+                if not cur.fetchone():
+                    return {"can_view": False, "reason": "user_not_found", "view_recorded": False}
+                
+                entitlement = _fetch_user_entitlement(cur, user_id)
+                if not entitlement:
+                    return {"can_view": False, "reason": "user_not_found", "view_recorded": False}
+                
+                if not entitlement["can_view"]:
+                    cache.set(user_id, entitlement)
+                    return {**entitlement, "view_recorded": False}
+                
+                cur.execute("SELECT increment_trial_view(%s::uuid)", (user_id,))
+                cur.execute("""
+                    INSERT INTO property_views (user_id, property_id, source)
+                    VALUES (%s::uuid, %s, 'detail')
+                """, (user_id, property_id))
+                
+                # Reler o perfil para refletir a view consumida
+                entitlement = _fetch_user_entitlement(cur, user_id) or entitlement
+            conn.commit()
+        
+        cache.set(user_id, entitlement)
+        return {**entitlement, "view_recorded": True}
+    except Exception as e:
+        cache.invalidate(user_id)
+        logger.error(f"Erro ao verificar/incrementar view: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+# ==================== SAVED SEARCHES ENDPOINTS ====================
+
+@app.post("/api/saved-searches/{user_id}")
+async def create_saved_search(user_id: str, data: SavedSearchCreate):
+    """Cria um alerta (busca salva) para o usuário"""
+    if data.min_value is not None and data.max_value is not None and data.min_value > data.max_value:
+        raise HTTPException(status_code=400, detail="min_value deve ser menor ou igual a max_value")
+    try:
+        return get_saved_search_service().create(user_id, data)
+    except Exception as e:
+        logger.error(f"Erro ao criar busca salva: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/saved-searches/{user_id}")
+async def list_saved_searches(user_id: str):
+    """Lista os alertas do usuário"""
+    return get_saved_search_service().list_for_user(user_id)
+
+
+@app.delete("/api/saved-searches/{user_id}/{search_id}")
+async def delete_saved_search(user_id: str, search_id: str):
+    """Remove um alerta do usuário"""
+    if not get_saved_search_service().delete(search_id, user_id=user_id):
+        raise HTTPException(status_code=404, detail="Busca salva não encontrada")
+    return {"status": "deleted", "id": search_id}
+
+
+@app.get("/api/saved-searches/{user_id}/notifications")
+async def get_saved_search_notifications(user_id: str, limit: int = Query(50, ge=1, le=500)):
+    """Retorna (e marca como lidas) as notificações pendentes do usuário"""
+    try:
+        items = get_saved_search_service().pop_notifications(user_id, limit=limit)
+    except Exception as e:
+        logger.error(f"Erro ao buscar notificações: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"user_id": user_id, "count": len(items), "items": items}
+
+
+@app.get("/api/admin/saved-searches/stats")
+async def get_saved_search_stats():
+    """Estatísticas do matching de buscas salvas"""
+    return get_saved_search_service().get_stats()
+
 # ==================== ANALYTICS ENDPOINTS ====================
 
 @app.post("/api/analytics/search")
@@ -2050,17 +2546,18 @@ async def import_pipeline_urls(urls: List[str]):
 async def run_all_scrapers(
     skip_geocoding: bool = False,
     limit: Optional[int] = None,
+    concurrency: Optional[int] = Query(None, ge=1, le=64, description="Leiloeiros simultâneos (1 = sequencial)"),
     background_tasks: BackgroundTasks = None
 ):
-    """Executa scraping de todos os leiloeiros (pode demorar horas)"""
+    """Executa scraping de todos os leiloeiros em paralelo, com limite por domínio"""
     
     if background_tasks:
         # Executar em background
-        background_tasks.add_task(scraper_orchestrator.run_all, skip_geocoding, limit)
+        background_tasks.add_task(scraper_orchestrator.run_all, skip_geocoding, limit, concurrency)
         return {"status": "started", "message": "Scraping iniciado em background"}
     
     # Executar sincrono (para testes com limit pequeno)
-    stats = await scraper_orchestrator.run_all(skip_geocoding, limit)
+    stats = await scraper_orchestrator.run_all(skip_geocoding, limit, concurrency)
     return stats
 
 
@@ -2159,13 +2656,15 @@ async def get_discovery_stats():
 @app.post("/api/scraper/run-smart")
 async def run_smart_scraper(
     limit: Optional[int] = Query(None),
-    skip_geocoding: bool = Query(True)
+    skip_geocoding: bool = Query(True),
+    concurrency: Optional[int] = Query(None, ge=1, le=64, description="Leiloeiros simultâneos (1 = sequencial)")
 ):
     """Executa scraping inteligente usando configurações descobertas"""
     try:
         result = await scraper_orchestrator.run_all_smart(
             skip_geocoding=skip_geocoding,
-            limit=limit
+            limit=limit,
+            concurrency=concurrency
         )
         return result
     except Exception as e:
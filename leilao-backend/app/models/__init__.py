@@ -1,5 +1,6 @@
 from .property import Property, PropertyCreate, PropertyUpdate, PropertyFilter
 from .auctioneer import Auctioneer, AuctioneerCreate
+from .saved_search import SavedSearch, SavedSearchCreate
 
 __all__ = [
     "Property",
@@ -8,4 +9,6 @@ __all__ = [
     "PropertyFilter",
     "Auctioneer",
     "AuctioneerCreate",
+    "SavedSearch",
+    "SavedSearchCreate",
 ]
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+from .property import PropertyCategory, AuctionType
+
+
+class SavedSearchCreate(BaseModel):
+    name: str = Field(..., description="Nome do alerta (ex.: Aptos em Campinas)")
+    state: Optional[str] = Field(None, description="Estado (UF)")
+    city: Optional[str] = Field(None, description="Cidade")
+    category: Optional[PropertyCategory] = Field(None, description="Categoria do imóvel")
+    auction_type: Optional[AuctionType] = Field(None, description="Tipo de leilão")
+    min_value: Optional[float] = Field(None, description="Valor mínimo")
+    max_value: Optional[float] = Field(None, description="Valor máximo")
+    min_discount: Optional[float] = Field(None, description="Desconto mínimo (%)")
+
+
+class SavedSearch(SavedSearchCreate):
+    id: str = Field(..., description="ID único da busca salva")
+    user_id: str = Field(..., description="ID do usuário dono do alerta")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Config:
+        from_attributes = True
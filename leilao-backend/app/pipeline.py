@@ -3,11 +3,14 @@ Pipeline de importação de links de leilão usando Gemini API para extração d
 """
 import os
 import json
+import asyncio
 import logging
-import httpx
 from typing import Optional, Dict, List
 import google.generativeai as genai
 
+from app.utils.html_slicer import AI_PROMPT_MAX_TOKENS, page_text
+from app.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 # Configurar API key do Gemini
@@ -24,7 +27,7 @@ async def extract_data_with_gemini(html_content: str, url: str) -> dict:
         return {"error": "GEMINI_API_KEY não configurada"}
     
     system_prompt = """Você é um especialista em extração de dados de páginas de leilão de imóveis.
-Analise o HTML fornecido e extraia as seguintes informações em formato JSON:
+Analise o conteúdo da página fornecido e extraia as seguintes informações em formato JSON:
 - auction_date_1: Data do 1º leilão (formato ISO 8601)
 - auction_value_1: Valor do 1º leilão (número)
 - auction_date_2: Data do 2º leilão (formato ISO 8601)  
@@ -39,10 +42,13 @@ Analise o HTML fornecido e extraia as seguintes informações em formato JSON:
 
 Retorne APENAS o JSON, sem markdown ou explicações."""
 
+    # Texto da página sem scripts/menus/rodapé, cortado no orçamento de tokens
+    text = await asyncio.to_thread(page_text, html_content, url, AI_PROMPT_MAX_TOKENS)
+    
     user_prompt = f"""URL: {url}
 
-HTML da página:
-{html_content[:50000]}
+Conteúdo da página (texto, links entre <>):
+{text}
 
 Extraia os dados do leilão em formato JSON."""
 
@@ -86,11 +92,11 @@ async def fetch_and_extract(url: str) -> Dict:
     logger.info(f"Initial fetch for {url}: starting")
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, follow_redirects=True)
-            response.raise_for_status()
-            html_content = response.text
-            
+        client = get_http_client(scope="pipeline")
+        response = await client.get(url, timeout=30.0, follow_redirects=True)
+        response.raise_for_status()
+        html_content = response.text
+        
         logger.info(f"Initial fetch for {url}: success=True")
         
         # Tentar extração com Gemini
@@ -19,8 +19,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass
-import httpx
 
+from app.utils.http_client import get_http_client
 from app.utils.normalizer import (
     normalize_category,
     normalize_state,
@@ -124,27 +124,27 @@ class CaixaScraper:
         Baixa o CSV da Caixa.
         """
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # Headers que simulam navegador
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
-                }
-                
-                logger.info(f"Baixando CSV de {CAIXA_CSV_URL}")
-                
-                response = await client.get(CAIXA_CSV_URL, headers=headers, follow_redirects=True)
+            client = get_http_client(scope="caixa")
+            # Headers que simulam navegador
+            headers = {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
+            }
+            
+            logger.info(f"Baixando CSV de {CAIXA_CSV_URL}")
+            
+            response = await client.get(CAIXA_CSV_URL, headers=headers, timeout=60.0, follow_redirects=True)
+            
+            if response.status_code == 200:
+                # O CSV da Caixa usa encoding ISO-8859-1 (Latin-1)
+                content = response.content.decode('iso-8859-1', errors='replace')
+                logger.info(f"CSV baixado: {len(content)} caracteres")
+                return content
+            else:
+                logger.error(f"Erro HTTP {response.status_code} ao baixar CSV")
+                return None
                 
-                if response.status_code == 200:
-                    # O CSV da Caixa usa encoding ISO-8859-1 (Latin-1)
-                    content = response.content.decode('iso-8859-1', errors='replace')
-                    logger.info(f"CSV baixado: {len(content)} caracteres")
-                    return content
-                else:
-                    logger.error(f"Erro HTTP {response.status_code} ao baixar CSV")
-                    return None
-                    
         except Exception as e:
             logger.error(f"Erro ao baixar CSV da Caixa: {e}")
             return None
@@ -9,16 +9,19 @@ Execução: python -m app.scrapers.configurable_scraper
 """
 
 import asyncio
-import httpx
 import json
 import csv
 import os
 import re
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+
+from app.services.structured_data import STRUCTURED_DATA_ENABLED, get_structured_extractor
+from app.utils.extraction_executor import get_extraction_executor
+from app.utils.html_parser import parse_html
+from app.utils.http_client import get_http_client
 
 # Configurar logging
 logging.basicConfig(
@@ -27,6 +30,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sites buscados ao mesmo tempo em scrape_batch
+SCRAPE_BATCH_CONCURRENCY = int(os.getenv("SCRAPE_BATCH_CONCURRENCY", "4"))
+
 
 class ConfigurableScraper:
     """Scraper configurável baseado em configurações JSON."""
@@ -58,45 +64,40 @@ class ConfigurableScraper:
         
         try:
             # Acessar URL
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                verify=False
-            ) as client:
-                response = await client.get(working_url, headers=self.headers)
-                
-                if response.status_code != 200:
-                    logger.warning(f"{name}: HTTP {response.status_code}")
-                    return []
-                
-                html = response.text
-                if not html or len(html) < 1000:
-                    logger.warning(f"{name}: HTML muito pequeno")
-                    return []
-                
-                # Parse HTML
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Extrair propriedades
-                card_selector = selectors.get('card')
-                if not card_selector:
-                    logger.warning(f"{name}: Seletor de card nao encontrado")
-                    return []
-                
-                cards = soup.select(card_selector)
-                logger.info(f"{name}: Encontrados {len(cards)} cards")
-                
-                for card in cards[:50]:  # Limitar a 50 cards
-                    try:
-                        prop = self._extract_property(card, selectors, website, name)
-                        if prop:
-                            properties.append(prop)
-                    except Exception as e:
-                        logger.debug(f"Erro ao extrair card: {e}")
-                        continue
-                
-                logger.info(f"{name}: {len(properties)} propriedades extraidas")
-                
+            client = get_http_client(verify=False, scope="configurable_scraper")
+            response = await client.get(working_url, headers=self.headers, timeout=self.timeout, follow_redirects=True)
+            
+            if response.status_code != 200:
+                logger.warning(f"{name}: HTTP {response.status_code}")
+                return []
+            
+            html = response.text
+            if not html or len(html) < 1000:
+                logger.warning(f"{name}: HTML muito pequeno")
+                return []
+            
+            # Listagem em dados estruturados (JSON-LD, __NEXT_DATA__...): sem parsear o DOM
+            if STRUCTURED_DATA_ENABLED:
+                items = get_structured_extractor().extract(html, working_url, name)
+                if items:
+                    properties = [self._structured_property(item, name) for item in items[:50]]
+                    logger.info(f"{name}: {len(properties)} propriedades extraidas de dados estruturados")
+                    return properties
+            
+            # Extrair propriedades
+            card_selector = selectors.get('card')
+            if not card_selector:
+                logger.warning(f"{name}: Seletor de card nao encontrado")
+                return []
+            
+            # Parse e extração no executor (pool de processos), fora do event loop
+            properties, card_count = await get_extraction_executor().run(
+                extract_listing, html, selectors, website, name
+            )
+            logger.info(f"{name}: Encontrados {card_count} cards")
+            
+            logger.info(f"{name}: {len(properties)} propriedades extraidas")
+            
         except Exception as e:
             logger.error(f"Erro ao fazer scraping de {name}: {e}")
         
@@ -114,7 +115,7 @@ class ConfigurableScraper:
         title_sel = selectors.get('title')
         if title_sel:
             try:
-                title_elem = card.select_one(title_sel) if '.' in title_sel or '#' in title_sel else card.find(title_sel.replace('h', 'h'))
+                title_elem = card.select_one(title_sel)
                 if title_elem:
                     title = title_elem.get_text(strip=True)
                     if title and len(title) > 10:
@@ -126,7 +127,7 @@ class ConfigurableScraper:
         price_sel = selectors.get('price')
         if price_sel:
             try:
-                price_elem = card.select_one(price_sel) if price_sel.startswith('.') or price_sel.startswith('#') else card.find(class_=price_sel.replace('.', ''))
+                price_elem = card.select_one(price_sel) if price_sel.startswith('.') or price_sel.startswith('#') else card.select_one('.' + price_sel.replace('.', ''))
                 if price_elem:
                     price_text = price_elem.get_text(strip=True)
                     price_value = self._parse_price(price_text)
@@ -138,10 +139,7 @@ class ConfigurableScraper:
         # Link
         link_sel = selectors.get('link', 'a[href]')
         try:
-            if link_sel == 'a[href]':
-                link_elem = card.find('a', href=True)
-            else:
-                link_elem = card.select_one(link_sel) if link_sel else card.find('a', href=True)
+            link_elem = card.select_one(link_sel or 'a[href]')
             
             if link_elem:
                 href = link_elem.get('href', '')
@@ -153,10 +151,9 @@ class ConfigurableScraper:
         # Imagem
         img_sel = selectors.get('image', 'img')
         try:
-            if img_sel == 'img' or img_sel == 'img[src]':
-                img_elem = card.find('img', src=True)
-            else:
-                img_elem = card.select_one(img_sel) if img_sel else card.find('img', src=True)
+            if img_sel == 'img' or not img_sel:
+                img_sel = 'img[src]'
+            img_elem = card.select_one(img_sel)
             
             if img_elem:
                 src = img_elem.get('src', '')
@@ -181,6 +178,26 @@ class ConfigurableScraper:
         
         return None
     
+    def _structured_property(self, item: Dict, source: str) -> Dict:
+        """Converte um item de dados estruturados para o formato de _extract_property."""
+        prop = {
+            'source': source,
+            'extracted_at': datetime.now().isoformat(),
+        }
+        if item.get('title'):
+            prop['title'] = item['title']
+        if item.get('price'):
+            prop['price'] = item['price']
+            prop['price_text'] = f"R$ {item['price']:,.2f}".replace(',', '_').replace('.', ',').replace('_', '.')
+        if item.get('url'):
+            prop['link'] = item['url']
+        if item.get('image_url'):
+            prop['image_url'] = item['image_url']
+        location = item.get('address') or ', '.join(p for p in (item.get('city'), item.get('state')) if p)
+        if location:
+            prop['location'] = location[:200]
+        return prop
+    
     def _parse_price(self, price_text: str) -> Optional[float]:
         """Parseia preço de texto."""
         if not price_text:
@@ -204,22 +221,31 @@ class ConfigurableScraper:
         
         return None
     
-    async def scrape_batch(self, configs: List[Dict]) -> List[Dict]:
-        """Scrape um lote de sites usando configurações."""
+    async def scrape_batch(self, configs: List[Dict], concurrency: int = SCRAPE_BATCH_CONCURRENCY) -> List[Dict]:
+        """
+        Scrape um lote de sites usando configurações.
+        
+        Até `concurrency` sites são buscados ao mesmo tempo; o parse vai para
+        o executor de extração, então o paralelismo de CPU é o número de
+        workers (EXTRACTION_WORKERS), independente deste valor.
+        """
         
-        all_properties = []
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
         
-        for i, config in enumerate(configs, 1):
+        async def process(i: int, config: Dict) -> List[Dict]:
             name = config.get('name', 'Unknown')
-            logger.info(f"[{i}/{len(configs)}] Processando {name}...")
-            
-            try:
-                properties = await self.scrape_site(config)
-                all_properties.extend(properties)
-                await asyncio.sleep(2)  # Pausa entre sites
-            except Exception as e:
-                logger.error(f"Erro ao processar {name}: {e}")
-                continue
+            async with semaphore:
+                logger.info(f"[{i}/{len(configs)}] Processando {name}...")
+                try:
+                    properties = await self.scrape_site(config)
+                    await asyncio.sleep(2)  # Pausa entre sites
+                    return properties
+                except Exception as e:
+                    logger.error(f"Erro ao processar {name}: {e}")
+                    return []
+        
+        results = await asyncio.gather(*(process(i, config) for i, config in enumerate(configs, 1)))
+        all_properties = [prop for properties in results for prop in properties]
         
         self.properties = all_properties
         return all_properties
@@ -253,6 +279,34 @@ class ConfigurableScraper:
         return {'json_file': json_file, 'csv_file': csv_file}
 
 
+# Instância usada pelos workers do executor de extração
+_extractor: Optional[ConfigurableScraper] = None
+
+
+def extract_listing(html: str, selectors: Dict, website: str, name: str) -> Tuple[List[Dict], int]:
+    """
+    Job do executor de extração: cards da listagem -> propriedades.
+    
+    Returns:
+        (propriedades dos primeiros 50 cards, número de cards encontrados)
+    """
+    global _extractor
+    if _extractor is None:
+        _extractor = ConfigurableScraper()
+    
+    cards = parse_html(html).select(selectors['card'])
+    properties = []
+    for card in cards[:50]:  # Limitar a 50 cards
+        try:
+            prop = _extractor._extract_property(card, selectors, website, name)
+            if prop:
+                properties.append(prop)
+        except Exception as e:
+            logger.debug(f"Erro ao extrair card: {e}")
+            continue
+    return properties, len(cards)
+
+
 def load_configs_from_site_analysis():
     """Carrega configurações do diretório site_analysis."""
     
@@ -10,10 +10,10 @@ import os
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
 
 from app.scrapers.base_scraper import BaseScraper
 from app.models.property import Property, PropertyCategory, AuctionType
+from app.utils.html_parser import find_all_by_class, parse_html
 from app.utils.image_extractor import extract_images
 from app.utils.date_parser import parse_brazilian_date, find_auction_dates
 from app.utils.normalizer import (
@@ -25,6 +25,7 @@ from app.utils.normalizer import (
 from app.utils.paginator import GenericPaginator, paginate_and_extract
 from app.utils.rate_limiter import RateLimiter, get_rate_limiter
 from app.utils.fetcher import MultiLayerFetcher
+from app.utils.extraction_executor import get_extraction_executor
 
 logger = logging.getLogger(__name__)
 
@@ -312,7 +313,7 @@ class GenericScraper(BaseScraper):
                 logger.info(f"Scraping {self.name} page {page}: {url}")
                 
                 html = self.get_page(url, wait_time=3.0)
-                soup = BeautifulSoup(html, 'lxml')
+                soup = parse_html(html)
                 
                 # Find property cards using configured selector
                 cards = soup.select(self.config.card_selector)
@@ -320,7 +321,7 @@ class GenericScraper(BaseScraper):
                 if not cards:
                     logger.warning(f"No cards found on {self.name} page {page}")
                     # Try broader selectors
-                    cards = soup.find_all(['div', 'article'], class_=re.compile(r'.*card.*|.*item.*|.*lote.*', re.I))
+                    cards = find_all_by_class(soup, r'.*card.*|.*item.*|.*lote.*', tags=['div', 'article'])
                 
                 logger.info(f"Found {len(cards)} cards on page {page}")
                 
@@ -524,7 +525,7 @@ class GenericScraper(BaseScraper):
         Extract a valid property image, ignoring logos and small images.
         
         Args:
-            card: BeautifulSoup element containing property card
+            card: Parsed element (app.utils.html_parser) containing property card
             
         Returns:
             Image URL or None
@@ -639,14 +640,14 @@ class GenericScraper(BaseScraper):
             Lista de dicionários com dados das propriedades
         """
         properties = []
-        soup = BeautifulSoup(html, 'lxml')
+        soup = parse_html(html)
         
         # Encontra cards usando o seletor configurado
         cards = soup.select(self.config.card_selector)
         
         if not cards:
             # Tenta seletores mais amplos
-            cards = soup.find_all(['div', 'article'], class_=re.compile(r'.*card.*|.*item.*|.*lote.*', re.I))
+            cards = find_all_by_class(soup, r'.*card.*|.*item.*|.*lote.*', tags=['div', 'article'])
         
         for card in cards:
             try:
@@ -686,6 +687,10 @@ class GenericScraper(BaseScraper):
         
         return properties
     
+    async def _extract_properties_async(self, html: str, url: str) -> List[Dict[str, Any]]:
+        """_extract_properties_from_html no executor de extração (pool de processos)."""
+        return await get_extraction_executor().run(extract_listing_page, html, url, self.config)
+    
     async def scrape_all_pages(
         self,
         base_url: str,
@@ -710,21 +715,30 @@ class GenericScraper(BaseScraper):
         
         # Função de fetch com rate limiting
         async def fetch_with_limit(url: str) -> str:
-            if not await rate_limiter.acquire(url):
+            lease = await rate_limiter.acquire(url)
+            if not lease:
                 raise Exception(f"Rate limited: {url}")
             
-            result = await self.fetcher.fetch(url)
+            try:
+                result = await self.fetcher.fetch(url)
+            except Exception:
+                rate_limiter.record_error(url, lease=lease)
+                raise
+            except BaseException:
+                # Cancelado: devolve o slot para os outros fetches do domínio
+                rate_limiter.release(url, lease)
+                raise
             
             if result.success:
-                rate_limiter.record_success(url)
+                rate_limiter.record_success(url, lease=lease)
                 return result.content
             else:
-                rate_limiter.record_error(url)
+                rate_limiter.record_error(url, lease=lease)
                 raise Exception(result.error or "Fetch failed")
         
-        # Função de extração
-        def extract_items(html: str, url: str) -> List[Dict[str, Any]]:
-            return self._extract_properties_from_html(html, url)
+        # Função de extração (parse no executor, fora do event loop)
+        async def extract_items(html: str, url: str) -> List[Dict[str, Any]]:
+            return await self._extract_properties_async(html, url)
         
         # Executa paginação
         try:
@@ -744,7 +758,7 @@ class GenericScraper(BaseScraper):
             # Fallback: tenta pelo menos a primeira página
             result = await self.fetcher.fetch(base_url)
             if result.success:
-                return self._extract_properties_from_html(result.content, base_url)
+                return await self._extract_properties_async(result.content, base_url)
             return []
     
     async def scrape(
@@ -773,7 +787,7 @@ class GenericScraper(BaseScraper):
             if not result.success:
                 logger.error(f"Failed to fetch {url}: {result.error}")
                 return []
-            properties = self._extract_properties_from_html(result.content, url)
+            properties = await self._extract_properties_async(result.content, url)
         
         # Aplica limite se especificado
         if limit and len(properties) > limit:
@@ -787,6 +801,24 @@ class GenericScraper(BaseScraper):
         return None
 
 
+# Scrapers dos workers do executor de extração, por configuração
+_extraction_scrapers: Dict[str, GenericScraper] = {}
+
+
+def extract_listing_page(html: str, url: str, config: ScraperConfig) -> List[Dict[str, Any]]:
+    """
+    Job do executor de extração: cards da listagem -> lista de dicionários.
+
+    Recebe a configuração já com os seletores do leiloeiro aplicados; o
+    GenericScraper do worker é reaproveitado entre páginas.
+    """
+    key = repr(config)
+    scraper = _extraction_scrapers.get(key)
+    if scraper is None:
+        scraper = _extraction_scrapers[key] = GenericScraper(config)
+    return scraper._extract_properties_from_html(html, url)
+
+
 def create_scraper(name: str, headless: bool = True) -> Optional[GenericScraper]:
     """Create a scraper for a known auction site."""
     config = SCRAPER_CONFIGS.get(name)
@@ -7,6 +7,8 @@ from typing import Optional, Dict, Any
 import httpx
 from bs4 import BeautifulSoup
 
+from app.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,13 +54,11 @@ class HttpxScraper:
             request_headers.update(headers)
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=follow_redirects,
-                verify=False  # Para desenvolvimento, em produção usar True
-            ) as client:
-                response = await client.get(url, headers=request_headers)
-                return response
+            client = get_http_client(verify=False, scope="httpx_scraper")  # Para desenvolvimento, em produção usar True
+            response = await client.get(
+                url, headers=request_headers, timeout=self.timeout, follow_redirects=follow_redirects
+            )
+            return response
         except Exception as e:
             logger.error(f"Erro ao fazer requisição para {url}: {e}")
             return None
@@ -122,18 +122,15 @@ class HttpxScraper:
             request_headers.update(headers)
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                verify=False
-            ) as client:
-                if json_data:
-                    response = await client.post(url, json=json_data, headers=request_headers)
-                elif data:
-                    response = await client.post(url, data=data, headers=request_headers)
-                else:
-                    response = await client.post(url, headers=request_headers)
-                return response
+            client = get_http_client(verify=False, scope="httpx_scraper")
+            options = {"timeout": self.timeout, "follow_redirects": True}
+            if json_data:
+                response = await client.post(url, json=json_data, headers=request_headers, **options)
+            elif data:
+                response = await client.post(url, data=data, headers=request_headers, **options)
+            else:
+                response = await client.post(url, headers=request_headers, **options)
+            return response
         except Exception as e:
             logger.error(f"Erro ao fazer POST para {url}: {e}")
             return None
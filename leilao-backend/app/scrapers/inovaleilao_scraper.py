@@ -14,9 +14,9 @@ from datetime import datetime
 from dataclasses import dataclass, field
 
 import requests
-from bs4 import BeautifulSoup
 
 from app.models.property import Property, PropertyCategory, AuctionType
+from app.utils.html_parser import make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -160,7 +160,7 @@ class InovaLeilaoScraper:
             response = self.session.get(self.BASE_URL, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             links = []
             for a_tag in soup.find_all('a', href=True):
@@ -185,7 +185,7 @@ class InovaLeilaoScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             # Extract title from h2 or h3
             title_tag = soup.find('h2') or soup.find('h3')
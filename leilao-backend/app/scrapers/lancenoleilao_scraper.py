@@ -8,12 +8,14 @@ import asyncio
 import re
 import logging
 from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+from contextlib import AsyncExitStack
+from playwright.async_api import Browser, Page, TimeoutError as PlaywrightTimeoutError
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from app.services.browser_pool import get_browser_pool, run_sync
 from app.services.structure_validator import structure_validator
 
 logger = logging.getLogger(__name__)
@@ -30,60 +32,27 @@ class LanceNoLeilaoScraper:
         self.headless = headless
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
+        self._page_lease: Optional[AsyncExitStack] = None
         self.properties: List[Dict] = []
         self.incomplete_properties: List[Dict] = []
     
     async def _setup_browser(self):
-        """Setup Playwright browser with stealth configuration."""
-        playwright = await async_playwright().start()
-        
-        browser = await playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-blink-features=AutomationControlled',
-                '--window-size=1920,1080',
-            ]
-        )
-        
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='pt-BR',
-            timezone_id='America/Sao_Paulo',
-            extra_http_headers={
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            }
+        """Borrow a page from the shared browser pool (stealth context)."""
+        self._page_lease = AsyncExitStack()
+        page = await self._page_lease.enter_async_context(
+            get_browser_pool(self.headless).page(self.AUCTIONEER_ID)
         )
-        
-        page = await context.new_page()
-        
-        await page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => false });
-            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-            Object.defineProperty(navigator, 'languages', { get: () => ['pt-BR', 'pt', 'en-US', 'en'] });
-            window.chrome = { runtime: {} };
-        """)
-        
-        self.browser = browser
+        self.browser = page.context.browser
         self.page = page
-        self.playwright = playwright
         
         return page
     
     async def _close_browser(self):
-        """Close the browser."""
-        if self.page:
-            await self.page.close()
-            self.page = None
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
-        if hasattr(self, 'playwright'):
-            await self.playwright.stop()
+        """Return the page to the pool (the browser stays up)."""
+        lease, self._page_lease = self._page_lease, None
+        self.page = None
+        if lease is not None:
+            await lease.aclose()
     
     def _parse_price(self, price_str: str) -> Optional[float]:
         """Parse Brazilian currency format to float."""
@@ -126,7 +95,7 @@ class LanceNoLeilaoScraper:
     
     def scrape_properties(self, max_properties: Optional[int] = None) -> List[Dict]:
         """Scrape properties from Lance no Leilão."""
-        return asyncio.run(self._scrape_properties_async(max_properties))
+        return run_sync(self._scrape_properties_async(max_properties))
     
     async def _scrape_properties_async(self, max_properties: Optional[int] = None) -> List[Dict]:
         """Scrape properties from Lance no Leilão (async version)."""
@@ -13,9 +13,9 @@ from datetime import datetime
 from dataclasses import dataclass, field
 
 import requests
-from bs4 import BeautifulSoup
 
 from app.models.property import Property, PropertyCategory, AuctionType
+from app.utils.html_parser import make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -134,7 +134,7 @@ class LeilaoVipScraper:
             response = self.session.get(self.BASE_URL, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             links = []
             for a_tag in soup.find_all('a', href=True):
@@ -160,7 +160,7 @@ class LeilaoVipScraper:
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             links = []
             for a_tag in soup.find_all('a', href=True):
@@ -185,7 +185,7 @@ class LeilaoVipScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             # Extract title from h1
             h1 = soup.find('h1')
@@ -13,9 +13,9 @@ from datetime import datetime
 from dataclasses import dataclass, field
 
 import requests
-from bs4 import BeautifulSoup
 
 from app.models.property import Property, PropertyCategory, AuctionType
+from app.utils.html_parser import make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -151,7 +151,7 @@ class MegaleiloesScraper:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             links = []
             for a_tag in soup.find_all('a', href=True):
@@ -180,7 +180,7 @@ class MegaleiloesScraper:
                 return None
                 
             final_url = response.url
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(response.text)
             
             h1_tag = soup.find('h1')
             title = self._clean_text(h1_tag.get_text()) if h1_tag else ""
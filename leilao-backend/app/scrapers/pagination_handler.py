@@ -8,7 +8,8 @@ import re
 import logging
 from typing import Optional, List, Dict, Callable, Any
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from bs4 import BeautifulSoup
+
+from app.utils.html_parser import parse_html
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,8 @@ class PaginationHandler:
         Detecta o tipo de paginação analisando o HTML.
         Retorna informações sobre a paginação encontrada.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        # Mesmo documento já parseado pelo extrator de cards da página
+        soup = parse_html(html)
         
         result = {
             "has_pagination": False,
@@ -8,13 +8,20 @@ import asyncio
 import re
 import logging
 from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+from contextlib import AsyncExitStack
+from playwright.async_api import Browser, Page, TimeoutError as PlaywrightTimeoutError
 import sys
 import os
 
 # Adicionar o diretório raiz ao path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from app.services.browser_pool import (
+    FULL_HEADERS_CONTEXT_OPTIONS,
+    FULL_STEALTH_INIT_SCRIPT,
+    get_browser_pool,
+    run_sync,
+)
 from app.services.structure_validator import structure_validator
 
 logger = logging.getLogger(__name__)
@@ -31,163 +38,31 @@ class PestanaScraper:
         self.headless = headless
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
+        self._page_lease: Optional[AsyncExitStack] = None
         self.properties: List[Dict] = []
         self.incomplete_properties: List[Dict] = []
     
     async def _setup_browser(self):
-        """Setup Playwright browser with stealth configuration."""
-        playwright = await async_playwright().start()
-        
-        # Configurações de stealth para evitar detecção
-        browser = await playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-features=IsolateOrigins,site-per-process',
-                '--window-size=1920,1080',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--disable-infobars',
-                '--disable-notifications',
-            ]
-        )
-        
-        # Criar contexto com configurações de stealth
-        context = await browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='pt-BR',
-            timezone_id='America/Sao_Paulo',
-            permissions=['geolocation'],
-            extra_http_headers={
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0',
-            }
+        """Empresta uma página do pool de browsers (contexto stealth do Pestana)."""
+        self._page_lease = AsyncExitStack()
+        page = await self._page_lease.enter_async_context(
+            get_browser_pool(self.headless).page(
+                self.AUCTIONEER_ID,
+                context_options=FULL_HEADERS_CONTEXT_OPTIONS,
+                init_script=FULL_STEALTH_INIT_SCRIPT,
+            )
         )
-        
-        # Criar página
-        page = await context.new_page()
-        
-        # Injetar scripts de stealth para ocultar automação
-        await page.add_init_script("""
-            // Ocultar webdriver - método mais robusto
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => false
-            });
-            
-            // Remover webdriver do navigator
-            delete navigator.__proto__.webdriver;
-            
-            // Sobrescrever plugins com objeto real
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => {
-                    const plugins = [];
-                    for (let i = 0; i < 5; i++) {
-                        plugins.push({
-                            name: `Plugin ${i}`,
-                            description: `Description ${i}`,
-                            filename: `plugin${i}.dll`
-                        });
-                    }
-                    return plugins;
-                }
-            });
-            
-            // Sobrescrever languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['pt-BR', 'pt', 'en-US', 'en']
-            });
-            
-            // Sobrescrever permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-            
-            // Ocultar chrome com propriedades completas
-            window.chrome = {
-                runtime: {},
-                loadTimes: function() {},
-                csi: function() {},
-                app: {}
-            };
-            
-            // Sobrescrever getBattery
-            if (navigator.getBattery) {
-                navigator.getBattery = () => Promise.resolve({
-                    charging: true,
-                    chargingTime: 0,
-                    dischargingTime: Infinity,
-                    level: 1
-                });
-            }
-            
-            // Sobrescrever platform
-            Object.defineProperty(navigator, 'platform', {
-                get: () => 'Win32'
-            });
-            
-            // Sobrescrever hardwareConcurrency
-            Object.defineProperty(navigator, 'hardwareConcurrency', {
-                get: () => 8
-            });
-            
-            // Sobrescrever deviceMemory
-            Object.defineProperty(navigator, 'deviceMemory', {
-                get: () => 8
-            });
-            
-            // Sobrescrever maxTouchPoints
-            Object.defineProperty(navigator, 'maxTouchPoints', {
-                get: () => 0
-            });
-            
-            // Adicionar propriedades que navegadores reais têm
-            Object.defineProperty(navigator, 'vendor', {
-                get: () => 'Google Inc.'
-            });
-            
-            // Sobrescrever onLine
-            Object.defineProperty(navigator, 'onLine', {
-                get: () => true
-            });
-            
-            // Sobrescrever cookieEnabled
-            Object.defineProperty(navigator, 'cookieEnabled', {
-                get: () => true
-            });
-        """)
-        
-        self.browser = browser
+        self.browser = page.context.browser
         self.page = page
-        self.playwright = playwright
         
         return page
     
     async def _close_browser(self):
-        """Close the browser."""
-        if self.page:
-            await self.page.close()
-            self.page = None
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
-        if hasattr(self, 'playwright'):
-            await self.playwright.stop()
+        """Devolve a página ao pool (o browser continua aberto)."""
+        lease, self._page_lease = self._page_lease, None
+        self.page = None
+        if lease is not None:
+            await lease.aclose()
     
     def _parse_price(self, price_str: str) -> Optional[float]:
         """Parse Brazilian currency format to float."""
@@ -239,8 +114,12 @@ class PestanaScraper:
         """
         Scrape properties from Pestana Leilões.
         Método síncrono que chama a versão assíncrona internamente.
+        
+        Roda no loop de fundo do pool de browsers (run_sync) e reaproveita o
+        Chromium entre execuções. Não pode ser chamado de dentro de um loop
+        de eventos rodando: lá, use await asyncio.to_thread(...).
         """
-        return asyncio.run(self._scrape_properties_async(max_properties))
+        return run_sync(self._scrape_properties_async(max_properties))
     
     async def _scrape_properties_async(self, max_properties: Optional[int] = None) -> List[Dict]:
         """Scrape properties from Pestana Leilões (versão assíncrona)."""
@@ -553,7 +432,7 @@ class PestanaScraper:
 async def main():
     """Test the scraper."""
     scraper = PestanaScraper(headless=True)
-    properties = await scraper.scrape_properties(max_properties=10)
+    properties = scraper.scrape_properties(max_properties=10)
     
     print("\n" + "="*50)
     print("SCRAPED PROPERTIES:")
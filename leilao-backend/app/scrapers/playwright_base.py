@@ -7,15 +7,19 @@ import asyncio
 import logging
 import re
 from typing import Dict, List, Optional, Set
+from contextlib import AsyncExitStack
 from datetime import datetime
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from playwright.async_api import Browser, Page, BrowserContext
+
+from app.services.browser_pool import get_browser_pool, run_sync
 
 logger = logging.getLogger(__name__)
 
 class PlaywrightBaseScraper:
     """
     Base class para scrapers Playwright com:
+    - Páginas emprestadas do pool de browsers (app/services/browser_pool.py)
     - Stealth mode (bypass anti-bot)
     - Detecção automática de paginação
     - Extração de todas as páginas
@@ -65,7 +69,7 @@ class PlaywrightBaseScraper:
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self.playwright = None
+        self._page_lease: Optional[AsyncExitStack] = None
         
         # Paginação
         self.detected_page_param = None
@@ -73,57 +77,26 @@ class PlaywrightBaseScraper:
         self.seen_urls: Set[str] = set()
     
     async def _setup_browser(self):
-        """Configura browser com stealth mode."""
-        self.playwright = await async_playwright().start()
-        
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-blink-features=AutomationControlled',
-                '--disable-features=IsolateOrigins,site-per-process',
-                '--window-size=1920,1080',
-            ]
-        )
-        
-        self.context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='pt-BR',
-            timezone_id='America/Sao_Paulo',
-            extra_http_headers={
-                'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            }
+        """Pega uma página do pool de browsers (contexto do site com stealth)."""
+        self._page_lease = AsyncExitStack()
+        site = self.AUCTIONEER_ID or urlparse(self.BASE_URL).netloc
+        self.page = await self._page_lease.enter_async_context(
+            get_browser_pool(self.headless).page(site)
         )
+        self.context = self.page.context
+        self.browser = self.context.browser
         
-        self.page = await self.context.new_page()
-        
-        # Scripts de stealth
-        await self.page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => false });
-            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-            Object.defineProperty(navigator, 'languages', { get: () => ['pt-BR', 'pt', 'en-US', 'en'] });
-            window.chrome = { runtime: {} };
-        """)
-        
-        logger.info("✅ Browser configurado com stealth mode")
+        logger.info("✅ Página do pool de browsers (stealth mode)")
     
     async def _close_browser(self):
-        """Fecha o browser."""
-        try:
-            if self.page:
-                await self.page.close()
-            if self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
-        except:
-            pass
+        """Devolve a página ao pool (o browser continua aberto)."""
+        lease, self._page_lease = self._page_lease, None
+        self.page = None
+        if lease is not None:
+            try:
+                await lease.aclose()
+            except Exception as e:
+                logger.debug(f"Erro ao devolver página ao pool: {e}")
     
     
     async def _scroll_page(self):
@@ -511,6 +484,6 @@ class PlaywrightBaseScraper:
         return properties
     
     def scrape(self, max_properties: int = None, max_pages: int = None) -> List[Dict]:
-        """Wrapper síncrono."""
-        return asyncio.run(self.scrape_async(max_properties, max_pages))
+        """Wrapper síncrono (no loop de fundo do pool: o Chromium é reaproveitado)."""
+        return run_sync(self.scrape_async(max_properties, max_pages))
 
@@ -3,120 +3,87 @@ Playwright Scraper - Scraper base usando Playwright para automação de browser.
 """
 import asyncio
 import logging
+from contextlib import AsyncExitStack
 from typing import Optional, Dict, Any, List
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import Browser, BrowserContext, Page
+
+from app.services.browser_pool import FULL_HEADERS_CONTEXT_OPTIONS, get_browser_pool
 
 logger = logging.getLogger(__name__)
 
+# Scripts de stealth para ocultar automação
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    window.chrome = {
+        runtime: {}
+    };
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['pt-BR', 'pt', 'en-US', 'en']
+    });
+"""
+
 
 class PlaywrightScraper:
     """Scraper base usando Playwright para automação de browser."""
     
-    def __init__(self, headless: bool = True, timeout: float = 30000.0):
+    def __init__(self, headless: bool = True, timeout: float = 30000.0, site: str = "playwright_scraper"):
         """
         Inicializa o scraper Playwright.
         
         Args:
             headless: Se deve executar em modo headless
             timeout: Timeout em milissegundos para ações do Playwright
+            site: Chave do contexto no pool de browsers (cookies por site)
         """
         self.headless = headless
         self.timeout = timeout
-        self.playwright = None
+        self.site = site
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._page_lease: Optional[AsyncExitStack] = None
     
     async def start(self) -> bool:
         """
-        Inicia o browser Playwright.
+        Empresta uma página do pool de browsers.
         
         Returns:
             True se iniciou com sucesso, False caso contrário
         """
         try:
-            self.playwright = await async_playwright().start()
-            
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                    '--window-size=1920,1080',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--disable-infobars',
-                    '--disable-notifications',
-                ]
-            )
-            
-            self.context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='pt-BR',
-                timezone_id='America/Sao_Paulo',
-                permissions=['geolocation'],
-                extra_http_headers={
-                    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0',
-                }
+            self._page_lease = AsyncExitStack()
+            self.page = await self._page_lease.enter_async_context(
+                get_browser_pool(self.headless).page(
+                    self.site,
+                    context_options=FULL_HEADERS_CONTEXT_OPTIONS,
+                    init_script=STEALTH_SCRIPT,
+                )
             )
-            
-            self.page = await self.context.new_page()
-            
-            # Injetar scripts de stealth para ocultar automação
-            await self.page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                window.chrome = {
-                    runtime: {}
-                };
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['pt-BR', 'pt', 'en-US', 'en']
-                });
-            """)
+            self.context = self.page.context
+            self.browser = self.context.browser
             
             logger.info("Browser Playwright iniciado com sucesso")
             return True
             
         except Exception as e:
             logger.error(f"Erro ao iniciar browser Playwright: {e}")
+            await self.stop()
             return False
     
     async def stop(self) -> None:
-        """Para e fecha o browser Playwright."""
+        """Devolve a página ao pool (o browser continua aberto)."""
+        lease, self._page_lease = self._page_lease, None
+        self.page = None
+        self.context = None
+        self.browser = None
         try:
-            if self.page:
-                await self.page.close()
-                self.page = None
-            
-            if self.context:
-                await self.context.close()
-                self.context = None
-            
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-            
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
+            if lease is not None:
+                await lease.aclose()
             
             logger.info("Browser Playwright fechado")
         except Exception as e:
@@ -6,6 +6,7 @@ import asyncio
 import re
 import logging
 import unicodedata
+from contextlib import AsyncExitStack
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
@@ -17,6 +18,8 @@ except ImportError:  # pragma: no cover - optional dependency
     Page = None
     BrowserContext = None
 
+from app.services.browser_pool import get_browser_pool, run_sync
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,60 +36,40 @@ class PortalZukScraperV2:
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._page_lease: Optional[AsyncExitStack] = None
         self.properties: List[Dict] = []
 
     def scrape_properties(self, max_properties: Optional[int] = None) -> List[Dict]:
-        """Synchronous entrypoint for compatibility with the scraper system."""
-        return asyncio.run(self._scrape_async(max_properties))
+        """Synchronous entrypoint for compatibility with the scraper system.
+
+        Runs on the browser pool's background loop (run_sync) and reuses
+        Chromium across runs. Not callable from a running event loop: there,
+        use ``await asyncio.to_thread(scraper.scrape_properties, ...)``.
+        """
+        return run_sync(self._scrape_async(max_properties))
 
     async def _setup_browser(self) -> None:
-        """Configure Playwright browser with stealth settings."""
+        """Borrow a page from the shared browser pool (stealth context)."""
         if async_playwright is None:
             raise RuntimeError(
                 "Playwright is not installed. Run: pip install playwright && playwright install chromium"
             )
 
-        playwright = await async_playwright().start()
-
-        self.browser = await playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-features=IsolateOrigins,site-per-process",
-                "--window-size=1920,1080",
-            ],
-        )
-
-        self.context = await self.browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            locale="pt-BR",
-            timezone_id="America/Sao_Paulo",
-        )
-
-        # Basic stealth overrides
-        await self.context.add_init_script(
-            """
-            Object.defineProperty(navigator, 'webdriver', { get: () => false });
-            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-            Object.defineProperty(navigator, 'languages', { get: () => ['pt-BR', 'pt', 'en-US', 'en'] });
-            window.chrome = { runtime: {} };
-            """
+        # Own site key: PortalZukScraperPlaywright keeps "portal_zuk" with
+        # full headers, and context options only apply when it is created
+        self._page_lease = AsyncExitStack()
+        self.page = await self._page_lease.enter_async_context(
+            get_browser_pool(self.headless).page(f"{self.AUCTIONEER_ID}_v2")
         )
-
-        self.page = await self.context.new_page()
+        self.context = self.page.context
+        self.browser = self.context.browser
 
     async def _close_browser(self) -> None:
-        """Close Playwright browser."""
-        if self.browser:
-            await self.browser.close()
+        """Return the page to the pool (the browser stays up)."""
+        lease, self._page_lease = self._page_lease, None
+        self.page = None
+        if lease is not None:
+            await lease.aclose()
 
     async def _scrape_async(self, max_properties: Optional[int] = None) -> List[Dict]:
         """Async implementation of the scraping flow."""
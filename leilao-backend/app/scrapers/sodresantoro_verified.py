@@ -8,11 +8,12 @@ URL /imoveis já filtra apenas imóveis.
 import httpx
 import logging
 import re
-from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
 from datetime import datetime
 from urllib.parse import urljoin
 
+from app.utils.html_parser import make_soup
+
 logger = logging.getLogger(__name__)
 
 class SodreSantoroScraper:
@@ -112,7 +113,7 @@ class SodreSantoroScraper:
                         logger.warning(f"  ⚠️ HTTP {response.status_code}")
                         break
                     
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = make_soup(response.text)
                     
                     # Tentar múltiplos seletores - priorizar links de lote
                     cards = []
@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 import requests
 
 from app.models.property import Property, PropertyCategory, AuctionType
+from app.utils.http_cache import cached_get_sync, get_http_cache
 
 logger = logging.getLogger(__name__)
 
@@ -180,8 +181,10 @@ class SuperbidScraper:
         url = f"{self.CATEGORY_URL}?searchType=opened&pageNumber={page}&pageSize={page_size}"
         
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            response = cached_get_sync(self.session, url, timeout=30)
+            if response.status_code != 200:
+                logger.error(f"Category page {page} returned HTTP {response.status_code}")
+                return []
             
             data = self._extract_next_data(response.text)
             if not data:
@@ -224,14 +227,21 @@ class SuperbidScraper:
         for url in base_urls_to_try:
             try:
                 self._delay(0.5, 1.0)
-                response = self.session.get(url, allow_redirects=True, timeout=30)
+                response = cached_get_sync(self.session, url, allow_redirects=True, timeout=30)
                 
                 if response.status_code == 200 and '/oferta/' in response.url:
-                    final_url = response.url
-                    data = self._extract_next_data(response.text)
+                    cache = get_http_cache()
+                    # Page unchanged since the last run (304 or same hash): reuse the parsed data
+                    prop_data = cache.get_derived(url, response.content_hash) if response.unchanged else None
+                    if prop_data is None:
+                        data = self._extract_next_data(response.text)
+                        prop_data = self._parse_property_from_next_data(data, response.url) if data else None
+                        if prop_data:
+                            cache.set_derived(url, response.content_hash, prop_data)
                     
-                    if data:
-                        return self._parse_property_from_next_data(data, final_url)
+                    if prop_data:
+                        prop_data['unchanged'] = response.unchanged
+                        return prop_data
                         
             except Exception as e:
                 logger.warning(f"Failed to fetch {url}: {e}")
@@ -372,7 +382,8 @@ class SuperbidScraper:
                         result.total_incomplete += 1
                         continue
                         
-                    if verify_urls:
+                    # An unchanged page was just revalidated at this same URL
+                    if verify_urls and not prop_data.get('unchanged'):
                         if not self._verify_url(prop_data['auctioneer_url']):
                             logger.warning(f"Property {offer_id} has invalid URL")
                             prop_data['missing_fields'] = ['invalid_url']
@@ -9,7 +9,6 @@ Execução: python -m app.scrapers.universal_scraper_v2
 """
 
 import asyncio
-import httpx
 import json
 import os
 import sys
@@ -18,7 +17,9 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+
+from app.utils.html_parser import HtmlDocument, find_by_class, parse_html
+from app.utils.http_client import get_http_client
 
 # Configurar logging
 logging.basicConfig(
@@ -27,6 +28,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+PROPERTY_LINK_PATTERN = re.compile(r'/imovel|/lote|/item|/detalhes', re.I)
+
 
 class UniversalScraperV2:
     """Scraper universal V2 que usa resultados do discovery."""
@@ -70,34 +73,32 @@ class UniversalScraperV2:
                 url = urljoin(website, path)
                 
                 try:
-                    async with httpx.AsyncClient(
-                        timeout=self.timeout,
-                        follow_redirects=True,
-                        verify=False
-                    ) as client:
-                        
-                        response = await client.get(url, headers=self.headers)
-                        
-                        if response.status_code != 200:
-                            continue
-                        
-                        html = response.text
-                        if not html or len(html) < 1000:
-                            continue
-                        
-                        # Parsear HTML
-                        soup = BeautifulSoup(html, 'lxml')
-                        
-                        # Tentar extrair propriedades
-                        site_properties = self._extract_properties(
-                            soup, name, website, selectors
-                        )
-                        
-                        if site_properties:
-                            properties.extend(site_properties)
-                            logger.info(f"{name}: {len(site_properties)} imoveis encontrados em {url}")
-                            break
-                        
+                    client = get_http_client(verify=False, scope="universal_scraper_v2")
+                    
+                    response = await client.get(
+                        url, headers=self.headers, timeout=self.timeout, follow_redirects=True
+                    )
+                    
+                    if response.status_code != 200:
+                        continue
+                    
+                    html = response.text
+                    if not html or len(html) < 1000:
+                        continue
+                    
+                    # Parsear HTML
+                    soup = parse_html(html)
+                    
+                    # Tentar extrair propriedades
+                    site_properties = self._extract_properties(
+                        soup, name, website, selectors
+                    )
+                    
+                    if site_properties:
+                        properties.extend(site_properties)
+                        logger.info(f"{name}: {len(site_properties)} imoveis encontrados em {url}")
+                        break
+                    
                 except Exception as e:
                     logger.debug(f"{name}: Erro ao tentar {url}: {e}")
                     continue
@@ -109,7 +110,7 @@ class UniversalScraperV2:
         
         return properties
     
-    def _extract_properties(self, soup: BeautifulSoup, source: str, base_url: str, selectors: Dict) -> List[Dict]:
+    def _extract_properties(self, soup: HtmlDocument, source: str, base_url: str, selectors: Dict) -> List[Dict]:
         """Extrai propriedades do HTML usando seletores."""
         
         properties = []
@@ -133,7 +134,7 @@ class UniversalScraperV2:
         
         if not cards:
             # Fallback: procurar por links que parecem ser de imóveis
-            links = soup.find_all('a', href=re.compile(r'/imovel|/lote|/item|/detalhes', re.I))
+            links = [a for a in soup.select('a[href]') if PROPERTY_LINK_PATTERN.search(a.get('href', ''))]
             if links:
                 # Criar cards falsos a partir dos links
                 for link in links[:20]:  # Limitar a 20
@@ -161,8 +162,8 @@ class UniversalScraperV2:
         # Título
         title_elem = (
             card.select_one(selectors.get('title', 'h2, h3, h4, [class*="title"]')) or
-            card.find(['h2', 'h3', 'h4']) or
-            card.find(class_=re.compile(r'title|titulo', re.I))
+            card.select_one('h2, h3, h4') or
+            find_by_class(card, r'title|titulo')
         )
         title = title_elem.get_text(strip=True) if title_elem else ''
         
@@ -170,7 +171,7 @@ class UniversalScraperV2:
             return None
         
         # Link
-        link_elem = card.find('a', href=True)
+        link_elem = card.select_one('a[href]')
         link = ''
         if link_elem:
             href = link_elem.get('href', '')
@@ -179,7 +180,7 @@ class UniversalScraperV2:
         # Preço
         price_elem = (
             card.select_one(selectors.get('price', '[class*="price"], [class*="valor"]')) or
-            card.find(class_=re.compile(r'price|valor|lance|preco', re.I))
+            find_by_class(card, r'price|valor|lance|preco')
         )
         price_text = price_elem.get_text(strip=True) if price_elem else ''
         price = self._parse_price(price_text)
@@ -187,12 +188,12 @@ class UniversalScraperV2:
         # Localização
         location_elem = (
             card.select_one(selectors.get('location', '[class*="location"], [class*="cidade"]')) or
-            card.find(class_=re.compile(r'location|local|cidade|endereco', re.I))
+            find_by_class(card, r'location|local|cidade|endereco')
         )
         location = location_elem.get_text(strip=True) if location_elem else ''
         
         # Imagem
-        img_elem = card.find('img', src=True)
+        img_elem = card.select_one('img[src]')
         image_url = ''
         if img_elem:
             src = img_elem.get('src', '')
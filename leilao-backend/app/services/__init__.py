@@ -1,6 +1,8 @@
 import os
 from dotenv import load_dotenv
 
+from app.utils.lazy import LazyObject
+
 # Carregar .env ANTES de qualquer outra coisa
 load_dotenv()
 
@@ -13,19 +15,30 @@ load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 USE_SQLITE = os.getenv("USE_SQLITE", "false").lower() == "true"
 
-if DATABASE_URL:
-    # Use PostgreSQL (Supabase)
-    from .postgres_database import get_postgres_database
-    db = get_postgres_database()
-elif USE_SQLITE:
-    # Use SQLite for local persistent storage
-    from .sqlite_database import get_sqlite_database
-    db = get_sqlite_database()
-else:
+def _create_database():
+    if DATABASE_URL:
+        # Use PostgreSQL (Supabase)
+        from .postgres_database import get_postgres_database
+        return get_postgres_database()
+    if USE_SQLITE:
+        # Use SQLite for local persistent storage
+        from .sqlite_database import get_sqlite_database
+        return get_sqlite_database()
     # Use in-memory database as fallback
-    from .database import InMemoryDatabase
-    db = InMemoryDatabase()
+    from .database import get_in_memory_database
+    return get_in_memory_database()
+
+
+# O backend (conexão, CREATE TABLE, carga de dados) só é construído no
+# primeiro uso ou em init_database(), chamado no startup da API
+db = LazyObject(_create_database, name="db")
+
+
+def init_database():
+    """Constrói o backend de banco se ainda não foi construído."""
+    return db.resolve()
+
 
 from .deduplication import DeduplicationService
 
-__all__ = ["db", "DeduplicationService"]
+__all__ = ["db", "init_database", "DeduplicationService"]
@@ -1,9 +1,10 @@
 import os
 import json
-import httpx
 import logging
 from typing import Dict, List, Optional
 
+from app.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
@@ -425,58 +426,58 @@ Retorne APENAS um JSON válido com:
 Se não conseguir determinar algum campo, use null."""
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "gpt-4o-mini",
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.1,
-                        "max_tokens": 200
-                    },
-                    timeout=30.0
-                )
+            client = get_http_client(scope="openai")
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "gpt-4o-mini",
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0.1,
+                    "max_tokens": 200
+                },
+                timeout=30.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                
+                # Validar resposta da API antes de acessar campos
+                if not result or 'choices' not in result or len(result['choices']) == 0:
+                    logger.warning(f"Resposta vazia ou inválida da OpenAI")
+                    return data  # Retorna dados originais sem normalização
                 
-                if response.status_code == 200:
-                    result = response.json()
+                message = result['choices'][0].get('message', {})
+                content = message.get('content', '')
+                if not content or not isinstance(content, str):
+                    logger.warning(f"Content vazio ou inválido na resposta da OpenAI")
+                    return data  # Retorna dados originais sem normalização
+                
+                # Extrair JSON da resposta
+                try:
+                    # Remove possíveis marcadores de código
+                    content = content.replace('```json', '').replace('```', '').strip()
+                    ai_data = json.loads(content)
                     
-                    # Validar resposta da API antes de acessar campos
-                    if not result or 'choices' not in result or len(result['choices']) == 0:
-                        logger.warning(f"Resposta vazia ou inválida da OpenAI")
-                        return data  # Retorna dados originais sem normalização
+                    # Mesclar dados da IA com os originais
+                    if ai_data.get('category') and ai_data['category'] in self.VALID_CATEGORIES:
+                        data['category'] = ai_data['category']
                     
-                    message = result['choices'][0].get('message', {})
-                    content = message.get('content', '')
-                    if not content or not isinstance(content, str):
-                        logger.warning(f"Content vazio ou inválido na resposta da OpenAI")
-                        return data  # Retorna dados originais sem normalização
+                    if ai_data.get('city') and not data.get('city'):
+                        data['city'] = ai_data['city']
                     
-                    # Extrair JSON da resposta
-                    try:
-                        # Remove possíveis marcadores de código
-                        content = content.replace('```json', '').replace('```', '').strip()
-                        ai_data = json.loads(content)
-                        
-                        # Mesclar dados da IA com os originais
-                        if ai_data.get('category') and ai_data['category'] in self.VALID_CATEGORIES:
-                            data['category'] = ai_data['category']
-                        
-                        if ai_data.get('city') and not data.get('city'):
-                            data['city'] = ai_data['city']
-                        
-                        if ai_data.get('state') and not data.get('state'):
-                            data['state'] = ai_data['state']
-                        
-                        if ai_data.get('address_normalized'):
-                            data['address'] = ai_data['address_normalized']
-                        
-                    except json.JSONDecodeError:
-                        logger.warning(f"Erro ao parsear resposta da IA: {content}")
-                
+                    if ai_data.get('state') and not data.get('state'):
+                        data['state'] = ai_data['state']
+                    
+                    if ai_data.get('address_normalized'):
+                        data['address'] = ai_data['address_normalized']
+                    
+                except json.JSONDecodeError:
+                    logger.warning(f"Erro ao parsear resposta da IA: {content}")
+            
         except Exception as e:
             logger.error(f"Erro na normalização IA: {e}")
         
@@ -516,54 +517,54 @@ Retorne APENAS um JSON array com objetos no formato:
 ]"""
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "gpt-4o-mini",
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.1,
-                        "max_tokens": 1000
-                    },
-                    timeout=60.0
-                )
+            client = get_http_client(scope="openai")
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "gpt-4o-mini",
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0.1,
+                    "max_tokens": 1000
+                },
+                timeout=60.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
                 
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    # Validar resposta da API antes de acessar campos
-                    if not result or 'choices' not in result or len(result['choices']) == 0:
-                        logger.warning(f"Resposta vazia ou inválida da OpenAI no batch")
-                        return batch  # Retorna dados originais sem normalização
-                    
-                    message = result['choices'][0].get('message', {})
-                    content = message.get('content', '')
-                    if not content or not isinstance(content, str):
-                        logger.warning(f"Content vazio ou inválido na resposta da OpenAI no batch")
-                        return batch  # Retorna dados originais sem normalização
-                    
-                    content = content.replace('```json', '').replace('```', '').strip()
-                    
-                    ai_results = json.loads(content)
-                    
-                    # Aplicar resultados da IA
-                    for ai_item in ai_results:
-                        idx = ai_item.get('index')
-                        if idx is not None:
-                            # Encontrar o item original
-                            for orig_idx, orig_data in needs_ai:
-                                if orig_idx == idx:
-                                    if ai_item.get('category') in self.VALID_CATEGORIES:
-                                        batch[orig_idx]['category'] = ai_item['category']
-                                    if ai_item.get('city'):
-                                        batch[orig_idx]['city'] = ai_item['city']
-                                    if ai_item.get('state'):
-                                        batch[orig_idx]['state'] = ai_item['state']
-                                    break
+                # Validar resposta da API antes de acessar campos
+                if not result or 'choices' not in result or len(result['choices']) == 0:
+                    logger.warning(f"Resposta vazia ou inválida da OpenAI no batch")
+                    return batch  # Retorna dados originais sem normalização
+                
+                message = result['choices'][0].get('message', {})
+                content = message.get('content', '')
+                if not content or not isinstance(content, str):
+                    logger.warning(f"Content vazio ou inválido na resposta da OpenAI no batch")
+                    return batch  # Retorna dados originais sem normalização
+                
+                content = content.replace('```json', '').replace('```', '').strip()
+                
+                ai_results = json.loads(content)
+                
+                # Aplicar resultados da IA
+                for ai_item in ai_results:
+                    idx = ai_item.get('index')
+                    if idx is not None:
+                        # Encontrar o item original
+                        for orig_idx, orig_data in needs_ai:
+                            if orig_idx == idx:
+                                if ai_item.get('category') in self.VALID_CATEGORIES:
+                                    batch[orig_idx]['category'] = ai_item['category']
+                                if ai_item.get('city'):
+                                    batch[orig_idx]['city'] = ai_item['city']
+                                if ai_item.get('state'):
+                                    batch[orig_idx]['state'] = ai_item['state']
+                                break
         
         except Exception as e:
             logger.error(f"Erro na normalização IA batch: {e}")
@@ -1,9 +1,11 @@
 import os
-import httpx
 from datetime import datetime, timedelta
 from typing import Optional
 import logging
 
+from app.services.entitlement_cache import get_entitlement_cache
+from app.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 ASAAS_API_KEY = os.environ.get('ASAAS_API_KEY')
@@ -44,35 +46,35 @@ class AsaasService:
         if phone:
             payload["phone"] = phone
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{ASAAS_BASE_URL}/customers",
-                json=payload,
-                headers=self.headers,
-                timeout=30.0
-            )
-            
-            if response.status_code in [200, 201]:
-                data = response.json()
-                return {"success": True, "customer_id": data["id"]}
-            else:
-                logger.error(f"Erro ao criar cliente Asaas: {response.text}")
-                return {"success": False, "error": response.text}
+        client = get_http_client(scope="asaas")
+        response = await client.post(
+            f"{ASAAS_BASE_URL}/customers",
+            json=payload,
+            headers=self.headers,
+            timeout=30.0
+        )
+        
+        if response.status_code in [200, 201]:
+            data = response.json()
+            return {"success": True, "customer_id": data["id"]}
+        else:
+            logger.error(f"Erro ao criar cliente Asaas: {response.text}")
+            return {"success": False, "error": response.text}
     
     async def _get_customer_by_email(self, email: str) -> Optional[dict]:
         """Busca cliente pelo email"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{ASAAS_BASE_URL}/customers",
-                params={"email": email},
-                headers=self.headers,
-                timeout=30.0
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("data") and len(data["data"]) > 0:
-                    return data["data"][0]
+        client = get_http_client(scope="asaas")
+        response = await client.get(
+            f"{ASAAS_BASE_URL}/customers",
+            params={"email": email},
+            headers=self.headers,
+            timeout=30.0
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("data") and len(data["data"]) > 0:
+                return data["data"][0]
         return None
     
     async def create_payment_link(
@@ -125,42 +127,42 @@ class AsaasService:
         if plan == "yearly":
             payload["maxInstallmentCount"] = 12
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{ASAAS_BASE_URL}/subscriptions",
-                json=payload,
-                headers=self.headers,
-                timeout=30.0
-            )
-            
-            if response.status_code in [200, 201]:
-                data = response.json()
-                # Asaas pode retornar invoiceUrl na resposta ou pode precisar buscar a primeira fatura
-                checkout_url = data.get("invoiceUrl") or data.get("url")
-                # Se não tem URL direta, tentar buscar a primeira fatura da assinatura
-                if not checkout_url and data.get("id"):
-                    # Criar um link temporário - na prática, o Asaas gera uma fatura automaticamente
-                    # que pode ser acessada via dashboard do cliente
-                    checkout_url = f"https://www.asaas.com/c/{customer_id}"
-                return {
-                    "success": True,
-                    "subscription_id": data["id"],
-                    "checkout_url": checkout_url,
-                    "customer_id": customer_id
-                }
-            else:
-                logger.error(f"Erro ao criar assinatura Asaas: {response.text}")
-                return {"success": False, "error": response.text}
+        client = get_http_client(scope="asaas")
+        response = await client.post(
+            f"{ASAAS_BASE_URL}/subscriptions",
+            json=payload,
+            headers=self.headers,
+            timeout=30.0
+        )
+        
+        if response.status_code in [200, 201]:
+            data = response.json()
+            # Asaas pode retornar invoiceUrl na resposta ou pode precisar buscar a primeira fatura
+            checkout_url = data.get("invoiceUrl") or data.get("url")
+            # Se não tem URL direta, tentar buscar a primeira fatura da assinatura
+            if not checkout_url and data.get("id"):
+                # Criar um link temporário - na prática, o Asaas gera uma fatura automaticamente
+                # que pode ser acessada via dashboard do cliente
+                checkout_url = f"https://www.asaas.com/c/{customer_id}"
+            return {
+                "success": True,
+                "subscription_id": data["id"],
+                "checkout_url": checkout_url,
+                "customer_id": customer_id
+            }
+        else:
+            logger.error(f"Erro ao criar assinatura Asaas: {response.text}")
+            return {"success": False, "error": response.text}
     
     async def cancel_subscription(self, subscription_id: str) -> dict:
         """Cancela uma assinatura"""
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{ASAAS_BASE_URL}/subscriptions/{subscription_id}",
-                headers=self.headers,
-                timeout=30.0
-            )
-            return {"success": response.status_code in [200, 204]}
+        client = get_http_client(scope="asaas")
+        response = await client.delete(
+            f"{ASAAS_BASE_URL}/subscriptions/{subscription_id}",
+            headers=self.headers,
+            timeout=30.0
+        )
+        return {"success": response.status_code in [200, 204]}
     
     def handle_webhook(self, payload: dict, db) -> dict:
         """Processa webhook do Asaas"""
@@ -219,6 +221,7 @@ class AsaasService:
                 """, (plan, end_date, user_id))
             conn.commit()
         
+        get_entitlement_cache().invalidate(user_id)
         logger.info(f"Assinatura ativada para user {user_id}, plano {plan}")
     
     def _mark_payment_overdue(self, user_id: str, db):
@@ -232,6 +235,8 @@ class AsaasService:
                     WHERE id = %s::uuid
                 """, (user_id,))
             conn.commit()
+        
+        get_entitlement_cache().invalidate(user_id)
     
     def _cancel_user_subscription(self, user_id: str, db):
         """Cancela assinatura"""
@@ -245,6 +250,8 @@ class AsaasService:
                     WHERE id = %s::uuid
                 """, (user_id,))
             conn.commit()
+        
+        get_entitlement_cache().invalidate(user_id)
 
 
 # Instância global
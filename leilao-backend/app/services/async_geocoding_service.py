@@ -17,10 +17,11 @@ import re
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from dataclasses import dataclass
-import httpx
 
 from supabase import create_client, Client
 
+from app.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 # Configuração
@@ -170,44 +171,44 @@ class AsyncGeocodingService:
         await self._rate_limit()
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                params = {
-                    "q": query,
-                    "format": "json",
-                    "limit": 1,
-                    "countrycodes": "br",
-                    "addressdetails": 1
-                }
-                
-                headers = {
-                    "User-Agent": "LeiloHub/1.0 (https://leilohub.com.br)"
-                }
-                
-                response = await client.get(NOMINATIM_URL, params=params, headers=headers)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if data and len(data) > 0:
-                        result = data[0]
-                        return GeocodingResult(
-                            success=True,
-                            latitude=float(result["lat"]),
-                            longitude=float(result["lon"]),
-                            source="nominatim"
-                        )
-                    else:
-                        return GeocodingResult(success=False, error="Endereço não encontrado")
-                
-                elif response.status_code == 429:
-                    return GeocodingResult(success=False, error="Rate limit exceeded")
+            client = get_http_client(scope="geocoding")
+            params = {
+                "q": query,
+                "format": "json",
+                "limit": 1,
+                "countrycodes": "br",
+                "addressdetails": 1
+            }
+            
+            headers = {
+                "User-Agent": "LeiloHub/1.0 (https://leilohub.com.br)"
+            }
+            
+            response = await client.get(NOMINATIM_URL, params=params, headers=headers, timeout=10.0)
+            
+            if response.status_code == 200:
+                data = response.json()
                 
-                else:
+                if data and len(data) > 0:
+                    result = data[0]
                     return GeocodingResult(
-                        success=False, 
-                        error=f"HTTP {response.status_code}"
+                        success=True,
+                        latitude=float(result["lat"]),
+                        longitude=float(result["lon"]),
+                        source="nominatim"
                     )
-                    
+                else:
+                    return GeocodingResult(success=False, error="Endereço não encontrado")
+            
+            elif response.status_code == 429:
+                return GeocodingResult(success=False, error="Rate limit exceeded")
+            
+            else:
+                return GeocodingResult(
+                    success=False, 
+                    error=f"HTTP {response.status_code}"
+                )
+                
         except Exception as e:
             logger.error(f"Erro no geocoding: {e}")
             return GeocodingResult(success=False, error=str(e))
@@ -0,0 +1,248 @@
+"""
+Índice de autocomplete para cidades e bairros.
+
+/api/filters/cities e /api/filters/neighborhoods retornam listas completas
+(milhares de municípios com a Caixa carregada) e o frontend filtra no cliente.
+Este índice mantém em memória arrays ordenados de chaves normalizadas
+(minúsculas, sem acento) por escopo - global, por estado e por cidade - e
+responde prefixos com bisect, retornando os top-k por número de imóveis.
+
+O índice é reconstruído quando a versão do dataset muda
+(db.get_dataset_version), verificada no máximo a cada VERSION_CHECK_INTERVAL
+segundos. A reconstrução roda em thread separada; enquanto isso as buscas
+continuam respondendo com o índice anterior.
+"""
+
+import heapq
+import logging
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+AUTOCOMPLETE_FIELDS = ("city", "neighborhood")
+
+
+def fold_text(text: Optional[str]) -> str:
+    """Normaliza texto para comparação: minúsculas, sem acentos, espaços colapsados."""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.lower().split())
+
+
+@dataclass
+class _Scope:
+    """Array ordenado de chaves normalizadas de um escopo (ex.: cidades de SP)."""
+    keys: List[str] = field(default_factory=list)
+    entries: List[dict] = field(default_factory=list)
+    counts: List[int] = field(default_factory=list)
+    top: List[int] = field(default_factory=list)  # índices ordenados por count desc
+
+
+def _build_scope(items: Dict[tuple, dict]) -> _Scope:
+    """Monta um escopo a partir de {chave_agregada: entry}."""
+    ordered = sorted(items.values(), key=lambda e: (e["_key"], -e["count"]))
+    scope = _Scope(
+        keys=[e["_key"] for e in ordered],
+        entries=[{k: v for k, v in e.items() if not k.startswith("_")} for e in ordered],
+        counts=[e["count"] for e in ordered],
+    )
+    scope.top = sorted(range(len(ordered)), key=lambda i: -scope.counts[i])
+    return scope
+
+
+def _add(bucket: Dict[tuple, dict], key: tuple, folded: str, entry: dict, count: int, variants: Dict[tuple, Dict[str, int]]):
+    """Agrega contagens; a grafia exibida é a variante com mais imóveis."""
+    current = bucket.get(key)
+    if current is None:
+        bucket[key] = {**entry, "count": count, "_key": folded}
+    else:
+        current["count"] += count
+
+    spelled = variants.setdefault(key, {})
+    spelled[entry["value"]] = spelled.get(entry["value"], 0) + count
+    best = max(spelled.items(), key=lambda kv: kv[1])[0]
+    bucket[key]["value"] = best
+
+
+class AutocompleteIndex:
+    """
+    Índice de prefixo (array ordenado + bisect) para cidades e bairros.
+
+    Escopos:
+        ("city", None)                      -> todas as cidades (por estado)
+        ("city", "SP")                      -> cidades de SP
+        ("neighborhood", None)              -> todos os bairros
+        ("neighborhood", "SP")              -> bairros de SP
+        ("neighborhood", "SP", "campinas")  -> bairros de Campinas/SP
+    """
+
+    VERSION_CHECK_INTERVAL = 60.0  # segundos entre verificações de versão
+
+    def __init__(self, db=None):
+        """
+        Args:
+            db: Backend de banco de dados (usa app.services.db se não fornecido)
+        """
+        self._db = db
+        self._scopes: Dict[tuple, _Scope] = {}
+        self._version: Optional[str] = None
+        self._last_check = 0.0
+        self._built_at: Optional[float] = None
+        self._build_seconds = 0.0
+        self._lock = threading.Lock()
+        self._rebuilding = False
+        self.queries = 0
+
+    @property
+    def db(self):
+        if self._db is None:
+            from app.services import db
+            self._db = db
+        return self._db
+
+    # ==================== Build ====================
+
+    def build(self, rows: Iterable[Tuple[str, str, Optional[str], int]]) -> None:
+        """Reconstrói o índice a partir de linhas (state, city, neighborhood, count)."""
+        started = time.perf_counter()
+        buckets: Dict[tuple, Dict[tuple, dict]] = {}
+        variants: Dict[tuple, Dict[str, int]] = {}
+
+        for state, city, neighborhood, count in rows:
+            if not city:
+                continue
+            uf = (state or "").upper()
+            city_key = fold_text(city)
+            city_entry = {"value": city, "state": uf}
+            for scope in (("city", None), ("city", uf)):
+                _add(buckets.setdefault(scope, {}), (uf, city_key), city_key,
+                     city_entry, count, variants.setdefault(scope, {}))
+
+            if neighborhood:
+                nb_key = fold_text(neighborhood)
+                nb_entry = {"value": neighborhood, "state": uf, "city": city}
+                for scope in (("neighborhood", None), ("neighborhood", uf), ("neighborhood", uf, city_key)):
+                    _add(buckets.setdefault(scope, {}), (uf, city_key, nb_key), nb_key,
+                         nb_entry, count, variants.setdefault(scope, {}))
+
+        scopes = {scope: _build_scope(items) for scope, items in buckets.items()}
+
+        # Troca atômica - buscas em andamento continuam com o índice antigo
+        self._scopes = scopes
+        self._built_at = time.time()
+        self._build_seconds = time.perf_counter() - started
+        logger.info(f"Autocomplete index rebuilt: {len(scopes)} scopes in {self._build_seconds * 1000:.1f}ms")
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reconstrói o índice se a versão do dataset mudou.
+
+        Returns:
+            True se o índice foi reconstruído
+        """
+        with self._lock:
+            self._last_check = time.monotonic()
+        version = self.db.get_dataset_version()
+        if not force and version == self._version and self._built_at is not None:
+            return False
+        self.build(self.db.get_location_counts())
+        self._version = version
+        return True
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"Erro ao atualizar índice de autocomplete: {e}")
+        finally:
+            self._rebuilding = False
+
+    def _ensure_fresh(self) -> None:
+        """Primeira busca constrói o índice; depois, verificação em background."""
+        if self._built_at is None:
+            self.refresh(force=True)
+            return
+        if time.monotonic() - self._last_check < self.VERSION_CHECK_INTERVAL:
+            return
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+            self._last_check = time.monotonic()
+        threading.Thread(target=self._refresh_in_background, daemon=True).start()
+
+    # ==================== Query ====================
+
+    def search(
+        self,
+        field: str,
+        query: str,
+        state: Optional[str] = None,
+        city: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[dict]:
+        """
+        Busca valores que começam com `query` (sem acento / case-insensitive).
+
+        Args:
+            field: 'city' ou 'neighborhood'
+            query: Prefixo digitado pelo usuário
+            state: UF para restringir a busca
+            city: Cidade para restringir bairros (requer state)
+            limit: Máximo de resultados (ordenados por número de imóveis)
+        """
+        if field not in AUTOCOMPLETE_FIELDS:
+            raise ValueError(f"Campo inválido para autocomplete: {field}")
+
+        self._ensure_fresh()
+        self.queries += 1
+
+        uf = state.upper() if state else None
+        if field == "neighborhood" and uf and city:
+            scope_key = ("neighborhood", uf, fold_text(city))
+        else:
+            scope_key = (field, uf)
+
+        scope = self._scopes.get(scope_key)
+        if scope is None:
+            return []
+
+        prefix = fold_text(query)
+        if not prefix:
+            return [dict(scope.entries[i]) for i in scope.top[:limit]]
+
+        lo = bisect_left(scope.keys, prefix)
+        hi = bisect_left(scope.keys, prefix + "\uffff", lo)
+        best = heapq.nlargest(limit, range(lo, hi), key=scope.counts.__getitem__)
+        return [dict(scope.entries[i]) for i in best]
+
+    def get_stats(self) -> dict:
+        """Retorna estatísticas do índice."""
+        return {
+            "version": self._version,
+            "scopes": len(self._scopes),
+            "cities": len(self._scopes.get(("city", None), _Scope()).keys),
+            "neighborhoods": len(self._scopes.get(("neighborhood", None), _Scope()).keys),
+            "built_at": self._built_at,
+            "build_ms": round(self._build_seconds * 1000, 2),
+            "queries": self.queries,
+        }
+
+
+# Instância global
+_autocomplete_index: Optional[AutocompleteIndex] = None
+
+
+def get_autocomplete_index() -> AutocompleteIndex:
+    """Obtém a instância global do índice de autocomplete."""
+    global _autocomplete_index
+    if _autocomplete_index is None:
+        _autocomplete_index = AutocompleteIndex()
+    return _autocomplete_index
@@ -19,6 +19,8 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 
+from app.services.event_bus import publish_event
+
 logger = logging.getLogger(__name__)
 
 
@@ -207,6 +209,7 @@ class AutonomousScheduler:
                 json.dump(self.status.to_dict(), f, indent=2)
         except Exception as e:
             logger.error(f"Error saving status: {e}")
+        publish_event("scheduler", "status", self.status.to_dict())
     
     def start(self) -> None:
         """Start the autonomous scheduler."""
@@ -696,13 +699,15 @@ class AutonomousScheduler:
                 logger.error(f"Error loading jobs: {e}")
         return {}
     
-    def _save_jobs(self, jobs: Dict[str, ScraperJobStatus]) -> None:
-        """Save scraper jobs to file."""
+    def _save_jobs(self, jobs: Dict[str, ScraperJobStatus], job_id: Optional[str] = None) -> None:
+        """Save scraper jobs to file and publish the updated job to the event bus."""
         try:
             with open(self.JOBS_FILE, 'w') as f:
                 json.dump({k: v.to_dict() for k, v in jobs.items()}, f, indent=2)
         except Exception as e:
             logger.error(f"Error saving jobs: {e}")
+        if job_id:
+            publish_event("scheduler", "job", self._summarize_job(job_id, jobs))
     
     def start_background_scraping(self, max_per_scraper: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -737,7 +742,7 @@ class AutonomousScheduler:
                 scraper_name=scraper_name,
                 status="pending",
             )
-        self._save_jobs(jobs)
+        self._save_jobs(jobs, job_id)
         
         # Start background thread
         def run_scrapers_background():
@@ -767,7 +772,7 @@ class AutonomousScheduler:
                     
                     jobs[job_key].status = "running"
                     jobs[job_key].started_at = datetime.now().isoformat()
-                    self._save_jobs(jobs)
+                    self._save_jobs(jobs, job_id)
                     
                     logger.info(f"Background job: Starting {config['name']}")
                     
@@ -811,7 +816,7 @@ class AutonomousScheduler:
                     jobs[job_key].status = "completed"
                     jobs[job_key].completed_at = datetime.now().isoformat()
                     jobs[job_key].properties_scraped = len(properties)
-                    self._save_jobs(jobs)
+                    self._save_jobs(jobs, job_id)
                     
                     logger.info(f"Background job: Completed {config['name']} - {len(properties)} properties")
                     self.status.jobs_completed_today += 1
@@ -832,7 +837,7 @@ class AutonomousScheduler:
                     jobs[job_key].status = "failed"
                     jobs[job_key].completed_at = datetime.now().isoformat()
                     jobs[job_key].error = str(e)
-                    self._save_jobs(jobs)
+                    self._save_jobs(jobs, job_id)
                     self.status.jobs_failed_today += 1
                 
                 # Small delay between scrapers
@@ -858,8 +863,10 @@ class AutonomousScheduler:
     
     def get_job_status(self, job_id: str) -> Dict[str, Any]:
         """Get status of a background scraping job."""
-        jobs = self._load_jobs()
-        
+        return self._summarize_job(job_id, self._load_jobs())
+    
+    def _summarize_job(self, job_id: str, jobs: Dict[str, ScraperJobStatus]) -> Dict[str, Any]:
+        """Aggregate the per-scraper entries of a job."""
         # Filter jobs by job_id
         job_statuses = [
             v.to_dict() for k, v in jobs.items() 
@@ -8,9 +8,13 @@ import logging
 from datetime import datetime
 from typing import Optional, List
 from app.services.postgres_database import PostgresDatabase
+from app.services.event_bus import publish_event
 
 logger = logging.getLogger(__name__)
 
+# Publica progresso no event bus a cada N imóveis
+PROGRESS_EVERY = 10
+
 class BackgroundGeocodingService:
     """
     Serviço que processa geocoding em background, sem bloquear requisições HTTP.
@@ -23,6 +27,10 @@ class BackgroundGeocodingService:
         self.error_count = 0
         self.start_time: Optional[datetime] = None
         
+    def _publish(self, type: str, **extra) -> None:
+        """Publica o status atual no tópico `geocoding` do event bus."""
+        publish_event("geocoding", type, {**self.get_status(), **extra})
+        
     async def get_pending_properties(self, limit: int = 100) -> List[dict]:
         """
         Busca imóveis que precisam de geocoding.
@@ -53,7 +61,7 @@ class BackgroundGeocodingService:
         Geocodifica um único imóvel usando Nominatim.
         Respeita rate limit de 1 req/segundo.
         """
-        import httpx
+        from app.utils.http_client import get_http_client
         
         # Monta o endereço completo
         parts = []
@@ -70,28 +78,29 @@ class BackgroundGeocodingService:
         full_address = ', '.join(filter(None, parts))
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    'https://nominatim.openstreetmap.org/search',
-                    params={
-                        'q': full_address,
-                        'format': 'json',
-                        'limit': 1,
-                        'countrycodes': 'br'
-                    },
-                    headers={
-                        'User-Agent': 'LeiloHub/1.0 (contato@leilohub.com.br)'
+            client = get_http_client(scope="geocoding")
+            response = await client.get(
+                'https://nominatim.openstreetmap.org/search',
+                params={
+                    'q': full_address,
+                    'format': 'json',
+                    'limit': 1,
+                    'countrycodes': 'br'
+                },
+                headers={
+                    'User-Agent': 'LeiloHub/1.0 (contato@leilohub.com.br)'
+                },
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                if data and len(data) > 0:
+                    return {
+                        'latitude': float(data[0]['lat']),
+                        'longitude': float(data[0]['lon'])
                     }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data and len(data) > 0:
-                        return {
-                            'latitude': float(data[0]['lat']),
-                            'longitude': float(data[0]['lon'])
-                        }
-                        
+                    
         except Exception as e:
             logger.error(f"Erro no geocoding de '{full_address}': {e}")
             
@@ -148,8 +157,11 @@ class BackgroundGeocodingService:
                 }
             
             logger.info(f"Iniciando geocoding de {len(properties)} imóveis")
+            self._publish("started", total=len(properties))
             
-            for prop in properties:
+            for i, prop in enumerate(properties, 1):
+                if i % PROGRESS_EVERY == 0:
+                    self._publish("progress", current=i, total=len(properties))
                 try:
                     coords = await self.geocode_single(prop)
                     
@@ -187,6 +199,7 @@ class BackgroundGeocodingService:
             
         finally:
             self.is_running = False
+            self._publish("finished")
     
     def get_status(self) -> dict:
         """
@@ -207,7 +220,9 @@ def get_geocoding_service() -> BackgroundGeocodingService:
     """Retorna a instância do serviço de geocoding."""
     global background_geocoding_service
     if background_geocoding_service is None:
-        raise RuntimeError("BackgroundGeocodingService não foi inicializado")
+        # Inicialização sob demanda (o main.py não inicializa mais no import)
+        from app.services import db
+        init_geocoding_service(db)
     return background_geocoding_service
 
 def init_geocoding_service(db: PostgresDatabase):
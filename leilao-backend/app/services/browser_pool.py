@@ -0,0 +1,680 @@
+"""
+Pool de browsers compartilhado pelos scrapers Playwright.
+
+Cada execução de PlaywrightBaseScraper (e do PortalZukScraperPlaywright)
+subia seu próprio Chromium, contexto e página: segundos de launch e
+centenas de MB por execução. Aqui os scrapers pegam páginas emprestadas:
+
+    async with get_browser_pool().page("megaleiloes") as page:
+        await page.goto(url)
+
+- os browsers vivem enquanto o event loop viver (BROWSER_POOL_SIZE por
+  loop; Playwright não atravessa event loops). Os wrappers síncronos usam
+  run_sync(), que roda tudo num loop de fundo compartilhado: execuções
+  seguidas de scrapers diferentes reaproveitam o mesmo Chromium;
+- cada site tem um contexto isolado (cookies, cache, storage), criado uma
+  vez com as opções de stealth e o init script (context.add_init_script);
+  os sites são distribuídos entre os browsers do pool;
+- páginas devolvidas voltam para about:blank e são reaproveitadas; depois
+  de BROWSER_PAGE_MAX_NAVIGATIONS navegações (ou se travarem) são fechadas
+  e recriadas. Contextos ociosos por BROWSER_CONTEXT_IDLE_TTL são fechados;
+- BROWSER_POOL_MAX_MEMORY_MB limita o RSS somado dos processos filhos
+  (Chromium + driver, lido de /proc; aproximado, só Linux): acima dele as
+  páginas ociosas são fechadas e, se não bastar, o browser mais antigo é
+  aposentado (fecha quando a última página emprestada voltar);
+- browser que cai (disconnected) é descartado e o próximo empréstimo sobe
+  outro; se o launch falhar, o driver do Playwright é reiniciado uma vez.
+
+BROWSER_POOL_MAX_PAGES limita as páginas emprestadas ao mesmo tempo por
+browser; acima disso page() espera uma ser devolvida.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+BROWSER_POOL_MAX_PAGES = int(os.getenv("BROWSER_POOL_MAX_PAGES", "4"))
+BROWSER_PAGE_MAX_NAVIGATIONS = int(os.getenv("BROWSER_PAGE_MAX_NAVIGATIONS", "50"))
+BROWSER_CONTEXT_IDLE_TTL = float(os.getenv("BROWSER_CONTEXT_IDLE_TTL", "600"))
+# 0 = sem limite de memória
+BROWSER_POOL_MAX_MEMORY_MB = int(os.getenv("BROWSER_POOL_MAX_MEMORY_MB", "1500"))
+BROWSER_POOL_HEADLESS = os.getenv("BROWSER_POOL_HEADLESS", "true").lower() == "true"
+# Tempo máximo (s) que run_sync espera uma execução no loop de fundo
+BROWSER_RUN_SYNC_TIMEOUT = float(os.getenv("BROWSER_RUN_SYNC_TIMEOUT", "3600"))
+
+# Intervalo mínimo entre leituras de memória em /proc
+_MEMORY_CHECK_INTERVAL = 15.0
+
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--window-size=1920,1080',
+    '--disable-infobars',
+    '--disable-notifications',
+]
+
+DEFAULT_CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'locale': 'pt-BR',
+    'timezone_id': 'America/Sao_Paulo',
+    'extra_http_headers': {
+        'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    },
+}
+
+STEALTH_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', { get: () => false });
+    Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+    Object.defineProperty(navigator, 'languages', { get: () => ['pt-BR', 'pt', 'en-US', 'en'] });
+    window.chrome = { runtime: {} };
+"""
+
+# Headers completos de browser real e permissão de geolocalização (Portal Zuk,
+# Pestana); sobrescrevem DEFAULT_CONTEXT_OPTIONS
+FULL_HEADERS_CONTEXT_OPTIONS = {
+    'permissions': ['geolocation'],
+    'extra_http_headers': {
+        'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+        'Cache-Control': 'max-age=0',
+    },
+}
+
+# Stealth completo (plugins, chrome.*, permissions, platform, hardware...)
+FULL_STEALTH_INIT_SCRIPT = """
+    // Ocultar webdriver - método mais robusto
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => false
+    });
+
+    // Remover webdriver do navigator
+    delete navigator.__proto__.webdriver;
+
+    // Sobrescrever plugins com objeto real
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => {
+            const plugins = [];
+            for (let i = 0; i < 5; i++) {
+                plugins.push({
+                    name: `Plugin ${i}`,
+                    description: `Description ${i}`,
+                    filename: `plugin${i}.dll`
+                });
+            }
+            return plugins;
+        }
+    });
+
+    // Sobrescrever languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['pt-BR', 'pt', 'en-US', 'en']
+    });
+
+    // Sobrescrever permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+
+    // Ocultar chrome com propriedades completas
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+
+    // Sobrescrever getBattery
+    if (navigator.getBattery) {
+        navigator.getBattery = () => Promise.resolve({
+            charging: true,
+            chargingTime: 0,
+            dischargingTime: Infinity,
+            level: 1
+        });
+    }
+
+    // Sobrescrever platform
+    Object.defineProperty(navigator, 'platform', {
+        get: () => 'Win32'
+    });
+
+    // Sobrescrever hardwareConcurrency
+    Object.defineProperty(navigator, 'hardwareConcurrency', {
+        get: () => 8
+    });
+
+    // Sobrescrever deviceMemory
+    Object.defineProperty(navigator, 'deviceMemory', {
+        get: () => 8
+    });
+
+    // Sobrescrever maxTouchPoints
+    Object.defineProperty(navigator, 'maxTouchPoints', {
+        get: () => 0
+    });
+
+    // Adicionar propriedades que navegadores reais têm
+    Object.defineProperty(navigator, 'vendor', {
+        get: () => 'Google Inc.'
+    });
+
+    // Sobrescrever onLine
+    Object.defineProperty(navigator, 'onLine', {
+        get: () => true
+    });
+
+    // Sobrescrever cookieEnabled
+    Object.defineProperty(navigator, 'cookieEnabled', {
+        get: () => true
+    });
+"""
+
+
+def _children_rss_mb() -> Optional[float]:
+    """RSS somado (MB) dos processos descendentes deste (Linux, via /proc)."""
+    try:
+        parents: Dict[int, int] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "rb") as f:
+                    stat = f.read().decode(errors="replace")
+                # O nome do processo pode ter espaços: campos depois do último ')'
+                parents[int(entry)] = int(stat.rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+    except OSError:
+        return None
+
+    descendants, frontier = set(), {os.getpid()}
+    while frontier:
+        frontier = {pid for pid, ppid in parents.items() if ppid in frontier} - descendants
+        descendants |= frontier
+
+    total_kb = 0
+    for pid in descendants:
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except (OSError, ValueError):
+            continue
+    return total_kb / 1024
+
+
+@dataclass
+class _BrowserSlot:
+    browser: Any
+    launched_at: float
+    leases: int = 0
+    contexts: int = 0
+    retired: bool = False         # fecha quando a última página voltar
+
+    @property
+    def usable(self) -> bool:
+        return not self.retired and self.browser.is_connected()
+
+
+@dataclass
+class _SiteContext:
+    site: str
+    context: Any
+    slot: _BrowserSlot
+    idle_pages: List[Any] = field(default_factory=list)
+    navigations: Dict[Any, int] = field(default_factory=dict)
+    crashed: set = field(default_factory=set)
+    leases: int = 0
+    last_used: float = 0.0
+
+
+class BrowserPool:
+    """Browsers de longa duração com um contexto isolado por site."""
+
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        max_pages: int = BROWSER_POOL_MAX_PAGES,
+        max_navigations: int = BROWSER_PAGE_MAX_NAVIGATIONS,
+        max_memory_mb: int = BROWSER_POOL_MAX_MEMORY_MB,
+        context_idle_ttl: float = BROWSER_CONTEXT_IDLE_TTL,
+        headless: bool = BROWSER_POOL_HEADLESS,
+    ):
+        self.size = max(size, 1)
+        self.max_pages = max(max_pages, 1)
+        self.max_navigations = max_navigations
+        self.max_memory_mb = max_memory_mb
+        self.context_idle_ttl = context_idle_ttl
+        self.headless = headless
+        self._playwright = None
+        self._slots: List[_BrowserSlot] = []
+        self._contexts: Dict[str, _SiteContext] = {}
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.size * self.max_pages)
+        self._memory_checked_at = 0.0
+        self._rss_mb: Optional[float] = None
+        self._stats = {
+            "leases": 0,
+            "browser_launches": 0,
+            "browser_crashes": 0,
+            "browsers_retired": 0,
+            "playwright_restarts": 0,
+            "contexts_created": 0,
+            "contexts_closed": 0,
+            "pages_created": 0,
+            "pages_reused": 0,
+            "pages_recycled": 0,
+            "page_crashes": 0,
+            "memory_recycles": 0,
+        }
+
+    @asynccontextmanager
+    async def page(
+        self,
+        site: str,
+        context_options: Optional[Dict[str, Any]] = None,
+        init_script: Optional[str] = STEALTH_INIT_SCRIPT,
+    ):
+        """
+        Empresta uma página do contexto do site (criando-o se preciso).
+
+        Args:
+            site: Identificador do site (AUCTIONEER_ID); define o contexto
+            context_options: Opções de new_context, só usadas ao criar o
+                contexto (sobrescrevem DEFAULT_CONTEXT_OPTIONS)
+            init_script: Script de stealth aplicado uma vez ao contexto
+        """
+        await self._semaphore.acquire()
+        try:
+            ctx, page = await self._checkout(site, context_options, init_script)
+            try:
+                yield page
+            finally:
+                await self._checkin(ctx, page)
+        finally:
+            self._semaphore.release()
+
+    async def _checkout(self, site: str, context_options, init_script):
+        async with self._lock:
+            ctx = self._contexts.get(site)
+            if ctx is not None and not ctx.slot.usable:
+                # Browser aposentado ou caído: o site ganha contexto novo
+                self._contexts.pop(site)
+                await self._release_context(ctx)
+                ctx = None
+            if ctx is None:
+                ctx = await self._new_context(site, context_options, init_script)
+
+            page = None
+            while ctx.idle_pages:
+                candidate = ctx.idle_pages.pop()
+                if not candidate.is_closed():
+                    page = candidate
+                    self._stats["pages_reused"] += 1
+                    break
+            if page is None:
+                page = await ctx.context.new_page()
+                ctx.navigations[page] = 0
+                page.on("framenavigated", lambda frame, ctx=ctx, page=page: self._on_navigation(ctx, page, frame))
+                page.on("crash", lambda page, ctx=ctx: self._on_page_crash(ctx, page))
+                self._stats["pages_created"] += 1
+
+            ctx.leases += 1
+            ctx.slot.leases += 1
+            ctx.last_used = time.time()
+            self._stats["leases"] += 1
+            return ctx, page
+
+    async def _checkin(self, ctx: _SiteContext, page) -> None:
+        recycle = (
+            page.is_closed()
+            or page in ctx.crashed
+            or not ctx.slot.usable
+            or (self.max_navigations and ctx.navigations.get(page, 0) >= self.max_navigations)
+        )
+        if not recycle:
+            try:
+                # Solta o DOM e os timers do site antes de guardar a página
+                await page.goto("about:blank")
+            except Exception as e:
+                logger.debug(f"Pool de browsers: página de {ctx.site} não voltou para about:blank: {e}")
+                recycle = True
+
+        async with self._lock:
+            ctx.leases -= 1
+            ctx.slot.leases -= 1
+            ctx.last_used = time.time()
+            if recycle or not ctx.slot.usable:
+                await self._close_page(ctx, page)
+                self._stats["pages_recycled"] += 1
+            else:
+                ctx.idle_pages.append(page)
+
+            if self._contexts.get(ctx.site) is not ctx and ctx.leases == 0:
+                await self._release_context(ctx)
+            await self._close_idle_contexts()
+            await self._check_memory()
+            await self._close_retired_browsers()
+
+    def _on_navigation(self, ctx: _SiteContext, page, frame) -> None:
+        if frame == page.main_frame and frame.url != "about:blank":
+            ctx.navigations[page] = ctx.navigations.get(page, 0) + 1
+
+    def _on_page_crash(self, ctx: _SiteContext, page) -> None:
+        ctx.crashed.add(page)
+        self._stats["page_crashes"] += 1
+        logger.warning(f"Pool de browsers: página de {ctx.site} travou; será recriada")
+
+    def _on_disconnected(self, slot: _BrowserSlot) -> None:
+        if not slot.retired:
+            slot.retired = True
+            self._stats["browser_crashes"] += 1
+            logger.warning("Pool de browsers: browser caiu; o próximo empréstimo sobe outro")
+
+    async def _start_playwright(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+
+    async def _launch(self) -> _BrowserSlot:
+        if self._playwright is None:
+            await self._start_playwright()
+        try:
+            browser = await self._playwright.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
+        except Exception as e:
+            # Driver do Playwright morto (ou travado): reinicia e tenta de novo
+            logger.warning(f"Pool de browsers: launch falhou ({e}); reiniciando o Playwright")
+            self._stats["playwright_restarts"] += 1
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            await self._start_playwright()
+            browser = await self._playwright.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
+
+        slot = _BrowserSlot(browser=browser, launched_at=time.time())
+        browser.on("disconnected", lambda _browser, slot=slot: self._on_disconnected(slot))
+        self._slots.append(slot)
+        self._stats["browser_launches"] += 1
+        logger.info(f"Pool de browsers: Chromium {browser.version} iniciado ({len(self._slots)} no pool)")
+        return slot
+
+    async def _pick_slot(self) -> _BrowserSlot:
+        """Browser para um contexto novo: o menos ocupado, subindo outro se houver vaga."""
+        usable = [slot for slot in self._slots if slot.usable]
+        if len(usable) < self.size and all(slot.contexts for slot in usable):
+            return await self._launch()
+        return min(usable, key=lambda slot: (slot.contexts, slot.leases))
+
+    async def _new_context(self, site: str, context_options, init_script) -> _SiteContext:
+        slot = await self._pick_slot()
+        options = {**DEFAULT_CONTEXT_OPTIONS, **(context_options or {})}
+        context = await slot.browser.new_context(**options)
+        if init_script:
+            await context.add_init_script(init_script)
+        slot.contexts += 1
+        ctx = _SiteContext(site=site, context=context, slot=slot, last_used=time.time())
+        self._contexts[site] = ctx
+        self._stats["contexts_created"] += 1
+        logger.debug(f"Pool de browsers: contexto criado para {site}")
+        return ctx
+
+    async def _close_page(self, ctx: _SiteContext, page) -> None:
+        ctx.navigations.pop(page, None)
+        ctx.crashed.discard(page)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception:
+            pass
+
+    async def _release_context(self, ctx: _SiteContext) -> None:
+        """Fecha o contexto (se ninguém o estiver usando) e suas páginas ociosas."""
+        if ctx.leases:
+            return
+        for page in ctx.idle_pages:
+            await self._close_page(ctx, page)
+        ctx.idle_pages.clear()
+        try:
+            if ctx.slot.browser.is_connected():
+                await ctx.context.close()
+        except Exception:
+            pass
+        ctx.slot.contexts -= 1
+        self._stats["contexts_closed"] += 1
+
+    async def _close_idle_contexts(self) -> None:
+        if not self.context_idle_ttl:
+            return
+        cutoff = time.time() - self.context_idle_ttl
+        for site, ctx in list(self._contexts.items()):
+            if ctx.leases == 0 and ctx.last_used < cutoff:
+                self._contexts.pop(site)
+                await self._release_context(ctx)
+
+    async def _check_memory(self) -> None:
+        if not self.max_memory_mb or time.time() - self._memory_checked_at < _MEMORY_CHECK_INTERVAL:
+            return
+        self._memory_checked_at = time.time()
+        self._rss_mb = await asyncio.to_thread(_children_rss_mb)
+        if self._rss_mb is None or self._rss_mb <= self.max_memory_mb:
+            return
+
+        self._stats["memory_recycles"] += 1
+        logger.warning(
+            f"Pool de browsers: {self._rss_mb:.0f} MB > {self.max_memory_mb} MB; fechando páginas ociosas"
+        )
+        for ctx in self._contexts.values():
+            for page in ctx.idle_pages:
+                await self._close_page(ctx, page)
+            ctx.idle_pages.clear()
+
+        self._rss_mb = await asyncio.to_thread(_children_rss_mb)
+        if self._rss_mb is not None and self._rss_mb > self.max_memory_mb:
+            usable = [slot for slot in self._slots if slot.usable]
+            if usable:
+                oldest = min(usable, key=lambda slot: slot.launched_at)
+                oldest.retired = True
+                self._stats["browsers_retired"] += 1
+                logger.warning("Pool de browsers: memória ainda acima do limite; aposentando o browser mais antigo")
+
+    async def _close_retired_browsers(self) -> None:
+        for slot in list(self._slots):
+            if slot.usable or slot.leases:
+                continue
+            for site, ctx in list(self._contexts.items()):
+                if ctx.slot is slot:
+                    self._contexts.pop(site)
+                    await self._release_context(ctx)
+            try:
+                if slot.browser.is_connected():
+                    await slot.browser.close()
+            except Exception:
+                pass
+            self._slots.remove(slot)
+
+    async def close(self) -> None:
+        """Fecha contextos, browsers e o driver do Playwright."""
+        async with self._lock:
+            for ctx in list(self._contexts.values()):
+                ctx.leases = 0
+                await self._release_context(ctx)
+            self._contexts.clear()
+            for slot in self._slots:
+                try:
+                    if slot.browser.is_connected():
+                        await slot.browser.close()
+                except Exception:
+                    pass
+            self._slots.clear()
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception:
+                    pass
+                self._playwright = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estatísticas do pool. Chamar no loop do pool (ver get_browser_pool_stats)."""
+        stats = dict(self._stats)
+        stats["browsers"] = len([slot for slot in self._slots if slot.usable])
+        stats["browsers_draining"] = len([slot for slot in self._slots if not slot.usable])
+        stats["pages_in_use"] = sum(slot.leases for slot in self._slots)
+        stats["rss_mb"] = round(self._rss_mb) if self._rss_mb is not None else None
+        stats["max_memory_mb"] = self.max_memory_mb
+        stats["sites"] = {
+            site: {
+                "pages_in_use": ctx.leases,
+                "idle_pages": len(ctx.idle_pages),
+                "idle_seconds": round(time.time() - ctx.last_used) if not ctx.leases else 0,
+            }
+            for site, ctx in self._contexts.items()
+        }
+        return stats
+
+
+# Um pool por event loop (e por modo headless): objetos do Playwright não
+# podem ser usados fora do loop em que foram criados
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, BrowserPool]]" = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(headless: bool = BROWSER_POOL_HEADLESS) -> BrowserPool:
+    """Obtém o pool de browsers do event loop atual."""
+    loop = asyncio.get_running_loop()
+    with _pools_lock:
+        # Loops encerrados (asyncio.run) não voltam: seus pools saem da tabela
+        for closed in [other for other in _pools if other.is_closed()]:
+            del _pools[closed]
+        pools = _pools.setdefault(loop, {})
+        if headless not in pools:
+            pools[headless] = BrowserPool(headless=headless)
+        return pools[headless]
+
+
+async def close_browser_pool() -> None:
+    """Fecha os pools de browsers do event loop atual."""
+    with _pools_lock:
+        pools = _pools.pop(asyncio.get_running_loop(), {})
+    for pool in pools.values():
+        await pool.close()
+
+
+async def _pool_stats(pool: BrowserPool) -> Dict[str, Any]:
+    return pool.get_stats()
+
+
+async def get_browser_pool_stats() -> Dict[str, Any]:
+    """
+    Estatísticas de todos os pools (loop da API e loop de fundo).
+
+    Cada pool é lido no próprio loop (run_coroutine_threadsafe): o loop de
+    fundo altera contextos e browsers enquanto a API pergunta.
+    """
+    with _pools_lock:
+        pools = [(loop, headless, pool) for loop, by_mode in _pools.items() for headless, pool in by_mode.items()]
+    current = asyncio.get_running_loop()
+    result = []
+    for loop, headless, pool in pools:
+        if loop is current:
+            stats = pool.get_stats()
+        elif loop.is_closed() or not loop.is_running():
+            continue
+        else:
+            future = asyncio.run_coroutine_threadsafe(_pool_stats(pool), loop)
+            try:
+                stats = await asyncio.wait_for(asyncio.wrap_future(future), timeout=5.0)
+            except asyncio.TimeoutError:
+                stats = {"error": "loop do pool não respondeu em 5s"}
+        result.append({"background_loop": loop is _background_loop, "headless": headless, **stats})
+    return {"pools": result}
+
+
+# Loop de fundo dos wrappers síncronos (scrape(), scrape_properties())
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="browser-pool-loop", daemon=True)
+            thread.start()
+            _background_loop = loop
+            atexit.register(_close_background_loop)
+        return _background_loop
+
+
+def _close_background_loop() -> None:
+    loop = _background_loop
+    if loop is None or loop.is_closed():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(close_browser_pool(), loop).result(timeout=30)
+    except Exception as e:
+        logger.debug(f"Pool de browsers: falha ao fechar o loop de fundo: {e}")
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def run_sync(coro, timeout: Optional[float] = None):
+    """
+    Executa a corrotina no loop de fundo do pool e espera o resultado.
+
+    Para os wrappers síncronos dos scrapers: com asyncio.run cada chamada
+    teria seu próprio loop (e seu próprio Chromium). Como asyncio.run, não
+    pode ser chamada de uma thread com event loop rodando (travaria o loop
+    durante o scrape inteiro): em código async, use
+    await asyncio.to_thread(scraper.scrape_properties, ...).
+
+    Args:
+        coro: Corrotina a executar
+        timeout: Segundos de espera (padrão BROWSER_RUN_SYNC_TIMEOUT); ao
+            estourar, a corrotina é cancelada e TimeoutError é levantado
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "run_sync() não pode ser chamada de um event loop rodando; "
+            "use await asyncio.to_thread(...) ou a versão async do scraper"
+        )
+    future = asyncio.run_coroutine_threadsafe(coro, _get_background_loop())
+    try:
+        return future.result(timeout=BROWSER_RUN_SYNC_TIMEOUT if timeout is None else timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
@@ -0,0 +1,171 @@
+"""
+Change feed - log de alterações de imóveis para sync incremental.
+
+Clientes (app mobile, parceiros) sincronizam com
+GET /api/properties/changes?since=<cursor> em vez de baixar a listagem
+inteira. Cada alteração relevante em `properties` gera uma linha no log:
+
+    insert      imóvel novo
+    update      dados alterados (datas, imagem, descrição...)
+    price_drop  menor lance disponível caiu (ver previous_*_value)
+    deactivate  imóvel saiu do site do leiloeiro
+    reactivate  imóvel voltou a aparecer
+    delete      imóvel removido do banco
+
+Alterações só de updated_at/last_seen_at (re-scrape sem mudança) não
+entram no log.
+
+O log é escrito pelo próprio banco (triggers no PostgreSQL e no SQLite),
+então captura também as escritas feitas via Supabase pelo SyncService.
+O backend em memória registra as alterações em um buffer limitado.
+
+Cursor: opaco para o cliente. No PostgreSQL é "<txid>_<seq>" (ver
+migrations/005_add_property_changes.sql); no backend em memória é
+"<época>_<seq>", com a época sorteada a cada processo; no SQLite é o seq.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, List, Optional, Tuple
+
+# Colunas cuja alteração isolada não gera entrada no log
+IGNORED_COLUMNS = ("updated_at", "last_seen_at")
+
+# Máximo de alterações mantidas pelo backend em memória
+MEMORY_CHANGE_LOG_SIZE = int(os.getenv("PROPERTY_CHANGES_MEMORY_SIZE", "100000"))
+
+# Tamanho máximo de página do endpoint
+MAX_CHANGES_PAGE = 1000
+
+
+def reference_price(first_value: Optional[float], second_value: Optional[float]) -> Optional[float]:
+    """Menor lance disponível: COALESCE(second_auction_value, first_auction_value)."""
+    return second_value if second_value is not None else first_value
+
+
+def classify_update(
+    old_active: Optional[bool],
+    new_active: Optional[bool],
+    old_price: Optional[float],
+    new_price: Optional[float],
+) -> str:
+    """Tipo de uma alteração (mesma regra do trigger do PostgreSQL)."""
+    old_active = True if old_active is None else bool(old_active)
+    new_active = True if new_active is None else bool(new_active)
+    if old_active and not new_active:
+        return "deactivate"
+    if not old_active and new_active:
+        return "reactivate"
+    if old_price is not None and new_price is not None and new_price < old_price:
+        return "price_drop"
+    return "update"
+
+
+def encode_cursor(seq: int, txid: Optional[str] = None) -> str:
+    return f"{txid}_{seq}" if txid is not None else str(seq)
+
+
+def decode_cursor(cursor: Optional[str]) -> Tuple[Optional[int], int]:
+    """
+    Decodifica um cursor em (txid, seq). Cursor vazio = início do log.
+
+    Raises:
+        ValueError: cursor malformado
+    """
+    if not cursor:
+        return None, 0
+    txid, sep, seq = cursor.partition("_")
+    if not sep:
+        return None, int(cursor)
+    return int(txid), int(seq)
+
+
+def change_row(
+    seq: int,
+    property_id: str,
+    change_type: str,
+    first_auction_value: Optional[float] = None,
+    second_auction_value: Optional[float] = None,
+    previous_first_auction_value: Optional[float] = None,
+    previous_second_auction_value: Optional[float] = None,
+    is_active: Optional[bool] = None,
+    changed_at: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+) -> dict:
+    """Formato de uma alteração na resposta da API."""
+    return {
+        "cursor": cursor or encode_cursor(seq),
+        "property_id": property_id,
+        "change_type": change_type,
+        "first_auction_value": first_auction_value,
+        "second_auction_value": second_auction_value,
+        "previous_first_auction_value": previous_first_auction_value,
+        "previous_second_auction_value": previous_second_auction_value,
+        "is_active": None if is_active is None else bool(is_active),
+        "changed_at": changed_at.isoformat() if isinstance(changed_at, datetime) else changed_at,
+    }
+
+
+class MemoryChangeLog:
+    """
+    Log de alterações do backend em memória (buffer circular).
+
+    Se o cursor do cliente for mais antigo que a alteração mais antiga
+    retida, get_changes sinaliza `reset_required` e o cliente deve
+    refazer a carga completa. O seq recomeça do zero a cada processo, por
+    isso o cursor carrega a época do processo: cursor de outra época (ou
+    à frente do head) também exige carga completa, em vez de o cliente
+    esperar em silêncio até o novo seq alcançar o antigo.
+    """
+
+    def __init__(self, max_size: int = MEMORY_CHANGE_LOG_SIZE):
+        self._entries: Deque[dict] = deque(maxlen=max_size)
+        self._seq = 0
+        self._epoch = time.time_ns() // 1000
+        self._lock = threading.Lock()
+
+    def record(self, prop, change_type: str) -> None:
+        """Registra uma alteração com os valores atuais do imóvel."""
+        with self._lock:
+            self._seq += 1
+            self._entries.append(change_row(
+                self._seq,
+                prop.id,
+                change_type,
+                prop.first_auction_value,
+                prop.second_auction_value,
+                prop.previous_first_auction_value,
+                prop.previous_second_auction_value,
+                prop.is_active,
+                datetime.utcnow(),
+                encode_cursor(self._seq, self._epoch),
+            ))
+
+    def get_changes(self, cursor: Optional[str], limit: int) -> Tuple[List[dict], str, bool, bool]:
+        """
+        Alterações após `cursor`, em ordem.
+
+        Returns:
+            (changes, next_cursor, has_more, reset_required)
+        """
+        epoch, since = decode_cursor(cursor)
+        with self._lock:
+            entries = list(self._entries)
+            head = self._seq
+        # Cursor de um processo anterior ou à frente do log: recomeça do início
+        stale = since > 0 and (epoch != self._epoch or since > head)
+        if stale:
+            since = 0
+        if not entries:
+            return [], encode_cursor(head, self._epoch), False, stale
+
+        first_seq = head - len(entries) + 1
+        reset_required = stale or since + 1 < first_seq
+        start = max(since + 1 - first_seq, 0)
+        page = entries[start:start + limit]
+        has_more = start + limit < len(entries)
+        next_cursor = page[-1]["cursor"] if page else encode_cursor(head, self._epoch)
+        return page, next_cursor, has_more, reset_required
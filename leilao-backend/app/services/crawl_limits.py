@@ -0,0 +1,136 @@
+"""
+Limites de concorrência por domínio para o ScraperOrchestrator.
+
+O scraping de cada leiloeiro (único passo que acessa o site) roda dentro
+de um slot; normalização e save ficam fora, sem segurar o domínio:
+
+    async with limits.slot(budget_key(auctioneer)):
+        properties = await universal_scraper.scrape_auctioneer(auctioneer)
+    ... normalização, save ...
+
+- um limite global de scrapes simultâneos (SCRAPER_CONCURRENCY);
+- um limite por chave de orçamento (SCRAPER_PER_DOMAIN_CONCURRENCY);
+- um intervalo mínimo entre o fim de um slot e o início do próximo na
+  mesma chave (SCRAPER_DOMAIN_DELAY), substituindo o sleep(2) global.
+
+A chave é o domínio do site, ou "platform:<tipo>" quando o leiloeiro usa
+uma plataforma white-label conhecida (PlatformType do AutonomousScheduler):
+sites diferentes da mesma plataforma batem na mesma infraestrutura e
+dividem o orçamento.
+
+O slot por domínio é adquirido antes do global, então um domínio ocupado
+não segura vagas globais enquanto espera.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_CONCURRENCY = int(os.getenv("SCRAPER_CONCURRENCY", "8"))
+SCRAPER_PER_DOMAIN_CONCURRENCY = int(os.getenv("SCRAPER_PER_DOMAIN_CONCURRENCY", "1"))
+SCRAPER_DOMAIN_DELAY = float(os.getenv("SCRAPER_DOMAIN_DELAY", "2"))
+
+# Catálogo mantido pelo AutonomousScheduler (lido direto do arquivo para
+# não importar o APScheduler)
+CATALOG_FILE = "/tmp/auctioneer_catalog.json"
+
+# Assinaturas de plataforma que aparecem na própria URL
+PLATFORM_URL_SIGNATURES = {
+    "leiloesweb.com.br": "leiloes_web",
+    "superbid": "superbid",
+    "sbwebservices.net": "superbid",
+    "megaleiloes.com.br": "mega_platform",
+}
+
+_IGNORED_PLATFORMS = ("unknown", "custom", "", None)
+
+
+def domain_of(url: Optional[str]) -> str:
+    """Host sem 'www.' (ex.: 'portalzuk.com.br')."""
+    if not url:
+        return "unknown"
+    if "://" not in url:
+        url = f"https://{url}"
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host or "unknown"
+
+
+def load_platform_catalog(path: str = CATALOG_FILE) -> Dict[str, str]:
+    """{id do leiloeiro ou domínio: platform_type} a partir do catálogo do scheduler."""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except Exception as e:
+        logger.warning(f"Erro ao ler catálogo de plataformas: {e}")
+        return {}
+    platforms = {}
+    for auc_id, info in data.items():
+        platform = info.get("platform_type")
+        if platform in _IGNORED_PLATFORMS:
+            continue
+        platforms[auc_id] = platform
+        if info.get("url"):
+            platforms[domain_of(info["url"])] = platform
+    return platforms
+
+
+def budget_key(auctioneer: Dict, platforms: Optional[Dict[str, str]] = None) -> str:
+    """Chave de orçamento do leiloeiro: plataforma white-label ou domínio."""
+    platforms = platforms or {}
+    website = auctioneer.get("website") or ""
+    domain = domain_of(website)
+
+    platform = platforms.get(auctioneer.get("id")) or platforms.get(domain)
+    if not platform:
+        lowered = website.lower()
+        platform = next((p for sig, p in PLATFORM_URL_SIGNATURES.items() if sig in lowered), None)
+    if platform and platform not in _IGNORED_PLATFORMS:
+        return f"platform:{platform}"
+    return domain
+
+
+class DomainLimits:
+    """Semáforo global + semáforo e intervalo mínimo por chave."""
+
+    def __init__(
+        self,
+        max_concurrency: int = SCRAPER_CONCURRENCY,
+        per_domain: int = SCRAPER_PER_DOMAIN_CONCURRENCY,
+        domain_delay: float = SCRAPER_DOMAIN_DELAY,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_domain = max(1, per_domain)
+        self.domain_delay = domain_delay
+        self._global = asyncio.Semaphore(self.max_concurrency)
+        self._domains: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+        self.active: Dict[str, int] = {}
+
+    @asynccontextmanager
+    async def slot(self, key: str):
+        domain_sem = self._domains.get(key)
+        if domain_sem is None:
+            domain_sem = self._domains[key] = asyncio.Semaphore(self.per_domain)
+
+        async with domain_sem:
+            wait = self._next_start.get(key, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            async with self._global:
+                self.active[key] = self.active.get(key, 0) + 1
+                try:
+                    yield
+                finally:
+                    self.active[key] -= 1
+                    if not self.active[key]:
+                        del self.active[key]
+                    self._next_start[key] = time.monotonic() + self.domain_delay
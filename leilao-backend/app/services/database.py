@@ -13,6 +13,10 @@ import os
 import logging
 from app.models.property import Property, PropertyCreate, PropertyFilter, PropertyCategory, AuctionType
 from app.models.auctioneer import Auctioneer, AuctioneerCreate
+from app.services.spatial_index import VersionedGeoIndex
+from app.services.facets import FacetBitmapIndex, SORT_FIELDS, iter_bits, mask_from_positions
+from app.services.change_feed import MemoryChangeLog, classify_update, reference_price
+from app.utils.lazy import LazyObject
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +66,16 @@ class InMemoryDatabase:
         self.auctioneers: Dict[str, Auctioneer] = {}
         # Index for O(1) deduplication lookups: normalized_source_url -> property_id
         self.properties_by_source: Dict[str, str] = {}
+        # Grade espacial para busca por raio (reconstruída quando o dataset muda)
+        self._geo_index = VersionedGeoIndex(
+            loader=lambda: [(p.id, p.latitude, p.longitude) for p in self.properties.values()],
+            version_fn=self.get_dataset_version,
+        )
+        # Bitmaps de facetas para /api/search (reconstruídos quando o dataset muda)
+        self._facet_index: Optional[FacetBitmapIndex] = None
+        self._facet_version: Optional[str] = None
+        # Log de alterações para /api/properties/changes (cargas iniciais não entram)
+        self._change_log = MemoryChangeLog()
         
         # Try to load from persistence first
         if self._load_from_disk():
@@ -221,6 +235,7 @@ class InMemoryDatabase:
         )
         
         self.properties[property_id] = property_obj
+        self._change_log.record(property_obj, "insert")
         
         # Update auctioneer property count
         if property_data.auctioneer_id in self.auctioneers:
@@ -231,15 +246,8 @@ class InMemoryDatabase:
     def get_property(self, property_id: str) -> Optional[Property]:
         return self.properties.get(property_id)
     
-    def get_properties(
-        self,
-        filters: Optional[PropertyFilter] = None,
-        skip: int = 0,
-        limit: int = 18,
-    ) -> tuple[List[Property], int]:
-        """Get properties with optional filtering and pagination."""
-        properties = list(self.properties.values())
-        
+    def _apply_filters(self, properties: List[Property], filters: Optional[PropertyFilter]) -> List[Property]:
+        """Apply a PropertyFilter to a list of properties."""
         if filters:
             # Filter by state
             if filters.state:
@@ -291,6 +299,17 @@ class InMemoryDatabase:
             if not filters.include_duplicates:
                 properties = [p for p in properties if not p.is_duplicate]
         
+        return properties
+    
+    def get_properties(
+        self,
+        filters: Optional[PropertyFilter] = None,
+        skip: int = 0,
+        limit: int = 18,
+    ) -> tuple[List[Property], int]:
+        """Get properties with optional filtering and pagination."""
+        properties = self._apply_filters(list(self.properties.values()), filters)
+        
         # Sort by discount percentage (highest first)
         properties.sort(key=lambda p: p.discount_percentage or 0, reverse=True)
         
@@ -299,12 +318,91 @@ class InMemoryDatabase:
         
         return paginated, total
     
+    def get_properties_near(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        filters: Optional[PropertyFilter] = None,
+        skip: int = 0,
+        limit: int = 18,
+    ) -> tuple[List[tuple[Property, float]], int]:
+        """
+        Get properties within radius_km of (lat, lng), nearest first.
+        
+        Returns:
+            ([(property, distance_km)], total)
+        """
+        candidates = self._geo_index.get().query_radius(lat, lng, radius_km)
+        distances = {prop_id: distance for distance, prop_id in candidates}
+        nearby = [self.properties[prop_id] for _, prop_id in candidates if prop_id in self.properties]
+        
+        # _apply_filters preserves order, so results stay sorted by distance
+        nearby = self._apply_filters(nearby, filters or PropertyFilter())
+        
+        page = nearby[skip:skip + limit]
+        return [(p, distances[p.id]) for p in page], len(nearby)
+    
+    def _get_facet_index(self) -> FacetBitmapIndex:
+        version = self.get_dataset_version()
+        if self._facet_index is None or version != self._facet_version:
+            self._facet_index = FacetBitmapIndex(self.properties.values())
+            self._facet_version = version
+        return self._facet_index
+    
+    def search_with_facets(
+        self,
+        filters: Optional[PropertyFilter] = None,
+        skip: int = 0,
+        limit: int = 18,
+        sort_by: str = "discount_percentage",
+        sort_order: str = "desc",
+    ) -> tuple[List[Property], int, dict]:
+        """
+        Get a page of properties plus facet counts under the same filters.
+        
+        Equality filters are ANDed bitmaps; range/text filters are applied
+        to the remaining candidates only.
+        
+        Returns:
+            (properties, total, facets)
+        """
+        filters = filters or PropertyFilter()
+        index = self._get_facet_index()
+        
+        mask = index.all if filters.include_duplicates else index.not_duplicate
+        for field in FacetBitmapIndex.EQUALITY_FIELDS:
+            value = getattr(filters, field)
+            if value:
+                mask &= index.equality_mask(field, value.value if hasattr(value, "value") else value)
+        
+        residual = PropertyFilter(
+            neighborhood=filters.neighborhood,
+            min_value=filters.min_value,
+            max_value=filters.max_value,
+            min_discount=filters.min_discount,
+            search_term=filters.search_term,
+            include_duplicates=True,
+        )
+        if any([residual.neighborhood, residual.min_value, residual.max_value,
+                residual.min_discount, residual.search_term]):
+            positions = list(iter_bits(mask))
+            kept = {id(p) for p in self._apply_filters([index.items[i] for i in positions], residual)}
+            mask = mask_from_positions(i for i in positions if id(index.items[i]) in kept)
+        
+        if sort_by not in SORT_FIELDS:
+            sort_by = "discount_percentage"
+        page = index.page(mask, sort_by, sort_order.lower() == "desc", skip, limit)
+        
+        return page, mask.bit_count(), index.facet_counts(mask)
+    
     def delete_property(self, property_id: str) -> bool:
         if property_id in self.properties:
             prop = self.properties[property_id]
             if prop.auctioneer_id in self.auctioneers:
                 self.auctioneers[prop.auctioneer_id].property_count -= 1
             del self.properties[property_id]
+            self._change_log.record(prop, "delete")
             return True
         return False
     
@@ -345,6 +443,7 @@ class InMemoryDatabase:
         
         # Add to database
         self.properties[prop.id] = prop
+        self._change_log.record(prop, "insert")
         
         # Update the URL index
         if normalized:
@@ -366,6 +465,7 @@ class InMemoryDatabase:
         Tracks value changes and updates last_seen_at.
         """
         now = datetime.utcnow()
+        before = self._change_snapshot(existing)
         
         # Track value changes
         value_changed = False
@@ -405,6 +505,32 @@ class InMemoryDatabase:
         if existing.deactivated_at:
             logger.info(f"Property {existing.id} reactivated (was deactivated at {existing.deactivated_at})")
             existing.deactivated_at = None
+        
+        if self._change_snapshot(existing) != before:
+            self._change_log.record(existing, classify_update(
+                before[-1], existing.is_active,
+                reference_price(before[0], before[1]),
+                reference_price(existing.first_auction_value, existing.second_auction_value),
+            ))
+    
+    @staticmethod
+    def _change_snapshot(prop: Property) -> tuple:
+        """Campos alterados por _update_property_from_scraper (is_active por último)."""
+        return (
+            prop.first_auction_value, prop.second_auction_value,
+            prop.first_auction_date, prop.second_auction_date,
+            prop.discount_percentage, prop.image_url, prop.evaluation_value,
+            prop.is_active,
+        )
+    
+    def get_changes(self, cursor: Optional[str] = None, limit: int = 100) -> tuple:
+        """
+        Get property changes after `cursor` in commit order.
+        
+        Returns:
+            (changes, next_cursor, has_more, reset_required)
+        """
+        return self._change_log.get_changes(cursor, limit)
     
     def mark_inactive_properties(self, auctioneer_id: str, seen_urls: set, scrape_time: datetime = None) -> dict:
         """
@@ -441,6 +567,7 @@ class InMemoryDatabase:
                     prop.deactivated_at = scrape_time
                     prop.updated_at = scrape_time
                     deactivated += 1
+                    self._change_log.record(prop, "deactivate")
                     logger.info(f"Property {prop.id} marked as inactive (not seen in scraper run)")
                 else:
                     already_inactive += 1
@@ -673,6 +800,21 @@ class InMemoryDatabase:
             "category_counts": category_counts,
             "state_counts": dict(sorted(state_counts.items(), key=lambda x: x[1], reverse=True)[:10]),
         }
+    
+    def get_location_counts(self) -> List[tuple]:
+        """Get (state, city, neighborhood, count) for non-duplicate properties."""
+        counts: Dict[tuple, int] = {}
+        for p in self.properties.values():
+            if p.is_duplicate or not p.city:
+                continue
+            key = (p.state, p.city, p.neighborhood)
+            counts[key] = counts.get(key, 0) + 1
+        return [(state, city, neighborhood, count) for (state, city, neighborhood), count in counts.items()]
+    
+    def get_dataset_version(self) -> str:
+        """Get a cheap fingerprint that changes whenever properties change."""
+        latest = max((p.updated_at for p in self.properties.values() if p.updated_at), default=None)
+        return f"{len(self.properties)}:{latest.isoformat() if latest else None}"
 
 
     def _load_sample_properties(self):
@@ -879,5 +1021,16 @@ class InMemoryDatabase:
             return False
 
 
-# Global database instance
-db = InMemoryDatabase()
+# Instância global (construída no primeiro uso: carrega o dataset de exemplo)
+_in_memory_db: Optional[InMemoryDatabase] = None
+
+
+def get_in_memory_database() -> InMemoryDatabase:
+    """Get the singleton in-memory database instance."""
+    global _in_memory_db
+    if _in_memory_db is None:
+        _in_memory_db = InMemoryDatabase()
+    return _in_memory_db
+
+
+db = LazyObject(get_in_memory_database, name="db")
@@ -0,0 +1,125 @@
+"""
+Entitlement cache - cache curto de permissões de acesso por usuário.
+
+Cada visualização de detalhe de imóvel chama /api/user/check-access, que
+executa can_view_property() + SELECT em user_profiles. O resultado muda
+raramente (pagamento, cancelamento, consumo de view do trial), então
+guardamos em memória com TTL curto e invalidamos explicitamente quando
+o webhook do Asaas ou o incremento de views alteram o perfil.
+
+Nota: o cache é por processo. Em múltiplas instâncias a invalidação
+só atinge a instância local - o TTL limita a janela de inconsistência.
+"""
+
+import os
+import time
+import threading
+import logging
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# TTL padrão em segundos (configurável via env)
+DEFAULT_TTL_SECONDS = float(os.getenv("ENTITLEMENT_CACHE_TTL", "60"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("ENTITLEMENT_CACHE_MAX_ENTRIES", "10000"))
+
+
+class EntitlementCache:
+    """
+    Cache TTL de permissões de acesso, indexado por user_id.
+
+    Thread-safe: o webhook do Asaas roda em código síncrono e os endpoints
+    de usuário em async, então protegemos o dict com um Lock simples.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            ttl_seconds: Tempo de vida de cada entrada
+            max_entries: Máximo de usuários em cache (entradas mais antigas são descartadas)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._entries: Dict[str, Tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, user_id: str) -> Optional[dict]:
+        """Retorna a permissão em cache, ou None se ausente/expirada."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if now >= expires_at:
+                del self._entries[user_id]
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(value)
+
+    def set(self, user_id: str, value: dict) -> None:
+        """Armazena a permissão de um usuário."""
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if user_id not in self._entries and len(self._entries) >= self.max_entries:
+                self._evict_locked()
+            self._entries[user_id] = (expires_at, dict(value))
+
+    def invalidate(self, user_id: str) -> None:
+        """Remove a permissão de um usuário (perfil mudou)."""
+        with self._lock:
+            if self._entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+        logger.debug(f"Entitlement invalidado para user {user_id}")
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        with self._lock:
+            self._entries.clear()
+
+    def _evict_locked(self) -> None:
+        """Descarta entradas expiradas; se não bastar, a que expira primeiro."""
+        now = time.monotonic()
+        expired = [uid for uid, (exp, _) in self._entries.items() if exp <= now]
+        for uid in expired:
+            del self._entries[uid]
+        if len(self._entries) >= self.max_entries:
+            oldest = min(self._entries, key=lambda uid: self._entries[uid][0])
+            del self._entries[oldest]
+
+    def get_stats(self) -> dict:
+        """Retorna estatísticas do cache."""
+        with self._lock:
+            size = len(self._entries)
+        total = self.hits + self.misses
+        return {
+            "size": size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# Instância global
+_entitlement_cache: Optional[EntitlementCache] = None
+
+
+def get_entitlement_cache() -> EntitlementCache:
+    """Obtém a instância global do cache de permissões."""
+    global _entitlement_cache
+    if _entitlement_cache is None:
+        _entitlement_cache = EntitlementCache()
+    return _entitlement_cache
@@ -0,0 +1,213 @@
+"""
+Event bus em processo para progresso de scraping, sync e geocoding.
+
+ScraperOrchestrator, AutonomousScheduler, SyncService e
+BackgroundGeocodingService publicam eventos aqui; GET /api/events entrega
+os eventos via Server-Sent Events com assinatura por tópico. Substitui o
+polling de /api/scraper/status, /api/scheduler/job-status/{job_id},
+/api/admin/geocoding/status etc.
+
+Tópicos:
+    scraper    ScraperOrchestrator (run_all, run_all_smart, run_single)
+    scheduler  AutonomousScheduler (status e jobs em background)
+    sync       SyncService
+    geocoding  BackgroundGeocodingService
+
+publish() pode ser chamado de qualquer thread (o job do scheduler roda
+em Thread própria): a entrega para cada assinante é agendada no event
+loop dele. O payload é serializado uma única vez na publicação.
+
+Ao conectar, o assinante recebe o último evento de cada tópico (estado
+atual, dispensando o primeiro poll) ou, se enviar Last-Event-ID, os
+eventos perdidos que ainda estão no histórico.
+
+Nota: o bus é por processo. Com vários workers, cada worker só vê os
+eventos dos jobs que ele próprio executa.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+TOPICS = ("scraper", "scheduler", "sync", "geocoding")
+
+# Eventos mantidos para replay via Last-Event-ID
+EVENT_BUS_HISTORY = int(os.getenv("EVENT_BUS_HISTORY", "500"))
+# Fila por assinante; cliente lento perde os eventos mais antigos
+EVENT_BUS_QUEUE_SIZE = int(os.getenv("EVENT_BUS_QUEUE_SIZE", "256"))
+
+
+class Event:
+    """Evento publicado (payload já serializado em JSON)."""
+
+    __slots__ = ("id", "topic", "type", "data", "timestamp")
+
+    def __init__(self, id: int, topic: str, type: str, data: str, timestamp: float):
+        self.id = id
+        self.topic = topic
+        self.type = type
+        self.data = data
+        self.timestamp = timestamp
+
+    def to_sse(self) -> str:
+        """Formata o evento no protocolo SSE (o nome do evento é o tópico)."""
+        return f"id: {self.id}\nevent: {self.topic}\ndata: {self.data}\n\n"
+
+
+class Subscription:
+    """Fila de eventos de um cliente SSE, ligada ao event loop que a criou."""
+
+    def __init__(self, topics: Set[str], queue_size: int):
+        self.topics = topics
+        self.dropped = 0
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def _put(self, event: Event) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    def push(self, event: Event) -> None:
+        """Entrega o evento a partir de qualquer thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._put(event)
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._put, event)
+            except RuntimeError:
+                # Loop já encerrado (shutdown)
+                pass
+
+    async def get(self, timeout: float) -> Optional[Event]:
+        """Próximo evento, ou None após `timeout` segundos (hora do heartbeat)."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBus:
+    """Pub/sub em memória com histórico curto e último evento por tópico."""
+
+    def __init__(self, history_size: int = EVENT_BUS_HISTORY, queue_size: int = EVENT_BUS_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._history: Deque[Event] = deque(maxlen=history_size)
+        self._latest: Dict[str, Event] = {}
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._seq = 0
+        self.published = 0
+
+    def publish(self, topic: str, type: str, data: Optional[Dict[str, Any]] = None) -> Event:
+        """Publica um evento em `topic`. Seguro para chamar de qualquer thread."""
+        payload = json.dumps({"type": type, **(data or {})}, default=str, ensure_ascii=False)
+        with self._lock:
+            self._seq += 1
+            event = Event(self._seq, topic, type, payload, time.time())
+            self._history.append(event)
+            self._latest[topic] = event
+            self.published += 1
+            targets = [sub for sub in self._subscribers if topic in sub.topics]
+        for sub in targets:
+            sub.push(event)
+        return event
+
+    def subscribe(self, topics: Optional[Iterable[str]] = None, last_event_id: Optional[int] = None) -> Subscription:
+        """
+        Registra um assinante (deve ser chamado dentro do event loop).
+
+        A carga inicial (replay ou último evento por tópico) é enfileirada
+        sob o mesmo lock do registro, sem buracos nem duplicatas.
+        """
+        sub = Subscription(set(topics or TOPICS), self.queue_size)
+        with self._lock:
+            if last_event_id is not None:
+                backlog = [e for e in self._history if e.id > last_event_id and e.topic in sub.topics]
+            else:
+                backlog = sorted(
+                    (e for t, e in self._latest.items() if t in sub.topics),
+                    key=lambda e: e.id,
+                )
+            for event in backlog:
+                sub._put(event)
+            self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def latest(self, topic: str) -> Optional[dict]:
+        """Último payload publicado em `topic`."""
+        event = self._latest.get(topic)
+        return json.loads(event.data) if event else None
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        return {
+            "published": self.published,
+            "subscribers": len(subscribers),
+            "history_size": len(self._history),
+            "dropped": sum(sub.dropped for sub in subscribers),
+            "last_event_id": self._seq,
+        }
+
+
+# Instância global
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Obtém a instância global do event bus."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
+
+
+def publish_event(topic: str, type: str, data: Optional[Dict[str, Any]] = None) -> None:
+    """Publica sem nunca propagar erro (instrumentação não pode quebrar um job)."""
+    try:
+        get_event_bus().publish(topic, type, data)
+    except Exception as e:
+        logger.debug(f"Falha ao publicar evento {topic}/{type}: {e}")
+
+
+async def stream_events(
+    topics: Iterable[str],
+    last_event_id: Optional[int],
+    is_disconnected,
+    heartbeat: float = 15.0,
+) -> AsyncIterator[str]:
+    """
+    Gera o corpo SSE de um assinante até o cliente desconectar.
+
+    A assinatura é feita dentro do gerador: se a resposta nunca começar a
+    ser enviada, nada fica registrado no bus.
+    """
+    bus = get_event_bus()
+    sub = bus.subscribe(topics, last_event_id)
+    try:
+        # Reconexão automática do EventSource após 3s
+        yield "retry: 3000\n\n"
+        while True:
+            event = await sub.get(heartbeat)
+            if await is_disconnected():
+                break
+            yield event.to_sse() if event is not None else ": keepalive\n\n"
+    finally:
+        bus.unsubscribe(sub)
@@ -0,0 +1,256 @@
+"""
+Cache de extrações por hash do conteúdo normalizado.
+
+UniversalScraper._extract_with_ai mandava o HTML (ou markdown do Jina) de
+cada listagem para o gpt-4o-mini em toda execução, mesmo sem mudança na
+página. Antes da chamada, o conteúdo agora é normalizado e hasheado:
+
+- remove scripts, estilos, comentários, <meta>/<link>, inputs hidden
+  (CSRF, __VIEWSTATE), atributos nonce/token e parâmetros de cache-busting
+  e de sessão nas URLs;
+- reduz horários a HH:MM (segundos e frações saem, data e hora ficam),
+  remove epochs em atributos/chaves (data-ts=, "updated_at":), contadores
+  regressivos ("2d 05h 13m") e tempos relativos ("há 5 minutos");
+- no markdown do Jina, remove a linha "Published Time".
+
+Se (url, hash) já tem uma extração bem-sucedida, os itens salvos são
+reaproveitados sem chamar a IA. As extrações ficam em SQLite
+(DATA_DIR/extraction_cache.db, as EXTRACTION_CACHE_VERSIONS mais recentes
+por URL), junto com hits/misses por leiloeiro.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.environ.get("DATA_DIR", "/tmp/leilohub_data")
+EXTRACTION_CACHE_FILE = os.path.join(DATA_DIR, "extraction_cache.db")
+EXTRACTION_CACHE_ENABLED = os.getenv("EXTRACTION_CACHE_ENABLED", "true").lower() == "true"
+# Versões (hashes) guardadas por URL
+EXTRACTION_CACHE_VERSIONS = int(os.getenv("EXTRACTION_CACHE_VERSIONS", "3"))
+# Extrações não usadas há mais que isso são apagadas (segundos)
+EXTRACTION_CACHE_MAX_AGE = float(os.getenv("EXTRACTION_CACHE_MAX_AGE", str(30 * 24 * 3600)))
+
+
+# ==================== Normalização ====================
+
+_HTML_NOISE = [
+    re.compile(r"<(script|style|noscript|svg|template)\b.*?</\1\s*>", re.I | re.S),
+    re.compile(r"<!--.*?-->", re.S),
+    re.compile(r"<(?:meta|link)\b[^>]*>", re.I),
+    re.compile(r"<input\b[^>]*\btype\s*=\s*[\"']?hidden[^>]*>", re.I),
+    # nonce="...", data-csrf="...", data-token-x="...", data-timestamp="..."
+    re.compile(r"\s(?:nonce|integrity|[\w-]*(?:csrf|xsrf|token|timestamp)[\w-]*)\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]+)", re.I),
+]
+
+_TEXT_NOISE = [
+    # Cache-busting e sessão em URLs
+    (re.compile(r"[?&](?:v|ver|version|_|t|ts|timestamp|cb|nocache|rnd|rand)=[^&\"'\s<>]*", re.I), ""),
+    (re.compile(r";jsessionid=[^?#\"'\s<>]*", re.I), ""),
+    (re.compile(r"\b(?:PHPSESSID|JSESSIONID|ASP\.NET_SessionId|sessionid|sid)=[^&\"'\s<>;]*", re.I), ""),
+    # Segundos/frações do relógio do servidor: "2026-03-10T14:32:05.123Z" -> "2026-03-10T14:32Z",
+    # "14:32:05" -> "14:32". Data e HH:MM ficam (leilão remarcado muda o hash).
+    (re.compile(r"(?<![\d:])(\d{1,2}:\d{2}):\d{2}(?:\.\d+)?(?![\d:])"), r"\1"),
+    # Epoch em segundos (2020+) ou milissegundos, só como valor de atributo/chave
+    # (data-ts="...", "updated_at": ..., _=...); números soltos podem ser telefone ou ID
+    (re.compile(r"((?<![\w-])(?:[\w-]*(?:ts|time|timestamp|updated|modified)(?:_at)?|_|t)[\"']?\s*[=:]\s*[\"']?)"
+                r"1[6-9]\d{8}(?:\d{3})?\b", re.I), r"\1"),
+    # Contadores regressivos: "2d 05h 13m 22s", "05h:13m"
+    (re.compile(r"\b\d{1,3}\s*d(?:ias?)?\s*:?\s*\d{1,2}\s*h\s*:?\s*\d{1,2}\s*m(?:in)?(?:\s*:?\s*\d{1,2}\s*s)?\b", re.I), ""),
+    (re.compile(r"\b\d{1,2}\s*h\s*:?\s*\d{1,2}\s*m(?:in)?\s*:?\s*\d{1,2}\s*s\b", re.I), ""),
+    (re.compile(r"\bh[aá]\s+\d+\s+(?:segundos?|minutos?|horas?)\b", re.I), ""),
+]
+
+_PUBLISHED_TIME = re.compile(r"^Published Time:.*$", re.M)
+_WHITESPACE = re.compile(r"\s+")
+_BETWEEN_TAGS = re.compile(r">\s+<")
+
+
+def normalize_content(content: str, is_markdown: bool = False) -> str:
+    """Conteúdo sem as partes que mudam a cada request (ver docstring do módulo)."""
+    if is_markdown:
+        content = _PUBLISHED_TIME.sub("", content)
+    else:
+        for pattern in _HTML_NOISE:
+            content = pattern.sub(" ", content)
+    for pattern, replacement in _TEXT_NOISE:
+        content = pattern.sub(replacement, content)
+    content = _WHITESPACE.sub(" ", content).strip()
+    return content if is_markdown else _BETWEEN_TAGS.sub("><", content)
+
+
+def content_fingerprint(content: str, is_markdown: bool = False) -> str:
+    """sha256 do conteúdo normalizado."""
+    return hashlib.sha256(normalize_content(content, is_markdown).encode("utf-8")).hexdigest()
+
+
+# ==================== Cache ====================
+
+class ExtractionCache:
+    """Itens extraídos por (url, hash do conteúdo), com hits/misses por leiloeiro."""
+
+    def __init__(self, db_file: str = EXTRACTION_CACHE_FILE, versions: int = EXTRACTION_CACHE_VERSIONS,
+                 max_age: float = EXTRACTION_CACHE_MAX_AGE):
+        self.db_file = db_file
+        self.versions = max(1, versions)
+        self.max_age = max_age
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self):
+        if not self._initialized:
+            self._init_db()
+        conn = sqlite3.connect(self.db_file, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._init_lock:
+            if self._initialized:
+                return
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            conn = sqlite3.connect(self.db_file, timeout=30.0)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS extractions (
+                        url TEXT NOT NULL,
+                        content_hash TEXT NOT NULL,
+                        source TEXT,
+                        items TEXT NOT NULL,
+                        item_count INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_used_at REAL NOT NULL,
+                        hits INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (url, content_hash)
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_extractions_url ON extractions(url, last_used_at);
+                    CREATE TABLE IF NOT EXISTS extraction_stats (
+                        source TEXT PRIMARY KEY,
+                        hits INTEGER NOT NULL DEFAULT 0,
+                        misses INTEGER NOT NULL DEFAULT 0,
+                        last_hit_at REAL,
+                        last_miss_at REAL
+                    );
+                """)
+                conn.commit()
+            finally:
+                conn.close()
+            self._initialized = True
+
+    def get(self, url: str, content_hash: str, source: str = "") -> Optional[List[Dict]]:
+        """Itens da última extração bem-sucedida deste conteúdo, ou None (conta hit/miss)."""
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT items FROM extractions WHERE url = ? AND content_hash = ?", (url, content_hash)
+            ).fetchone()
+            column, last = ("hits", "last_hit_at") if row else ("misses", "last_miss_at")
+            conn.execute(
+                f"""INSERT INTO extraction_stats (source, {column}, {last}) VALUES (?, 1, ?)
+                    ON CONFLICT(source) DO UPDATE SET {column} = {column} + 1, {last} = excluded.{last}""",
+                (source, now),
+            )
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE extractions SET hits = hits + 1, last_used_at = ? WHERE url = ? AND content_hash = ?",
+                (now, url, content_hash),
+            )
+        return json.loads(row["items"])
+
+    def put(self, url: str, content_hash: str, items: List[Dict], source: str = "") -> None:
+        """
+        Salva uma extração bem-sucedida e descarta versões antigas da URL.
+
+        Extração vazia não é guardada: uma resposta ruim da IA (ou um filtro
+        que zerou a página) ficaria servida enquanto o conteúdo não mudasse.
+        """
+        if not items:
+            return
+        try:
+            payload = json.dumps(items, ensure_ascii=False, default=str)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Extração de {url} não serializável: {e}")
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT INTO extractions (url, content_hash, source, items, item_count, created_at, last_used_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(url, content_hash) DO UPDATE SET
+                       items = excluded.items, item_count = excluded.item_count, last_used_at = excluded.last_used_at""",
+                (url, content_hash, source, payload, len(items), now, now),
+            )
+            conn.execute(
+                """DELETE FROM extractions WHERE url = ? AND content_hash NOT IN (
+                       SELECT content_hash FROM extractions WHERE url = ? ORDER BY last_used_at DESC LIMIT ?)""",
+                (url, url, self.versions),
+            )
+
+    def prune(self) -> int:
+        """Apaga extrações não usadas há mais de max_age. Retorna quantas saíram."""
+        with self._connect() as conn:
+            return conn.execute(
+                "DELETE FROM extractions WHERE last_used_at < ?", (time.time() - self.max_age,)
+            ).rowcount
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM extractions")
+            conn.execute("DELETE FROM extraction_stats")
+
+    def get_stats(self) -> dict:
+        """Totais e taxa de acerto por leiloeiro (piores primeiro)."""
+        with self._connect() as conn:
+            entries, urls = conn.execute("SELECT COUNT(*), COUNT(DISTINCT url) FROM extractions").fetchone()
+            rows = conn.execute("SELECT * FROM extraction_stats").fetchall()
+        per_source = []
+        for row in rows:
+            total = row["hits"] + row["misses"]
+            per_source.append({
+                "source": row["source"],
+                "hits": row["hits"],
+                "misses": row["misses"],
+                "hit_rate": round(row["hits"] / total, 3) if total else 0.0,
+                "last_hit_at": row["last_hit_at"],
+                "last_miss_at": row["last_miss_at"],
+            })
+        per_source.sort(key=lambda s: (s["hit_rate"], -s["misses"]))
+        hits = sum(s["hits"] for s in per_source)
+        misses = sum(s["misses"] for s in per_source)
+        return {
+            "enabled": EXTRACTION_CACHE_ENABLED,
+            "entries": entries,
+            "urls": urls,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "per_source": per_source,
+        }
+
+
+# Instância global
+_extraction_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Obtém a instância global do cache de extrações."""
+    global _extraction_cache
+    if _extraction_cache is None:
+        _extraction_cache = ExtractionCache()
+    return _extraction_cache
@@ -0,0 +1,227 @@
+"""
+Facetas da busca (/api/search).
+
+Define os buckets de desconto e preço, gera as expressões CASE usadas
+pelos backends SQL e mantém o índice de bitmaps do backend em memória.
+
+Facetas retornadas (sempre sob os filtros aplicados):
+    state, city, category, auction_type, discount, price
+
+O preço de referência de um imóvel é o menor lance disponível:
+COALESCE(second_auction_value, first_auction_value).
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.models.property import Property
+
+# Máximo de cidades retornadas na faceta city (ordenadas por contagem)
+FACET_CITY_LIMIT = 50
+
+# (label, mínimo inclusivo, máximo exclusivo)
+DISCOUNT_BUCKETS: List[Tuple[str, Optional[float], Optional[float]]] = [
+    ("0-20", None, 20),
+    ("20-40", 20, 40),
+    ("40-60", 40, 60),
+    ("60+", 60, None),
+]
+
+PRICE_BUCKETS: List[Tuple[str, Optional[float], Optional[float]]] = [
+    ("0-100k", None, 100_000),
+    ("100k-200k", 100_000, 200_000),
+    ("200k-500k", 200_000, 500_000),
+    ("500k-1M", 500_000, 1_000_000),
+    ("1M+", 1_000_000, None),
+]
+
+PRICE_SQL = "COALESCE(second_auction_value, first_auction_value)"
+
+SORT_FIELDS = ("discount_percentage", "first_auction_value", "second_auction_value", "created_at")
+
+
+def bucket_label(value: Optional[float], buckets) -> Optional[str]:
+    """Retorna o label do bucket de `value`, ou None se ausente."""
+    if value is None:
+        return None
+    for label, lo, hi in buckets:
+        if (lo is None or value >= lo) and (hi is None or value < hi):
+            return label
+    return None
+
+
+def bucket_case_sql(expr: str, buckets) -> str:
+    """Expressão SQL CASE que mapeia `expr` para o label do bucket."""
+    whens = []
+    for label, lo, hi in buckets:
+        parts = []
+        if lo is not None:
+            parts.append(f"{expr} >= {lo}")
+        if hi is not None:
+            parts.append(f"{expr} < {hi}")
+        whens.append(f"WHEN {' AND '.join(parts)} THEN '{label}'")
+    return f"(CASE WHEN {expr} IS NULL THEN NULL {' '.join(whens)} END)"
+
+
+def property_price(prop: Property) -> Optional[float]:
+    """Preço de referência (menor lance disponível)."""
+    return prop.second_auction_value if prop.second_auction_value is not None else prop.first_auction_value
+
+
+def build_facets(
+    states: Dict[str, int],
+    cities: Dict[Tuple[str, str], int],
+    categories: Dict[str, int],
+    auction_types: Dict[str, int],
+    discounts: Dict[str, int],
+    prices: Dict[str, int],
+) -> dict:
+    """Monta o payload de facetas a partir das contagens agregadas."""
+    def ranked(counts: Dict[str, int]) -> List[dict]:
+        return [
+            {"value": value, "count": count}
+            for value, count in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+            if value is not None and count > 0
+        ]
+
+    top_cities = sorted(cities.items(), key=lambda kv: (-kv[1], kv[0]))[:FACET_CITY_LIMIT]
+    return {
+        "state": ranked(states),
+        "city": [
+            {"value": city, "state": state, "count": count}
+            for (state, city), count in top_cities
+            if city is not None and count > 0
+        ],
+        "category": ranked(categories),
+        "auction_type": ranked(auction_types),
+        # Buckets mantêm a ordem definida (inclusive vazios) para o slider do frontend
+        "discount": [{"value": label, "count": discounts.get(label, 0)} for label, _, _ in DISCOUNT_BUCKETS],
+        "price": [{"value": label, "count": prices.get(label, 0)} for label, _, _ in PRICE_BUCKETS],
+    }
+
+
+# Posições dos bits ligados de cada byte (0-255)
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Posições dos bits ligados em `mask`, em ordem crescente."""
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for index, byte in enumerate(data):
+        if byte:
+            base = index << 3
+            for bit in _BYTE_BITS[byte]:
+                yield base + bit
+
+
+def mask_from_positions(positions: Iterable[int]) -> int:
+    """Bitmap com os bits de `positions` ligados (sem OR repetido em ints grandes)."""
+    buffer = bytearray()
+    for pos in positions:
+        byte = pos >> 3
+        if byte >= len(buffer):
+            buffer.extend(b"\x00" * (byte + 1 - len(buffer)))
+        buffer[byte] |= 1 << (pos & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class FacetBitmapIndex:
+    """
+    Índice de bitmaps do backend em memória.
+
+    Cada imóvel recebe uma posição; cada valor de faceta (e cada valor de
+    filtro por igualdade) guarda um int Python usado como bitmap. Filtros
+    viram AND de bitmaps e a contagem de uma faceta é popcount(mask & bitmap).
+    """
+
+    # Campos com filtro por igualdade (state/city comparados em minúsculas)
+    EQUALITY_FIELDS = ("state", "city", "category", "auction_type", "auctioneer_id")
+
+    def __init__(self, properties: Iterable[Property]):
+        self.items: List[Property] = list(properties)
+        self.all = (1 << len(self.items)) - 1
+        self._orders: Dict[Tuple[str, bool], List[int]] = {}
+
+        # Coleta posições por valor e converte em bitmap no fim
+        not_duplicate: List[int] = []
+        filters: Dict[str, Dict[str, List[int]]] = {field: {} for field in self.EQUALITY_FIELDS}
+        facets: Dict[str, Dict[object, List[int]]] = {
+            "state": {}, "city": {}, "category": {}, "auction_type": {}, "discount": {}, "price": {},
+        }
+
+        for pos, prop in enumerate(self.items):
+            if not prop.is_duplicate:
+                not_duplicate.append(pos)
+
+            category = prop.category.value if prop.category else None
+            auction_type = prop.auction_type.value if prop.auction_type else None
+            keys = {
+                "state": (prop.state or "").lower(),
+                "city": (prop.city or "").lower(),
+                "category": category,
+                "auction_type": auction_type,
+                "auctioneer_id": prop.auctioneer_id,
+            }
+            for field, key in keys.items():
+                filters[field].setdefault(key, []).append(pos)
+
+            values = {
+                "state": prop.state,
+                "city": (prop.state, prop.city),
+                "category": category,
+                "auction_type": auction_type,
+                "discount": bucket_label(prop.discount_percentage, DISCOUNT_BUCKETS),
+                "price": bucket_label(property_price(prop), PRICE_BUCKETS),
+            }
+            for facet, value in values.items():
+                if value is not None:
+                    facets[facet].setdefault(value, []).append(pos)
+
+        self.not_duplicate = mask_from_positions(not_duplicate)
+        self.filters: Dict[str, Dict[str, int]] = {
+            field: {key: mask_from_positions(positions) for key, positions in values.items()}
+            for field, values in filters.items()
+        }
+        self.facets: Dict[str, Dict[object, int]] = {
+            facet: {value: mask_from_positions(positions) for value, positions in values.items()}
+            for facet, values in facets.items()
+        }
+
+    def sorted_positions(self, field: str, descending: bool) -> List[int]:
+        """Posições ordenadas por `field` (NULLs no fim), calculadas sob demanda."""
+        key = (field, descending)
+        order = self._orders.get(key)
+        if order is None:
+            with_value = [pos for pos, prop in enumerate(self.items) if getattr(prop, field) is not None]
+            with_value.sort(key=lambda pos: getattr(self.items[pos], field), reverse=descending)
+            nulls = [pos for pos, prop in enumerate(self.items) if getattr(prop, field) is None]
+            order = self._orders[key] = with_value + nulls
+        return order
+
+    def page(self, mask: int, field: str, descending: bool, skip: int, limit: int) -> List[Property]:
+        """Percorre a ordem pré-calculada coletando só os imóveis presentes em `mask`."""
+        data = mask.to_bytes((len(self.items) + 7) // 8, "little")
+        wanted = skip + limit
+        found: List[Property] = []
+        for pos in self.sorted_positions(field, descending):
+            if data[pos >> 3] >> (pos & 7) & 1:
+                found.append(self.items[pos])
+                if len(found) >= wanted:
+                    break
+        return found[skip:]
+
+    def equality_mask(self, field: str, value: str) -> int:
+        """Bitmap dos imóveis com field == value."""
+        if field in ("state", "city"):
+            value = value.lower()
+        return self.filters[field].get(value, 0)
+
+    def facet_counts(self, mask: int) -> dict:
+        """Contagens de todas as facetas restritas a `mask`."""
+        counts = {
+            facet: {value: (mask & bitmap).bit_count() for value, bitmap in bitmaps.items()}
+            for facet, bitmaps in self.facets.items()
+        }
+        return build_facets(
+            counts["state"], counts["city"], counts["category"],
+            counts["auction_type"], counts["discount"], counts["price"],
+        )
@@ -1,10 +1,11 @@
 import os
-import httpx
 import logging
 import re
 from typing import Dict, List, Optional, Tuple
 import asyncio
 
+from app.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 # Padrões que indicam endereço inválido
@@ -109,29 +110,29 @@ class GeocodingService:
             return self.cache[cache_key]
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.NOMINATIM_URL,
-                    params={
-                        "q": query,
-                        "format": "json",
-                        "limit": 1,
-                        "countrycodes": "br"
-                    },
-                    headers={"User-Agent": self.user_agent},
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    results = response.json()
-                    if results:
-                        lat = float(results[0]["lat"])
-                        lng = float(results[0]["lon"])
-                        
-                        # Armazena no cache
-                        self.cache[cache_key] = (lat, lng)
-                        
-                        return (lat, lng)
+            client = get_http_client(scope="geocoding")
+            response = await client.get(
+                self.NOMINATIM_URL,
+                params={
+                    "q": query,
+                    "format": "json",
+                    "limit": 1,
+                    "countrycodes": "br"
+                },
+                headers={"User-Agent": self.user_agent},
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                results = response.json()
+                if results:
+                    lat = float(results[0]["lat"])
+                    lng = float(results[0]["lon"])
+                    
+                    # Armazena no cache
+                    self.cache[cache_key] = (lat, lng)
+                    
+                    return (lat, lng)
         
         except Exception as e:
             logger.error(f"Erro no geocoding de '{query}': {e}")
@@ -0,0 +1,216 @@
+"""
+Detector de bloqueio do event loop (modo debug).
+
+Vários handlers `async def` chamam código síncrono (psycopg, requests,
+GeocodingService.geocode, time.sleep) e travam o loop inteiro enquanto
+rodam. Este monitor encontra esses pontos:
+
+- um heartbeat agendado no loop (call_later) marca quando o loop está
+  vivo e mede o atraso de cada batida;
+- uma thread watchdog verifica o heartbeat; se ele está parado há mais
+  que o limite, captura a pilha da thread do loop (sys._current_frames)
+  enquanto o bloqueio ainda está acontecendo;
+- quando o loop volta, a duração total do bloqueio é atribuída ao ponto
+  de chamada capturado.
+
+Os bloqueios são agregados por local (arquivo:linha:função do frame mais
+interno dentro de app/) e expostos em GET /api/admin/loop-blocking.
+
+Ativação: LOOP_BLOCK_DETECTOR=true (no startup) ou
+POST /api/admin/loop-blocking/start. Custo: uma thread acordando a cada
+limite/2 e um callback no loop a cada limite/2.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LOOP_BLOCK_DETECTOR = os.getenv("LOOP_BLOCK_DETECTOR", "false").lower() == "true"
+# Bloqueio mínimo reportado (ms)
+LOOP_BLOCK_THRESHOLD_MS = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100"))
+# Profundidade da pilha guardada por local
+STACK_DEPTH = 12
+
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _is_app_frame(filename: str) -> bool:
+    return filename.startswith(_APP_DIR) and not filename.endswith("loop_monitor.py")
+
+
+class BlockingSite:
+    """Bloqueios agregados de um ponto de chamada."""
+
+    __slots__ = ("location", "blocking_call", "count", "total_ms", "max_ms", "stack", "last_seen")
+
+    def __init__(self, location: str, blocking_call: str, stack: List[str]):
+        self.location = location
+        self.blocking_call = blocking_call
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.stack = stack
+        self.last_seen = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "location": self.location,
+            "blocking_call": self.blocking_call,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "last_seen": self.last_seen,
+            "stack": self.stack,
+        }
+
+
+class LoopBlockMonitor:
+    """Heartbeat no loop + watchdog em thread que captura a pilha do bloqueio."""
+
+    def __init__(self, threshold_ms: float = LOOP_BLOCK_THRESHOLD_MS):
+        self.threshold = threshold_ms / 1000
+        self.interval = self.threshold / 2
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+        self._last_beat = 0.0
+        # Pilha capturada pelo watchdog para o bloqueio em andamento
+        self._pending: Optional[Tuple[float, str, str, List[str]]] = None
+
+        self.sites: Dict[str, BlockingSite] = {}
+        self.blocks = 0
+        self.unattributed = 0
+        self.max_lag_ms = 0.0
+        self.started_at: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._watchdog is not None and self._watchdog.is_alive()
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Inicia o monitor para `loop` (deve ser chamado dentro do loop)."""
+        if self.running:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._last_beat = time.monotonic()
+        self.started_at = time.time()
+        self._handle = self._loop.call_later(self.interval, self._beat)
+        self._watchdog = threading.Thread(target=self._watch, args=(self._stop,), name="loop-block-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(f"Detector de bloqueio do event loop ativo (limite {self.threshold * 1000:.0f} ms)")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._watchdog = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self.sites.clear()
+            self.blocks = 0
+            self.unattributed = 0
+            self.max_lag_ms = 0.0
+
+    # ---- loop thread ----
+
+    def _beat(self) -> None:
+        now = time.monotonic()
+        lag = now - self._last_beat - self.interval
+        self._last_beat = now
+        if not self._stop.is_set():
+            self._handle = self._loop.call_later(self.interval, self._beat)
+
+        if lag < self.threshold:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, None
+            self.blocks += 1
+            lag_ms = lag * 1000
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            if pending is None:
+                # Bloqueio terminou antes do watchdog conseguir amostrar
+                self.unattributed += 1
+                return
+            _, location, blocking_call, stack = pending
+            site = self.sites.get(location)
+            if site is None:
+                site = self.sites[location] = BlockingSite(location, blocking_call, stack)
+            site.count += 1
+            site.total_ms += lag_ms
+            site.max_ms = max(site.max_ms, lag_ms)
+            site.last_seen = time.time()
+
+    # ---- watchdog thread ----
+
+    def _watch(self, stop: threading.Event) -> None:
+        while not stop.wait(self.interval):
+            beat = self._last_beat
+            if time.monotonic() - beat - self.interval < self.threshold:
+                continue
+            with self._lock:
+                if self._pending is not None and self._pending[0] == beat:
+                    continue  # este bloqueio já foi amostrado
+            sample = self._capture()
+            if sample is not None:
+                with self._lock:
+                    self._pending = (beat, *sample)
+
+    def _capture(self) -> Optional[Tuple[str, str, List[str]]]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        summary = traceback.extract_stack(frame)
+        leaf = summary[-1]
+        blocking_call = f"{leaf.filename}:{leaf.lineno} in {leaf.name}"
+
+        app_frames = [f for f in summary if _is_app_frame(f.filename)]
+        site_frame = app_frames[-1] if app_frames else leaf
+        location = f"{os.path.relpath(site_frame.filename, os.path.dirname(_APP_DIR))}:{site_frame.lineno} in {site_frame.name}"
+
+        stack = [
+            f"{f.filename}:{f.lineno} in {f.name}" + (f" | {f.line}" if f.line else "")
+            for f in summary[-STACK_DEPTH:]
+        ]
+        return location, blocking_call, stack
+
+    def get_report(self, limit: int = 20) -> dict:
+        """Locais que mais bloquearam o loop, ordenados pelo tempo total."""
+        with self._lock:
+            sites = sorted(self.sites.values(), key=lambda s: s.total_ms, reverse=True)[:limit]
+            return {
+                "running": self.running,
+                "threshold_ms": self.threshold * 1000,
+                "started_at": self.started_at,
+                "blocks": self.blocks,
+                "unattributed": self.unattributed,
+                "max_lag_ms": round(self.max_lag_ms, 1),
+                "sites": [site.to_dict() for site in sites],
+            }
+
+
+# Instância global
+_loop_monitor: Optional[LoopBlockMonitor] = None
+
+
+def get_loop_monitor() -> LoopBlockMonitor:
+    """Obtém a instância global do detector de bloqueio."""
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopBlockMonitor()
+    return _loop_monitor
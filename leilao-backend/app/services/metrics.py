@@ -0,0 +1,395 @@
+"""
+Métricas no formato de exposição do Prometheus (GET /metrics).
+
+Implementação mínima sem dependência externa: Counter, Gauge e Histogram
+com labels. O filho de cada combinação de labels é criado uma única vez
+e guardado por tupla; no caminho quente (middleware HTTP, métodos do
+PostgresDatabase) só há um lookup em dict e um incremento sob lock, sem
+montar dicts de labels por request.
+
+Métricas registradas:
+    http_requests_total / http_request_duration_seconds   MetricsMiddleware
+    db_query_duration_seconds / db_query_errors_total     instrument_methods(PostgresDatabase)
+    db_connections_in_use / db_connections_opened_total   PostgresDatabase._get_connection
+    event_loop_lag_seconds                                monitor_event_loop_lag
+    http_client_*                                         app.utils.http_client (requests de saída por host)
+    cache_*                                               collectors (get_stats dos caches)
+
+Valores que já existem em outros serviços (hits do EntitlementCache,
+SingleFlight etc.) são lidos na hora do scrape via add_collector(), sem
+custo no caminho do request.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Buckets de latência (segundos)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Intervalo de amostragem do lag do event loop (segundos)
+EVENT_LOOP_LAG_INTERVAL = float(os.getenv("EVENT_LOOP_LAG_INTERVAL", "0.5"))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            # Métrica sem labels aparece no scrape desde o início (com 0)
+            self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values) -> object:
+        """Filho para a combinação de labels (criado uma vez e reutilizado)."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: esperados labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.type}\n"
+        return header + "".join(self._samples())
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}\n"
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "_lock")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # último = +Inf
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def _samples(self):
+        bucket_names = self.labelnames + ("le",)
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(bucket_names, values + (bound,))} {cumulative}\n"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}\n"
+            yield f"{self.name}_count{labels} {cumulative}\n"
+
+
+class MetricsRegistry:
+    """Registro das métricas e dos collectors lidos no scrape."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[_Metric]]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[_Metric]]) -> None:
+        """Registra função chamada a cada scrape que retorna métricas prontas."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Texto no formato de exposição do Prometheus."""
+        parts = [metric.render() for metric in list(self._metrics.values())]
+        for collector in self._collectors:
+            try:
+                parts.extend(metric.render() for metric in collector())
+            except Exception as e:
+                logger.warning(f"Collector de métricas falhou: {e}")
+        return "".join(parts)
+
+
+# Instância global
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Obtém a instância global do registro de métricas."""
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
+
+
+# ==================== Métricas da aplicação ====================
+
+registry = get_metrics_registry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "Requests HTTP por rota e status", ("method", "route", "status")
+)
+HTTP_LATENCY = registry.histogram(
+    "http_request_duration_seconds", "Latência dos requests HTTP por rota", ("method", "route", "status")
+)
+DB_QUERY_LATENCY = registry.histogram(
+    "db_query_duration_seconds", "Duração dos métodos do banco", ("method",)
+)
+DB_QUERY_ERRORS = registry.counter(
+    "db_query_errors_total", "Exceções nos métodos do banco", ("method",)
+)
+DB_CONNECTIONS_IN_USE = registry.gauge(
+    "db_connections_in_use", "Conexões com o Postgres abertas no momento"
+)
+DB_CONNECTIONS_OPENED = registry.counter(
+    "db_connections_opened_total", "Conexões com o Postgres abertas desde o start"
+)
+DB_CONNECT_LATENCY = registry.histogram(
+    "db_connect_duration_seconds", "Tempo para abrir uma conexão com o Postgres"
+)
+EVENT_LOOP_LAG = registry.histogram(
+    "event_loop_lag_seconds", "Atraso do event loop além do sleep agendado",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+EVENT_LOOP_LAG_LAST = registry.gauge(
+    "event_loop_lag_last_seconds", "Último atraso medido do event loop"
+)
+
+
+# ==================== Middleware HTTP ====================
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI puro (sem BaseHTTPMiddleware) que mede cada request.
+
+    O label `route` é o template da rota ("/api/properties/{property_id}"),
+    nunca o path bruto, para manter a cardinalidade fixa.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._children: Dict[Tuple[str, str, int], Tuple[_Value, _HistogramChild]] = {}
+
+    def _child(self, method: str, route: str, status: int):
+        key = (method, route, status)
+        child = self._children.get(key)
+        if child is None:
+            status_label = str(status)
+            child = (HTTP_REQUESTS.labels(method, route, status_label),
+                     HTTP_LATENCY.labels(method, route, status_label))
+            self._children[key] = child
+        return child
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            counter, histogram = self._child(
+                scope["method"], getattr(route, "path", UNMATCHED_ROUTE), status
+            )
+            counter.inc()
+            histogram.observe(time.perf_counter() - start)
+
+
+# ==================== Banco ====================
+
+def instrument_methods(cls, histogram: Histogram = DB_QUERY_LATENCY, errors: Counter = DB_QUERY_ERRORS):
+    """
+    Envolve os métodos públicos de `cls` medindo duração e exceções.
+
+    Usado como decorator de classe (ex.: PostgresDatabase). Os filhos das
+    métricas são resolvidos aqui, uma vez por método.
+    """
+    for name, func in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(func):
+            continue
+        setattr(cls, name, _timed(func, histogram.labels(name), errors.labels(name)))
+    return cls
+
+
+def _timed(func, observer: _HistogramChild, error_counter: _Value):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            error_counter.inc()
+            raise
+        finally:
+            observer.observe(time.perf_counter() - start)
+    return wrapper
+
+
+# ==================== Event loop ====================
+
+async def monitor_event_loop_lag(interval: float = EVENT_LOOP_LAG_INTERVAL) -> None:
+    """Mede periodicamente quanto o loop atrasa para acordar de um sleep."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(0.0, loop.time() - start - interval)
+        EVENT_LOOP_LAG.observe(lag)
+        EVENT_LOOP_LAG_LAST.set(lag)
+
+
+# ==================== Caches ====================
+
+def cache_collector() -> List[_Metric]:
+    """Hits/misses dos caches em memória, lidos do get_stats de cada um."""
+    from app.services.entitlement_cache import get_entitlement_cache
+    from app.services.extraction_cache import get_extraction_cache
+    from app.services.single_flight import get_single_flight
+
+    hits = Counter("cache_hits_total", "Hits dos caches em memória", ("cache",))
+    misses = Counter("cache_misses_total", "Misses dos caches em memória", ("cache",))
+    coalesced = Counter("single_flight_coalesced_total", "Chamadas que esperaram uma execução em andamento")
+
+    entitlement = get_entitlement_cache().get_stats()
+    hits.labels("entitlement").set(entitlement["hits"])
+    misses.labels("entitlement").set(entitlement["misses"])
+
+    single_flight = get_single_flight().get_stats()
+    hits.labels("single_flight").set(single_flight["cache_hits"])
+    misses.labels("single_flight").set(single_flight["executions"])
+    coalesced.labels().set(single_flight["coalesced"])
+
+    extraction = get_extraction_cache().get_stats()
+    hits.labels("extraction").set(extraction["hits"])
+    misses.labels("extraction").set(extraction["misses"])
+
+    return [hits, misses, coalesced]
+
+
+registry.add_collector(cache_collector)
@@ -4,7 +4,10 @@ Provides persistent storage that survives restarts and works with multiple insta
 """
 
 import os
+import re
+import json
 import logging
+import time
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from contextlib import contextmanager, nullcontext
@@ -18,6 +21,15 @@ from app.models.property import Property, PropertyCreate, PropertyFilter, Proper
 from app.models.auctioneer import Auctioneer, AuctioneerCreate
 from app.utils.image_blacklist import clean_image_url, get_source_url_or_fallback
 from app.utils.text_normalizer import normalize_city_name, normalize_neighborhood
+from app.services.spatial_index import bounding_box, EARTH_RADIUS_KM
+from app.services.facets import (
+    DISCOUNT_BUCKETS, PRICE_BUCKETS, PRICE_SQL, SORT_FIELDS, bucket_case_sql, build_facets,
+)
+from app.services.change_feed import change_row, decode_cursor, encode_cursor
+from app.services.metrics import (
+    DB_CONNECT_LATENCY, DB_CONNECTIONS_IN_USE, DB_CONNECTIONS_OPENED, instrument_methods,
+)
+from app.services.query_log import get_query_log
 
 # Carregar .env ANTES de qualquer outra coisa
 load_dotenv()
@@ -84,6 +96,8 @@ CREATE INDEX IF NOT EXISTS idx_properties_is_active ON properties(is_active);
 CREATE INDEX IF NOT EXISTS idx_properties_is_duplicate ON properties(is_duplicate);
 CREATE INDEX IF NOT EXISTS idx_properties_dedup_key ON properties(dedup_key);
 CREATE INDEX IF NOT EXISTS idx_properties_source_url ON properties(source_url);
+CREATE INDEX IF NOT EXISTS idx_properties_lat_lng ON properties(latitude, longitude)
+    WHERE latitude IS NOT NULL AND longitude IS NOT NULL AND is_duplicate = FALSE;
 """
 
 CREATE_AUCTIONEERS_TABLE = """
@@ -161,6 +175,32 @@ class _OfflineConnectionMock:
         return False
 
 
+class _TimedCursor(psycopg.Cursor):
+    """Cursor que registra a duração de cada statement no slow-query log."""
+
+    def execute(self, query, params=None, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().execute(query, params, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            sql = query if isinstance(query, str) else query.as_string(self)
+            _query_log.record(sql, params, elapsed_ms)
+
+
+_query_log = get_query_log()
+
+
+class _TrackedConnection(psycopg.Connection):
+    """Conexão que mantém o gauge db_connections_in_use (não há pool: uma conexão por operação)."""
+
+    def close(self):
+        if not self.closed:
+            DB_CONNECTIONS_IN_USE.dec()
+        super().close()
+
+
+@instrument_methods
 class PostgresDatabase:
     def __init__(self):
         # Verificar se modo offline está ativado
@@ -176,6 +216,7 @@ class PostgresDatabase:
             raise ValueError("DATABASE_URL environment variable is not set")
         
         self._init_db()
+        get_query_log().explain_runner = self._explain
         
         # Cache for auctioneers (small dataset, OK to keep in memory)
         self._auctioneers_cache: Dict[str, Auctioneer] = {}
@@ -188,7 +229,22 @@ class PostgresDatabase:
         if self._offline_mode:
             logger.debug("Modo Offline: Retornando conexão mock")
             return _OfflineConnectionMock()
-        return psycopg.connect(DATABASE_URL, row_factory=dict_row)
+        start = time.perf_counter()
+        conn = _TrackedConnection.connect(DATABASE_URL, row_factory=dict_row, cursor_factory=_TimedCursor)
+        DB_CONNECT_LATENCY.observe(time.perf_counter() - start)
+        DB_CONNECTIONS_OPENED.inc()
+        DB_CONNECTIONS_IN_USE.inc()
+        return conn
+    
+    def _explain(self, statement: str, params) -> object:
+        """Executa um EXPLAIN em conexão própria (thread do slow-query log)."""
+        with psycopg.connect(DATABASE_URL) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SET statement_timeout = '30s'")
+                cur.execute(statement, params)
+                row = cur.fetchone()
+            conn.rollback()
+        return row[0] if row else None
     
     def _init_db(self):
         """Initialize database tables."""
@@ -433,6 +489,50 @@ class PostgresDatabase:
             logger.error(f"Error getting property {prop_id}: {e}")
             return None
     
+    def _build_filter_conditions(self, filters: Optional[PropertyFilter]) -> Tuple[List[str], list]:
+        """Translate a PropertyFilter into SQL conditions and params."""
+        conditions = []
+        params = []
+        
+        # Always exclude duplicates unless explicitly requested
+        if filters is None or not filters.include_duplicates:
+            conditions.append("is_duplicate = FALSE")
+        
+        if filters:
+            if filters.state:
+                conditions.append("state = %s")
+                params.append(filters.state)
+            if filters.city:
+                conditions.append("city = %s")
+                params.append(filters.city)
+            if filters.neighborhood:
+                conditions.append("neighborhood ILIKE %s")
+                params.append(f"%{filters.neighborhood}%")
+            if filters.category:
+                conditions.append("category = %s")
+                params.append(filters.category.value)
+            if filters.auction_type:
+                conditions.append("auction_type = %s")
+                params.append(filters.auction_type.value)
+            if filters.min_value is not None:
+                conditions.append("(first_auction_value >= %s OR second_auction_value >= %s)")
+                params.extend([filters.min_value, filters.min_value])
+            if filters.max_value is not None:
+                conditions.append("(first_auction_value <= %s OR second_auction_value <= %s)")
+                params.extend([filters.max_value, filters.max_value])
+            if filters.min_discount is not None:
+                conditions.append("discount_percentage >= %s")
+                params.append(filters.min_discount)
+            if filters.auctioneer_id:
+                conditions.append("auctioneer_id = %s")
+                params.append(filters.auctioneer_id)
+            if filters.search_term:
+                conditions.append("(title ILIKE %s OR description ILIKE %s OR address ILIKE %s)")
+                search = f"%{filters.search_term}%"
+                params.extend([search, search, search])
+        
+        return conditions, params
+    
     def get_properties(
         self,
         filters: Optional[PropertyFilter] = None,
@@ -446,45 +546,7 @@ class PostgresDatabase:
             logger.debug("Modo Offline: get_properties() retornando lista vazia")
             return [], 0
         try:
-            conditions = []
-            params = []
-            
-            # Always exclude duplicates unless explicitly requested
-            if filters is None or not filters.include_duplicates:
-                conditions.append("is_duplicate = FALSE")
-            
-            if filters:
-                if filters.state:
-                    conditions.append("state = %s")
-                    params.append(filters.state)
-                if filters.city:
-                    conditions.append("city = %s")
-                    params.append(filters.city)
-                if filters.neighborhood:
-                    conditions.append("neighborhood ILIKE %s")
-                    params.append(f"%{filters.neighborhood}%")
-                if filters.category:
-                    conditions.append("category = %s")
-                    params.append(filters.category.value)
-                if filters.auction_type:
-                    conditions.append("auction_type = %s")
-                    params.append(filters.auction_type.value)
-                if filters.min_value is not None:
-                    conditions.append("(first_auction_value >= %s OR second_auction_value >= %s)")
-                    params.extend([filters.min_value, filters.min_value])
-                if filters.max_value is not None:
-                    conditions.append("(first_auction_value <= %s OR second_auction_value <= %s)")
-                    params.extend([filters.max_value, filters.max_value])
-                if filters.min_discount is not None:
-                    conditions.append("discount_percentage >= %s")
-                    params.append(filters.min_discount)
-                if filters.auctioneer_id:
-                    conditions.append("auctioneer_id = %s")
-                    params.append(filters.auctioneer_id)
-                if filters.search_term:
-                    conditions.append("(title ILIKE %s OR description ILIKE %s OR address ILIKE %s)")
-                    search = f"%{filters.search_term}%"
-                    params.extend([search, search, search])
+            conditions, params = self._build_filter_conditions(filters)
             
             # If sorting by discount_percentage, filter out NULLs and invalid values
             if sort_by == "discount_percentage":
@@ -523,6 +585,180 @@ class PostgresDatabase:
             logger.error(f"Error getting properties: {e}")
             return [], 0
     
+    def get_properties_near(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        filters: Optional[PropertyFilter] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Tuple[List[Tuple[Property, float]], int]:
+        """
+        Get properties within radius_km of (lat, lng), nearest first.
+        
+        Bounding box on idx_properties_lat_lng prunes candidates; exact
+        haversine distance is computed in SQL for the radius test and ordering.
+        
+        Returns:
+            ([(property, distance_km)], total)
+        """
+        if self._offline_mode:
+            logger.debug("Modo Offline: get_properties_near() retornando lista vazia")
+            return [], 0
+        try:
+            conditions, params = self._build_filter_conditions(filters)
+            min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+            conditions.append("latitude BETWEEN %s AND %s")
+            conditions.append("longitude BETWEEN %s AND %s")
+            params.extend([min_lat, max_lat, min_lng, max_lng])
+            where_clause = " AND ".join(conditions)
+            
+            distance_sql = (
+                f"2 * {EARTH_RADIUS_KM} * ASIN(LEAST(1.0, SQRT("
+                "POWER(SIN(RADIANS(latitude - %s) / 2), 2) + "
+                "COS(RADIANS(%s)) * COS(RADIANS(latitude)) * "
+                "POWER(SIN(RADIANS(longitude - %s) / 2), 2))))"
+            )
+            
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"""
+                        SELECT *, COUNT(*) OVER() AS total_count FROM (
+                            SELECT *, {distance_sql} AS distance_km
+                            FROM properties WHERE {where_clause}
+                        ) AS candidates
+                        WHERE distance_km <= %s
+                        ORDER BY distance_km
+                        LIMIT %s OFFSET %s
+                        """,
+                        [lat, lat, lng] + params + [radius_km, limit, skip]
+                    )
+                    rows = cur.fetchall()
+                    
+                    if rows:
+                        total = rows[0]['total_count']
+                    elif skip > 0:
+                        # Página além do fim: a janela não retorna linhas, contar à parte
+                        cur.execute(
+                            f"SELECT COUNT(*) as count FROM (SELECT {distance_sql} AS distance_km "
+                            f"FROM properties WHERE {where_clause}) AS candidates WHERE distance_km <= %s",
+                            [lat, lat, lng] + params + [radius_km]
+                        )
+                        row = cur.fetchone()
+                        total = row['count'] if row else 0
+                    else:
+                        total = 0
+            
+            return [(self._row_to_property(row), row['distance_km']) for row in rows], total
+        except Exception as e:
+            logger.error(f"Error getting properties near ({lat}, {lng}): {e}")
+            return [], 0
+    
+    # Colunas do GROUPING SETS, na ordem usada em GROUPING(...)
+    _FACET_COLUMNS = ("state", "city", "category", "auction_type", "discount_bucket", "price_bucket")
+    
+    def search_with_facets(
+        self,
+        filters: Optional[PropertyFilter] = None,
+        skip: int = 0,
+        limit: int = 20,
+        sort_by: str = "discount_percentage",
+        sort_order: str = "desc",
+    ) -> Tuple[List[Property], int, dict]:
+        """
+        Get a page of properties plus facet counts in a single statement.
+        
+        Facets (state, state+city, category, auction_type, discount and price
+        buckets) and the total come from one GROUPING SETS aggregate over the
+        filtered rows; the page is joined to it as a LATERAL subquery, so a
+        page past the end still returns one row carrying the facets.
+        
+        Returns:
+            (properties, total, facets)
+        """
+        empty = build_facets({}, {}, {}, {}, {}, {})
+        if self._offline_mode:
+            logger.debug("Modo Offline: search_with_facets() retornando lista vazia")
+            return [], 0, empty
+        try:
+            conditions, params = self._build_filter_conditions(filters)
+            where_clause = " AND ".join(conditions) if conditions else "1=1"
+            
+            if sort_by not in SORT_FIELDS:
+                sort_by = "discount_percentage"
+            direction = "DESC" if sort_order.lower() == "desc" else "ASC"
+            order_clause = f"{sort_by} {direction} NULLS LAST, id"
+            outer_order = f"page.{sort_by} {direction} NULLS LAST, page.id"
+            
+            columns = ", ".join(self._FACET_COLUMNS)
+            query = f"""
+                WITH facet_counts AS (
+                    SELECT {columns}, GROUPING({columns}) AS grp, COUNT(*) AS count
+                    FROM (
+                        SELECT state, city, category, auction_type,
+                               {bucket_case_sql("discount_percentage", DISCOUNT_BUCKETS)} AS discount_bucket,
+                               {bucket_case_sql(PRICE_SQL, PRICE_BUCKETS)} AS price_bucket
+                        FROM properties WHERE {where_clause}
+                    ) AS bucketed
+                    GROUP BY GROUPING SETS (
+                        (state), (state, city), (category), (auction_type),
+                        (discount_bucket), (price_bucket), ()
+                    )
+                ),
+                facets AS (
+                    SELECT json_agg(facet_counts)::text AS facets FROM facet_counts
+                )
+                SELECT page.*, facets.facets AS facets_json
+                FROM facets
+                LEFT JOIN LATERAL (
+                    SELECT * FROM properties WHERE {where_clause}
+                    ORDER BY {order_clause} LIMIT %s OFFSET %s
+                ) AS page ON TRUE
+                ORDER BY {outer_order}
+            """
+            
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, params + params + [limit, skip])
+                    rows = cur.fetchall()
+            
+            if not rows:
+                return [], 0, empty
+            
+            # facets_json é texto (não jsonb) para ser decodificado uma única vez
+            total, facets = self._parse_facet_rows(json.loads(rows[0]['facets_json'] or "[]"))
+            properties = [self._row_to_property(row) for row in rows if row.get('id') is not None]
+            return properties, total, facets
+        except Exception as e:
+            logger.error(f"Error searching properties with facets: {e}")
+            return [], 0, empty
+    
+    def _parse_facet_rows(self, facet_rows: List[dict]) -> Tuple[int, dict]:
+        """Split GROUPING SETS rows into total + facet counts."""
+        width = len(self._FACET_COLUMNS)
+        counts = {key: {} for key in ("state", "city", "category", "auction_type", "discount_bucket", "price_bucket")}
+        total = 0
+        for row in facet_rows:
+            # Bit ligado em GROUPING() = coluna agregada (fora do grouping set)
+            grouped = {
+                col for i, col in enumerate(self._FACET_COLUMNS)
+                if not (row['grp'] >> (width - 1 - i)) & 1
+            }
+            if not grouped:
+                total = row['count']
+            elif grouped == {"state", "city"}:
+                counts["city"][(row['state'], row['city'])] = row['count']
+            else:
+                col = grouped.pop()
+                counts[col][row[col]] = row['count']
+        
+        return total, build_facets(
+            counts["state"], counts["city"], counts["category"],
+            counts["auction_type"], counts["discount_bucket"], counts["price_bucket"],
+        )
+    
     def get_property_count(self) -> int:
         """Get total property count."""
         if self._offline_mode:
@@ -764,6 +1000,105 @@ class PostgresDatabase:
             logger.error(f"Error getting unique neighborhoods: {e}")
             return []
     
+    def get_location_counts(self) -> List[Tuple[str, str, Optional[str], int]]:
+        """Get (state, city, neighborhood, count) for non-duplicate properties."""
+        if self._offline_mode:
+            return []
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        SELECT state, city, neighborhood, COUNT(*) as count
+                        FROM properties
+                        WHERE is_duplicate = FALSE AND city IS NOT NULL
+                        GROUP BY state, city, neighborhood
+                    """)
+                    return [(row['state'], row['city'], row['neighborhood'], row['count']) for row in cur.fetchall()]
+        except Exception as e:
+            logger.error(f"Error getting location counts: {e}")
+            return []
+    
+    def get_index_columns(self) -> Dict[str, List[List[str]]]:
+        """Colunas de cada índice existente, por tabela (usado pelo index advisor)."""
+        indexes: Dict[str, List[List[str]]] = {}
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT tablename, indexdef FROM pg_indexes WHERE schemaname = 'public'")
+                for row in cur.fetchall():
+                    match = re.search(r"\((.+)\)", row['indexdef'])
+                    if match:
+                        columns = [c.strip().split(" ")[0].strip('"') for c in match.group(1).split(",")]
+                        indexes.setdefault(row['tablename'], []).append(columns)
+        return indexes
+    
+    def get_dataset_version(self) -> str:
+        """Get a cheap fingerprint that changes whenever properties change."""
+        if self._offline_mode:
+            return "offline"
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT COUNT(*) as count, MAX(updated_at) as updated FROM properties")
+                    row = cur.fetchone()
+                    return f"{row['count']}:{row['updated']}"
+        except Exception as e:
+            logger.error(f"Error getting dataset version: {e}")
+            return ""
+    
+    def get_changes(self, cursor: Optional[str] = None, limit: int = 100) -> tuple:
+        """
+        Get property changes after `cursor` (see migrations/005_add_property_changes.sql).
+        
+        Only changes from transactions older than the snapshot xmin are
+        returned: every transaction that could still add rows with a lower
+        (txid, seq) has finished, so advancing the cursor never skips a
+        change. A long-running transaction delays the feed, it doesn't lose rows.
+        
+        Returns:
+            (changes, next_cursor, has_more, reset_required)
+        """
+        if self._offline_mode:
+            return [], cursor or "", False, False
+        
+        txid, seq = decode_cursor(cursor)
+        conditions = ["txid < pg_snapshot_xmin(pg_current_snapshot())"]
+        params: list = []
+        if txid is not None:
+            conditions.append("(txid, seq) > (%s::xid8, %s)")
+            params.extend([str(txid), seq])
+        
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(f"""
+                        SELECT seq, txid::text AS txid, property_id, change_type,
+                               first_auction_value, second_auction_value,
+                               previous_first_auction_value, previous_second_auction_value,
+                               is_active, changed_at
+                        FROM property_changes
+                        WHERE {' AND '.join(conditions)}
+                        ORDER BY txid, seq
+                        LIMIT %s
+                    """, params + [limit + 1])
+                    rows = cur.fetchall()
+        except Exception as e:
+            logger.error(f"Error getting property changes: {e}")
+            raise
+        
+        has_more = len(rows) > limit
+        changes = [
+            change_row(
+                row['seq'], row['property_id'], row['change_type'],
+                row['first_auction_value'], row['second_auction_value'],
+                row['previous_first_auction_value'], row['previous_second_auction_value'],
+                row['is_active'], row['changed_at'],
+                cursor=encode_cursor(row['seq'], row['txid']),
+            )
+            for row in rows[:limit]
+        ]
+        next_cursor = changes[-1]['cursor'] if changes else (cursor or "")
+        return changes, next_cursor, has_more, False
+    
     def get_properties_by_source(self, source: str, include_duplicates: bool = False) -> Tuple[List[Property], int]:
         """Get properties filtered by source."""
         if self._offline_mode:
@@ -0,0 +1,319 @@
+"""
+Slow-query log do PostgresDatabase com captura de EXPLAIN.
+
+Todo statement executado por um cursor do PostgresDatabase é cronometrado
+e agrupado pelo fingerprint do SQL normalizado (literais e parâmetros
+viram `?`, listas IN colapsam), então as combinações de filtros do
+get_properties aparecem como entradas distintas.
+
+Quando um SELECT passa de SLOW_QUERY_MS, o plano é capturado com
+EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) em uma thread separada, com
+conexão própria, no máximo uma vez por fingerprint a cada
+EXPLAIN_SAMPLE_INTERVAL segundos. O EXPLAIN ANALYZE executa a query de
+novo, por isso é amostrado e nunca roda para escritas: um WITH com CTE
+gravável (INSERT/UPDATE/DELETE ... RETURNING) ou SELECT ... FOR UPDATE
+recebe só o EXPLAIN simples, sem executar. Os planos ficam em um ring
+buffer em memória.
+
+advise_indexes() percorre os planos capturados e sugere índices para
+Seq Scans que descartam muitas linhas por filtro, ILIKE com curinga
+inicial (pg_trgm) e ordenações grandes sem índice.
+
+Endpoints: GET /api/admin/db/slow-queries e /api/admin/db/index-advice.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Statements acima deste tempo entram no slow log (ms)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+# Intervalo mínimo entre dois EXPLAIN do mesmo fingerprint (s)
+EXPLAIN_SAMPLE_INTERVAL = float(os.getenv("EXPLAIN_SAMPLE_INTERVAL", "300"))
+# Planos guardados
+SLOW_QUERY_PLANS = int(os.getenv("SLOW_QUERY_PLANS", "50"))
+# Fingerprints distintos acompanhados (protege contra SQL não parametrizado)
+MAX_FINGERPRINTS = 2000
+
+# Seq Scan que descarta mais que isto por filtro merece índice
+ADVISOR_MIN_ROWS_REMOVED = 1000
+# Ordenação com mais linhas que isto sem índice
+ADVISOR_MIN_SORT_ROWS = 5000
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_RE = re.compile(r"%\(\w+\)s|%s|\$\d+")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WS_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """SQL sem literais, parâmetros e espaços variáveis."""
+    sql = _STRING_RE.sub("?", sql)
+    sql = _PARAM_RE.sub("?", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("(?)", sql)
+    return _WS_RE.sub(" ", sql).strip().lower()
+
+
+def fingerprint(normalized: str) -> str:
+    return hashlib.md5(normalized.encode("utf-8")).hexdigest()[:12]
+
+
+_WRITE_RE = re.compile(r"\b(?:insert|update|delete|merge)\b", re.I)
+
+
+def _is_select(sql: str) -> bool:
+    head = sql.lstrip().lower()
+    return head.startswith("select") or head.startswith("with")
+
+
+def _is_read_only(sql: str) -> bool:
+    """SELECT/WITH sem INSERT/UPDATE/DELETE (CTE gravável) nem FOR UPDATE."""
+    return _is_select(sql) and not _WRITE_RE.search(_STRING_RE.sub("?", sql))
+
+
+class QueryStats:
+    """Tempos agregados de um fingerprint."""
+
+    __slots__ = ("fingerprint", "query", "calls", "total_ms", "max_ms", "slow_calls", "last_explain_at")
+
+    def __init__(self, fp: str, query: str):
+        self.fingerprint = fp
+        self.query = query
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow_calls = 0
+        self.last_explain_at = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "query": self.query,
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 1),
+            "mean_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 1),
+            "slow_calls": self.slow_calls,
+        }
+
+
+class QueryLog:
+    """Estatísticas por fingerprint + ring buffer de planos das queries lentas."""
+
+    def __init__(
+        self,
+        slow_ms: float = SLOW_QUERY_MS,
+        explain_interval: float = EXPLAIN_SAMPLE_INTERVAL,
+        max_plans: int = SLOW_QUERY_PLANS,
+    ):
+        self.slow_ms = slow_ms
+        self.explain_interval = explain_interval
+        self._stats: Dict[str, QueryStats] = {}
+        self._plans: Deque[dict] = deque(maxlen=max_plans)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Função que executa o EXPLAIN (definida pelo PostgresDatabase)
+        self.explain_runner: Optional[Callable[[str, object], object]] = None
+        self.explain_errors = 0
+
+    def record(self, sql: str, params, elapsed_ms: float) -> None:
+        """Registra a execução de um statement (chamado pelo cursor)."""
+        # O texto do SQL se repete (só os parâmetros mudam): normalização em cache
+        normalized = normalize_sql(sql)
+        fp = fingerprint(normalized)
+        sample = False
+        with self._lock:
+            stats = self._stats.get(fp)
+            if stats is None:
+                if len(self._stats) >= MAX_FINGERPRINTS:
+                    return
+                stats = self._stats[fp] = QueryStats(fp, normalized)
+            stats.calls += 1
+            stats.total_ms += elapsed_ms
+            if elapsed_ms > stats.max_ms:
+                stats.max_ms = elapsed_ms
+            if elapsed_ms >= self.slow_ms:
+                stats.slow_calls += 1
+                now = time.time()
+                if (
+                    self.explain_runner is not None
+                    and _is_select(sql)
+                    and now - stats.last_explain_at >= self.explain_interval
+                ):
+                    stats.last_explain_at = now
+                    sample = True
+        if sample:
+            logger.warning(f"Query lenta ({elapsed_ms:.0f} ms) [{fp}]: {normalized[:200]}")
+            self._submit_explain(fp, sql, params, elapsed_ms)
+
+    def _submit_explain(self, fp: str, sql: str, params, elapsed_ms: float) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="explain")
+        self._executor.submit(self._capture_plan, fp, sql, params, elapsed_ms)
+
+    def _capture_plan(self, fp: str, sql: str, params, elapsed_ms: float) -> None:
+        try:
+            # ANALYZE executa a query de novo: CTE gravável só com o plano estimado
+            analyzed = _is_read_only(sql)
+            options = "ANALYZE, BUFFERS, FORMAT JSON" if analyzed else "FORMAT JSON"
+            plan = self.explain_runner(f"EXPLAIN ({options}) {sql}", params)
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            if isinstance(plan, list):
+                plan = plan[0]
+        except Exception as e:
+            self.explain_errors += 1
+            logger.debug(f"EXPLAIN falhou para {fp}: {e}")
+            return
+        with self._lock:
+            self._plans.append({
+                "fingerprint": fp,
+                "captured_at": time.time(),
+                "elapsed_ms": round(elapsed_ms, 1),
+                "execution_ms": plan.get("Execution Time"),
+                "analyzed": analyzed,
+                "plan": plan,
+            })
+
+    def top(self, limit: int = 20, order_by: str = "total_ms") -> List[dict]:
+        """Top-N fingerprints por total_ms, mean_ms, max_ms ou calls."""
+        with self._lock:
+            rows = [s.to_dict() for s in self._stats.values()]
+        return sorted(rows, key=lambda r: r.get(order_by, 0), reverse=True)[:limit]
+
+    def plans(self, fp: Optional[str] = None) -> List[dict]:
+        with self._lock:
+            plans = list(self._plans)
+        if fp:
+            plans = [p for p in plans if p["fingerprint"] == fp]
+        return list(reversed(plans))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._plans.clear()
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "fingerprints": len(self._stats),
+                "statements": sum(s.calls for s in self._stats.values()),
+                "slow_statements": sum(s.slow_calls for s in self._stats.values()),
+                "plans": len(self._plans),
+                "explain_errors": self.explain_errors,
+                "slow_query_ms": self.slow_ms,
+            }
+
+
+# ==================== Index advisor ====================
+
+_FILTER_COLUMN_RE = re.compile(r"\(?\(?(\w+)\)?(?:::\w+)?\s*(=|<>|>=|<=|<|>|~~\*|~~|!~~\*|IS NOT NULL|IS NULL)\s*((?:true|false)\b|'?%?)")
+
+
+def _walk(node: dict) -> Iterable[dict]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+def _filter_columns(expression: str) -> List[tuple]:
+    """(coluna, operador, curinga_inicial) extraídos de um Filter do plano."""
+    found = []
+    for column, op, prefix in _FILTER_COLUMN_RE.findall(expression or ""):
+        if column.lower() in ("and", "or", "not", "lower", "upper"):
+            continue
+        if prefix in ("true", "false"):
+            continue  # booleano: seletividade baixa, índice não ajuda
+        found.append((column, op, prefix == "'%"))
+    return found
+
+
+def _already_indexed(table: str, column: str, existing: Dict[str, List[List[str]]]) -> bool:
+    return any(cols and cols[0] == column for cols in existing.get(table, []))
+
+
+def advise_indexes(plans: List[dict], existing: Optional[Dict[str, List[List[str]]]] = None) -> List[dict]:
+    """
+    Sugere índices a partir dos planos capturados.
+
+    Args:
+        plans: Entradas de QueryLog.plans()
+        existing: {tabela: [[colunas do índice], ...]} para não sugerir o que já existe
+    """
+    existing = existing or {}
+    suggestions: Dict[str, dict] = {}
+
+    def suggest(key: str, table: str, statement: str, reason: str, fp: str, impact: float):
+        entry = suggestions.setdefault(key, {
+            "table": table, "statement": statement, "reason": reason,
+            "fingerprints": [], "rows_affected": 0,
+        })
+        if fp not in entry["fingerprints"]:
+            entry["fingerprints"].append(fp)
+        entry["rows_affected"] += int(impact)
+
+    for captured in plans:
+        fp = captured["fingerprint"]
+        root = captured["plan"].get("Plan", {})
+        for node in _walk(root):
+            node_type = node.get("Node Type", "")
+            # Sort fica acima do scan: a tabela é a primeira da subárvore
+            table = next((n["Relation Name"] for n in _walk(node) if n.get("Relation Name")), None)
+
+            if node_type == "Seq Scan" and node.get("Rows Removed by Filter", 0) >= ADVISOR_MIN_ROWS_REMOVED:
+                removed = node["Rows Removed by Filter"]
+                for column, op, leading_wildcard in _filter_columns(node.get("Filter", "")):
+                    if op in ("~~*", "~~") and leading_wildcard:
+                        suggest(
+                            f"trgm:{table}.{column}", table,
+                            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{table}_{column}_trgm "
+                            f"ON {table} USING gin ({column} gin_trgm_ops);",
+                            f"ILIKE com curinga inicial em {column} força Seq Scan (requer CREATE EXTENSION pg_trgm)",
+                            fp, removed,
+                        )
+                    elif op not in ("<>", "!~~*") and not _already_indexed(table, column, existing):
+                        suggest(
+                            f"btree:{table}.{column}", table,
+                            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{table}_{column} ON {table} ({column});",
+                            f"Seq Scan descartou {removed} linhas filtrando por {column}",
+                            fp, removed,
+                        )
+
+            if node_type == "Sort" and node.get("Actual Rows", 0) * node.get("Actual Loops", 1) >= ADVISOR_MIN_SORT_ROWS:
+                keys = [re.sub(r"[()]|\s+(DESC|ASC|NULLS \w+)", "", k).split(".")[-1] for k in node.get("Sort Key", [])]
+                keys = [k for k in keys if re.fullmatch(r"\w+", k)]
+                if keys and table and not _already_indexed(table, keys[0], existing):
+                    cols = ", ".join(keys)
+                    suggest(
+                        f"sort:{table}.{cols}", table,
+                        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{table}_{'_'.join(keys)} ON {table} ({cols});",
+                        f"Ordenação de {node.get('Actual Rows')} linhas ({node.get('Sort Method', 'sort')}) por {cols}",
+                        fp, node.get("Actual Rows", 0),
+                    )
+
+    return sorted(suggestions.values(), key=lambda s: s["rows_affected"], reverse=True)
+
+
+# Instância global
+_query_log: Optional[QueryLog] = None
+
+
+def get_query_log() -> QueryLog:
+    """Obtém a instância global do slow-query log."""
+    global _query_log
+    if _query_log is None:
+        _query_log = QueryLog()
+    return _query_log
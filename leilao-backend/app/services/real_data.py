@@ -1,2415 +1,55 @@
 """
 Real property data scraped from Portal Zuk, Superbid, and Mega Leiloes.
-This file is auto-generated by the scraper.
 Last updated: 2025-12-10 18:13:00 (corrected price extraction)
+
+Os imóveis ficam em app/config/real_properties.ndjson (um JSON por linha,
+só os campos diferentes do default) e são lidos sob demanda pelo backend
+em memória, em vez de um literal Python de 2.400 linhas compilado e
+executado no import.
+
+Cada linha vai direto para Property.model_validate_json: no pydantic v2
+o parse + validação roda no core em Rust e sai ~5x mais rápido que
+json.loads + model_construct (que monta o objeto em Python).
+Benchmark: scripts/benchmark_dev_dataset.py
 """
 
+import json
+import os
 from datetime import datetime
-from typing import List
-from app.models.property import Property, PropertyCategory, AuctionType
+from typing import Iterator, List
+
+from app.models.property import Property
+
+REAL_PROPERTIES_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "config", "real_properties.ndjson"
+)
+
+# Campos que não são gravados no arquivo (definidos na carga)
+_RUNTIME_FIELDS = ("created_at", "updated_at")
+
+
+def iter_real_properties(path: str = REAL_PROPERTIES_FILE) -> Iterator[Property]:
+    """Lê o dataset linha a linha."""
+    now = datetime.now()
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            prop = Property.model_validate_json(line)
+            prop.created_at = now
+            prop.updated_at = now
+            yield prop
 
 
 def get_real_properties() -> List[Property]:
     """Return list of real properties scraped from auctioneers."""
-    return [
-        Property(
-            id="975ddca9-1caf-41d6-a0d8-cbc6938941c2",
-            title="Imóvel Residencial à venda em leilão - Campinas / SP- Dos AmaraisRua Projetada,  190 - Campinas/SP",
-            description="Imóvel Residencial à venda em leilão - Campinas / SP- Dos AmaraisRua Projetada,  190 - Campinas/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Campinas",
-            neighborhood="Jardim Sao Goncalo",
-            address="Campinas / SP- Dos AmaraisRua Projetada,  190",
-            area_total=49.08,
-            evaluation_value=425695.01,
-            first_auction_value=425695.01,
-            second_auction_value=404410.26,
-            discount_percentage=5.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/26a0787a51491c2e1ffbe9644a5aae7e.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/campinas/jardim-sao-goncalo/rua-joao-baptista-vicentin-11/34757-214201",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/campinas/jardim-sao-goncalo/rua-joao-baptista-vicentin-11/34757-214201",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="8b4387b3-c596-46e3-96b3-0bf057a3076c",
-            title="Box de Garagem à venda em leilão - São Paulo / SP- RepúblicaRua Araújo,  70 - Sao Paulo/SP",
-            description="Box de Garagem à venda em leilão - São Paulo / SP- RepúblicaRua Araújo,  70 - Sao Paulo/SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Republica",
-            address="São Paulo / SP- RepúblicaRua Araújo,  70",
-            area_total=20.0,
-            evaluation_value=13526.44,
-            first_auction_value=13526.44,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/754e45c7d8942a12074b642b969d5d88.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/republica/rua-araujo-154/34740-213993",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/republica/rua-araujo-154/34740-213993",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="bfd6f060-ef58-4de0-9557-4e40a41ced0a",
-            title="Box de Garagem à venda em leilão - São Paulo / SP- RepúblicaRua Araújo,  70 - Sao Paulo/SP",
-            description="Box de Garagem à venda em leilão - São Paulo / SP- RepúblicaRua Araújo,  70 - Sao Paulo/SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Republica",
-            address="São Paulo / SP- RepúblicaRua Araújo,  70",
-            area_total=20.0,
-            evaluation_value=13526.44,
-            first_auction_value=13526.44,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/4217eab86527cc5d9963b85f863fb02d.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/republica/rua-araujo-154/34740-213994",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/republica/rua-araujo-154/34740-213994",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="6c3ee4f5-c997-42b2-a862-46ac85cf5015",
-            title="Apartamento à venda em leilão - Colina / SP- Jardim São JoãoRua D,  124 - Olimpia/SP",
-            description="Apartamento à venda em leilão - Colina / SP- Jardim São JoãoRua D,  124 - Olimpia/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Olimpia",
-            neighborhood="Jardim Santa Ifigenia",
-            address="Colina / SP- Jardim São JoãoRua D,  124",
-            area_total=141.24,
-            evaluation_value=135124.94,
-            first_auction_value=135124.94,
-            second_auction_value=81074.96,
-            discount_percentage=40.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/f65d4f7ac88efe54892f74394744d79f.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/olimpia/jardim-santa-ifigenia/avenida-aurora-forti-neves-1.030/34735-213970",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/olimpia/jardim-santa-ifigenia/avenida-aurora-forti-neves-1.030/34735-213970",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="663aa1c4-f8c5-4997-a47c-278f12a314f2",
-            title="Sobrado à venda em leilão - Campinas / SP- Jardim São GonçaloRua João Baptista Vicentin,  11 - Campinas/SP",
-            description="Sobrado à venda em leilão - Campinas / SP- Jardim São GonçaloRua João Baptista Vicentin,  11 - Campinas/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Campinas",
-            neighborhood="Loteamento Alphaville Campinas",
-            address="Campinas / SP- Jardim São GonçaloRua João Baptista Vicentin,  11",
-            area_total=49.08,
-            evaluation_value=7329729.86,
-            first_auction_value=7329729.86,
-            second_auction_value=4397837.91,
-            discount_percentage=40.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/10/22f9cb35234c8c00d43945201d0e7025.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/campinas/loteamento-alphaville-campinas/rua-marica-21/34550-212583",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/campinas/loteamento-alphaville-campinas/rua-marica-21/34550-212583",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="1c2ac4d7-7e87-4fb4-8860-8d4777deaa8c",
-            title="Terreno à venda em leilão - Atibaia / SP- CaetetubaAvenida Jerônimo de Camargo,  6997 - Bom Jesus Dos Perdoes/SP",
-            description="Terreno à venda em leilão - Atibaia / SP- CaetetubaAvenida Jerônimo de Camargo,  6997 - Bom Jesus Dos Perdoes/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Bom Jesus Dos Perdoes",
-            neighborhood="Parque Hortensia",
-            address="Atibaia / SP- CaetetubaAvenida Jerônimo de Camargo,  6997",
-            area_total=44.93,
-            evaluation_value=None,
-            first_auction_value=None,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/08/064dcec00ff2c102aa4b7cb39c26e0c5.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/bom-jesus-dos-perdoes/parque-hortensia/travessa-panama-s-n%C2%BA/33755-207138",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/bom-jesus-dos-perdoes/parque-hortensia/travessa-panama-s-n%C2%BA/33755-207138",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="88c0a662-b49b-446a-af56-44aa36a6b096",
-            title="Terrenos à venda em leilão - Ibitinga / SP- Jardim CentenárioAvenida José Zapatta,  S/n - Ibitinga/SP",
-            description="Terrenos à venda em leilão - Ibitinga / SP- Jardim CentenárioAvenida José Zapatta,  S/n - Ibitinga/SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Ibitinga",
-            neighborhood="Jardim Sao Jose",
-            address="Ibitinga / SP- Jardim CentenárioAvenida José Zapatta,  S/n",
-            area_total=260.0,
-            evaluation_value=133124.18,
-            first_auction_value=133124.18,
-            second_auction_value=106499.34,
-            discount_percentage=20.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/7a5b0866a8f757291d1a340bc3f405cd.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/ibitinga/jardim-sao-jose/avenida-dom-pedro-ii-s-n/34708-213740",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/ibitinga/jardim-sao-jose/avenida-dom-pedro-ii-s-n/34708-213740",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="9ee77841-da67-469f-a4c3-e4fb7460fe77",
-            title="Casa à venda em leilão - Ibitinga / SP- Jardim São JoséAvenida Dom Pedro II,  S/n - Ibitinga/SP",
-            description="Casa à venda em leilão - Ibitinga / SP- Jardim São JoséAvenida Dom Pedro II,  S/n - Ibitinga/SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Ibitinga",
-            neighborhood="Centro",
-            address="Ibitinga / SP- Jardim São JoséAvenida Dom Pedro II,  S/n",
-            area_total=330.0,
-            evaluation_value=136149.74,
-            first_auction_value=136149.74,
-            second_auction_value=108919.79,
-            discount_percentage=20.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/eb109a168a2bd8de6d649e473362df6a.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/ibitinga/centro/rua-gama-cerqueira-356/34708-213741",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/ibitinga/centro/rua-gama-cerqueira-356/34708-213741",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="5b69dcfd-3f03-4baa-82b9-6f0ae5072b5b",
-            title="Terrenos à venda em leilão - Ibitinga / SP- Jardim São JoséAvenida Dom Pedro II,  S/n - Ibitinga/SP",
-            description="Terrenos à venda em leilão - Ibitinga / SP- Jardim São JoséAvenida Dom Pedro II,  S/n - Ibitinga/SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Ibitinga",
-            neighborhood="Jardim Centenario",
-            address="Ibitinga / SP- Jardim São JoséAvenida Dom Pedro II,  S/n",
-            area_total=330.0,
-            evaluation_value=302554.96,
-            first_auction_value=302554.96,
-            second_auction_value=242043.97,
-            discount_percentage=20.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/9159fc88dd75b3e49d82e558e4d73b3e.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/ibitinga/jardim-centenario/avenida-jose-zapatta-s-n/34708-213742",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/ibitinga/jardim-centenario/avenida-jose-zapatta-s-n/34708-213742",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="a0e97497-a1c9-4562-9248-5acdc333b76d",
-            title="Casa à venda em leilão - Ribeirão Preto / SP- CentroRua Barão do Amazonas,  685 - Ribeirao Preto/SP",
-            description="Casa à venda em leilão - Ribeirão Preto / SP- CentroRua Barão do Amazonas,  685 - Ribeirao Preto/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Ribeirao Preto",
-            neighborhood="Vila Tiberio",
-            address="Ribeirão Preto / SP- CentroRua Barão do Amazonas,  685",
-            area_total=30.34,
-            evaluation_value=200000.0,
-            first_auction_value=200000.0,
-            second_auction_value=140000.0,
-            discount_percentage=30.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/5b6fc8591dda87d11421750e82fab204.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/ribeirao-preto/vila-tiberio/rua-conselheiro-dantas-1184/34777-214259",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/ribeirao-preto/vila-tiberio/rua-conselheiro-dantas-1184/34777-214259",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="5372a800-d9ba-47d5-865b-29e64d926d42",
-            title="Terreno à venda em leilão - São Paulo / SP- PerdizesRua Itapicuru,  369 - Sao Paulo/SP",
-            description="Terreno à venda em leilão - São Paulo / SP- PerdizesRua Itapicuru,  369 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Barra Funda",
-            address="São Paulo / SP- PerdizesRua Itapicuru,  369",
-            area_total=36.91,
-            evaluation_value=281720.11,
-            first_auction_value=281720.11,
-            second_auction_value=140860.05,
-            discount_percentage=50.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/935a8c8c088382b1d52cba0adee0e30e.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/barra-funda/rua-lopes-chaves-262/34653-213485",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/barra-funda/rua-lopes-chaves-262/34653-213485",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="57df2019-9b6a-4d9f-b51d-137d75ca93f6",
-            title="Terreno c/benfeitorias à venda em leilão - Ribeirão Preto / SP- IndependênciaRua Luiz Pedro Bom,  100 - Ribeirao Preto/SP",
-            description="Terreno c/benfeitorias à venda em leilão - Ribeirão Preto / SP- IndependênciaRua Luiz Pedro Bom,  100 - Ribeirao Preto/SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Ribeirao Preto",
-            neighborhood="Bairro Das Palmeiras",
-            address="Ribeirão Preto / SP- IndependênciaRua Luiz Pedro Bom,  100",
-            area_total=207.62,
-            evaluation_value=None,
-            first_auction_value=None,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/5ff1cf987ce13fb320fcbadf18ae2016.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/ribeirao-preto/bairro-das-palmeiras/rua-jeronimo-alfredo-amor-espin-s-n/34653-213489",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/ribeirao-preto/bairro-das-palmeiras/rua-jeronimo-alfredo-amor-espin-s-n/34653-213489",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="a3eacafd-b4a4-4069-9ed6-5eea58768331",
-            title="Apartamento à venda em leilão - Guarulhos / SP- São MiguelRua Mucugeo,  215 - Guarulhos/SP",
-            description="Apartamento à venda em leilão - Guarulhos / SP- São MiguelRua Mucugeo,  215 - Guarulhos/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Guarulhos",
-            neighborhood="Jardim Nova Cidade",
-            address="Guarulhos / SP- São MiguelRua Mucugeo,  215",
-            area_total=46.25,
-            evaluation_value=232837.09,
-            first_auction_value=232837.09,
-            second_auction_value=116418.54,
-            discount_percentage=50.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/a76904335e81620e2d68ee699bee5861.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/guarulhos/jardim-nova-cidade/estrada-do-caminho-velho-525/34747-214025",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/guarulhos/jardim-nova-cidade/estrada-do-caminho-velho-525/34747-214025",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="3cacae35-8df3-4b34-b416-166b979e3da4",
-            title="Apartamento à venda em leilão - São Paulo / SP- ParaísoRua Correia Dias,  526 - Sao Paulo/SP",
-            description="Apartamento à venda em leilão - São Paulo / SP- ParaísoRua Correia Dias,  526 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Moema",
-            address="São Paulo / SP- ParaísoRua Correia Dias,  526",
-            area_total=37.99,
-            evaluation_value=3854190.44,
-            first_auction_value=3854190.44,
-            second_auction_value=3036720.75,
-            discount_percentage=21.2,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/1cbf1ecdd82e6ecb8351532a33b498be.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/moema/alameda-dos-nhambiquaras-1990/34696-213712",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/moema/alameda-dos-nhambiquaras-1990/34696-213712",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="a76c791e-0c09-4504-b8ae-1fa950beffa8",
-            title="Apartamento à venda em leilão - Rua Minas Gerais, 316 – Cj 62 - HigienópolisSão Paulo/SP, CEP: 01244-010 - Zuk - Sao Paulo/SP",
-            description="Apartamento à venda em leilão - Rua Minas Gerais, 316 – Cj 62 - HigienópolisSão Paulo/SP, CEP: 01244-010 - Zuk - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Jardim Paulista",
-            address="Rua Minas Gerais, 316 – Cj 62 - HigienópolisSão Paulo/SP, CEP: 01244-010 - Zuk",
-            area_total=235.94,
-            evaluation_value=1832565.11,
-            first_auction_value=1832565.11,
-            second_auction_value=916282.56,
-            discount_percentage=50.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/5848b44c906b88d9f60ad8531efe05d6.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/jardim-paulista/alameda-fernao-cardim-217/34758-214202",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/jardim-paulista/alameda-fernao-cardim-217/34758-214202",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="c27a5a9b-f325-434d-82ab-312e5b5241c0",
-            title="Casa à venda em leilão - São Paulo / SP- Jardim Maria NazaréRua Francisco Guimarães Pereira Júnior,  19 - Sao Paulo/SP",
-            description="Casa à venda em leilão - São Paulo / SP- Jardim Maria NazaréRua Francisco Guimarães Pereira Júnior,  19 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Vila Nova Mazzei",
-            address="São Paulo / SP- Jardim Maria NazaréRua Francisco Guimarães Pereira Júnior,  19",
-            area_total=67.74,
-            evaluation_value=609178.11,
-            first_auction_value=609178.11,
-            second_auction_value=304589.05,
-            discount_percentage=50.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/2168df9bc7cb6eaa41ddf49919ff0707.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/vila-nova-mazzei/rua-das-imbiras-791/34763-214219",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/vila-nova-mazzei/rua-das-imbiras-791/34763-214219",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="5e409f4c-bfab-427d-b30d-d765b9534f99",
-            title="Casa à venda em leilão - São Paulo / SP- Vila MonumentoRua Mongóis,  54 - Sao Paulo/SP",
-            description="Casa à venda em leilão - São Paulo / SP- Vila MonumentoRua Mongóis,  54 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Ipiranga",
-            address="São Paulo / SP- Vila MonumentoRua Mongóis,  54",
-            area_total=68.0,
-            evaluation_value=1593918.56,
-            first_auction_value=1593918.56,
-            second_auction_value=796959.28,
-            discount_percentage=50.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/6978b3a5326d3e8cd8ccbb43b8c11947.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/ipiranga/rua-costa-aguiar-1534/34742-214020",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/ipiranga/rua-costa-aguiar-1534/34742-214020",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="5489fa76-4592-4274-aea0-ab6af277fc25",
-            title="Sobrado à venda em leilão - Guarujá / SP- Vicente de CarvalhoRua Seis,  13 - Guaruja/SP",
-            description="Sobrado à venda em leilão - Guarujá / SP- Vicente de CarvalhoRua Seis,  13 - Guaruja/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Guaruja",
-            neighborhood="Vicente De Carvalho",
-            address="Guarujá / SP- Vicente de CarvalhoRua Seis,  13",
-            area_total=57.0,
-            evaluation_value=1002470.26,
-            first_auction_value=1002470.26,
-            second_auction_value=601482.16,
-            discount_percentage=40.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/c7d9a6fd75a23fd16ee157fda1ee9f90.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/guaruja/vicente-de-carvalho/rua-para-255/34761-214211",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/guaruja/vicente-de-carvalho/rua-para-255/34761-214211",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="5e99dbcf-ca8c-44bb-a8dc-625876a67d29",
-            title="Apartamento à venda em leilão - São Paulo / SP- PerdizesRua Ministro Ferreira Alves,  1031 - Sao Paulo/SP",
-            description="Apartamento à venda em leilão - São Paulo / SP- PerdizesRua Ministro Ferreira Alves,  1031 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Lapa",
-            address="São Paulo / SP- PerdizesRua Ministro Ferreira Alves,  1031",
-            area_total=138.19,
-            evaluation_value=1143717.43,
-            first_auction_value=1143717.43,
-            second_auction_value=857788.07,
-            discount_percentage=25.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/9042cc963d7bf34243bbfa8002abc58f.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/lapa/rua-tito-86/34755-214193",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/lapa/rua-tito-86/34755-214193",
-            accepts_financing=True,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="00a42ca1-c98a-4a78-b3ef-4d1dcba2e6d8",
-            title="Garagem à venda em leilão - São Paulo / SP- PerdizesRua Ministro Ferreira Alves,  1031 - Sao Paulo/SP",
-            description="Garagem à venda em leilão - São Paulo / SP- PerdizesRua Ministro Ferreira Alves,  1031 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Lapa",
-            address="São Paulo / SP- PerdizesRua Ministro Ferreira Alves,  1031",
-            area_total=63.59,
-            evaluation_value=69635.94,
-            first_auction_value=69635.94,
-            second_auction_value=52226.96,
-            discount_percentage=25.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/50da89d1a89ac477d2e01cdbabea2fbf.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/lapa/rua-tito-86/34755-214194",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/lapa/rua-tito-86/34755-214194",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="cbb342e9-95ca-4573-8b73-e91f78874cdd",
-            title="Garagem à venda em leilão - São Paulo / SP- PerdizesRua Ministro Ferreira Alves,  1031 - Sao Paulo/SP",
-            description="Garagem à venda em leilão - São Paulo / SP- PerdizesRua Ministro Ferreira Alves,  1031 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Lapa",
-            address="São Paulo / SP- PerdizesRua Ministro Ferreira Alves,  1031",
-            area_total=31.79,
-            evaluation_value=34817.97,
-            first_auction_value=34817.97,
-            second_auction_value=26113.48,
-            discount_percentage=25.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/6ebc18f58ab50610efb1758c9db043d6.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/lapa/rua-tito-86/34755-214195",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/lapa/rua-tito-86/34755-214195",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="bcba277f-095b-4b92-8a89-64addbe0272a",
-            title="Conjunto Comercial à venda em leilão - São Paulo / SP- RepúblicaRua Araújo,  62 e 70 - Sao Paulo/SP",
-            description="Conjunto Comercial à venda em leilão - São Paulo / SP- RepúblicaRua Araújo,  62 e 70 - Sao Paulo/SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Republica",
-            address="São Paulo / SP- RepúblicaRua Araújo,  62 e 70",
-            area_total=69.76,
-            evaluation_value=285929.36,
-            first_auction_value=285929.36,
-            second_auction_value=214447.02,
-            discount_percentage=25.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/ded995f1415e3ca58242c16537ec516e.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/republica/rua-araujo-70/34755-214196",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/republica/rua-araujo-70/34755-214196",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="d0d681ed-341b-43dc-a558-3054f8ea2dc4",
-            title="Box de Garagem à venda em leilão - São Paulo / SP- RepúblicaRua Araújo,  70 - Sao Paulo/SP",
-            description="Box de Garagem à venda em leilão - São Paulo / SP- RepúblicaRua Araújo,  70 - Sao Paulo/SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Republica",
-            address="São Paulo / SP- RepúblicaRua Araújo,  70",
-            area_total=40.59,
-            evaluation_value=30597.61,
-            first_auction_value=30597.61,
-            second_auction_value=22948.21,
-            discount_percentage=25.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/d4465ac1c4d93132163470939104a1f2.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/republica/rua-araujo-62-e-70/34755-214197",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/republica/rua-araujo-62-e-70/34755-214197",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="594e3c53-3f87-477a-9653-15577aee2ace",
-            title="Apartamentos à venda em leilão - São Paulo / SP- PerdizesRua Tucuna,  913 - Sao Paulo/SP",
-            description="Apartamentos à venda em leilão - São Paulo / SP- PerdizesRua Tucuna,  913 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Perdizes",
-            address="São Paulo / SP- PerdizesRua Tucuna,  913",
-            area_total=161.58,
-            evaluation_value=728012.02,
-            first_auction_value=728012.02,
-            second_auction_value=546009.02,
-            discount_percentage=25.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/9ef4e776ae5a86e50ad42089ef7d2acd.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/perdizes/rua-tucuna-114/34755-214198",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/perdizes/rua-tucuna-114/34755-214198",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="9f00b4cf-f8b3-446f-9ab0-cc67b08f700a",
-            title="Garagem à venda em leilão - São Paulo / SP- LapaRua Tito,  86 - Sao Paulo/SP",
-            description="Garagem à venda em leilão - São Paulo / SP- LapaRua Tito,  86 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Perdizes",
-            address="São Paulo / SP- LapaRua Tito,  86",
-            area_total=55.09,
-            evaluation_value=61195.21,
-            first_auction_value=61195.21,
-            second_auction_value=45896.41,
-            discount_percentage=25.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/8a68e1d08b996d313da4601a07b441fe.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/perdizes/rua-ministro-ferreira-alves-1031/34755-214199",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/perdizes/rua-ministro-ferreira-alves-1031/34755-214199",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="9c5e1279-21c4-4cb6-97f4-f84392eeef81",
-            title="Apartamento à venda em leilão - Taubaté / SP- Jardim JaraguáAvenida Manoel Antônio de Carvalho,  590 - Taubate/SP",
-            description="Apartamento à venda em leilão - Taubaté / SP- Jardim JaraguáAvenida Manoel Antônio de Carvalho,  590 - Taubate/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Taubate",
-            neighborhood="Vila Sao Jose",
-            address="Taubaté / SP- Jardim JaraguáAvenida Manoel Antônio de Carvalho,  590",
-            area_total=114.78,
-            evaluation_value=287235.48,
-            first_auction_value=287235.48,
-            second_auction_value=172341.29,
-            discount_percentage=40.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/d2ddea1bca67a8ac62e8c3638e4db934.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/taubate/vila-sao-jose/rua-padre-timoteo-correa-de-toledo-453/34748-214026",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/taubate/vila-sao-jose/rua-padre-timoteo-correa-de-toledo-453/34748-214026",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="3cabb58c-3499-4f73-b10c-218785a08ab6",
-            title="Apartamento à venda em leilão - São Paulo / SP- Jardim MonjoloRua Professor Rivadávia de Campos,  169 - Sao Paulo/SP",
-            description="Apartamento à venda em leilão - São Paulo / SP- Jardim MonjoloRua Professor Rivadávia de Campos,  169 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Nossa Senhora Do O",
-            address="São Paulo / SP- Jardim MonjoloRua Professor Rivadávia de Campos,  169",
-            area_total=88.95,
-            evaluation_value=374302.09,
-            first_auction_value=374302.09,
-            second_auction_value=324677.89,
-            discount_percentage=13.3,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/b252807072d4c00ba2098f5bcf55a7d7.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/nossa-senhora-do-o/rua-professor-joao-machado-255/34665-213554",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/nossa-senhora-do-o/rua-professor-joao-machado-255/34665-213554",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="0296cab5-33f6-4a37-9023-dc123f920d5d",
-            title="Casa à venda em leilão - Vargem Grande Paulista / SP- Condomínio Villagio Chácaras do CarmoEstrada Municipal do Carmo,  626 - Cotia/SP",
-            description="Casa à venda em leilão - Vargem Grande Paulista / SP- Condomínio Villagio Chácaras do CarmoEstrada Municipal do Carmo,  626 - Cotia/SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Cotia",
-            neighborhood="Aguassai _ Agua Espraiada",
-            address="Vargem Grande Paulista / SP- Condomínio Villagio Chácaras do CarmoEstrada Municipal do Carmo,  626",
-            area_total=131.42,
-            evaluation_value=176880.0,
-            first_auction_value=176880.0,
-            second_auction_value=170412.43,
-            discount_percentage=3.7,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/413471cbbbdd330367f7f10dd2d31cbc.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/cotia/aguassai-_-agua-espraiada/rua-jose-teixeira-de-oliveira-680/34665-213556",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/cotia/aguassai-_-agua-espraiada/rua-jose-teixeira-de-oliveira-680/34665-213556",
-            accepts_financing=True,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="7551dc43-bdc0-484b-99ce-52ec1dbb13d6",
-            title="Casa à venda em leilão - São Paulo / SP- Jardim PaulistaRua Alvorada,  616 - Sao Paulo/SP",
-            description="Casa à venda em leilão - São Paulo / SP- Jardim PaulistaRua Alvorada,  616 - Sao Paulo/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Jardim Novo Mundo",
-            address="São Paulo / SP- Jardim PaulistaRua Alvorada,  616",
-            area_total=25.99,
-            evaluation_value=1750854.79,
-            first_auction_value=1750854.79,
-            second_auction_value=875427.4,
-            discount_percentage=50.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/c1031accff733336e2e92fb7c04814a9.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/jardim-novo-mundo/rua-doutor-jose-candido-de-souza-735/34765-214234",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sao-paulo/jardim-novo-mundo/rua-doutor-jose-candido-de-souza-735/34765-214234",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="813bca40-d88e-41dd-9234-92d3c602c271",
-            title="Casa à venda em leilão - Sorocaba / SP- Jardim HungaresRua Professor Armando Rizzo,  440 - Sorocaba/SP",
-            description="Casa à venda em leilão - Sorocaba / SP- Jardim HungaresRua Professor Armando Rizzo,  440 - Sorocaba/SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sorocaba",
-            neighborhood="Jardim Saira",
-            address="Sorocaba / SP- Jardim HungaresRua Professor Armando Rizzo,  440",
-            area_total=47.28,
-            evaluation_value=538795.36,
-            first_auction_value=538795.36,
-            second_auction_value=323277.22,
-            discount_percentage=40.0,
-            image_url="https://imagens.portalzuk.com.br/detalhe/2025/11/a37a0143ff5f13c3d536ee2c470b2a21.webp",
-            auctioneer_url="https://www.portalzuk.com.br/imovel/sp/sorocaba/jardim-saira/alameda-itapira-183/34759-214209",
-            auctioneer_name="Portal Zuk",
-            auctioneer_id="portal_zuk",
-            source_url="https://www.portalzuk.com.br/imovel/sp/sorocaba/jardim-saira/alameda-itapira-183/34759-214209",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        # Superbid properties (10 properties)
-        Property(
-            id="superbid-4466863",
-            title="Casa 144m², Ocidental Parque, Cidade Ocidental/GO - Ocupada",
-            description="Casa 144m², Ocidental Parque, Cidade Ocidental/GO - Ocupada.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="GO",
-            city="Cidade Ocidental",
-            neighborhood="Ocidental Parque",
-            address="SQ 16, lote 46, quadra 06, Bairro Ocidental Parque, Cidade Ocidental/GO",
-            area_total=144.0,
-            evaluation_value=361613.19,
-            first_auction_value=361613.19,
-            second_auction_value=437466.29,
-            discount_percentage=None,
-            image_url="https://ms.sbwebservices.net/photos/23b5a07d-057d-4247-9007-ee5fddf80d27.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/casa-144ma2-ocidental-parque-cidade-ocidental-go-ocupada-4466863",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/casa-144ma2-ocidental-parque-cidade-ocidental-go-ocupada-4466863",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="superbid-4489340",
-            title="Apto 76m², 1 Vaga no Edificio Residencial Malaga, Santa Candida, Curitiba/PR",
-            description="Apto 76m², 1 Vaga no Edificio Residencial Malaga no Bairro Santa Candida em Curitiba/PR.",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="PR",
-            city="Curitiba",
-            neighborhood="Santa Candida",
-            address="Rua Coronel Wallace Scott Murray, 365, Apto 103, Edificio Residencial Malaga",
-            area_total=76.0,
-            evaluation_value=343233.36,
-            first_auction_value=343233.36,
-            second_auction_value=291080.31,
-            discount_percentage=15.2,
-            image_url="https://ms.sbwebservices.net/photos/495ff861-b59c-4093-b9d6-983c004ba458.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/apto-76ma2-1-vaga-no-edifacio-residencial-malaga-no-bairro-santa-candida-em-curitiba-pr-4489340",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/apto-76ma2-1-vaga-no-edifacio-residencial-malaga-no-bairro-santa-candida-em-curitiba-pr-4489340",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="superbid-4476879",
-            title="Casa 139m² no Centro, Pirassununga/SP",
-            description="Casa 139m² no Centro, Pirassununga/SP.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Pirassununga",
-            neighborhood="Centro",
-            address="Rua Theodoro Mac Can, 254, Centro, Pirassununga/SP",
-            area_total=139.0,
-            evaluation_value=370905.93,
-            first_auction_value=370905.93,
-            second_auction_value=237472.83,
-            discount_percentage=36.0,
-            image_url="https://ms.sbwebservices.net/photos/412b82e4-fd92-47b7-af9e-a9b0189c7a54.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/casa-139ma2-no-centro-pirassununga-sp-4476879",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/casa-139ma2-no-centro-pirassununga-sp-4476879",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="superbid-4504824",
-            title="Casa 495m², Recanto dos Passaros, Sorriso/MT - Ocupado",
-            description="Casa 495m², Recanto dos Passaros, Sorriso/MT - Ocupado.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="MT",
-            city="Sorriso",
-            neighborhood="Recanto dos Passaros",
-            address="Rua dos Canarios, 365, Recanto dos Passaros, Sorriso/MT",
-            area_total=495.0,
-            evaluation_value=1501528.23,
-            first_auction_value=1501528.23,
-            second_auction_value=1136405.02,
-            discount_percentage=24.3,
-            image_url="https://ms.sbwebservices.net/photos/a1630ed8-a27b-4834-8f9d-d86213930125.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/casa-495ma2-recanto-dos-passaros-sorriso-mt-ocupado-4504824",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/casa-495ma2-recanto-dos-passaros-sorriso-mt-ocupado-4504824",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="superbid-4504848",
-            title="Casa 360m², Chacaras de Inoa, Marica/RJ - Ocupada",
-            description="Casa 360m², Chacaras de Inoa, Marica/RJ - Ocupada.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="RJ",
-            city="Marica",
-            neighborhood="Chacaras de Inoa",
-            address="Rua Tres, 114, casa 814, Condominio Reserva Residencial, Chacaras de Inoa, Marica/RJ",
-            area_total=360.0,
-            evaluation_value=384509.87,
-            first_auction_value=384509.87,
-            second_auction_value=297974.69,
-            discount_percentage=22.5,
-            image_url="https://ms.sbwebservices.net/photos/0057cc81-56a8-4a24-9272-3345c0aeb81d.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/casa-360ma2-chacaras-de-inoa-marica-rj-ocupada-4504848",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/casa-360ma2-chacaras-de-inoa-marica-rj-ocupada-4504848",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="superbid-4490663",
-            title="Casa 60m², Vila Ipora, Guapimirim/RJ - Ocupada",
-            description="Casa 60m², Vila Ipora, em Guapimirim/RJ - Ocupada.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="RJ",
-            city="Guapimirim",
-            neighborhood="Vila Ipora",
-            address="Rua Sargento Mendes, 419, Casa 1, Vila Ipora, Guapimirim/RJ",
-            area_total=60.0,
-            evaluation_value=205869.35,
-            first_auction_value=205869.35,
-            second_auction_value=163983.20,
-            discount_percentage=20.3,
-            image_url="https://ms.sbwebservices.net/photos/bc444e2b-46dd-41ef-a79a-32dcbe4f9c0a.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/casa-60ma2-vila-ipora-em-guapimirim-rj-ocupada-4490663",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/casa-60ma2-vila-ipora-em-guapimirim-rj-ocupada-4490663",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="superbid-4479740",
-            title="Casa 172m², Loteamento Paraizo, Conceicao do Almeida/BA - Ocupada",
-            description="Casa 172m², Loteamento Paraizo, Conceicao do Almeida/BA - Ocupada.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="BA",
-            city="Conceicao do Almeida",
-            neighborhood="Loteamento Paraizo",
-            address="Rua E, Lote 10, Quadra G, Loteamento Paraizo, Conceicao do Almeida/BA",
-            area_total=172.0,
-            evaluation_value=420638.50,
-            first_auction_value=420638.50,
-            second_auction_value=145791.57,
-            discount_percentage=65.3,
-            image_url="https://ms.sbwebservices.net/photos/3b4a3d83-b2f7-4b66-9843-a623d4f6d0c7.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/casa-172ma2-loteamento-paraizo-conceiaao-do-almeida-ba-ocupada-4479740",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/casa-172ma2-loteamento-paraizo-conceiaao-do-almeida-ba-ocupada-4479740",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="superbid-4498037",
-            title="Casa 142m², Jardim Anzai, Suzano/SP - Ocupada",
-            description="Casa 142m², Jardim Anzai, Suzano/SP - Ocupada.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Suzano",
-            neighborhood="Jardim Anzai",
-            address="Rua Maria de Lourdes F. de Almeida, 55, Jardim Anzai, Suzano/SP",
-            area_total=142.0,
-            evaluation_value=571147.59,
-            first_auction_value=571147.59,
-            second_auction_value=447950.04,
-            discount_percentage=21.6,
-            image_url="https://ms.sbwebservices.net/photos/12dc9def-6b8b-49a4-b332-6f0e7bfb0078.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/casa-142ma2-jardim-anzai-suzano-sp-ocupada-4498037",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/casa-142ma2-jardim-anzai-suzano-sp-ocupada-4498037",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="superbid-4500584",
-            title="Sobrado 197m², 1 Vaga no Residencial Tapajos, Vila Cachoeirinha, Cachoeirinha/RS",
-            description="Sobrado 197m², 1 Vaga no Residencial Tapajos na Vila Cachoeirinha em Cachoeirinha/RS.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="RS",
-            city="Cachoeirinha",
-            neighborhood="Vila Cachoeirinha",
-            address="Rua Tapajos, 168, Sobrado 04, Residencial Tapajos, Vila Cachoeirinha, Cachoeirinha/RS",
-            area_total=197.0,
-            evaluation_value=443978.01,
-            first_auction_value=443978.01,
-            second_auction_value=278789.34,
-            discount_percentage=37.2,
-            image_url="https://ms.sbwebservices.net/photos/1b5d47d3-ea3c-416a-b25a-127ef943f158.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/sobrado-197ma2-1-vaga-no-residencial-tapaja3s-na-vila-cachoeirinha-em-cachoeirinha-rs-4500584",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/sobrado-197ma2-1-vaga-no-residencial-tapaja3s-na-vila-cachoeirinha-em-cachoeirinha-rs-4500584",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="superbid-4459146",
-            title="Casa 124m², Parque Residencial Santa Cruz, Cascavel/PR - Ocupada",
-            description="Casa 124m², Parque Residencial Santa Cruz, Cascavel/PR - Ocupada.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="PR",
-            city="Cascavel",
-            neighborhood="Parque Residencial Santa Cruz",
-            address="Rua Kamayuras, 434, casa 01, Condominio Residencial Zaramella, Parque Residencial Santa Cruz",
-            area_total=124.0,
-            evaluation_value=760988.76,
-            first_auction_value=760988.76,
-            second_auction_value=903773.23,
-            discount_percentage=None,
-            image_url="https://ms.sbwebservices.net/photos/f9d6ec7c-e2d6-49c0-98c4-0c3b2b98f7d5.jpg",
-            auctioneer_url="https://www.superbid.net/oferta/casa-124ma2-parque-residencial-santa-cruz-cascavel-pr-ocupada-4459146",
-            auctioneer_name="Superbid",
-            auctioneer_id="superbid",
-            source_url="https://www.superbid.net/oferta/casa-124ma2-parque-residencial-santa-cruz-cascavel-pr-ocupada-4459146",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        # Mega Leiloes properties (10 properties)
-        Property(
-            id="megaleiloes-X118312",
-            title="Predio Comercial 1.400 m² - Foz do Iguacu-PR - Av. Brasil, 509 - Centro",
-            description="Predio Comercial 1.400 m² - Foz do Iguacu-PR - Av. Brasil, 509 - Centro",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="PR",
-            city="Foz Do Iguacu",
-            neighborhood="Centro",
-            address="Av. Brasil, 509 - Centro, Foz do Iguacu-PR",
-            area_total=1400.0,
-            evaluation_value=11126448.58,
-            first_auction_value=11126448.58,
-            second_auction_value=2980800.0,
-            discount_percentage=73.2,
-            image_url="https://cdn1.megaleiloes.com.br/batches/118312/d4ea233fac15d0819f4c07d6d73e9512_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/imoveis-comerciais/pr/foz-do-iguacu/predio-comercial-1400-m2-foz-do-iguacu-pr-av-brasil-509-centro-x118312",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/imoveis-comerciais/pr/foz-do-iguacu/predio-comercial-1400-m2-foz-do-iguacu-pr-av-brasil-509-centro-x118312",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="megaleiloes-X118371",
-            title="Casa em Condominio 99 m² - Ribeirao dos Porcos - Atibaia - SP",
-            description="Casa em Condominio 99 m² - Ribeirao dos Porcos - Atibaia - SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Atibaia",
-            neighborhood="Ribeirao Dos Porcos",
-            address="Ribeirao dos Porcos, Atibaia-SP",
-            area_total=99.0,
-            evaluation_value=781013.5,
-            first_auction_value=781013.5,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://cdn1.megaleiloes.com.br/batches/118371/d0d19fe9cf936856bdc4fd21026d97c9_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/casas/sp/atibaia/casa-em-condominio-99-m2-ribeirao-dos-porcos-atibaia-sp-x118371",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/casas/sp/atibaia/casa-em-condominio-99-m2-ribeirao-dos-porcos-atibaia-sp-x118371",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="megaleiloes-X118313",
-            title="Imovel Residencial e Comercial 318 m² - Candido Sales-BA",
-            description="Imovel Residencial e Comercial 318 m² - Candido Sales-BA - Rua Adelmario Pinheiro, 96 - Nova Conquista",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="BA",
-            city="Candido Sales",
-            neighborhood="Nova Conquista",
-            address="Rua Adelmario Pinheiro, 96 - Nova Conquista, Candido Sales-BA",
-            area_total=318.0,
-            evaluation_value=375000.0,
-            first_auction_value=375000.0,
-            second_auction_value=225000.0,
-            discount_percentage=40.0,
-            image_url="https://cdn1.megaleiloes.com.br/batches/118313/ea032bdfd488b4d6c67ea8c0d6190776_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/imoveis-comerciais/ba/candido-sales/imovel-residencial-e-comercial-318-m2-candido-sales-ba-rua-adelmario-pinheiro-96-nova-conquista-x118313",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/imoveis-comerciais/ba/candido-sales/imovel-residencial-e-comercial-318-m2-candido-sales-ba-rua-adelmario-pinheiro-96-nova-conquista-x118313",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="megaleiloes-X118372",
-            title="Apartamento 24 m² (Studio 7.004-A) - Vila Mariana - Sao Paulo - SP",
-            description="Apartamento 24 m² (Studio 7.004-A) - Vila Mariana - Sao Paulo - SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Vila Mariana",
-            address="Vila Mariana, Sao Paulo-SP",
-            area_total=24.0,
-            evaluation_value=344000.0,
-            first_auction_value=344000.0,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://cdn1.megaleiloes.com.br/batches/118372/60701d27cf900f55c70223cde6dae5d7_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/apartamentos/sp/sao-paulo/apartamento-24-m2-studio-7004-a-vila-mariana-sao-paulo-sp-x118372",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/apartamentos/sp/sao-paulo/apartamento-24-m2-studio-7004-a-vila-mariana-sao-paulo-sp-x118372",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="megaleiloes-X118482",
-            title="Apartamento 115 m² (02 vagas) - Jardim - Santo Andre - SP",
-            description="Apartamento 115 m² (02 vagas) - Jardim - Santo Andre - SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Santo Andre",
-            neighborhood="Jardim",
-            address="Jardim, Santo Andre-SP",
-            area_total=115.0,
-            evaluation_value=1246634.29,
-            first_auction_value=1246634.29,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://cdn1.megaleiloes.com.br/batches/118482/30fce3a4b0430fd97fe5f0d12bf0c3a5_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/apartamentos/sp/santo-andre/apartamento-115-m2-02-vagas-jardim-santo-andre-sp-x118482",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/apartamentos/sp/santo-andre/apartamento-115-m2-02-vagas-jardim-santo-andre-sp-x118482",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="megaleiloes-X118314",
-            title="Terreno 300 m² - Divinopolis-MG - Santa Lucia",
-            description="Terreno 300 m² - Divinopolis-MG - Rua Jesuino Ferreira da Silva - Lt. 206 da Qd. 226 da Zona 36 - Santa Lucia",
-            category=PropertyCategory.TERRENO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="MG",
-            city="Divinopolis",
-            neighborhood="Santa Lucia",
-            address="Rua Jesuino Ferreira da Silva - Lt. 206 da Qd. 226 da Zona 36 - Santa Lucia, Divinopolis-MG",
-            area_total=300.0,
-            evaluation_value=96720.29,
-            first_auction_value=96720.29,
-            second_auction_value=50400.0,
-            discount_percentage=47.9,
-            image_url="https://cdn1.megaleiloes.com.br/batches/118314/02a7cbfa312ebc4066c2926011c2a678_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/terrenos-e-lotes/mg/divinopolis/terreno-300-m2-divinopolis-mg-rua-jesuino-ferreira-da-silva-lt-206-da-qd-226-da-zona-36-santa-lucia-x118314",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/terrenos-e-lotes/mg/divinopolis/terreno-300-m2-divinopolis-mg-rua-jesuino-ferreira-da-silva-lt-206-da-qd-226-da-zona-36-santa-lucia-x118314",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="megaleiloes-X118342",
-            title="Casa 246 m² - Porecatu-PR e Apartamento 165 - Londrina-PR",
-            description="Casa 246 m² - Porecatu-PR - Rua do Lago, 385 - Porto das Aguas e Apartamento 165 - Londrina-PR",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="PR",
-            city="Londrina",
-            neighborhood="Gleba Fazenda Palhano",
-            address="Rua do Lago, 385 - Porto das Aguas, Porecatu-PR / Rua Eurico Hummig, 107 - Apto. 2203, Londrina-PR",
-            area_total=246.0,
-            evaluation_value=3139000.0,
-            first_auction_value=3139000.0,
-            second_auction_value=1883400.0,
-            discount_percentage=40.0,
-            image_url="https://cdn1.megaleiloes.com.br/batches/118342/fc828004091f522986ac2926cacbdc28_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/casas/pr/londrina/casa-246-m2-porecatu-pr-rua-do-lago-385-porto-das-aguas-e-apartamento-165-londrina-pr-rua-eurico-hummig-107-apto-2203-gleba-fazenda-palhano-x118342",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/casas/pr/londrina/casa-246-m2-porecatu-pr-rua-do-lago-385-porto-das-aguas-e-apartamento-165-londrina-pr-rua-eurico-hummig-107-apto-2203-gleba-fazenda-palhano-x118342",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="megaleiloes-J117019",
-            title="Imoveis Residenciais e Comercial 230 m² - Campo Limpo - Sao Paulo - SP",
-            description="Imoveis Residenciais e Comercial 230 m² - Campo Limpo - Sao Paulo - SP",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Campo Limpo",
-            address="Campo Limpo, Sao Paulo-SP",
-            area_total=230.0,
-            evaluation_value=435449.75,
-            first_auction_value=435449.75,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://cdn1.megaleiloes.com.br/batches/117019/53bdb5b3f0dd286795084fac8e42f367_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/imoveis-comerciais/sp/sao-paulo/imoveis-residenciais-e-comercial-230-m2-campo-limpo-sao-paulo-sp-j117019",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/imoveis-comerciais/sp/sao-paulo/imoveis-residenciais-e-comercial-230-m2-campo-limpo-sao-paulo-sp-j117019",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="megaleiloes-X118499",
-            title="Apartamento 178 m² (privativa + comum) - Pitangueiras - Guaruja - SP",
-            description="Apartamento 178 m² (privativa + comum) - Pitangueiras - Guaruja - SP",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Guaruja",
-            neighborhood="Pitangueiras",
-            address="Pitangueiras, Guaruja-SP",
-            area_total=178.0,
-            evaluation_value=713070.0,
-            first_auction_value=713070.0,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://cdn1.megaleiloes.com.br/batches/118499/a2cb8b05e0fcb00d6a9a6e18f15f2b82_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/apartamentos/sp/guaruja/apartamento-178-m2-privativa--comum-pitangueiras-guaruja-sp-x118499",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/apartamentos/sp/guaruja/apartamento-178-m2-privativa--comum-pitangueiras-guaruja-sp-x118499",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="megaleiloes-X118500",
-            title="Casa 118 m² - Vila Santa Terezinha - Sao Paulo - SP",
-            description="Casa 118 m² - Vila Santa Terezinha - Sao Paulo - SP",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Sao Paulo",
-            neighborhood="Vila Santa Terezinha",
-            address="Vila Santa Terezinha, Sao Paulo-SP",
-            area_total=118.0,
-            evaluation_value=373770.0,
-            first_auction_value=373770.0,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://cdn1.megaleiloes.com.br/batches/118500/262a2a8b41d5e621aec420564e2e87d5_670x380.jpg",
-            auctioneer_url="https://www.megaleiloes.com.br/imoveis/casas/sp/sao-paulo/casa-118-m2-vila-santa-terezinha-sao-paulo-sp-x118500",
-            auctioneer_name="Mega Leiloes",
-            auctioneer_id="megaleiloes",
-            source_url="https://www.megaleiloes.com.br/imoveis/casas/sp/sao-paulo/casa-118-m2-vila-santa-terezinha-sao-paulo-sp-x118500",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        # Leilão VIP Properties (8 properties)
-        Property(
-            id="leilaovip-casa-com-20475-m-pauliceia-14172",
-            title="Casa com 204,75 m² - Paulicéia",
-            description="Casa com 204,75 m² em Piracicaba/SP - Paulicéia",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Piracicaba",
-            neighborhood="Paulicéia",
-            address="RUA DONA IDALINA, 141, PAULICÉIA",
-            area_total=204.75,
-            evaluation_value=883813.48,
-            first_auction_value=883813.48,
-            second_auction_value=499095.01,
-            discount_percentage=43.5,
-            image_url="https://armazupleilaovipprd.blob.core.windows.net/uploads/f4e12c2e-de90-4556-a5cb-36c65c5eb6ca.png",
-            auctioneer_url="https://www.leilaovip.com.br/evento/anuncio/casa-com-20475-m-pauliceia-14172",
-            auctioneer_name="Leilao VIP",
-            auctioneer_id="leilaovip",
-            source_url="https://www.leilaovip.com.br/evento/anuncio/casa-com-20475-m-pauliceia-14172",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="leilaovip-apartamento-com-11333m-vila-mariana-02-14039",
-            title="Apartamento com 113,33m² - Vila Mariana",
-            description="Apartamento com 113,33m² em São Paulo/SP - Vila Mariana",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.JUDICIAL,
-            state="SP",
-            city="São Paulo",
-            neighborhood="Vila Mariana",
-            address="RUA MADRE CABRINI, 314, VILA MARIANA",
-            area_total=113.33,
-            evaluation_value=1068745.74,
-            first_auction_value=1068745.74,
-            second_auction_value=641247.45,
-            discount_percentage=40.0,
-            image_url="https://armazupleilaovipprd.blob.core.windows.net/uploads/89dcf30f-7727-4472-b645-487b48b94762.png",
-            auctioneer_url="https://www.leilaovip.com.br/evento/anuncio/apartamento-com-11333m-vila-mariana-02-14039",
-            auctioneer_name="Leilao VIP",
-            auctioneer_id="leilaovip",
-            source_url="https://www.leilaovip.com.br/evento/anuncio/apartamento-com-11333m-vila-mariana-02-14039",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="leilaovip-apartamento-com-6596-m-setor-oeste-14143",
-            title="Apartamento com 65,96 m² - Setor Oeste",
-            description="Apartamento com 65,96 m² em Caldas Novas/GO - Setor Oeste",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="GO",
-            city="Caldas Novas",
-            neighborhood="Setor Oeste",
-            address="RUA ANTÔNIO COELHO DE GODOY, S/N, SETOR OESTE",
-            area_total=65.96,
-            evaluation_value=341944.36,
-            first_auction_value=341944.36,
-            second_auction_value=317131.97,
-            discount_percentage=7.3,
-            image_url="https://armazupleilaovipprd.blob.core.windows.net/uploads/ca5881aa-82fd-4545-ae93-14f26f8cb314.jpg",
-            auctioneer_url="https://www.leilaovip.com.br/evento/anuncio/apartamento-com-6596-m-setor-oeste-14143",
-            auctioneer_name="Leilao VIP",
-            auctioneer_id="leilaovip",
-            source_url="https://www.leilaovip.com.br/evento/anuncio/apartamento-com-6596-m-setor-oeste-14143",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="leilaovip-imovel-comercial-com-37881-m-vila-progresso-02-14135",
-            title="Imóvel comercial com 378,81 m² - Vila Progresso",
-            description="Imóvel comercial com 378,81 m² em Campinas/SP - Vila Progresso",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="SP",
-            city="Campinas",
-            neighborhood="Vila Progresso",
-            address="AV. JORGE TIBIRIÇÁ, 225, VILA PROGRESSO",
-            area_total=378.81,
-            evaluation_value=1052427.67,
-            first_auction_value=1052427.67,
-            second_auction_value=841942.14,
-            discount_percentage=20.0,
-            image_url="https://armazupleilaovipprd.blob.core.windows.net/uploads/292044a4-1fb7-48f4-a113-f7dc4e01087c.png",
-            auctioneer_url="https://www.leilaovip.com.br/evento/anuncio/imovel-comercial-com-37881-m-vila-progresso-02-14135",
-            auctioneer_name="Leilao VIP",
-            auctioneer_id="leilaovip",
-            source_url="https://www.leilaovip.com.br/evento/anuncio/imovel-comercial-com-37881-m-vila-progresso-02-14135",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="leilaovip-sala-comercial-com-3564-m-centro-14103",
-            title="Sala Comercial com 35,64 m² - Centro",
-            description="Sala Comercial com 35,64 m² em Rio de Janeiro/RJ - Centro",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Centro",
-            address="AVENIDA RIO BRANCO, 156, CENTRO",
-            area_total=35.64,
-            evaluation_value=45000.0,
-            first_auction_value=45000.0,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://armazupleilaovipprd.blob.core.windows.net/uploads/2d2360428f6c4c46afeea0ff4f8bc7c5.jpg",
-            auctioneer_url="https://www.leilaovip.com.br/evento/anuncio/sala-comercial-com-3564-m-centro-14103",
-            auctioneer_name="Leilao VIP",
-            auctioneer_id="leilaovip",
-            source_url="https://www.leilaovip.com.br/evento/anuncio/sala-comercial-com-3564-m-centro-14103",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="leilaovip-casa-com-18133m-eldorado-14847",
-            title="Casa com 181,33 m² - Eldorado",
-            description="Casa com 181,33 m² em Chapecó/SC - Eldorado",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SC",
-            city="Chapecó",
-            neighborhood="Eldorado",
-            address="RUA HERVAL DO OESTE, 389-E, ELDORADO",
-            area_total=181.33,
-            evaluation_value=423000.0,
-            first_auction_value=423000.0,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://armazupleilaovipprd.blob.core.windows.net/uploads/a7b151bf-e68f-487e-82ae-b655f30510f2.png",
-            auctioneer_url="https://www.leilaovip.com.br/evento/anuncio/casa-com-18133m-eldorado-14847",
-            auctioneer_name="Leilao VIP",
-            auctioneer_id="leilaovip",
-            source_url="https://www.leilaovip.com.br/evento/anuncio/casa-com-18133m-eldorado-14847",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="leilaovip-casa-com-16800-m-conj-hab-brig-faria-lima-13006",
-            title="Casa com 168,00 m² - Conj Hab. Brig. Faria Lima",
-            description="Casa com 168,00 m² em São Paulo/SP - Conj Hab. Brig. Faria Lima",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="São Paulo",
-            neighborhood="Conj Hab. Brig. Faria Lima",
-            address="RUA PARDINHO, 81, CONJ HAB BRIG FARIA LIMA",
-            area_total=168.0,
-            evaluation_value=163000.0,
-            first_auction_value=163000.0,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://armazupleilaovipprd.blob.core.windows.net/uploads/7a746c0a-a77f-42ec-a85a-0ac1f4405a97.jpg",
-            auctioneer_url="https://www.leilaovip.com.br/evento/anuncio/casa-com-16800-m-conj-hab-brig-faria-lima-13006",
-            auctioneer_name="Leilao VIP",
-            auctioneer_id="leilaovip",
-            source_url="https://www.leilaovip.com.br/evento/anuncio/casa-com-16800-m-conj-hab-brig-faria-lima-13006",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="leilaovip-apartamento-com-6474-m-jardim-jaqueline-14148",
-            title="Apartamento com 64,74 m² - Jardim Jaqueline",
-            description="Apartamento com 64,74 m² em São Paulo/SP - Jardim Jaqueline",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="São Paulo",
-            neighborhood="Jardim Jaqueline",
-            address="RUA BONIFÁCIO VERONESE, 169, JARDIM JAQUELINE",
-            area_total=64.74,
-            evaluation_value=270000.0,
-            first_auction_value=270000.0,
-            second_auction_value=None,
-            discount_percentage=None,
-            image_url="https://armazupleilaovipprd.blob.core.windows.net/uploads/49ca6832-f951-47c9-bab2-ad2f96d18ca3.png",
-            auctioneer_url="https://www.leilaovip.com.br/evento/anuncio/apartamento-com-6474-m-jardim-jaqueline-14148",
-            auctioneer_name="Leilao VIP",
-            auctioneer_id="leilaovip",
-            source_url="https://www.leilaovip.com.br/evento/anuncio/apartamento-com-6474-m-jardim-jaqueline-14148",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        # Inova Leilao properties (10 properties from Pernambuco/Alagoas regional auctioneer)
-        Property(
-            id="inovaleilao-1",
-            title="Lote de Terra c/ Benfeitorias - Bodocó / PE",
-            description="Lote de Terra c/ Benfeitorias em Bodocó/PE - Leilão Judicial TJPE",
-            category=PropertyCategory.TERRENO,
-            auction_type=AuctionType.JUDICIAL,
-            state="PE",
-            city="Bodocó",
-            neighborhood="",
-            address="Bodocó, PE",
-            area_total=300.0,
-            evaluation_value=140000.0,
-            first_auction_value=140000.0,
-            second_auction_value=70000.0,
-            discount_percentage=50.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/0692eef8f2a037.png",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-10-28-lote-de-terra-c-300m-c-benfeitorias-bodoco-pe",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-10-28-lote-de-terra-c-300m-c-benfeitorias-bodoco-pe",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="inovaleilao-2",
-            title="Aptº 0102, c/ 135m², Edf. Casa Parque - Rosarinho",
-            description="Apartamento 0102 com 135m² no Edifício Casa Parque, Rosarinho, Recife/PE",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.JUDICIAL,
-            state="PE",
-            city="Recife",
-            neighborhood="Rosarinho",
-            address="Rosarinho, Recife/PE",
-            area_total=135.0,
-            evaluation_value=894292.56,
-            first_auction_value=894292.56,
-            second_auction_value=447146.28,
-            discount_percentage=50.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/0692dff3e844f8.png",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-12-01-apt-0102-c-135m-edf-casa-parque-rosarinho",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-12-01-apt-0102-c-135m-edf-casa-parque-rosarinho",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="inovaleilao-3",
-            title="Aptº 1002, c/ 105,46m², Edf. Piazza - Parnamirim",
-            description="Apartamento 1002 com 105,46m², 03 quartos no Edifício Piazza, Parnamirim, Recife/PE",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.JUDICIAL,
-            state="PE",
-            city="Recife",
-            neighborhood="Parnamirim",
-            address="Parnamirim, Recife/PE",
-            area_total=105.46,
-            evaluation_value=1017502.64,
-            first_auction_value=1017502.64,
-            second_auction_value=508751.32,
-            discount_percentage=50.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/0692df2c407665.png",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-12-01-apt-1002-c-105-46m-03qtos-edf-piazza-parnamirim",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-12-01-apt-1002-c-105-46m-03qtos-edf-piazza-parnamirim",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="inovaleilao-4",
-            title="Lote de Terreno c/ Área de 183,04m² - Carpina",
-            description="Lote de Terreno com 183,04m² em Carpina/PE - Leilão Judicial TJPE",
-            category=PropertyCategory.TERRENO,
-            auction_type=AuctionType.JUDICIAL,
-            state="PE",
-            city="Carpina",
-            neighborhood="",
-            address="Carpina, PE",
-            area_total=183.04,
-            evaluation_value=34000.0,
-            first_auction_value=34000.0,
-            second_auction_value=20400.0,
-            discount_percentage=40.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/0690dcdf855953.png",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-11-07-lote-de-terreno-c-183-04m-carpina",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-11-07-lote-de-terreno-c-183-04m-carpina",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="inovaleilao-5",
-            title="Imóvel Comercial no Jaraguá / AL",
-            description="Imóvel Comercial no bairro Jaraguá, Maceió/AL - Leilão Judicial",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="AL",
-            city="Maceió",
-            neighborhood="Jaraguá",
-            address="Jaraguá, Maceió/AL",
-            area_total=None,
-            evaluation_value=1700148.22,
-            first_auction_value=1700148.22,
-            second_auction_value=850074.11,
-            discount_percentage=50.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/0692862747a17a.png",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-11-17-imovel-comercial-no-jaragua-al",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-11-17-imovel-comercial-no-jaragua-al",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="inovaleilao-6",
-            title="Loja nº 04 c/ 44,72m², Galeria 133 - Maceió/AL",
-            description="Loja nº 04 com 44,72m² na Galeria 133, Maceió/AL - Leilão Judicial",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="AL",
-            city="Maceió",
-            neighborhood="Centro",
-            address="Galeria 133, Maceió/AL",
-            area_total=44.72,
-            evaluation_value=60000.0,
-            first_auction_value=60000.0,
-            second_auction_value=30000.0,
-            discount_percentage=50.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/0692459d5b4245.jpg",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-11-24-loja-n-04-c-44-72m-galeria-133-maceio-al",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-11-24-loja-n-04-c-44-72m-galeria-133-maceio-al",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="inovaleilao-7",
-            title="Loja nº 05 c/ 44,72m², Galeria 133 - Maceió/AL",
-            description="Loja nº 05 com 44,72m² na Galeria 133, Maceió/AL - Leilão Judicial",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="AL",
-            city="Maceió",
-            neighborhood="Centro",
-            address="Galeria 133, Maceió/AL",
-            area_total=44.72,
-            evaluation_value=60000.0,
-            first_auction_value=60000.0,
-            second_auction_value=30000.0,
-            discount_percentage=50.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/069245b7f2b6d2.jpg",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-11-24-loja-n-05-c-44-72m-galeria-133-maceio-al",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-11-24-loja-n-05-c-44-72m-galeria-133-maceio-al",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="inovaleilao-8",
-            title="Loja nº 06 c/ 44,72m², Galeria 133 - Maceió/AL",
-            description="Loja nº 06 com 44,72m² na Galeria 133, Maceió/AL - Leilão Judicial",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="AL",
-            city="Maceió",
-            neighborhood="Centro",
-            address="Galeria 133, Maceió/AL",
-            area_total=44.72,
-            evaluation_value=60000.0,
-            first_auction_value=60000.0,
-            second_auction_value=30000.0,
-            discount_percentage=50.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/069245ceea6cc7.jpg",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-11-24-loja-n-06-c-44-72m-galeria-133-maceio-al",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-11-24-loja-n-06-c-44-72m-galeria-133-maceio-al",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="inovaleilao-9",
-            title="Loja nº 07 c/ 44,72m², Galeria 133 - Maceió/AL",
-            description="Loja nº 07 com 44,72m² na Galeria 133, Maceió/AL - Leilão Judicial",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="AL",
-            city="Maceió",
-            neighborhood="Centro",
-            address="Galeria 133, Maceió/AL",
-            area_total=44.72,
-            evaluation_value=60000.0,
-            first_auction_value=60000.0,
-            second_auction_value=30000.0,
-            discount_percentage=50.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/069245e7a9e142.jpg",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-11-24-loja-n-07-c-44-72m-galeria-133-maceio-al",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-11-24-loja-n-07-c-44-72m-galeria-133-maceio-al",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="inovaleilao-10",
-            title="Aptº 304, c/ 123m², 03qtos c/dep. - Ponta Verde/AL",
-            description="Apartamento 304 com 123m², 03 quartos com dependência em Ponta Verde, Maceió/AL",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.JUDICIAL,
-            state="AL",
-            city="Maceió",
-            neighborhood="Ponta Verde",
-            address="Ponta Verde, Maceió/AL",
-            area_total=123.0,
-            evaluation_value=800000.0,
-            first_auction_value=800000.0,
-            second_auction_value=400000.0,
-            discount_percentage=50.0,
-            image_url="https://www.inovaleilao.com.br/arquivos/leiloes/lotes/imagens/06925ecdc29590.jpeg",
-            auctioneer_url="https://www.inovaleilao.com.br/leiloes/2025-11-25-apt-304-c-123-00m-03qtos-c-dep-ponta-verde-al",
-            auctioneer_name="Inova Leilao",
-            auctioneer_id="inovaleilao",
-            source_url="https://www.inovaleilao.com.br/leiloes/2025-11-25-apt-304-c-123-00m-03qtos-c-dep-ponta-verde-al",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        # Pestana Leiloes properties (10 properties from major RS/SC/SP auctioneer)
-        Property(
-            id="pestana-1",
-            title="Prédio Industrial - Fraiburgo/SC",
-            description="Prédios Industriais. Áreas: construída 26.657,57m² e terreno 141.290,00m². Leilão BRDE.",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SC",
-            city="Fraiburgo",
-            neighborhood="",
-            address="Fraiburgo, SC",
-            area_total=141290.0,
-            evaluation_value=28100000.0,
-            first_auction_value=28100000.0,
-            second_auction_value=28100000.0,
-            discount_percentage=0.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17030084.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5381/386511",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5381/386511",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="pestana-2",
-            title="Terreno - Guarapuava/PR",
-            description="Terreno em Guarapuava/PR. Leilão de Imóveis Sicredi - Sistêmico.",
-            category=PropertyCategory.TERRENO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="PR",
-            city="Guarapuava",
-            neighborhood="",
-            address="Guarapuava, PR",
-            area_total=0.0,
-            evaluation_value=17500000.0,
-            first_auction_value=17500000.0,
-            second_auction_value=17500000.0,
-            discount_percentage=0.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17591205.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5578/397727",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5578/397727",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="pestana-3",
-            title="Prédio - Teutônia/RS",
-            description="Prédio em Teutônia/RS. Leilão de imóveis BRDE - RS.",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="RS",
-            city="Teutônia",
-            neighborhood="",
-            address="Teutônia, RS",
-            area_total=0.0,
-            evaluation_value=11700000.0,
-            first_auction_value=11700000.0,
-            second_auction_value=11700000.0,
-            discount_percentage=0.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17685024.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5605/398542",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5605/398542",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="pestana-4",
-            title="Apartamento - Campinas/SP",
-            description="Apartamento em Campinas/SP. Lei 9.514 Bradesco. Desconto de 68%.",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Campinas",
-            neighborhood="",
-            address="Campinas, SP",
-            area_total=0.0,
-            evaluation_value=26843750.0,
-            first_auction_value=26843750.0,
-            second_auction_value=8590000.0,
-            discount_percentage=68.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17691714.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5593/398653",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5593/398653",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="pestana-5",
-            title="Terreno - Várzea Grande/MT",
-            description="Terreno em Várzea Grande/MT. Leilão de Imóveis Sicredi - Sistêmico.",
-            category=PropertyCategory.TERRENO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="MT",
-            city="Várzea Grande",
-            neighborhood="",
-            address="Várzea Grande, MT",
-            area_total=0.0,
-            evaluation_value=6184000.0,
-            first_auction_value=6184000.0,
-            second_auction_value=6184000.0,
-            discount_percentage=0.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17605549.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5578/397683",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5578/397683",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="pestana-6",
-            title="Terreno - Nova Guarita/MT",
-            description="Terreno em Nova Guarita/MT. Leilão de Imóveis Sicredi Grandes Rios.",
-            category=PropertyCategory.TERRENO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="MT",
-            city="Nova Guarita",
-            neighborhood="",
-            address="Nova Guarita, MT",
-            area_total=0.0,
-            evaluation_value=5600000.0,
-            first_auction_value=5600000.0,
-            second_auction_value=5600000.0,
-            discount_percentage=0.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17591205.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5607/398742",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5607/398742",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="pestana-7",
-            title="Terreno - Biguaçu/SC",
-            description="Terreno em Biguaçu/SC. Leilão de Imóveis Santander.",
-            category=PropertyCategory.TERRENO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SC",
-            city="Biguaçu",
-            neighborhood="",
-            address="Biguaçu, SC",
-            area_total=0.0,
-            evaluation_value=4999999.0,
-            first_auction_value=4999999.0,
-            second_auction_value=4999999.0,
-            discount_percentage=0.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17591205.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5602/398430",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5602/398430",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="pestana-8",
-            title="Casa - Guarujá/SP",
-            description="Casa em Guarujá/SP. Leilão de Imóveis Lei 9.514. Desconto de 23%.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SP",
-            city="Guarujá",
-            neighborhood="",
-            address="Guarujá, SP",
-            area_total=0.0,
-            evaluation_value=6027100.0,
-            first_auction_value=6027100.0,
-            second_auction_value=4641867.17,
-            discount_percentage=23.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17617618.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5570/397295",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5570/397295",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="pestana-9",
-            title="Terreno - Taió/SC",
-            description="Terreno em Taió/SC. Leilão de Imóveis Sicredi.",
-            category=PropertyCategory.TERRENO,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SC",
-            city="Taió",
-            neighborhood="",
-            address="Taió, SC",
-            area_total=0.0,
-            evaluation_value=1500000.0,
-            first_auction_value=1500000.0,
-            second_auction_value=1500000.0,
-            discount_percentage=0.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17591205.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5539/395627",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5539/395627",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="pestana-10",
-            title="Casa - Rio do Sul/SC",
-            description="Casa em Rio do Sul/SC. Leilão de Imóveis BRDE - SC.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.EXTRAJUDICIAL,
-            state="SC",
-            city="Rio do Sul",
-            neighborhood="",
-            address="Rio do Sul, SC",
-            area_total=0.0,
-            evaluation_value=800000.0,
-            first_auction_value=800000.0,
-            second_auction_value=800000.0,
-            discount_percentage=0.0,
-            image_url="https://ged.pestanaleiloes.com.br/ged/17029428.png",
-            auctioneer_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5380/386486",
-            auctioneer_name="Pestana Leiloes",
-            auctioneer_id="pestana_leiloes",
-            source_url="https://www.pestanaleiloes.com.br/agenda-de-leiloes/5380/386486",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        # Silas Leiloeiro (S&A Leilões) - 10 properties from Rio de Janeiro
-        Property(
-            id="silas-1",
-            title="Apartamento em Botafogo - 403m² - Vista Incrível",
-            description="Apartamento em Botafogo com 403m², 5 quartos + área externa com 2 quartos de empregada + 2 vagas. Praia de Botafogo, N° 130, APT 1001.",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Botafogo",
-            address="Praia de Botafogo, N° 130, APT 1001 - Botafogo - RJ",
-            area_total=403.0,
-            evaluation_value=3995000.0,
-            first_auction_value=3995000.0,
-            second_auction_value=1997500.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/011368/011368_000000_05_19911.jpg",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041860801251009030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041860801251009030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="silas-2",
-            title="Apartamento em Irajá - 79m²",
-            description="Apartamento em Irajá com 79m². Rua Licínio Barcelos, 118, APT 202.",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Irajá",
-            address="Rua Licínio Barcelos, 118, APT 202 - Irajá - RJ",
-            area_total=79.0,
-            evaluation_value=300000.0,
-            first_auction_value=300000.0,
-            second_auction_value=150000.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/011402/011402_000000_05_20125.JPG",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041140201251009030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041140201251009030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="silas-3",
-            title="Sala Comercial - Santo Cristo (Porto Maravilha)",
-            description="Sala comercial no Porto Maravilha. Rua Equador, N° 43, Bloco 03, Unidade 714 - Santo Cristo.",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Santo Cristo",
-            address="Rua Equador, N° 43, Bloco 03, Unidade 714 - Santo Cristo - RJ",
-            area_total=0.0,
-            evaluation_value=200000.0,
-            first_auction_value=200000.0,
-            second_auction_value=100000.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/011415/011415_000000_05_20321.jpg",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041541101251010030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041541101251010030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="silas-4",
-            title="Apartamento no Rocha - 66m² - Infraestrutura Total",
-            description="Apartamento no Rocha com 66m² e infraestrutura total. Rua São João N. 27, APT 905.",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Rocha",
-            address="Rua São João N. 27, APT 905 - Rocha - RJ",
-            area_total=66.0,
-            evaluation_value=350000.0,
-            first_auction_value=350000.0,
-            second_auction_value=175000.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/011425/011425_000000_05_20338.jpg",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041524101251012030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041524101251012030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="silas-5",
-            title="Imóvel na Av. dos Democráticos - Bonsucesso",
-            description="Imóvel na Avenida dos Democráticos, N° 2010 - Bonsucesso - RJ.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Bonsucesso",
-            address="Avenida dos Democráticos, N° 2010 - Bonsucesso - RJ",
-            area_total=0.0,
-            evaluation_value=400000.0,
-            first_auction_value=400000.0,
-            second_auction_value=200000.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/010281/010281_000000_05_16326.JPG",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041820101251012030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041820101251012030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="silas-6",
-            title="Prédio Comercial em Copacabana",
-            description="Prédio comercial em Copacabana. Rua Siqueira Campos, Nº 36.",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Copacabana",
-            address="Rua Siqueira Campos, Nº 36 - Copacabana - RJ",
-            area_total=0.0,
-            evaluation_value=5000000.0,
-            first_auction_value=5000000.0,
-            second_auction_value=2500000.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/010288/010288_000000_05_16353.jpg",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20048820106261022030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20048820106261022030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="silas-7",
-            title="Grupo de Salas no Centro - 75m²",
-            description="Grupo de salas comerciais no Centro com 75m². Rua Debret, Nº 79 – Salas 307 à 309.",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Centro",
-            address="Rua Debret, Nº 79 – Salas 307 à 309 - Centro - RJ",
-            area_total=75.0,
-            evaluation_value=400000.0,
-            first_auction_value=400000.0,
-            second_auction_value=200000.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/011427/011427_000000_05_20377.png",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20047241106261022030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20047241106261022030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="silas-8",
-            title="Sala Comercial - Santo Cristo (Porto Maravilha) - Unidade 915",
-            description="Sala comercial no Porto Maravilha. Rua Equador, N° 43, Bloco 03, Unidade 915 - Santo Cristo.",
-            category=PropertyCategory.COMERCIAL,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Santo Cristo",
-            address="Rua Equador, N° 43, Bloco 03, Unidade 915 - Santo Cristo - RJ",
-            area_total=0.0,
-            evaluation_value=200000.0,
-            first_auction_value=200000.0,
-            second_auction_value=100000.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/011432/011432_000000_05_20401.jpg",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20042341106261023030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20042341106261023030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="silas-9",
-            title="Apartamento em Jacarepaguá - 39m² - Infraestrutura Total",
-            description="Apartamento em Jacarepaguá com 39m² e infraestrutura total. Estrada dos Três Rios, N°830, BL 2 APT. 407.",
-            category=PropertyCategory.APARTAMENTO,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Jacarepaguá",
-            address="Estrada dos Três Rios, N°830, BL 2 APT. 407 - Jacarepaguá - RJ",
-            area_total=39.0,
-            evaluation_value=250000.0,
-            first_auction_value=250000.0,
-            second_auction_value=125000.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/007201/007201_000000_05_19794.jpg",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041027006261026030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20041027006261026030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="silas-10",
-            title="Casa no Jardim América - 42m²",
-            description="Casa no Jardim América com 42m². Rua Marechal Felipe Schmidt, Lote Nº 18, Quadra 17.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Jardim América",
-            address="Rua Marechal Felipe Schmidt, Lote Nº 18, Quadra 17 - Jardim América - RJ",
-            area_total=42.0,
-            evaluation_value=200000.0,
-            first_auction_value=200000.0,
-            second_auction_value=100000.0,
-            discount_percentage=50.0,
-            image_url="https://www.silasleiloeiro.lel.br/Arquivos/010278/010278_000000_05_16305.JPG",
-            auctioneer_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20048720106261026030011",
-            auctioneer_name="Silas Leiloeiro",
-            auctioneer_id="silas_leiloeiro",
-            source_url="https://www.silasleiloeiro.lel.br/Leilao.asp?zz=20048720106261026030011",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        # Roberto Fernandes Leilões - 4 properties (Rio Grande do Norte auctioneer)
-        Property(
-            id="roberto-1",
-            title="Granja Senum - Imóvel Rural com 20,60 hectares",
-            description="Imóvel rural denominado Granja Senum, correspondente a 39 lotes de terra, parte integrante do loteamento Lagoa Grande em Ceará-Mirim/RN. Área de 20,60 hectares com casa sede (6 cômodos, 295m²), casa do morador (3 cômodos, 108m²), galpão (522m²), aviários, poço tubular e diversas plantações. Área construída total: 925,80m².",
-            category=PropertyCategory.TERRENO,
-            auction_type=AuctionType.JUDICIAL,
-            state="RN",
-            city="Ceará-Mirim",
-            neighborhood="Lagoa Grande",
-            address="Granja Senum, Loteamento Lagoa Grande - Ceará-Mirim/RN",
-            area_total=206000.0,
-            evaluation_value=513197.54,
-            first_auction_value=513197.54,
-            second_auction_value=256598.77,
-            discount_percentage=50.0,
-            image_url="https://www.robertofernandesleiloes.com.br/principal/pub/Image/20241203105016FOTO_GRANJA_SENUM.jpg",
-            auctioneer_url="https://www.robertofernandesleiloes.com.br/leilao/detalhe_lote/322/",
-            auctioneer_name="Roberto Fernandes Leiloes",
-            auctioneer_id="roberto_fernandes",
-            source_url="https://www.robertofernandesleiloes.com.br/leilao/detalhe_lote/322/",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="roberto-2",
-            title="Casa no Condomínio Residencial Mahatma Gandhi - Natal/RN",
-            description="Imóvel residencial, casa de nº 20, integrante do Condomínio Residencial Mahatma Gandhi, localizado na Avenida Mahatma Gandhi em Natal/RN. Leilão judicial com 50% de desconto no 2º leilão.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.JUDICIAL,
-            state="RN",
-            city="Natal",
-            neighborhood="Mahatma Gandhi",
-            address="Avenida Mahatma Gandhi, Casa 20, Condomínio Residencial Mahatma Gandhi - Natal/RN",
-            area_total=0.0,
-            evaluation_value=569091.42,
-            first_auction_value=569091.42,
-            second_auction_value=284545.71,
-            discount_percentage=50.0,
-            image_url="https://www.robertofernandesleiloes.com.br/principal/pub/Image/20241210091500CASA_MAHATMA.jpg",
-            auctioneer_url="https://www.robertofernandesleiloes.com.br/leilao/detalhe_lote/324/",
-            auctioneer_name="Roberto Fernandes Leiloes",
-            auctioneer_id="roberto_fernandes",
-            source_url="https://www.robertofernandesleiloes.com.br/leilao/detalhe_lote/324/",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        Property(
-            id="roberto-3",
-            title="Casa em Candelária - Natal/RN",
-            description="Imóvel residencial localizado na Rua Eletrecista Elias Ferreira, 2036, lote 4, Candelária, Natal/RN. Leilão judicial com 50% de desconto no 2º leilão.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.JUDICIAL,
-            state="RN",
-            city="Natal",
-            neighborhood="Candelária",
-            address="Rua Eletrecista Elias Ferreira, 2036, Lote 4 - Candelária - Natal/RN",
-            area_total=0.0,
-            evaluation_value=559216.50,
-            first_auction_value=559216.50,
-            second_auction_value=279608.25,
-            discount_percentage=50.0,
-            image_url="https://www.robertofernandesleiloes.com.br/principal/pub/Image/20241210091600CASA_CANDELARIA.jpg",
-            auctioneer_url="https://www.robertofernandesleiloes.com.br/leilao/detalhe_lote/325/",
-            auctioneer_name="Roberto Fernandes Leiloes",
-            auctioneer_id="roberto_fernandes",
-            source_url="https://www.robertofernandesleiloes.com.br/leilao/detalhe_lote/325/",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-        # Mauricio Mariz Leilões - 1 property (Rio de Janeiro auctioneer)
-        Property(
-            id="mauricio-1",
-            title="Casa no Condomínio Vivendas do Sol - Recreio dos Bandeirantes/RJ",
-            description="Casa localizada na Rua Raphael Paixão, nº 105, Casa 1, Condomínio Vivendas do Sol, Recreio dos Bandeirantes, Rio de Janeiro/RJ. Área construída: 255m². Matrícula 9º RGI: 199.913. Leilão judicial com 50% de desconto no 2º leilão.",
-            category=PropertyCategory.CASA,
-            auction_type=AuctionType.JUDICIAL,
-            state="RJ",
-            city="Rio de Janeiro",
-            neighborhood="Recreio dos Bandeirantes",
-            address="Rua Raphael Paixão, nº 105, Casa 1, Condomínio Vivendas do Sol - Recreio dos Bandeirantes - RJ",
-            area_total=255.0,
-            evaluation_value=1470000.0,
-            first_auction_value=1470000.0,
-            second_auction_value=735000.0,
-            discount_percentage=50.0,
-            image_url="https://www.mauriciomarizleiloes.com.br/manage/pub/Image/20251204080047FOTO_CASA_RECREIO.jpg",
-            auctioneer_url="https://www.mauriciomarizleiloes.com.br/leilao/detalhe_lote/133/",
-            auctioneer_name="Mauricio Mariz Leiloes",
-            auctioneer_id="mauricio_mariz",
-            source_url="https://www.mauriciomarizleiloes.com.br/leilao/detalhe_lote/133/",
-            accepts_financing=False,
-            accepts_fgts=False,
-            accepts_installments=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        ),
-    ]
+    return list(iter_real_properties())
+
+
+def dump_real_properties(properties: List[Property], path: str = REAL_PROPERTIES_FILE) -> int:
+    """Grava o dataset no formato lido por iter_real_properties (campos default são omitidos)."""
+    with open(path, "w", encoding="utf-8") as f:
+        for prop in properties:
+            data = prop.model_dump(mode="json", exclude_defaults=True, exclude=set(_RUNTIME_FIELDS))
+            f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return len(properties)
@@ -0,0 +1,478 @@
+"""
+Buscas salvas (alertas) com matching incremental de imóveis novos.
+
+Em vez de rodar cada busca salva contra /api/properties, indexamos os
+predicados das buscas e, para cada imóvel inserido ou com preço alterado
+pelos writers em massa (sync da Caixa, bulk-import), encontramos as buscas
+que ele satisfaz:
+
+- Índice invertido por (estado, cidade, categoria), com '*' como curinga:
+  um imóvel consulta no máximo 8 buckets.
+- Em cada bucket, buscas com predicados idênticos formam uma assinatura;
+  a faixa de preço [min_value, max_value] das assinaturas fica numa
+  interval tree (consulta de ponto em O(log n + k)) e o desconto mínimo
+  num array ordenado (bisect). O lado mais seletivo filtra o outro.
+- Tipo de leilão é verificado nas assinaturas restantes.
+
+Os matches viram notificações. Um par (busca, imóvel) só é notificado de
+novo se o preço mudou. Com PostgreSQL as buscas e notificações ficam nas
+tabelas saved_searches / saved_search_notifications (migration 004); nos
+outros backends ficam apenas em memória.
+"""
+
+import logging
+import os
+import threading
+import uuid
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from app.models.saved_search import SavedSearch, SavedSearchCreate
+from app.services.autocomplete_index import fold_text
+
+logger = logging.getLogger(__name__)
+
+WILDCARD = "*"
+MAX_PENDING_PER_USER = 500
+# Pares (busca, imóvel) lembrados para não notificar o mesmo preço duas vezes.
+# Com PostgreSQL o índice único da tabela de notificações garante isso após restart.
+MAX_NOTIFIED_PAIRS = int(os.getenv("SAVED_SEARCH_MAX_NOTIFIED_PAIRS", "1000000"))
+
+_NEG_INF = float("-inf")
+_POS_INF = float("inf")
+
+
+class IntervalTree:
+    """
+    Interval tree centrada e estática para consultas de ponto (stabbing).
+
+    Cada nó guarda os intervalos que contêm seu centro, ordenados pelo
+    início (asc) e pelo fim (desc); os demais descem para a esquerda ou
+    direita. Reconstruída quando o bucket muda.
+    """
+
+    __slots__ = ("center", "by_lo", "by_hi", "left", "right")
+
+    def __init__(self, intervals: List[Tuple[float, float, str]]):
+        endpoints = sorted(x for lo, hi, _ in intervals for x in (lo, hi) if abs(x) != _POS_INF)
+        self.center = endpoints[len(endpoints) // 2] if endpoints else 0.0
+
+        here, left, right = [], [], []
+        for interval in intervals:
+            lo, hi, _ = interval
+            if hi < self.center:
+                left.append(interval)
+            elif lo > self.center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        # O centro é um extremo de algum intervalo, então `here` nunca fica vazio
+        # e cada nível reduz o problema
+        self.by_lo = sorted(here, key=lambda i: i[0])
+        self.by_hi = sorted(here, key=lambda i: -i[1])
+        self.left = IntervalTree(left) if left else None
+        self.right = IntervalTree(right) if right else None
+
+    def stab(self, x: float) -> List[str]:
+        """IDs dos intervalos [lo, hi] que contêm x."""
+        result = []
+        node = self
+        while node is not None:
+            if x < node.center:
+                for lo, _, item in node.by_lo:
+                    if lo > x:
+                        break
+                    result.append(item)
+                node = node.left
+            else:
+                for _, hi, item in node.by_hi:
+                    if hi < x:
+                        break
+                    result.append(item)
+                node = node.right if x > node.center else None
+        return result
+
+
+class _Bucket:
+    """
+    Buscas salvas com a mesma chave (estado, cidade, categoria).
+
+    Buscas com predicados idênticos (faixa de preço, desconto mínimo, tipo de
+    leilão) são agrupadas em uma assinatura - filtros do frontend usam
+    valores redondos, então há poucas assinaturas distintas por bucket e
+    o custo do match é proporcional a elas, não ao número de buscas.
+    """
+
+    def __init__(self):
+        self.searches: Dict[str, tuple] = {}
+        self._groups: Dict[tuple, Dict[str, None]] = {}
+        self._dirty = True
+        self._tree: Optional[IntervalTree] = None
+        self._discount_values: List[float] = []
+        self._discount_signatures: List[tuple] = []
+
+    def add(self, search_id: str, lo: float, hi: float, min_discount: float, auction_type: Optional[str]):
+        signature = (lo, hi, min_discount, auction_type)
+        self.searches[search_id] = signature
+        group = self._groups.setdefault(signature, {})
+        if not group:
+            self._dirty = True
+        group[search_id] = None
+
+    def remove(self, search_id: str):
+        signature = self.searches.pop(search_id, None)
+        if signature is None:
+            return
+        group = self._groups[signature]
+        del group[search_id]
+        if not group:
+            del self._groups[signature]
+            self._dirty = True
+
+    def _rebuild(self):
+        self._tree = IntervalTree([(sig[0], sig[1], sig) for sig in self._groups])
+        ordered = sorted(self._groups, key=lambda sig: sig[2])
+        self._discount_values = [sig[2] for sig in ordered]
+        self._discount_signatures = ordered
+        self._dirty = False
+
+    def match(self, price: Optional[float], discount: Optional[float], auction_type: Optional[str]) -> List[str]:
+        if self._dirty:
+            self._rebuild()
+
+        # Imóvel sem preço/desconto só casa com buscas sem essa restrição
+        threshold = discount if discount is not None else _NEG_INF
+        by_discount = bisect_right(self._discount_values, threshold)
+        if price is None:
+            signatures = [
+                sig for sig in self._discount_signatures[:by_discount]
+                if sig[0] == _NEG_INF and sig[1] == _POS_INF
+            ]
+        else:
+            by_price = self._tree.stab(price)
+            if len(by_price) <= by_discount:
+                signatures = [sig for sig in by_price if sig[2] <= threshold]
+            else:
+                signatures = [sig for sig in self._discount_signatures[:by_discount] if sig[0] <= price <= sig[1]]
+
+        matches: List[str] = []
+        for sig in signatures:
+            if sig[3] is None or sig[3] == auction_type:
+                matches.extend(self._groups[sig])
+        return matches
+
+
+def _value(prop: Any, field: str) -> Any:
+    """Lê um campo de Property ou de dict (sync_service usa dicts)."""
+    if isinstance(prop, dict):
+        return prop.get(field)
+    return getattr(prop, field, None)
+
+
+def _enum_value(value: Any) -> Optional[str]:
+    return value.value if hasattr(value, "value") else value
+
+
+def _price(prop: Any) -> Optional[float]:
+    """Preço de referência: menor lance disponível."""
+    second = _value(prop, "second_auction_value")
+    return second if second is not None else _value(prop, "first_auction_value")
+
+
+class SavedSearchIndex:
+    """Índice invertido de buscas salvas."""
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, str, str], _Bucket] = {}
+        self._keys: Dict[str, Tuple[str, str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _key(state: Optional[str], city: Optional[str], category: Optional[str]) -> Tuple[str, str, str]:
+        return (
+            state.upper() if state else WILDCARD,
+            fold_text(city) or WILDCARD,
+            category or WILDCARD,
+        )
+
+    def add(self, search: SavedSearch) -> None:
+        self.remove(search.id)
+        key = self._key(search.state, search.city, _enum_value(search.category))
+        self._buckets.setdefault(key, _Bucket()).add(
+            search.id,
+            search.min_value if search.min_value is not None else _NEG_INF,
+            search.max_value if search.max_value is not None else _POS_INF,
+            search.min_discount if search.min_discount is not None else _NEG_INF,
+            _enum_value(search.auction_type),
+        )
+        self._keys[search.id] = key
+
+    def remove(self, search_id: str) -> None:
+        key = self._keys.pop(search_id, None)
+        if key is None:
+            return
+        bucket = self._buckets[key]
+        bucket.remove(search_id)
+        if not bucket.searches:
+            del self._buckets[key]
+
+    def match(self, prop: Any) -> List[str]:
+        """IDs das buscas salvas satisfeitas pelo imóvel."""
+        state = (_value(prop, "state") or "").upper()
+        city = fold_text(_value(prop, "city"))
+        category = _enum_value(_value(prop, "category"))
+        auction_type = _enum_value(_value(prop, "auction_type"))
+        price = _price(prop)
+        discount = _value(prop, "discount_percentage")
+
+        matches = []
+        for s in (state, WILDCARD):
+            for c in (city, WILDCARD):
+                for cat in (category, WILDCARD):
+                    bucket = self._buckets.get((s, c, cat))
+                    if bucket is not None:
+                        matches.extend(bucket.match(price, discount, auction_type))
+        return matches
+
+
+class SavedSearchService:
+    """
+    Gerencia buscas salvas, matching incremental e fila de notificações.
+    """
+
+    def __init__(self, db=None, persistent: Optional[bool] = None):
+        """
+        Args:
+            db: Backend de banco de dados (usa app.services.db se não fornecido)
+            persistent: Persistir em PostgreSQL (padrão: se DATABASE_URL estiver configurada)
+        """
+        self._db = db
+        self._persistent = persistent
+        self.index = SavedSearchIndex()
+        self.searches: Dict[str, SavedSearch] = {}
+        self._pending: Dict[str, Deque[dict]] = {}
+        self._notified: "OrderedDict[Tuple[str, str], Optional[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = False
+
+        self.properties_processed = 0
+        self.notifications_created = 0
+
+    @property
+    def db(self):
+        if self._db is None:
+            from app.services import db
+            self._db = db
+        return self._db
+
+    @property
+    def persistent(self) -> bool:
+        if self._persistent is None:
+            from app.services import DATABASE_URL
+            self._persistent = bool(DATABASE_URL)
+        return self._persistent
+
+    # ==================== Buscas ====================
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if self.persistent:
+                try:
+                    with self.db._get_connection() as conn:
+                        with conn.cursor() as cur:
+                            cur.execute("SELECT * FROM saved_searches")
+                            rows = cur.fetchall()
+                    for row in rows:
+                        search = SavedSearch(**{**dict(row), "id": str(row["id"]), "user_id": str(row["user_id"])})
+                        self.searches[search.id] = search
+                        self.index.add(search)
+                    logger.info(f"Buscas salvas carregadas: {len(rows)}")
+                except Exception as e:
+                    logger.error(f"Erro ao carregar buscas salvas: {e}")
+            self._loaded = True
+
+    def create(self, user_id: str, data: SavedSearchCreate) -> SavedSearch:
+        """Cria uma busca salva e a adiciona ao índice."""
+        self._ensure_loaded()
+        search = SavedSearch(id=str(uuid.uuid4()), user_id=user_id, **data.model_dump())
+
+        if self.persistent:
+            with self.db._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        INSERT INTO saved_searches (
+                            id, user_id, name, state, city, category, auction_type,
+                            min_value, max_value, min_discount, created_at
+                        ) VALUES (%s::uuid, %s::uuid, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    """, (
+                        search.id, user_id, search.name, search.state, search.city,
+                        _enum_value(search.category), _enum_value(search.auction_type),
+                        search.min_value, search.max_value, search.min_discount, search.created_at,
+                    ))
+                conn.commit()
+
+        with self._lock:
+            self.searches[search.id] = search
+            self.index.add(search)
+        return search
+
+    def delete(self, search_id: str, user_id: Optional[str] = None) -> bool:
+        """Remove uma busca salva (opcionalmente verificando o dono)."""
+        self._ensure_loaded()
+        search = self.searches.get(search_id)
+        if search is None or (user_id and search.user_id != user_id):
+            return False
+
+        if self.persistent:
+            with self.db._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("DELETE FROM saved_searches WHERE id = %s::uuid", (search_id,))
+                conn.commit()
+
+        with self._lock:
+            self.searches.pop(search_id, None)
+            self.index.remove(search_id)
+        return True
+
+    def list_for_user(self, user_id: str) -> List[SavedSearch]:
+        self._ensure_loaded()
+        return sorted(
+            (s for s in self.searches.values() if s.user_id == user_id),
+            key=lambda s: s.created_at,
+        )
+
+    # ==================== Matching ====================
+
+    def process_properties(self, properties: Iterable[Any]) -> int:
+        """
+        Casa imóveis inseridos/atualizados com as buscas salvas.
+
+        Chamado pelos writers em massa após gravar um lote. Imóveis cujo
+        preço não mudou desde a última notificação são ignorados. É
+        bloqueante (segundos para lotes grandes): em código async, chamar
+        via asyncio.to_thread.
+
+        Returns:
+            Número de notificações criadas
+        """
+        self._ensure_loaded()
+        if not self.searches:
+            return 0
+
+        created: List[dict] = []
+        now = datetime.utcnow()
+        with self._lock:
+            for prop in properties:
+                self.properties_processed += 1
+                if _value(prop, "is_duplicate") or _value(prop, "is_active") is False:
+                    continue
+                prop_id = _value(prop, "id")
+                price = _price(prop)
+                for search_id in self.index.match(prop):
+                    key = (search_id, prop_id)
+                    if key in self._notified and self._notified[key] == price:
+                        continue
+                    self._notified[key] = price
+                    self._notified.move_to_end(key)
+                    if len(self._notified) > MAX_NOTIFIED_PAIRS:
+                        self._notified.popitem(last=False)
+                    search = self.searches[search_id]
+                    notification = {
+                        "search_id": search_id,
+                        "search_name": search.name,
+                        "user_id": search.user_id,
+                        "property_id": prop_id,
+                        "title": _value(prop, "title"),
+                        "city": _value(prop, "city"),
+                        "state": _value(prop, "state"),
+                        "price": price,
+                        "discount_percentage": _value(prop, "discount_percentage"),
+                        "matched_at": now,
+                    }
+                    queue = self._pending.setdefault(search.user_id, deque(maxlen=MAX_PENDING_PER_USER))
+                    queue.append(notification)
+                    created.append(notification)
+
+            self.notifications_created += len(created)
+
+        if created and self.persistent:
+            self._persist_notifications(created)
+        if created:
+            logger.info(f"Buscas salvas: {len(created)} notificações criadas")
+        return len(created)
+
+    def _persist_notifications(self, notifications: List[dict]) -> None:
+        try:
+            with self.db._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.executemany("""
+                        INSERT INTO saved_search_notifications (
+                            search_id, user_id, property_id, price, discount_percentage, created_at
+                        ) VALUES (%s::uuid, %s::uuid, %s, %s, %s, %s)
+                        ON CONFLICT DO NOTHING
+                    """, [
+                        (n["search_id"], n["user_id"], n["property_id"], n["price"],
+                         n["discount_percentage"], n["matched_at"])
+                        for n in notifications
+                    ])
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Erro ao gravar notificações de buscas salvas: {e}")
+
+    def pop_notifications(self, user_id: str, limit: int = 50) -> List[dict]:
+        """Retorna e marca como lidas as notificações pendentes do usuário."""
+        if self.persistent:
+            with self.db._get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        UPDATE saved_search_notifications SET read_at = NOW()
+                        WHERE id IN (
+                            SELECT id FROM saved_search_notifications
+                            WHERE user_id = %s::uuid AND read_at IS NULL
+                            ORDER BY created_at LIMIT %s
+                        )
+                        RETURNING search_id, property_id, price, discount_percentage, created_at
+                    """, (user_id, limit))
+                    rows = cur.fetchall()
+                conn.commit()
+            with self._lock:
+                self._pending.pop(user_id, None)
+            return [dict(row) for row in rows]
+
+        with self._lock:
+            queue = self._pending.get(user_id)
+            if not queue:
+                return []
+            return [queue.popleft() for _ in range(min(limit, len(queue)))]
+
+    def get_stats(self) -> dict:
+        """Retorna estatísticas do subsistema."""
+        return {
+            "saved_searches": len(self.index),
+            "buckets": len(self.index._buckets),
+            "properties_processed": self.properties_processed,
+            "notifications_created": self.notifications_created,
+            "pending_users": len(self._pending),
+            "persistent": self.persistent,
+        }
+
+
+# Instância global
+_saved_search_service: Optional[SavedSearchService] = None
+
+
+def get_saved_search_service() -> SavedSearchService:
+    """Obtém a instância global do serviço de buscas salvas."""
+    global _saved_search_service
+    if _saved_search_service is None:
+        _saved_search_service = SavedSearchService()
+    return _saved_search_service
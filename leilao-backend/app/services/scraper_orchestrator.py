@@ -11,10 +11,26 @@ from app.services.ai_normalizer import ai_normalizer
 from app.services.geocoding_service import geocoding_service
 from app.services.postgres_database import get_postgres_database
 from app.services.structure_validator import structure_validator
+from app.services.event_bus import publish_event
+from app.services.crawl_limits import DomainLimits, budget_key, load_platform_catalog, SCRAPER_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 db = get_postgres_database()
 
+
+class _Run:
+    """Estado de uma execução concorrente (limites, lock de geocoding, progresso)."""
+    
+    def __init__(self, skip_geocoding: bool, concurrency: Optional[int], mode: Optional[str] = None):
+        self.skip_geocoding = skip_geocoding
+        self.mode = mode
+        self.limits = DomainLimits(max_concurrency=concurrency or SCRAPER_CONCURRENCY)
+        # Nominatim aceita 1 req/s: geocoding de leiloeiros diferentes não roda em paralelo
+        self.geocoding_lock = asyncio.Lock()
+        self.started = 0
+        self.completed = 0
+
+
 class ScraperOrchestrator:
     """Orquestra o scraping de todos os leiloeiros"""
     
@@ -31,9 +47,11 @@ class ScraperOrchestrator:
             "errors": []
         }
     
-    async def run_all(self, skip_geocoding: bool = False, limit: Optional[int] = None) -> Dict:
-        """Executa scraping de todos os leiloeiros ativos"""
-        
+    def _publish(self, type: str, **extra) -> None:
+        """Publica o estado atual no tópico `scraper` do event bus."""
+        publish_event("scraper", type, {**self.stats, **extra})
+    
+    def _reset_stats(self, **extra) -> None:
         self.stats = {
             "started_at": datetime.now().isoformat(),
             "finished_at": None,
@@ -43,73 +61,121 @@ class ScraperOrchestrator:
             "total_properties": 0,
             "new_properties": 0,
             "updated_properties": 0,
+            **extra,
             "errors": []
         }
+    
+    async def _run_concurrently(self, auctioneers: List[Dict], process, run: "_Run") -> None:
+        """
+        Processa os leiloeiros em paralelo respeitando os limites por domínio
+        (ver crawl_limits). Cada leiloeiro é salvo no banco assim que termina.
+        """
+        platforms = load_platform_catalog()
+        keys = [budget_key(a, platforms) for a in auctioneers]
+        logger.info(
+            f"Concorrência: {run.limits.max_concurrency} global, {run.limits.per_domain} por domínio, "
+            f"{len(set(keys))} domínios/plataformas"
+        )
+        
+        async def process_one(auctioneer: Dict, key: str) -> None:
+            await process(auctioneer, key, run)
+            run.completed += 1
+        
+        await asyncio.gather(*(process_one(a, k) for a, k in zip(auctioneers, keys)), return_exceptions=True)
+    
+    def _progress(self, run: "_Run", name: str) -> None:
+        run.started += 1
+        logger.info(f"[{run.started}/{self.stats['total_auctioneers']}] Processando {name}...")
+        extra = {"mode": run.mode} if run.mode else {}
+        self._publish(
+            "progress",
+            **extra,
+            current=run.started,
+            completed=run.completed,
+            current_auctioneer=name,
+            in_flight=sorted(run.limits.active),
+        )
+    
+    async def run_all(self, skip_geocoding: bool = False, limit: Optional[int] = None, concurrency: Optional[int] = None) -> Dict:
+        """
+        Executa scraping de todos os leiloeiros ativos.
+        
+        Args:
+            concurrency: Scrapes simultâneos (padrão SCRAPER_CONCURRENCY; 1 = um site por vez)
+        """
+        self._reset_stats()
         
         # Buscar leiloeiros ativos
-        auctioneers = self._get_active_auctioneers(limit)
+        auctioneers = await asyncio.to_thread(self._get_active_auctioneers, limit)
         self.stats["total_auctioneers"] = len(auctioneers)
         
         logger.info(f"Iniciando scraping de {len(auctioneers)} leiloeiros")
+        self._publish("started")
         
-        for i, auctioneer in enumerate(auctioneers):
-            name = auctioneer.get('name', 'Unknown')
-            auctioneer_id = auctioneer.get('id')
-            
-            logger.info(f"[{i+1}/{len(auctioneers)}] Processando {name}...")
-            
-            try:
-                # Scraping
-                properties = await universal_scraper.scrape_auctioneer(auctioneer)
-                
-                if not properties:
-                    self._update_auctioneer_status(auctioneer_id, 'error', 'Nenhum imóvel encontrado')
-                    self.stats["failed"] += 1
-                    continue
-                
-                # Normalização
-                logger.info(f"Normalizando {len(properties)} imóveis de {name}...")
-                normalized = await ai_normalizer.normalize_batch(properties)
-                
-                # Geocoding (opcional)
-                if not skip_geocoding:
-                    logger.info(f"Geocodificando {len(normalized)} imóveis de {name}...")
-                    normalized = await geocoding_service.geocode_batch(normalized, delay=0.5)
-                
-                # Salvar no banco
-                new_count, updated_count = self._save_properties(normalized, auctioneer_id, name)
-                
-                self.stats["total_properties"] += len(normalized)
-                self.stats["new_properties"] += new_count
-                self.stats["updated_properties"] += updated_count
-                self.stats["successful"] += 1
-                
-                # Atualizar status do leiloeiro
-                self._update_auctioneer_status(
-                    auctioneer_id, 
-                    'success', 
-                    None, 
-                    len(normalized)
-                )
-                
-                logger.info(f"✓ {name}: {new_count} novos, {updated_count} atualizados")
-                
-                # Pequena pausa entre leiloeiros para não sobrecarregar
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"✗ Erro em {name}: {error_msg}")
-                self.stats["failed"] += 1
-                self.stats["errors"].append({"auctioneer": name, "error": error_msg})
-                self._update_auctioneer_status(auctioneer_id, 'error', error_msg)
+        await self._run_concurrently(auctioneers, self._process_auctioneer, _Run(skip_geocoding, concurrency))
         
         self.stats["finished_at"] = datetime.now().isoformat()
+        self._publish("finished")
         
         logger.info(f"Scraping finalizado: {self.stats['successful']} sucesso, {self.stats['failed']} falhas")
         
         return self.stats
     
+    async def _process_auctioneer(self, auctioneer: Dict, key: str, run: "_Run") -> None:
+        """Scraping → normalização → geocoding → save de um leiloeiro (run_all)."""
+        name = auctioneer.get('name', 'Unknown')
+        auctioneer_id = auctioneer.get('id')
+        
+        try:
+            # Scraping: único passo que acessa o site, feito dentro do slot do domínio
+            async with run.limits.slot(key):
+                self._progress(run, name)
+                properties = await universal_scraper.scrape_auctioneer(auctioneer)
+            
+            if not properties:
+                await asyncio.to_thread(self._update_auctioneer_status, auctioneer_id, 'error', 'Nenhum imóvel encontrado')
+                self.stats["failed"] += 1
+                return
+            
+            # Normalização
+            logger.info(f"Normalizando {len(properties)} imóveis de {name}...")
+            normalized = await ai_normalizer.normalize_batch(properties)
+            
+            # Geocoding (opcional)
+            if not run.skip_geocoding:
+                async with run.geocoding_lock:
+                    logger.info(f"Geocodificando {len(normalized)} imóveis de {name}...")
+                    normalized = await geocoding_service.geocode_batch(normalized, delay=0.5)
+            
+            # Salvar no banco
+            new_count, updated_count = await asyncio.to_thread(self._save_properties, normalized, auctioneer_id, name)
+            
+            self.stats["total_properties"] += len(normalized)
+            self.stats["new_properties"] += new_count
+            self.stats["updated_properties"] += updated_count
+            self.stats["successful"] += 1
+            
+            # Atualizar status do leiloeiro
+            await asyncio.to_thread(
+                self._update_auctioneer_status,
+                auctioneer_id, 
+                'success', 
+                None, 
+                len(normalized)
+            )
+            
+            logger.info(f"✓ {name}: {new_count} novos, {updated_count} atualizados")
+            
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"✗ Erro em {name}: {error_msg}")
+            self.stats["failed"] += 1
+            self.stats["errors"].append({"auctioneer": name, "error": error_msg})
+            try:
+                await asyncio.to_thread(self._update_auctioneer_status, auctioneer_id, 'error', error_msg)
+            except Exception as status_err:
+                logger.warning(f"Erro ao atualizar status de {name}: {status_err}")
+    
     async def run_single(self, auctioneer_id: str, skip_geocoding: bool = False) -> Dict:
         """Executa scraping de um único leiloeiro"""
         
@@ -140,17 +206,20 @@ class ScraperOrchestrator:
             
             self._update_auctioneer_status(auctioneer_id, 'success', None, len(normalized))
             
-            return {
+            result = {
                 "success": True,
                 "auctioneer": name,
                 "total": len(normalized),
                 "new": new_count,
                 "updated": updated_count
             }
+            publish_event("scraper", "single_finished", result)
+            return result
             
         except Exception as e:
             error_msg = str(e)
             self._update_auctioneer_status(auctioneer_id, 'error', error_msg)
+            publish_event("scraper", "single_failed", {"auctioneer": name, "error": error_msg})
             return {"error": error_msg, "auctioneer": name}
     
     def _get_active_auctioneers(self, limit: Optional[int] = None) -> List[Dict]:
@@ -385,134 +454,118 @@ class ScraperOrchestrator:
         
         return new_count, updated_count
     
-    async def run_all_smart(self, skip_geocoding: bool = False, limit: Optional[int] = None) -> Dict:
+    async def run_all_smart(self, skip_geocoding: bool = False, limit: Optional[int] = None, concurrency: Optional[int] = None) -> Dict:
         """
         Executa scraping usando configurações descobertas quando disponíveis.
+        
+        Args:
+            concurrency: Scrapes simultâneos (padrão SCRAPER_CONCURRENCY; 1 = um site por vez)
         """
-        self.stats = {
-            "started_at": datetime.now().isoformat(),
-            "finished_at": None,
-            "total_auctioneers": 0,
-            "successful": 0,
-            "failed": 0,
-            "total_properties": 0,
-            "new_properties": 0,
-            "updated_properties": 0,
-            "used_config": 0,
-            "used_fallback": 0,
-            "errors": []
-        }
+        self._reset_stats(used_config=0, used_fallback=0)
         
         # Buscar leiloeiros ativos com configurações
-        auctioneers = self._get_active_auctioneers_with_config(limit)
+        auctioneers = await asyncio.to_thread(self._get_active_auctioneers_with_config, limit)
         self.stats["total_auctioneers"] = len(auctioneers)
         
         logger.info(f"🚀 Iniciando scraping SMART de {len(auctioneers)} leiloeiros")
+        self._publish("started", mode="smart")
         
-        for i, auctioneer in enumerate(auctioneers, 1):
-            auc_id = auctioneer["id"]
-            auc_name = auctioneer["name"]
-            config = auctioneer.get("scrape_config")
-            
-            logger.info(f"[{i}/{len(auctioneers)}] Processando {auc_name}...")
-            
-            self._update_auctioneer_status(auc_id, "running")
-            
-            try:
-                # Extração
+        await self._run_concurrently(auctioneers, self._process_auctioneer_smart, _Run(skip_geocoding, concurrency, mode="smart"))
+        
+        self.stats["finished_at"] = datetime.now().isoformat()
+        self._publish("finished", mode="smart")
+        
+        logger.info(f"🏁 Scraping SMART finalizado: {self.stats['successful']} sucesso, {self.stats['failed']} falhas")
+        logger.info(f"   Config usado: {self.stats['used_config']}, Fallback: {self.stats['used_fallback']}")
+        
+        return self.stats
+    
+    def _update_validation_metrics(self, auc_id: str, success: bool, properties_count: int) -> None:
+        """Atualiza métricas do structure_validator sem afetar o fluxo principal."""
+        try:
+            structure_validator.update_validation_metrics(
+                auctioneer_id=auc_id,
+                success=success,
+                properties_count=properties_count
+            )
+        except Exception as metric_err:
+            logger.warning(f"Erro ao atualizar métricas: {metric_err}")
+    
+    async def _process_auctioneer_smart(self, auctioneer: Dict, key: str, run: "_Run") -> None:
+        """Extração (config descoberta ou fallback) → normalização → geocoding → save (run_all_smart)."""
+        auc_id = auctioneer["id"]
+        auc_name = auctioneer["name"]
+        config = auctioneer.get("scrape_config")
+        
+        try:
+            # Extração: único passo que acessa o site, feito dentro do slot do domínio
+            async with run.limits.slot(key):
+                self._progress(run, auc_name)
+                await asyncio.to_thread(self._update_auctioneer_status, auc_id, "running")
+                
                 if config and isinstance(config, dict):
-                    logger.info(f"  → Usando configuração descoberta ({config.get('site_type')})")
+                    logger.info(f"  → {auc_name}: usando configuração descoberta ({config.get('site_type')})")
                     properties = await universal_scraper.scrape_with_config(auctioneer, config)
                     self.stats["used_config"] += 1
                 else:
-                    logger.info(f"  → Usando método tradicional (sem config)")
+                    logger.info(f"  → {auc_name}: usando método tradicional (sem config)")
                     properties = await universal_scraper.scrape_auctioneer(auctioneer)
                     self.stats["used_fallback"] += 1
-                
-                if not properties:
-                    self._update_auctioneer_status(auc_id, "error", "Nenhum imóvel encontrado")
-                    self.stats["failed"] += 1
-                    # Atualizar métricas em bloco try separado
-                    try:
-                        structure_validator.update_validation_metrics(auc_id, False, 0)
-                    except Exception as metric_err:
-                        logger.warning(f"Erro ao atualizar métricas: {metric_err}")
-                    continue
-                
-                # Normalização
+            
+            if not properties:
+                await asyncio.to_thread(self._update_auctioneer_status, auc_id, "error", "Nenhum imóvel encontrado")
+                self.stats["failed"] += 1
+                await asyncio.to_thread(self._update_validation_metrics, auc_id, False, 0)
+                return
+            
+            # Normalização
+            try:
+                normalized = await ai_normalizer.normalize_batch(properties)
+                logger.info(f"Normalizados {len(normalized)}/{len(properties)} imóveis")
+            except Exception as norm_err:
+                logger.error(f"Erro na normalização: {norm_err}")
+                normalized = properties  # Usar dados não normalizados
+            
+            # Geocoding (opcional)
+            if not run.skip_geocoding:
                 try:
-                    normalized = await ai_normalizer.normalize_batch(properties)
-                    logger.info(f"Normalizados {len(normalized)}/{len(properties)} imóveis")
-                except Exception as norm_err:
-                    logger.error(f"Erro na normalização: {norm_err}")
-                    normalized = properties  # Usar dados não normalizados
-                
-                # Geocoding (opcional)
-                if not skip_geocoding:
-                    try:
+                    async with run.geocoding_lock:
                         logger.info(f"Geocodificando {len(normalized)} imóveis de {auc_name}...")
                         normalized = await geocoding_service.geocode_batch(normalized, delay=0.5)
-                    except Exception as geo_err:
-                        logger.warning(f"Erro no geocoding: {geo_err}, continuando sem geocoding")
-                
-                # Salvamento
-                try:
-                    new_count, updated_count = self._save_properties(normalized, auc_id, auc_name)
-                    self._update_auctioneer_status(auc_id, "success", None, len(normalized))
-                    self.stats["successful"] += 1
-                    self.stats["total_properties"] += len(normalized)
-                    self.stats["new_properties"] += new_count
-                    self.stats["updated_properties"] += updated_count
-                except Exception as save_err:
-                    logger.error(f"Erro ao salvar: {save_err}")
-                    self._update_auctioneer_status(auc_id, "error", str(save_err))
-                    self.stats["failed"] += 1
-                    # Não atualizar métricas de sucesso se salvamento falhou
-                    try:
-                        structure_validator.update_validation_metrics(auc_id, False, 0)
-                    except Exception as metric_err:
-                        logger.warning(f"Erro ao atualizar métricas: {metric_err}")
-                    continue
-                
-                # Métricas (em bloco separado para não afetar fluxo principal)
-                try:
-                    structure_validator.update_validation_metrics(
-                        auctioneer_id=auc_id,
-                        success=True,
-                        properties_count=len(normalized)
-                    )
-                except Exception as metric_err:
-                    logger.warning(f"Erro ao atualizar métricas: {metric_err}")
-                
-                logger.info(f"✅ {auc_name}: {new_count} novos, {updated_count} atualizados")
-                
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"❌ {auc_name}: {error_msg}")
-                logger.debug(traceback.format_exc())
-                self._update_auctioneer_status(auc_id, "error", error_msg)
+                except Exception as geo_err:
+                    logger.warning(f"Erro no geocoding: {geo_err}, continuando sem geocoding")
+            
+            # Salvamento (assim que o leiloeiro termina, sem esperar os demais)
+            try:
+                new_count, updated_count = await asyncio.to_thread(self._save_properties, normalized, auc_id, auc_name)
+                await asyncio.to_thread(self._update_auctioneer_status, auc_id, "success", None, len(normalized))
+                self.stats["successful"] += 1
+                self.stats["total_properties"] += len(normalized)
+                self.stats["new_properties"] += new_count
+                self.stats["updated_properties"] += updated_count
+            except Exception as save_err:
+                logger.error(f"Erro ao salvar: {save_err}")
+                await asyncio.to_thread(self._update_auctioneer_status, auc_id, "error", str(save_err))
                 self.stats["failed"] += 1
-                self.stats["errors"].append({"name": auc_name, "error": error_msg})
-                
-                # Atualizar métricas de falha (em bloco separado)
-                try:
-                    structure_validator.update_validation_metrics(
-                        auctioneer_id=auc_id,
-                        success=False,
-                        properties_count=0
-                    )
-                except Exception as metric_err:
-                    logger.warning(f"Erro ao atualizar métricas de falha: {metric_err}")
+                # Não atualizar métricas de sucesso se salvamento falhou
+                await asyncio.to_thread(self._update_validation_metrics, auc_id, False, 0)
+                return
             
-            # Pequena pausa entre leiloeiros
-            await asyncio.sleep(2)
-        
-        self.stats["finished_at"] = datetime.now().isoformat()
-        
-        logger.info(f"🏁 Scraping SMART finalizado: {self.stats['successful']} sucesso, {self.stats['failed']} falhas")
-        logger.info(f"   Config usado: {self.stats['used_config']}, Fallback: {self.stats['used_fallback']}")
-        
-        return self.stats
+            await asyncio.to_thread(self._update_validation_metrics, auc_id, True, len(normalized))
+            
+            logger.info(f"✅ {auc_name}: {new_count} novos, {updated_count} atualizados")
+            
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"❌ {auc_name}: {error_msg}")
+            logger.debug(traceback.format_exc())
+            self.stats["failed"] += 1
+            self.stats["errors"].append({"name": auc_name, "error": error_msg})
+            try:
+                await asyncio.to_thread(self._update_auctioneer_status, auc_id, "error", error_msg)
+            except Exception as status_err:
+                logger.warning(f"Erro ao atualizar status de {auc_name}: {status_err}")
+            await asyncio.to_thread(self._update_validation_metrics, auc_id, False, 0)
     
     def _get_active_auctioneers_with_config(self, limit: Optional[int] = None) -> List[Dict]:
         """Busca leiloeiros ativos com suas configurações"""
@@ -0,0 +1,722 @@
+"""
+Indução de seletores CSS a partir de uma extração com IA.
+
+Sites sem configuração em app/configs/sites/*.json passam toda listagem
+pelo gpt-4o-mini em toda execução. Depois de uma extração com IA
+bem-sucedida, este módulo procura no DOM os nós com o título, preço, link e
+imagem de cada imóvel retornado, sobe até o card de cada um (o maior
+ancestral que não contém outro imóvel) e generaliza para seletores
+card/title/price/link/image, no formato que ConfigurableScraper
+(`selectors`) e GenericScraper._apply_selector_config
+(`listing_page.selectors`) já leem.
+
+Os seletores induzidos numa página ficam como candidatos (em memória) até
+serem validados numa segunda página do mesmo site, comparando com os itens
+que a IA extraiu dela. Validados, são salvos em
+app/configs/sites/<domínio>.json com method="induced_selectors", e as
+próximas listagens do site são extraídas por seletor, sem IA. Se a extração
+por seletor falhar (nenhum card, cards sem título/link), a listagem volta
+para a IA; SELECTOR_MAX_FAILURES falhas seguidas desativam a configuração e
+a indução recomeça.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+from soupsieve import SelectorSyntaxError
+
+from app.configs.config_manager import ConfigManager
+from app.utils.html_parser import parse_html
+
+logger = logging.getLogger(__name__)
+
+SELECTOR_INDUCTION_ENABLED = os.getenv("SELECTOR_INDUCTION_ENABLED", "true").lower() == "true"
+# Falhas seguidas da extração por seletor antes de desativar a configuração
+SELECTOR_MAX_FAILURES = int(os.getenv("SELECTOR_MAX_FAILURES", "3"))
+
+INDUCED_METHOD = "induced_selectors"
+# Imóveis da IA localizados no DOM para tentar induzir
+MIN_MATCHED_ITEMS = 3
+# Fração dos imóveis que um seletor precisa acertar
+MIN_SELECTOR_HITS = 0.6
+# Fração dos cards com título e link para aceitar uma extração por seletor
+MIN_FIELD_COVERAGE = 0.8
+# Fração dos imóveis da IA que a extração por seletor precisa encontrar na validação
+MIN_AGREEMENT = 0.7
+
+_WHITESPACE = re.compile(r"\s+")
+# "R$ 1.234,56" ou valores com milhar/centavos que não sejam área ("62,33m²") ou percentual
+_PRICE = re.compile(
+    r"R\$\s*([\d.]+(?:,\d{1,2})?)"
+    r"|(\d{1,3}(?:\.\d{3})+(?:,\d{2})?|\d+,\d{2})(?![\d,]|\s*(?:m²|m2|%|ha\b))"
+)
+# Classes geradas (CSS-in-JS, hashes) ou de estado não servem como seletor
+_UNSTABLE_CLASS = re.compile(
+    r"^(?:css|sc|jsx|emotion|styled|ng|svelte)-|\d{3,}"
+    # Hash de CSS modules ("Card_title__aB3xZ", "card_x7k2p"): sufixo com dígito ou
+    # maiúsculas e minúsculas misturadas; snake_case comum ("lote_valor") é estável
+    r"|_(?=[a-zA-Z0-9]*\d)[a-zA-Z0-9]{5,}$|_(?=[a-zA-Z0-9]*[A-Z])(?=[a-zA-Z0-9]*[a-z])[a-zA-Z0-9]{5,}$"
+    r"|^(?:active|selected|first|last|odd|even|hover|show|hidden|clearfix|row)$"
+    # Utilitários de layout (Bootstrap/Tailwind): mudam com o grid, não com o conteúdo
+    r"|^(?:[mp][trblxyse]?|g[xy]?|gap|col(?:-\w+)?|d|w|h|text|align|justify|flex|order|offset)-"
+)
+_IMAGE_ATTRS = ("src", "data-src", "data-lazy", "data-lazy-src", "data-original")
+_NOISE_TAGS = ("script", "style", "noscript", "template", "svg")
+_ROOT_TAGS = ("[document]", "html", "body")
+
+
+# ==================== Utilitários ====================
+
+def _norm(text) -> str:
+    return _WHITESPACE.sub(" ", str(text or "")).strip().casefold()
+
+
+def _text(element) -> str:
+    return _WHITESPACE.sub(" ", element.get_text(" ", strip=True)).strip()
+
+
+def _parse(html: str) -> BeautifulSoup:
+    soup = BeautifulSoup(html, "lxml")
+    for element in soup(_NOISE_TAGS):
+        element.decompose()
+    return soup
+
+
+def _url_key(url) -> str:
+    """URL comparável: sem fragmento e sem barra final."""
+    return str(url or "").split("#", 1)[0].rstrip("/")
+
+
+def stable_external_id(item: Dict) -> Optional[str]:
+    """
+    external_id estável para um item sem código do lote: hash da URL do
+    imóvel (sem fragmento/barra final) ou, sem URL, do título. Igual entre
+    execuções, ao contrário de hash(), que muda a cada processo.
+    """
+    key = _url_key(item.get("url")) or _WHITESPACE.sub(" ", str(item.get("title") or "")).strip().lower()
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] if key else None
+
+
+def _absolute(url, base_url: str) -> str:
+    url = str(url or "").strip()
+    return urljoin(base_url, url) if url else ""
+
+
+def _to_float(value) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value) if value > 0 else None
+    if isinstance(value, str):
+        prices = parse_prices(value)
+        return prices[0] if prices else None
+    return None
+
+
+def parse_prices(text: str) -> List[float]:
+    """Valores em formato brasileiro no texto ("R$ 1.234,56", "173.172,51")."""
+    values = []
+    for match in _PRICE.finditer(text or ""):
+        raw = (match.group(1) or match.group(2)).replace(".", "").replace(",", ".")
+        try:
+            value = float(raw)
+        except ValueError:
+            continue
+        if value > 0:
+            values.append(value)
+    return values
+
+
+def _same_price(a: float, b: float) -> bool:
+    return abs(a - b) <= max(1.0, 0.01 * b)
+
+
+def _image_src(img, base_url: str) -> str:
+    for attr in _IMAGE_ATTRS:
+        src = (img.get(attr) or "").strip()
+        if src and not src.startswith("data:"):
+            return _absolute(src, base_url)
+    return ""
+
+
+def _select(root, selector: str) -> List:
+    try:
+        return root.select(selector)
+    except (SelectorSyntaxError, ValueError, NotImplementedError):
+        return []
+
+
+def _select_one(root, selector: str):
+    try:
+        return root.select_one(selector)
+    except (SelectorSyntaxError, ValueError, NotImplementedError):
+        return None
+
+
+def _classes(element) -> List[str]:
+    return [
+        cls for cls in (element.get("class") or [])
+        if cls and not _UNSTABLE_CLASS.search(cls) and re.match(r"^[A-Za-z_][\w-]*$", cls)
+    ]
+
+
+def _candidates(element) -> List[str]:
+    """Seletores simples para o elemento, dos mais específicos aos genéricos.
+
+    A forma ".classe" vem primeiro: ConfigurableScraper só usa select_one
+    em title/price quando o seletor começa com '.' ou '#'.
+    """
+    classes = _classes(element)
+    selectors = [f".{cls}" for cls in classes]
+    selectors += [f"{element.name}.{cls}" for cls in classes]
+    item_prop = element.get("itemprop")
+    if item_prop and re.match(r"^[\w-]+$", item_prop):
+        selectors.append(f'{element.name}[itemprop="{item_prop}"]')
+    selectors.append(element.name)
+    parent = element.parent
+    if parent is not None and parent.name not in _ROOT_TAGS:
+        parent_classes = _classes(parent)
+        if parent_classes:
+            selectors.append(f"{parent.name}.{parent_classes[0]} > {element.name}")
+    return selectors
+
+
+def _chain(element) -> List:
+    """O elemento e seus ancestrais, sem documento/html/body."""
+    chain = [element]
+    chain.extend(p for p in element.parents if p.name not in _ROOT_TAGS)
+    return chain
+
+
+def _lca(nodes: List):
+    """Menor ancestral comum dos nós."""
+    if not nodes:
+        return None
+    common = {id(x) for x in _chain(nodes[0])}
+    for node in nodes[1:]:
+        common &= {id(x) for x in _chain(node)}
+    return next((x for x in _chain(nodes[0]) if id(x) in common), None)
+
+
+# ==================== Localização dos imóveis no DOM ====================
+
+class _Match:
+    """Nós de um imóvel da IA encontrados na página."""
+
+    def __init__(self, item: Dict):
+        self.item = item
+        self.title = _norm(item.get("title"))
+        self.url = ""
+        self.price = _to_float(item.get("price"))
+        self.image = ""
+        self.title_node = None
+        self.link_node = None
+        self.price_node = None
+        self.image_node = None
+        self.chain: List = []  # do menor ancestral comum dos nós até o card
+
+    @property
+    def nodes(self) -> List:
+        return [n for n in (self.title_node, self.link_node, self.price_node, self.image_node) if n is not None]
+
+
+def _find_title(strings: List[Tuple[object, str]], title: str):
+    """Elemento com o texto que contém o título (ou a maior parte dele)."""
+    if len(title) < 8:
+        return None
+    best, best_len = None, None
+    for parent, text in strings:
+        if title in text or (text in title and len(text) >= 0.6 * len(title)):
+            if best_len is None or len(text) < best_len:
+                best, best_len = parent, len(text)
+    return best
+
+
+def _locate(soup: BeautifulSoup, items: List[Dict], base_url: str) -> List[_Match]:
+    strings = []
+    for string in soup.find_all(string=True):
+        text = _norm(string)
+        if len(text) >= 5 and string.parent is not None and string.parent.name not in _ROOT_TAGS:
+            strings.append((string.parent, text))
+    links: Dict[str, List] = defaultdict(list)
+    for a in soup.find_all("a", href=True):
+        links[_url_key(_absolute(a["href"], base_url))].append(a)
+
+    matches = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        match = _Match(item)
+        match.url = _url_key(_absolute(item.get("url"), base_url))
+        match.image = _url_key(_absolute(item.get("image_url"), base_url))
+        match.title_node = _find_title(strings, match.title) if match.title else None
+        candidates = links.get(match.url, []) if match.url else []
+        if candidates:
+            if match.title_node is not None:
+                # O link mais próximo do título (o mesmo link pode estar no carrossel)
+                depth = lambda a: len(_chain(_lca([a, match.title_node]) or a))
+                match.link_node = max(candidates, key=depth)
+            else:
+                match.link_node = candidates[0]
+        if match.title_node is not None or match.link_node is not None:
+            matches.append(match)
+    return matches
+
+
+def _expand_cards(matches: List[_Match], base_url: str) -> None:
+    """Para cada imóvel, sobe até o maior ancestral que não contém outro imóvel."""
+    owners: Dict[int, set] = defaultdict(set)
+    for i, match in enumerate(matches):
+        for node in match.nodes:
+            for ancestor in _chain(node):
+                owners[id(ancestor)].add(i)
+
+    for i, match in enumerate(matches):
+        start = _lca(match.nodes)
+        if start is None or len(owners[id(start)]) > 1:
+            continue
+        chain = [start]
+        parent = start.parent
+        while parent is not None and parent.name not in _ROOT_TAGS and owners[id(parent)] == {i}:
+            chain.append(parent)
+            parent = parent.parent
+        card = chain[-1]
+        # Preço e imagem ficam fora do título/link; procurados dentro do card
+        if match.price is not None:
+            # O menor elemento cujo texto tem o preço ("R$" e o valor podem estar em nós separados)
+            priced = [
+                element for element in card.find_all(True)
+                if any(_same_price(v, match.price) for v in parse_prices(_text(element)))
+            ]
+            if priced:
+                match.price_node = min(priced, key=lambda element: len(_text(element)))
+        if match.image:
+            match.image_node = next(
+                (img for img in card.find_all("img") if _url_key(_image_src(img, base_url)) == match.image), None
+            )
+        # O card precisa conter todos os campos encontrados
+        start_id = id(_lca(match.nodes))
+        ids = [id(element) for element in chain]
+        match.chain = chain[ids.index(start_id):] if start_id in ids else chain
+
+
+# ==================== Generalização ====================
+
+def _card_selector(soup: BeautifulSoup, matches: List[_Match]) -> Tuple[Optional[str], Dict[int, object]]:
+    """Seletor que cobre os cards do maior número de imóveis com menos elementos sobrando."""
+    counts: Counter = Counter()
+    for match in matches:
+        seen = set()
+        for element in match.chain:
+            for selector in _candidates(element):
+                if selector not in seen:
+                    seen.add(selector)
+                    counts[selector] += 1
+
+    best, best_key, best_cards = None, None, {}
+    for selector, count in counts.items():
+        if count < MIN_SELECTOR_HITS * len(matches):
+            continue
+        matched = _select(soup, selector)
+        matched_ids = {id(element) for element in matched}
+        cards = {}
+        for i, match in enumerate(matches):
+            # O primeiro elemento da cadeia (a partir dos campos) que o seletor pega
+            card = next((e for e in match.chain if id(e) in matched_ids), None)
+            if card is not None:
+                cards[i] = card
+        if len(cards) < MIN_SELECTOR_HITS * len(matches) or len(set(map(id, cards.values()))) < len(cards):
+            continue
+        key = (-len(cards), len(matched), len(selector))
+        if best_key is None or key < best_key:
+            best, best_key, best_cards = selector, key, cards
+    return best, best_cards
+
+
+def _field_selector(pairs: List[Tuple[object, object, _Match]], accept, extra: Tuple[str, ...] = ()) -> Optional[str]:
+    """Seletor relativo ao card que acerta o campo no maior número de imóveis."""
+    order: List[str] = []
+    for _, node, _ in pairs:
+        for selector in list(extra) + _candidates(node):
+            if selector not in order:
+                order.append(selector)
+
+    best, best_hits = None, 0
+    for selector in order:
+        hits = 0
+        for card, _, match in pairs:
+            found = _select_one(card, selector)
+            if found is not None and accept(found, match):
+                hits += 1
+        if hits > best_hits:
+            best, best_hits = selector, hits
+    if best is None or best_hits < MIN_SELECTOR_HITS * len(pairs):
+        return None
+    return best
+
+
+def induce_selectors(html: str, items: List[Dict], base_url: str) -> Optional[Dict]:
+    """
+    Induz seletores card/title/price/link/image a partir dos imóveis que a
+    IA extraiu desta página.
+
+    Returns:
+        Dict com os seletores e os imóveis localizados, ou None se não deu
+        para localizar MIN_MATCHED_ITEMS imóveis com um card em comum.
+    """
+    if not html or len(items) < MIN_MATCHED_ITEMS:
+        return None
+    soup = _parse(html)
+    matches = _locate(soup, items, base_url)
+    if len(matches) < MIN_MATCHED_ITEMS:
+        logger.debug(f"Indução em {base_url}: só {len(matches)} imóveis localizados no DOM")
+        return None
+    _expand_cards(matches, base_url)
+    matches = [m for m in matches if m.chain]
+
+    card_selector, cards = _card_selector(soup, matches)
+    if not card_selector or len(cards) < MIN_MATCHED_ITEMS:
+        logger.debug(f"Indução em {base_url}: nenhum seletor de card comum")
+        return None
+
+    def pairs(field: str):
+        return [(cards[i], getattr(m, field), m) for i, m in enumerate(matches)
+                if i in cards and getattr(m, field) is not None]
+
+    title_pairs = pairs("title_node")
+    title = _field_selector(
+        title_pairs, lambda found, m: bool(m.title) and (m.title in _norm(_text(found)) or found is m.title_node)
+    ) if title_pairs else None
+    link_pairs = pairs("link_node")
+    link = _field_selector(
+        link_pairs, lambda found, m: _url_key(_absolute(found.get("href"), base_url)) == m.url,
+        extra=("a[href]",),
+    ) if link_pairs else None
+    price_pairs = pairs("price_node")
+    price = _field_selector(
+        price_pairs, lambda found, m: any(_same_price(v, m.price) for v in parse_prices(_text(found)))
+    ) if price_pairs else None
+    image_pairs = pairs("image_node")
+    image = _field_selector(
+        image_pairs, lambda found, m: found is m.image_node, extra=("img",)
+    ) if image_pairs else None
+
+    if not title and not link:
+        return None
+    selectors = {"card": card_selector, "title": title, "price": price, "link": link or "a[href]", "image": image or "img"}
+    return {"selectors": selectors, "matched_items": len(cards), "ai_items": len(items)}
+
+
+# ==================== Extração por seletor ====================
+
+def extract_with_selectors(html: str, selectors: Dict, base_url: str) -> Tuple[List[Dict], int]:
+    """
+    Extrai os imóveis da listagem com os seletores, no formato dos itens da IA
+    (title, price, url, image_url).
+
+    Returns:
+        (itens, número de cards encontrados)
+    """
+    # Documento compartilhado (selectolax/lxml); a indução usa uma árvore própria
+    soup = parse_html(html)
+    cards = _select(soup, selectors.get("card") or "")
+    items = []
+    seen = set()
+    for card in cards:
+        item: Dict = {}
+        title_sel = selectors.get("title")
+        title = _select_one(card, title_sel) if title_sel else None
+        if title is not None and _text(title):
+            item["title"] = _text(title)[:500]
+        link_sel = selectors.get("link") or "a[href]"
+        link = card if card.name == "a" and card.get("href") else _select_one(card, link_sel)
+        if link is not None and link.get("href"):
+            item["url"] = _absolute(link.get("href"), base_url)
+        price_sel = selectors.get("price")
+        price = _select_one(card, price_sel) if price_sel else None
+        if price is not None:
+            values = parse_prices(_text(price))
+            if values:
+                item["price"] = values[0]
+        image_sel = selectors.get("image") or "img"
+        image = _select_one(card, image_sel)
+        if image is not None and image.name != "img":
+            image = _select_one(image, "img")
+        if image is not None:
+            src = _image_src(image, base_url)
+            if src:
+                item["image_url"] = src
+        if not item.get("title") and not item.get("url"):
+            continue
+        # Carrosséis repetem o mesmo card
+        key = item.get("url") or item.get("title")
+        if key in seen:
+            continue
+        seen.add(key)
+        item["external_id"] = stable_external_id(item)
+        items.append(item)
+    return items, len(cards)
+
+
+def check_extraction(items: List[Dict], selectors: Dict) -> Tuple[bool, Dict]:
+    """Verifica se a extração por seletor parece completa (cards com título/link/preço)."""
+    total = len(items)
+    with_title = sum(1 for item in items if item.get("title"))
+    with_url = sum(1 for item in items if item.get("url"))
+    with_price = sum(1 for item in items if item.get("price"))
+    report = {"items": total, "with_title": with_title, "with_url": with_url, "with_price": with_price}
+    if not total:
+        return False, report
+    ok = with_url / total >= MIN_FIELD_COVERAGE
+    if selectors.get("title"):
+        ok = ok and with_title / total >= MIN_FIELD_COVERAGE
+    if selectors.get("price"):
+        ok = ok and with_price / total >= 0.5
+    return ok, report
+
+
+def validate_selectors(html: str, selectors: Dict, base_url: str, ai_items: List[Dict]) -> Tuple[bool, Dict]:
+    """
+    Aplica os seletores a uma página e compara com os imóveis que a IA
+    extraiu dela: a extração precisa ser completa e encontrar MIN_AGREEMENT
+    dos imóveis da IA (por URL ou título).
+    """
+    items, card_count = extract_with_selectors(html, selectors, base_url)
+    ok, report = check_extraction(items, selectors)
+    urls = {_url_key(item.get("url")) for item in items if item.get("url")}
+    titles = [_norm(item.get("title")) for item in items if item.get("title")]
+    found = 0
+    expected = 0
+    for ai_item in ai_items:
+        if not isinstance(ai_item, dict):
+            continue
+        expected += 1
+        url = _url_key(_absolute(ai_item.get("url"), base_url))
+        title = _norm(ai_item.get("title"))
+        if (url and url in urls) or (title and any(title in t or t in title for t in titles if t)):
+            found += 1
+    agreement = found / expected if expected else 0.0
+    report.update({"cards": card_count, "ai_items": expected, "agreement": round(agreement, 3)})
+    return ok and agreement >= MIN_AGREEMENT, report
+
+
+# ==================== Configurações induzidas ====================
+
+def site_domain(url: str) -> str:
+    netloc = urlparse(url).netloc.lower().split(":")[0]
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+class SelectorInducer:
+    """
+    Configurações induzidas por domínio: extração por seletor quando há uma
+    ativa e indução/validação a partir das extrações com IA.
+    """
+
+    def __init__(self, config_manager: Optional[ConfigManager] = None, max_failures: int = SELECTOR_MAX_FAILURES):
+        self.configs = config_manager or ConfigManager()
+        self.max_failures = max(1, max_failures)
+        self._lock = threading.Lock()
+        self._by_domain: Optional[Dict[str, str]] = None
+        # Seletores induzidos aguardando validação numa segunda página
+        self._candidates: Dict[str, Dict] = {}
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+
+    def _site_name(self, domain: str) -> str:
+        return re.sub(r"[^a-z0-9]+", "_", domain).strip("_")
+
+    def _config_for(self, domain: str) -> Optional[Dict]:
+        """Configuração (manual ou induzida) do domínio, pelo campo website/working_url."""
+        with self._lock:
+            if self._by_domain is None:
+                self._by_domain = {}
+                for path in sorted(self.configs.config_dir.glob("*.json")):
+                    try:
+                        with open(path, "r", encoding="utf-8") as f:
+                            config = json.load(f)
+                    except (OSError, ValueError) as e:
+                        logger.debug(f"Configuração ilegível {path}: {e}")
+                        continue
+                    for field in ("website", "working_url"):
+                        if isinstance(config, dict) and config.get(field):
+                            self._by_domain.setdefault(site_domain(config[field]), path.stem)
+            site_name = self._by_domain.get(domain)
+        return self.configs.get_config(site_name) if site_name else None
+
+    def _save(self, domain: str, config: Dict) -> None:
+        site_name = config.get("id") or self._site_name(domain)
+        if self.configs.save_config(site_name, config):
+            with self._lock:
+                if self._by_domain is not None:
+                    self._by_domain[domain] = site_name
+
+    def active_selectors(self, url: str) -> Optional[Dict]:
+        """Seletores induzidos e validados do domínio, se houver."""
+        config = self._config_for(site_domain(url))
+        if config and config.get("method") == INDUCED_METHOD and config.get("status") == "active":
+            return config.get("selectors")
+        return None
+
+    def extract(self, html: str, url: str, source: str = "") -> Optional[List[Dict]]:
+        """
+        Extrai a listagem com os seletores induzidos do domínio. Retorna None
+        se não há configuração ativa ou se a extração não passou na checagem
+        (o chamador deve usar a IA).
+        """
+        selectors = self.active_selectors(url)
+        if not selectors:
+            return None
+        items, card_count = extract_with_selectors(html, selectors, url)
+        ok, report = check_extraction(items, selectors)
+        stats = self._stats[source or site_domain(url)]
+        if not ok:
+            stats["selector_failures"] += 1
+            logger.info(f"Seletores induzidos falharam em {url} ({card_count} cards, {report}), usando IA")
+            return None
+        stats["selector_hits"] += 1
+        config = self._config_for(site_domain(url))
+        if config and config.get("induced", {}).get("failures"):
+            config["induced"]["failures"] = 0
+            self._save(site_domain(url), config)
+        return items
+
+    def record_fallback(self, url: str, ai_items: List[Dict]) -> None:
+        """
+        Conta uma falha da configuração ativa quando a IA achou imóveis numa
+        página em que os seletores não acharam. Após max_failures seguidas,
+        desativa a configuração (a indução recomeça na próxima extração).
+        """
+        if len(ai_items) < MIN_MATCHED_ITEMS:
+            return
+        domain = site_domain(url)
+        config = self._config_for(domain)
+        if not config or config.get("method") != INDUCED_METHOD or config.get("status") != "active":
+            return
+        induced = config.setdefault("induced", {})
+        induced["failures"] = induced.get("failures", 0) + 1
+        if induced["failures"] >= self.max_failures:
+            config["status"] = "failed"
+            logger.warning(f"Seletores induzidos de {domain} desativados após {induced['failures']} falhas")
+        self._save(domain, config)
+
+    def learn(self, html: str, url: str, ai_items: List[Dict], source: str = "") -> Optional[str]:
+        """
+        Aprende com uma extração com IA desta página.
+
+        Returns:
+            "candidate" (seletores induzidos, aguardando validação), "active"
+            (validados nesta página e salvos) ou None (nada a fazer).
+        """
+        if not html or len(ai_items) < MIN_MATCHED_ITEMS:
+            return None
+        domain = site_domain(url)
+        config = self._config_for(domain)
+        if config and (config.get("method") != INDUCED_METHOD or config.get("status") == "active"):
+            # Site com configuração manual, ou seletores ativos (falha já contada)
+            return None
+        stats = self._stats[source or domain]
+
+        with self._lock:
+            candidate = self._candidates.get(domain)
+        if candidate and _url_key(candidate["from_url"]) != _url_key(url):
+            ok, report = validate_selectors(html, candidate["selectors"], url, ai_items)
+            if ok:
+                self._save(domain, self._build_config(domain, source, candidate, url, report))
+                with self._lock:
+                    self._candidates.pop(domain, None)
+                stats["validated"] += 1
+                logger.info(f"Seletores induzidos para {domain} validados em {url} ({report}): "
+                            f"{candidate['selectors']}")
+                return "active"
+            stats["rejected"] += 1
+            logger.info(f"Seletores candidatos de {domain} reprovados em {url} ({report}), induzindo de novo")
+
+        induced = induce_selectors(html, ai_items, url)
+        if not induced:
+            return None
+        induced["from_url"] = url
+        with self._lock:
+            self._candidates[domain] = induced
+        stats["induced"] += 1
+        logger.info(f"Seletores induzidos de {url} ({induced['matched_items']}/{induced['ai_items']} imóveis): "
+                    f"{induced['selectors']}")
+        return "candidate"
+
+    def _build_config(self, domain: str, source: str, candidate: Dict, validated_url: str, report: Dict) -> Dict:
+        selectors = candidate["selectors"]
+        parsed = urlparse(validated_url)
+        now = datetime.now().isoformat()
+        return {
+            "id": self._site_name(domain),
+            "version": "1.0",
+            "name": source or domain,
+            "website": f"{parsed.scheme}://{parsed.netloc}",
+            "working_url": candidate["from_url"],
+            "method": INDUCED_METHOD,
+            "selectors": dict(selectors),
+            # Formato de GenericScraper._apply_selector_config
+            "listing_page": {
+                "selectors": {
+                    "property_card": selectors["card"],
+                    "title": selectors.get("title"),
+                    "price": selectors.get("price"),
+                    "property_link": selectors.get("link"),
+                    "image": selectors.get("image"),
+                },
+            },
+            "induced": {
+                "from_url": candidate["from_url"],
+                "validated_on": validated_url,
+                "matched_items": candidate["matched_items"],
+                "validation": report,
+                "failures": 0,
+            },
+            "status": "active",
+            "created_at": now,
+            "last_tested_at": now,
+        }
+
+    def get_stats(self) -> dict:
+        """Configurações induzidas, candidatos pendentes e contadores por leiloeiro."""
+        induced = []
+        for site_name in self.configs.list_configs():
+            config = self.configs.get_config(site_name) or {}
+            if config.get("method") == INDUCED_METHOD:
+                induced.append({
+                    "site": site_name,
+                    "name": config.get("name"),
+                    "status": config.get("status"),
+                    "selectors": config.get("selectors"),
+                    "failures": config.get("induced", {}).get("failures", 0),
+                    "created_at": config.get("created_at"),
+                })
+        with self._lock:
+            candidates = {domain: c["selectors"] for domain, c in self._candidates.items()}
+        per_source = [{"source": source, **counts} for source, counts in sorted(self._stats.items())]
+        return {
+            "enabled": SELECTOR_INDUCTION_ENABLED,
+            "configs": induced,
+            "candidates": candidates,
+            "selector_hits": sum(s.get("selector_hits", 0) for s in per_source),
+            "selector_failures": sum(s.get("selector_failures", 0) for s in per_source),
+            "per_source": per_source,
+        }
+
+
+# Instância global
+_selector_inducer: Optional[SelectorInducer] = None
+
+
+def get_selector_inducer() -> SelectorInducer:
+    """Obtém a instância global do indutor de seletores."""
+    global _selector_inducer
+    if _selector_inducer is None:
+        _selector_inducer = SelectorInducer()
+    return _selector_inducer
@@ -0,0 +1,199 @@
+"""
+Single-flight - coalescência de consultas idênticas concorrentes.
+
+Quando um e-mail de marketing sai, centenas de usuários abrem a mesma
+listagem (/api/properties?state=SP&sort_by=discount_percentage) e /api/stats
+em poucos segundos. Sem coalescência cada request executa seu próprio
+COUNT + ORDER BY. Aqui, requests concorrentes com a mesma chave (filtro
+normalizado) aguardam a mesma consulta em andamento e compartilham o
+resultado.
+
+Opcionalmente o resultado fica em cache por `result_ttl` segundos após a
+conclusão (micro-cache), absorvendo as ondas que chegam logo em seguida.
+
+Nota: a coalescência é por processo e por event loop.
+"""
+
+import asyncio
+import os
+import time
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# TTL padrão do micro-cache de resultados (0 = apenas coalescência)
+DEFAULT_RESULT_TTL = float(os.getenv("SINGLE_FLIGHT_RESULT_TTL", "0"))
+DEFAULT_MAX_RESULTS = int(os.getenv("SINGLE_FLIGHT_MAX_RESULTS", "1000"))
+
+
+def make_key(namespace: str, case_insensitive: Iterable[str] = (), **params: Any) -> tuple:
+    """
+    Monta uma chave estável a partir de parâmetros de consulta.
+
+    Parâmetros None são descartados. Só os parâmetros em `case_insensitive`
+    (os que a consulta compara com ILIKE ou já normaliza) vão em minúsculas;
+    os demais entram como vieram, porque um `.eq()` distingue "Judicial"
+    de "judicial" e cada um precisa da sua própria consulta.
+    """
+    case_insensitive = frozenset(case_insensitive)
+    items = []
+    for name in sorted(params):
+        value = params[name]
+        if value is None:
+            continue
+        if name in case_insensitive and isinstance(value, str):
+            value = value.lower()
+        items.append((name, value))
+    return (namespace, tuple(items))
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    # Evita "Task exception was never retrieved" quando todos os chamadores saíram
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes com a mesma chave em uma única execução.
+
+    O primeiro chamador executa a função; os demais aguardam o mesmo
+    Future. Exceções também são compartilhadas (e não ficam em cache).
+    """
+
+    def __init__(
+        self,
+        result_ttl: float = DEFAULT_RESULT_TTL,
+        max_results: int = DEFAULT_MAX_RESULTS,
+    ):
+        """
+        Args:
+            result_ttl: Segundos que o resultado fica em cache após concluir (0 desativa)
+            max_results: Máximo de resultados em cache
+        """
+        self.result_ttl = result_ttl
+        self.max_results = max_results
+
+        self._in_flight: Dict[Any, asyncio.Future] = {}
+        self._results: Dict[Any, Tuple[float, Any]] = {}
+
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.max_waiters = 0
+        self._waiters: Dict[Any, int] = {}
+
+    async def do(
+        self,
+        key: Any,
+        fn: Callable[[], Awaitable[Any]],
+        result_ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Executa `fn()` uma única vez para todas as chamadas concorrentes de `key`.
+
+        Args:
+            key: Chave da consulta (ver make_key)
+            fn: Corrotina sem argumentos que produz o resultado
+            result_ttl: Sobrescreve o TTL do micro-cache para esta chamada
+        """
+        self.calls += 1
+        ttl = self.result_ttl if result_ttl is None else result_ttl
+
+        if ttl > 0:
+            cached = self._results.get(key)
+            if cached is not None:
+                expires_at, value = cached
+                if time.monotonic() < expires_at:
+                    self.cache_hits += 1
+                    return value
+                del self._results[key]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            self._waiters[key] = self._waiters.get(key, 1) + 1
+            self.max_waiters = max(self.max_waiters, self._waiters[key])
+            # shield: o cancelamento de um chamador não cancela a consulta compartilhada
+            return await asyncio.shield(task)
+
+        # A consulta roda numa task própria: cancelar o primeiro chamador
+        # não a cancela nem propaga CancelledError para os que esperam
+        task = asyncio.ensure_future(self._execute(key, fn, ttl))
+        task.add_done_callback(_retrieve_exception)
+        self._in_flight[key] = task
+        self._waiters[key] = 1
+        self.max_waiters = max(self.max_waiters, 1)
+        self.executions += 1
+        return await asyncio.shield(task)
+
+    async def _execute(self, key: Any, fn: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        try:
+            result = await fn()
+        except BaseException:
+            self.errors += 1
+            raise
+        else:
+            if ttl > 0:
+                self._store(key, result, ttl)
+            return result
+        finally:
+            self._in_flight.pop(key, None)
+            self._waiters.pop(key, None)
+
+    async def do_sync(
+        self,
+        key: Any,
+        fn: Callable[[], Any],
+        result_ttl: Optional[float] = None,
+    ) -> Any:
+        """Como do(), para funções bloqueantes (executadas em thread)."""
+        return await self.do(key, lambda: asyncio.to_thread(fn), result_ttl=result_ttl)
+
+    def _store(self, key: Any, value: Any, ttl: float) -> None:
+        if key not in self._results and len(self._results) >= self.max_results:
+            now = time.monotonic()
+            expired = [k for k, (exp, _) in self._results.items() if exp <= now]
+            for k in expired:
+                del self._results[k]
+            if len(self._results) >= self.max_results:
+                oldest = min(self._results, key=lambda k: self._results[k][0])
+                del self._results[oldest]
+        self._results[key] = (time.monotonic() + ttl, value)
+
+    def forget(self, key: Any = None) -> None:
+        """Descarta resultados em cache (todos, se key for None)."""
+        if key is None:
+            self._results.clear()
+        else:
+            self._results.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """Retorna métricas de coalescência."""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits,
+            "errors": self.errors,
+            "in_flight": len(self._in_flight),
+            "cached_results": len(self._results),
+            "max_waiters": self.max_waiters,
+            "result_ttl": self.result_ttl,
+            "saved_ratio": round((self.coalesced + self.cache_hits) / self.calls, 4) if self.calls else 0.0,
+        }
+
+
+# Instância global
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Obtém a instância global de single-flight."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
@@ -10,7 +10,8 @@ import hashlib
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-import httpx
+
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -117,24 +118,24 @@ HTML para analisar:
         
         # Tentar fetch direto primeiro
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(website, headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                })
-                if response.status_code == 200 and len(response.text) > 1000:
-                    logger.info(f"Homepage obtida via fetch direto: {len(response.text)} chars")
-                    return response.text
+            client = get_http_client(scope="site_discovery")
+            response = await client.get(website, headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            }, timeout=30.0, follow_redirects=True)
+            if response.status_code == 200 and len(response.text) > 1000:
+                logger.info(f"Homepage obtida via fetch direto: {len(response.text)} chars")
+                return response.text
         except Exception as e:
             logger.warning(f"Fetch direto falhou: {e}")
         
         # Fallback para Jina
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                jina_url = f"https://r.jina.ai/{website}"
-                response = await client.get(jina_url, headers={"X-Return-Format": "html"})
-                if response.status_code == 200:
-                    logger.info(f"Homepage obtida via Jina: {len(response.text)} chars")
-                    return response.text
+            client = get_http_client(scope="jina")
+            jina_url = f"https://r.jina.ai/{website}"
+            response = await client.get(jina_url, headers={"X-Return-Format": "html"}, timeout=60.0)
+            if response.status_code == 200:
+                logger.info(f"Homepage obtida via Jina: {len(response.text)} chars")
+                return response.text
         except Exception as e:
             logger.warning(f"Jina falhou: {e}")
         
@@ -149,60 +150,61 @@ HTML para analisar:
         prompt = self.DISCOVERY_PROMPT + f"\n\nURL base: {website}\n\n" + html_truncated
         
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.openai_api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "gpt-4o-mini",
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": "Você é um especialista em web scraping. Analise sites e retorne APENAS JSON válido, sem explicações."
-                            },
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "temperature": 0.1,
-                        "max_tokens": 2000
-                    }
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"OpenAI retornou {response.status_code}")
-                    return None
-                
-                result = response.json()
-                
-                # Validar resposta
-                if not result or "choices" not in result or len(result["choices"]) == 0:
-                    logger.error("Resposta vazia da OpenAI")
-                    return None
-                
-                content = result["choices"][0].get("message", {}).get("content", "")
-                if not content:
-                    logger.error("Content vazio na resposta")
-                    return None
-                
-                # Limpar e parsear JSON
-                content = content.strip()
-                if content.startswith("```json"):
-                    content = content[7:]
-                if content.startswith("```"):
-                    content = content[3:]
-                if content.endswith("```"):
-                    content = content[:-3]
-                content = content.strip()
-                
-                config = json.loads(content)
-                logger.info(f"IA descobriu estrutura: {config.get('site_type')}")
-                return config
-                
+            client = get_http_client(scope="openai")
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.openai_api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "gpt-4o-mini",
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": "Você é um especialista em web scraping. Analise sites e retorne APENAS JSON válido, sem explicações."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    "temperature": 0.1,
+                    "max_tokens": 2000
+                },
+                timeout=120.0
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"OpenAI retornou {response.status_code}")
+                return None
+            
+            result = response.json()
+            
+            # Validar resposta
+            if not result or "choices" not in result or len(result["choices"]) == 0:
+                logger.error("Resposta vazia da OpenAI")
+                return None
+            
+            content = result["choices"][0].get("message", {}).get("content", "")
+            if not content:
+                logger.error("Content vazio na resposta")
+                return None
+            
+            # Limpar e parsear JSON
+            content = content.strip()
+            if content.startswith("```json"):
+                content = content[7:]
+            if content.startswith("```"):
+                content = content[3:]
+            if content.endswith("```"):
+                content = content[:-3]
+            content = content.strip()
+            
+            config = json.loads(content)
+            logger.info(f"IA descobriu estrutura: {config.get('site_type')}")
+            return config
+            
         except json.JSONDecodeError as e:
             logger.error(f"Erro ao parsear JSON da IA: {e}")
             return None
@@ -267,24 +269,24 @@ HTML para analisar:
         validated_filters = []
         
         if "property_filters" in config:
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                for f in config["property_filters"]:
-                    url = f.get("url")
-                    if not url:
-                        continue
-                    
-                    try:
-                        response = await client.head(url, headers={
-                            "User-Agent": "Mozilla/5.0"
-                        })
-                        if response.status_code in [200, 301, 302]:
-                            f["validated"] = True
-                            validated_filters.append(f)
-                            logger.debug(f"✓ Filtro validado: {f['name']}")
-                        else:
-                            logger.debug(f"✗ Filtro inválido ({response.status_code}): {f['name']}")
-                    except:
-                        logger.debug(f"✗ Filtro inacessível: {f['name']}")
+            client = get_http_client(scope="site_discovery")
+            for f in config["property_filters"]:
+                url = f.get("url")
+                if not url:
+                    continue
+                
+                try:
+                    response = await client.head(url, headers={
+                        "User-Agent": "Mozilla/5.0"
+                    }, timeout=15.0, follow_redirects=True)
+                    if response.status_code in [200, 301, 302]:
+                        f["validated"] = True
+                        validated_filters.append(f)
+                        logger.debug(f"✓ Filtro validado: {f['name']}")
+                    else:
+                        logger.debug(f"✗ Filtro inválido ({response.status_code}): {f['name']}")
+                except:
+                    logger.debug(f"✗ Filtro inacessível: {f['name']}")
         
             config["property_filters"] = validated_filters
         
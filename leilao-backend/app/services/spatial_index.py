@@ -0,0 +1,158 @@
+"""
+Índice espacial para busca por raio ("perto de mim").
+
+- haversine_km / bounding_box: geometria usada por todos os backends
+- GeoGridIndex: grade uniforme lat/lng em memória (SQLite e in-memory)
+- VersionedGeoIndex: reconstrói a grade quando a versão do dataset muda
+
+O PostgreSQL usa o bounding box como pré-filtro sobre o índice
+idx_properties_lat_lng e calcula a distância exata em SQL.
+"""
+
+import math
+import threading
+import time
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_KM / 180.0
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Distância em km entre dois pontos (fórmula de haversine)."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat: float, lng: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """
+    Retângulo (min_lat, max_lat, min_lng, max_lng) que contém o círculo.
+    Usado como pré-filtro barato antes do haversine exato.
+    """
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    angular = radius_km / EARTH_RADIUS_KM
+    cos_lat = math.cos(math.radians(lat))
+    # Perto dos polos (ou raio enorme) o círculo cobre todas as longitudes
+    if cos_lat < 1e-6 or math.sin(angular) >= cos_lat:
+        dlng = 180.0
+    else:
+        dlng = math.degrees(math.asin(math.sin(angular) / cos_lat))
+    return (
+        max(-90.0, lat - dlat),
+        min(90.0, lat + dlat),
+        lng - dlng,
+        lng + dlng,
+    )
+
+
+class GeoGridIndex:
+    """
+    Grade uniforme de células lat/lng.
+
+    Cada célula guarda (id, lat, lng). Uma busca por raio visita apenas as
+    células que intersectam o bounding box e aplica haversine nos candidatos.
+    Com células de 0.1° (~11 km) e 100k pontos isso é ordens de grandeza
+    mais rápido que varrer todos os pontos.
+    """
+
+    def __init__(self, cell_deg: float = 0.1):
+        """
+        Args:
+            cell_deg: Tamanho da célula em graus
+        """
+        self.cell_deg = cell_deg
+        self._cells: Dict[Tuple[int, int], List[Tuple[str, float, float]]] = {}
+        self.size = 0
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (int(math.floor(lat / self.cell_deg)), int(math.floor(lng / self.cell_deg)))
+
+    def build(self, points: Iterable[Tuple[str, Optional[float], Optional[float]]]) -> "GeoGridIndex":
+        """Constrói a grade a partir de (id, lat, lng); pontos sem coordenadas são ignorados."""
+        cells: Dict[Tuple[int, int], List[Tuple[str, float, float]]] = {}
+        size = 0
+        for point_id, lat, lng in points:
+            if lat is None or lng is None:
+                continue
+            cells.setdefault(self._cell(lat, lng), []).append((point_id, lat, lng))
+            size += 1
+        self._cells = cells
+        self.size = size
+        return self
+
+    def query_radius(self, lat: float, lng: float, radius_km: float) -> List[Tuple[float, str]]:
+        """
+        Retorna [(distance_km, id)] dentro do raio, ordenado por distância.
+        """
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+        lat_lo, lng_lo = self._cell(min_lat, min_lng)
+        lat_hi, lng_hi = self._cell(max_lat, max_lng)
+
+        results = []
+        for i in range(lat_lo, lat_hi + 1):
+            for j in range(lng_lo, lng_hi + 1):
+                for point_id, plat, plng in self._cells.get((i, j), ()):
+                    if plat < min_lat or plat > max_lat or plng < min_lng or plng > max_lng:
+                        continue
+                    distance = haversine_km(lat, lng, plat, plng)
+                    if distance <= radius_km:
+                        results.append((distance, point_id))
+        results.sort()
+        return results
+
+
+class VersionedGeoIndex:
+    """
+    Mantém um GeoGridIndex sincronizado com o dataset.
+
+    A versão (db.get_dataset_version) é verificada no máximo a cada
+    check_interval segundos; se mudou, a grade é reconstruída com loader().
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[Tuple[str, Optional[float], Optional[float]]]],
+        version_fn: Callable[[], str],
+        check_interval: float = 30.0,
+        cell_deg: float = 0.1,
+    ):
+        self._loader = loader
+        self._version_fn = version_fn
+        self.check_interval = check_interval
+        self.cell_deg = cell_deg
+        self._index: Optional[GeoGridIndex] = None
+        self._version: Optional[str] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> GeoGridIndex:
+        """Retorna a grade atual, reconstruindo-a se o dataset mudou."""
+        now = time.monotonic()
+        if self._index is not None and now - self._last_check < self.check_interval:
+            return self._index
+
+        with self._lock:
+            if self._index is not None and time.monotonic() - self._last_check < self.check_interval:
+                return self._index
+            version = self._version_fn()
+            if self._index is None or version != self._version:
+                started = time.perf_counter()
+                self._index = GeoGridIndex(self.cell_deg).build(self._loader())
+                self._version = version
+                logger.info(
+                    f"Geo index rebuilt: {self._index.size} points in "
+                    f"{(time.perf_counter() - started) * 1000:.1f}ms"
+                )
+            self._last_check = time.monotonic()
+            return self._index
+
+    def invalidate(self) -> None:
+        """Força verificação de versão na próxima busca."""
+        self._last_check = 0.0
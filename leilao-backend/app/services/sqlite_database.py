@@ -14,6 +14,11 @@ from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 
 from app.models.property import Property, PropertyCreate, PropertyFilter, PropertyCategory, AuctionType
 from app.models.auctioneer import Auctioneer, AuctioneerCreate
+from app.services.spatial_index import VersionedGeoIndex
+from app.services.facets import (
+    DISCOUNT_BUCKETS, PRICE_BUCKETS, PRICE_SQL, SORT_FIELDS, bucket_case_sql, build_facets,
+)
+from app.services.change_feed import IGNORED_COLUMNS, change_row, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +60,9 @@ class SQLiteDatabase:
         self._auctioneers_cache: Dict[str, Auctioneer] = {}
         self._load_auctioneers_cache()
         
+        # Grade espacial em memória para busca por raio (reconstruída quando o dataset muda)
+        self._geo_index = VersionedGeoIndex(loader=self._load_geo_points, version_fn=self.get_dataset_version)
+        
         logger.info(f"SQLite database initialized at {DB_FILE}")
     
     @contextmanager
@@ -131,6 +139,8 @@ class SQLiteDatabase:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_is_duplicate ON properties(is_duplicate)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_properties_is_active ON properties(is_active)")
             
+            self._init_change_log(conn)
+            
             # Auctioneers table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS auctioneers (
@@ -149,6 +159,71 @@ class SQLiteDatabase:
             conn.commit()
             logger.info("Database tables initialized")
     
+    def _init_change_log(self, conn: sqlite3.Connection):
+        """
+        Create the property_changes table and the triggers that feed it.
+        
+        Triggers are recreated on every start so the UPDATE filter always
+        covers the current columns of `properties`.
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS property_changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                property_id TEXT NOT NULL,
+                change_type TEXT NOT NULL,
+                first_auction_value REAL,
+                second_auction_value REAL,
+                previous_first_auction_value REAL,
+                previous_second_auction_value REAL,
+                is_active INTEGER,
+                changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+            )
+        """)
+        
+        columns = [row['name'] for row in conn.execute("PRAGMA table_info(properties)")]
+        changed = " OR ".join(f"OLD.{c} IS NOT NEW.{c}" for c in columns if c not in IGNORED_COLUMNS)
+        insert = """
+            INSERT INTO property_changes (
+                property_id, change_type, first_auction_value, second_auction_value,
+                previous_first_auction_value, previous_second_auction_value, is_active
+            )
+        """
+        
+        for trigger in ("trg_property_changes_insert", "trg_property_changes_update", "trg_property_changes_delete"):
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        conn.execute(f"""
+            CREATE TRIGGER trg_property_changes_insert AFTER INSERT ON properties
+            BEGIN
+                {insert} VALUES (NEW.id, 'insert', NEW.first_auction_value, NEW.second_auction_value,
+                                 NULL, NULL, NEW.is_active);
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER trg_property_changes_update AFTER UPDATE ON properties
+            WHEN {changed}
+            BEGIN
+                {insert} VALUES (
+                    NEW.id,
+                    CASE
+                        WHEN COALESCE(OLD.is_active, 1) AND NOT COALESCE(NEW.is_active, 1) THEN 'deactivate'
+                        WHEN NOT COALESCE(OLD.is_active, 1) AND COALESCE(NEW.is_active, 1) THEN 'reactivate'
+                        WHEN COALESCE(NEW.second_auction_value, NEW.first_auction_value)
+                             < COALESCE(OLD.second_auction_value, OLD.first_auction_value) THEN 'price_drop'
+                        ELSE 'update'
+                    END,
+                    NEW.first_auction_value, NEW.second_auction_value,
+                    NEW.previous_first_auction_value, NEW.previous_second_auction_value, NEW.is_active
+                );
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER trg_property_changes_delete AFTER DELETE ON properties
+            BEGIN
+                {insert} VALUES (OLD.id, 'delete', OLD.first_auction_value, OLD.second_auction_value,
+                                 OLD.previous_first_auction_value, OLD.previous_second_auction_value, 0);
+            END
+        """)
+    
     def _load_auctioneers_cache(self):
         """Load auctioneers into memory cache."""
         with self._get_connection() as conn:
@@ -343,13 +418,8 @@ class SQLiteDatabase:
                 return self._row_to_property(row)
         return None
     
-    def get_properties(
-        self,
-        filters: Optional[PropertyFilter] = None,
-        skip: int = 0,
-        limit: int = 18,
-    ) -> Tuple[List[Property], int]:
-        """Get properties with optional filtering and pagination."""
+    def _build_filter_conditions(self, filters: Optional[PropertyFilter]) -> Tuple[List[str], list]:
+        """Translate a PropertyFilter into SQL conditions and params."""
         conditions = []
         params = []
         
@@ -400,6 +470,17 @@ class SQLiteDatabase:
         else:
             conditions.append("is_duplicate = 0")
         
+        return conditions, params
+    
+    def get_properties(
+        self,
+        filters: Optional[PropertyFilter] = None,
+        skip: int = 0,
+        limit: int = 18,
+    ) -> Tuple[List[Property], int]:
+        """Get properties with optional filtering and pagination."""
+        conditions, params = self._build_filter_conditions(filters)
+        
         where_clause = " AND ".join(conditions) if conditions else "1=1"
         
         with self._get_connection() as conn:
@@ -420,6 +501,133 @@ class SQLiteDatabase:
         
         return properties, total
     
+    def _load_geo_points(self) -> List[Tuple[str, float, float]]:
+        """Load (id, latitude, longitude) of every geocoded property."""
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT id, latitude, longitude FROM properties WHERE latitude IS NOT NULL AND longitude IS NOT NULL"
+            )
+            return [(row['id'], row['latitude'], row['longitude']) for row in cursor]
+    
+    def get_properties_near(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float,
+        filters: Optional[PropertyFilter] = None,
+        skip: int = 0,
+        limit: int = 18,
+    ) -> Tuple[List[Tuple[Property, float]], int]:
+        """
+        Get properties within radius_km of (lat, lng), nearest first.
+        
+        Candidates come from the in-memory grid index; filters are applied in
+        SQL on the candidate ids, and only the requested page is loaded.
+        
+        Returns:
+            ([(property, distance_km)], total)
+        """
+        candidates = self._geo_index.get().query_radius(lat, lng, radius_km)
+        if not candidates:
+            return [], 0
+        
+        conditions, params = self._build_filter_conditions(filters)
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        
+        matching = set()
+        chunk_size = 500
+        with self._get_connection() as conn:
+            for i in range(0, len(candidates), chunk_size):
+                chunk = [prop_id for _, prop_id in candidates[i:i + chunk_size]]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT id FROM properties WHERE id IN ({placeholders}) AND {where_clause}",
+                    chunk + params
+                )
+                matching.update(row['id'] for row in cursor)
+            
+            ranked = [(distance, prop_id) for distance, prop_id in candidates if prop_id in matching]
+            page = ranked[skip:skip + limit]
+            
+            rows_by_id = {}
+            if page:
+                page_ids = [prop_id for _, prop_id in page]
+                placeholders = ",".join("?" * len(page_ids))
+                cursor = conn.execute(f"SELECT * FROM properties WHERE id IN ({placeholders})", page_ids)
+                rows_by_id = {row['id']: row for row in cursor}
+        
+        results = [
+            (self._row_to_property(rows_by_id[prop_id]), distance)
+            for distance, prop_id in page if prop_id in rows_by_id
+        ]
+        return results, len(ranked)
+    
+    def search_with_facets(
+        self,
+        filters: Optional[PropertyFilter] = None,
+        skip: int = 0,
+        limit: int = 18,
+        sort_by: str = "discount_percentage",
+        sort_order: str = "desc",
+    ) -> Tuple[List[Property], int, dict]:
+        """
+        Get a page of properties plus facet counts under the same filters.
+        
+        SQLite has no GROUPING SETS, so all facets and the total come from a
+        single UNION ALL of GROUP BYs over one filtered CTE.
+        
+        Returns:
+            (properties, total, facets)
+        """
+        conditions, params = self._build_filter_conditions(filters)
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        
+        if sort_by not in SORT_FIELDS:
+            sort_by = "discount_percentage"
+        direction = "DESC" if sort_order.lower() == "desc" else "ASC"
+        
+        facet_query = f"""
+            WITH filtered AS (
+                SELECT state, city, category, auction_type,
+                       {bucket_case_sql("discount_percentage", DISCOUNT_BUCKETS)} AS discount_bucket,
+                       {bucket_case_sql(PRICE_SQL, PRICE_BUCKETS)} AS price_bucket
+                FROM properties WHERE {where_clause}
+            )
+            SELECT 'total' AS facet, NULL AS value, NULL AS state, COUNT(*) AS count FROM filtered
+            UNION ALL SELECT 'state', state, NULL, COUNT(*) FROM filtered GROUP BY state
+            UNION ALL SELECT 'city', city, state, COUNT(*) FROM filtered GROUP BY state, city
+            UNION ALL SELECT 'category', category, NULL, COUNT(*) FROM filtered GROUP BY category
+            UNION ALL SELECT 'auction_type', auction_type, NULL, COUNT(*) FROM filtered GROUP BY auction_type
+            UNION ALL SELECT 'discount', discount_bucket, NULL, COUNT(*) FROM filtered GROUP BY discount_bucket
+            UNION ALL SELECT 'price', price_bucket, NULL, COUNT(*) FROM filtered GROUP BY price_bucket
+        """
+        
+        counts = {key: {} for key in ("state", "city", "category", "auction_type", "discount", "price")}
+        total = 0
+        with self._get_connection() as conn:
+            for row in conn.execute(facet_query, params):
+                if row['facet'] == 'total':
+                    total = row['count']
+                elif row['facet'] == 'city':
+                    counts['city'][(row['state'], row['value'])] = row['count']
+                else:
+                    counts[row['facet']][row['value']] = row['count']
+            
+            properties = []
+            if total > skip:
+                cursor = conn.execute(
+                    f"SELECT * FROM properties WHERE {where_clause} "
+                    f"ORDER BY {sort_by} {direction} NULLS LAST, id LIMIT ? OFFSET ?",
+                    params + [limit, skip]
+                )
+                properties = [self._row_to_property(row) for row in cursor]
+        
+        facets = build_facets(
+            counts["state"], counts["city"], counts["category"],
+            counts["auction_type"], counts["discount"], counts["price"],
+        )
+        return properties, total, facets
+    
     def add_property(self, prop: Property, auto_save: bool = False, upsert: bool = True) -> Property:
         """Add or update a property."""
         normalized_url = normalize_url(prop.source_url or prop.auctioneer_url or "")
@@ -471,20 +679,27 @@ class SQLiteDatabase:
         """Update an existing property with new data."""
         now = datetime.utcnow()
         
+        # Colunas à direita no SET ainda têm o valor antigo: guarda o valor anterior se mudou
         conn.execute("""
             UPDATE properties SET
-                title = ?,
-                first_auction_value = ?,
-                first_auction_date = ?,
-                second_auction_value = ?,
-                second_auction_date = ?,
-                discount_percentage = ?,
-                image_url = ?,
-                evaluation_value = ?,
-                updated_at = ?,
-                last_seen_at = ?,
+                previous_first_auction_value = CASE WHEN first_auction_value IS NOT ?2
+                    THEN first_auction_value ELSE previous_first_auction_value END,
+                previous_second_auction_value = CASE WHEN second_auction_value IS NOT ?4
+                    THEN second_auction_value ELSE previous_second_auction_value END,
+                value_changed_at = CASE WHEN first_auction_value IS NOT ?2 OR second_auction_value IS NOT ?4
+                    THEN ?9 ELSE value_changed_at END,
+                title = ?1,
+                first_auction_value = ?2,
+                first_auction_date = ?3,
+                second_auction_value = ?4,
+                second_auction_date = ?5,
+                discount_percentage = ?6,
+                image_url = ?7,
+                evaluation_value = ?8,
+                updated_at = ?9,
+                last_seen_at = ?10,
                 is_active = 1
-            WHERE id = ?
+            WHERE id = ?11
         """, (
             new_prop.title,
             new_prop.first_auction_value,
@@ -681,6 +896,58 @@ class SQLiteDatabase:
             "state_counts": state_counts,
         }
     
+    def get_location_counts(self) -> List[Tuple[str, str, Optional[str], int]]:
+        """Get (state, city, neighborhood, count) for non-duplicate properties."""
+        with self._get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT state, city, neighborhood, COUNT(*) as count
+                FROM properties
+                WHERE is_duplicate = 0 AND city IS NOT NULL
+                GROUP BY state, city, neighborhood
+            """)
+            return [(row['state'], row['city'], row['neighborhood'], row['count']) for row in cursor]
+    
+    def get_dataset_version(self) -> str:
+        """Get a cheap fingerprint that changes whenever properties change."""
+        with self._get_connection() as conn:
+            cursor = conn.execute("SELECT COUNT(*), MAX(updated_at) FROM properties")
+            count, updated = cursor.fetchone()
+        return f"{count}:{updated}"
+    
+    def get_changes(self, cursor: Optional[str] = None, limit: int = 100) -> tuple:
+        """
+        Get property changes after `cursor` in commit order.
+        
+        SQLite has a single writer, so seq order is commit order. A cursor
+        ahead of the log (database recreated) requires a full reload.
+        
+        Returns:
+            (changes, next_cursor, has_more, reset_required)
+        """
+        _, since = decode_cursor(cursor)
+        reset_required = False
+        with self._get_connection() as conn:
+            if since:
+                head = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM property_changes").fetchone()[0]
+                if since > head:
+                    since, reset_required = 0, True
+            rows = conn.execute(
+                "SELECT * FROM property_changes WHERE seq > ? ORDER BY seq LIMIT ?",
+                (since, limit + 1),
+            ).fetchall()
+        has_more = len(rows) > limit
+        changes = [
+            change_row(
+                row['seq'], row['property_id'], row['change_type'],
+                row['first_auction_value'], row['second_auction_value'],
+                row['previous_first_auction_value'], row['previous_second_auction_value'],
+                row['is_active'], row['changed_at'],
+            )
+            for row in rows[:limit]
+        ]
+        next_cursor = changes[-1]['cursor'] if changes else encode_cursor(since)
+        return changes, next_cursor, has_more, reset_required
+    
     def update_auctioneer_property_counts(self):
         """Update property counts for all auctioneers."""
         with self._get_connection() as conn:
@@ -11,7 +11,8 @@ import re
 import traceback
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
-import httpx
+
+from app.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -121,15 +122,15 @@ class StructureValidator:
         
         try:
             # Baixar homepage
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(website, headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                })
-                
-                if response.status_code != 200:
-                    return False, stored_hash  # Não conseguiu verificar, manter atual
-                
-                html = response.text
+            client = get_http_client(scope="structure_validator")
+            response = await client.get(website, headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            }, timeout=30.0, follow_redirects=True)
+            
+            if response.status_code != 200:
+                return False, stored_hash  # Não conseguiu verificar, manter atual
+            
+            html = response.text
             
             # Extrair estrutura relevante (links de navegação, menus, filtros)
             structure = self._extract_structure_signature(html)
@@ -0,0 +1,581 @@
+"""
+Extração de imóveis a partir de dados estruturados embutidos na página.
+
+Muitos sites de leilão já mandam a listagem inteira em JSON dentro do HTML
+(SuperbidScraper._extract_next_data lê o __NEXT_DATA__ do Superbid). Antes
+de parsear o DOM com seletores ou chamar a IA, esta etapa procura:
+
+- <script type="application/ld+json"> com schema.org (ItemList, Product,
+  Offer, Place, Residence/House/Apartment, RealEstateListing, @graph);
+- <script id="__NEXT_DATA__"> (props.pageProps do Next.js);
+- estado inline: window.__INITIAL_STATE__, __PRELOADED_STATE__, __STATE__,
+  __APOLLO_STATE__, __NUXT__ (quando é JSON, ou JSON.parse("..."));
+- microdata (itemscope/itemprop), só quando a página tem itemscope.
+
+Os blocos JSON são localizados por regex, sem montar o DOM. Nos blobs de
+Next.js/estado, a listagem é a lista (ou dict de entidades, no Apollo) de
+objetos com título e preço/link; os campos são mapeados por nomes comuns
+(titulo/title/shortDesc, valor/price/initialBidValue...). O resultado vem
+no formato dos itens da IA (title, price, url, image_url, city, state...).
+
+Hits por leiloeiro e por tipo de payload ficam em get_stats().
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urljoin
+
+from app.services.selector_induction import parse_prices
+
+logger = logging.getLogger(__name__)
+
+STRUCTURED_DATA_ENABLED = os.getenv("STRUCTURED_DATA_ENABLED", "true").lower() == "true"
+# Imóveis mínimos para aceitar um payload como a listagem da página
+MIN_STRUCTURED_ITEMS = int(os.getenv("MIN_STRUCTURED_ITEMS", "3"))
+
+_JSON_LD = re.compile(
+    r"<script[^>]*type\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script\s*>", re.I | re.S
+)
+_NEXT_DATA = re.compile(r"<script[^>]*id\s*=\s*[\"']__NEXT_DATA__[\"'][^>]*>(.*?)</script\s*>", re.I | re.S)
+_INLINE_STATE = re.compile(
+    r"(?:window\.|self\.)?(__INITIAL_STATE__|__PRELOADED_STATE__|__STATE__|__APOLLO_STATE__|__APP_STATE__|__NUXT__)"
+    r"\s*=\s*"
+)
+_JSON_PARSE = re.compile(r"JSON\.parse\(\s*(\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*')\s*\)", re.S)
+_CDATA = re.compile(r"^\s*(?://\s*)?<!\[CDATA\[|(?://\s*)?\]\]>\s*$|^\s*<!--|-->\s*$")
+_WHITESPACE = re.compile(r"\s+")
+
+# Tipos schema.org que descrevem um imóvel/lote
+_SCHEMA_TYPES = {
+    "product", "individualproduct", "offer", "aggregateoffer", "place", "residence", "house",
+    "singlefamilyresidence", "apartment", "apartmentcomplex", "accommodation", "room",
+    "realestatelisting", "landform", "localbusiness",
+}
+_SCHEMA_CATEGORIES = {
+    "house": "Casa", "singlefamilyresidence": "Casa", "apartment": "Apartamento",
+    "apartmentcomplex": "Apartamento", "room": "Comercial", "landform": "Terreno",
+}
+_PROPERTY_WORDS = re.compile(
+    r"apartamento|\bapto\b|casa|sobrado|terreno|im[óo]ve|\blote\b|sala|loja|galp[ãa]o|pr[ée]dio"
+    r"|fazenda|s[íi]tio|ch[áa]cara|[áa]rea|m²|m2|resid|comercial",
+    re.I,
+)
+
+# Nomes de campo (minúsculos, sem _ e -) nos JSON de Next.js/estado inline
+_FIELDS = {
+    "title": ("titulo", "title", "nome", "name", "shortdesc", "descricaoresumida", "headline", "label"),
+    "price": (
+        "valor", "price", "preco", "lanceinicial", "lanceminimo", "valorminimo", "valorlance",
+        "initialbidvalue", "currentminbid", "minimumbid", "minbid", "currentbid", "firstauctionvalue",
+        "valor1praca", "valorprimeiropraca", "saleprice", "amount",
+    ),
+    "evaluated_price": (
+        "valoravaliacao", "avaliacao", "valormercado", "evaluation", "evaluationvalue", "appraisalvalue",
+        "evaluatedprice", "marketvalue",
+    ),
+    "url": ("url", "link", "href", "permalink", "detailurl", "detalhesurl", "sourceurl", "canonicalurl"),
+    "image_url": (
+        "imagem", "image", "imageurl", "img", "foto", "photo", "thumbnail", "thumb", "thumbnailurl",
+        "cover", "capa", "imagens", "images", "fotos", "photos", "gallery", "galleryjson", "pictures",
+    ),
+    "address": ("endereco", "address", "logradouro", "streetaddress", "localizacao", "location"),
+    "city": ("cidade", "city", "municipio", "addresslocality", "localidade"),
+    "state": ("estado", "state", "uf", "addressregion"),
+    "neighborhood": ("bairro", "neighborhood", "district"),
+    "category": ("tipo", "category", "categoria", "tipoimovel", "propertytype"),
+    "area": ("area", "metragem", "areatotal", "areaprivativa", "floorsize", "m2"),
+    "auction_date": (
+        "dataleilao", "auctiondate", "datapraca", "firstauctiondate", "enddate", "datafim",
+        "datainicio", "startdate", "closingdate",
+    ),
+    "external_id": ("id", "codigo", "code", "ref", "referencia", "lote", "lotnumber", "sku", "productid"),
+}
+_FIELD_BY_KEY = {alias: name for name, aliases in _FIELDS.items() for alias in aliases}
+# Sub-objetos em que os campos do imóvel costumam estar aninhados
+_NESTED_KEYS = ("product", "produto", "imovel", "property", "item", "lote", "lot", "address", "endereco",
+                "location", "localizacao", "offerdetail", "detail", "detalhes", "attributes", "node")
+
+_MAX_WALK_NODES = 200000
+
+
+@dataclass
+class StructuredResult:
+    """Imóveis encontrados em dados estruturados e o tipo de payload de onde vieram."""
+    items: List[Dict] = field(default_factory=list)
+    kind: Optional[str] = None  # json_ld, next_data, inline_state, microdata
+
+
+# ==================== Utilitários ====================
+
+def _key(name: str) -> str:
+    return re.sub(r"[_\-\s]", "", str(name)).lower()
+
+
+def _clean(text: Any) -> str:
+    return _WHITESPACE.sub(" ", re.sub(r"<[^>]+>", " ", str(text))).strip()
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if value > 0 else None
+    if isinstance(value, dict):
+        for key in ("value", "price", "amount", "valor"):
+            if key in value:
+                return _number(value[key])
+        return None
+    if isinstance(value, str):
+        prices = parse_prices(value)
+        if prices:
+            return prices[0]
+        try:
+            number = float(value.strip())
+        except ValueError:
+            return None
+        return number if number > 0 else None
+    return None
+
+
+def _url(value: Any, base_url: str) -> Optional[str]:
+    """URL de um valor (string, lista ou objeto com url/link/src)."""
+    if isinstance(value, list):
+        for entry in value:
+            url = _url(entry, base_url)
+            if url:
+                return url
+        return None
+    if isinstance(value, dict):
+        for key in ("url", "link", "src", "href", "contentUrl", "@id", "original", "large", "medium"):
+            if value.get(key):
+                return _url(value[key], base_url)
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if not value or value.startswith(("data:", "javascript:", "#", "mailto:", "tel:")) or " " in value:
+            return None
+        if value.startswith(("http://", "https://", "//", "/")) or re.search(r"\.\w{2,4}(?:[?#]|$)", value):
+            return urljoin(base_url, value)
+    return None
+
+
+def _text(value: Any) -> Optional[str]:
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+        text = _clean(value)
+        return text or None
+    if isinstance(value, dict):
+        for key in ("name", "nome", "description", "descricao", "value", "label"):
+            if isinstance(value.get(key), (str, int, float)):
+                return _text(value[key])
+    return None
+
+
+def _loads(raw: str) -> Optional[Any]:
+    raw = _CDATA.sub("", raw.strip()).strip().rstrip(";")
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        # Vírgula sobrando antes de } ou ] (comum em JSON-LD escrito à mão)
+        try:
+            return json.loads(re.sub(r",\s*([}\]])", r"\1", raw))
+        except ValueError:
+            return None
+
+
+def _valid(item: Dict) -> bool:
+    title = item.get("title") or ""
+    return len(title) >= 5 and bool(item.get("price") or item.get("url"))
+
+
+# ==================== schema.org (JSON-LD e microdata) ====================
+
+def _types(node: Dict) -> set:
+    types = node.get("@type") or node.get("type") or []
+    if isinstance(types, str):
+        types = [types]
+    return {str(t).rsplit("/", 1)[-1].lower() for t in types if t}
+
+
+def _schema_nodes(node: Any, depth: int = 0) -> Iterator[Dict]:
+    """Objetos schema.org que descrevem imóveis (ItemList e @graph são abertos)."""
+    if depth > 12:
+        return
+    if isinstance(node, list):
+        for entry in node:
+            yield from _schema_nodes(entry, depth + 1)
+        return
+    if not isinstance(node, dict):
+        return
+    types = _types(node)
+    if "itemlist" in types or "offercatalog" in types:
+        for element in node.get("itemListElement") or []:
+            if isinstance(element, dict) and isinstance(element.get("item"), dict):
+                element = element["item"]
+            yield from _schema_nodes(element, depth + 1)
+        return
+    if types & _SCHEMA_TYPES:
+        yield node
+        return
+    for key in ("@graph", "mainEntity", "about", "hasPart"):
+        if key in node:
+            yield from _schema_nodes(node[key], depth + 1)
+
+
+def _schema_address(value: Any, item: Dict) -> None:
+    if isinstance(value, str):
+        item.setdefault("address", _clean(value))
+        return
+    if not isinstance(value, dict):
+        return
+    street = _text(value.get("streetAddress"))
+    city = _text(value.get("addressLocality"))
+    state = _text(value.get("addressRegion"))
+    if city:
+        item.setdefault("city", city)
+    if state:
+        item.setdefault("state", state)
+    parts = [p for p in (street, city, state) if p]
+    if parts:
+        item.setdefault("address", ", ".join(parts))
+
+
+def _map_schema(node: Dict, base_url: str) -> Dict:
+    item: Dict = {}
+    # Offer com itemOffered: o imóvel está no itemOffered, o preço na oferta
+    offered = node.get("itemOffered")
+    sources = [node] + ([offered] if isinstance(offered, dict) else [])
+    for source in sources:
+        title = _text(source.get("name")) or _text(source.get("headline"))
+        if title:
+            item.setdefault("title", title[:500])
+        url = _url(source.get("url"), base_url)
+        if url:
+            item.setdefault("url", url)
+        image = _url(source.get("image") or source.get("photo"), base_url)
+        if image:
+            item.setdefault("image_url", image)
+        if source.get("description"):
+            item.setdefault("description", _clean(source["description"])[:1000])
+        address = source.get("address")
+        if address is None and isinstance(source.get("location"), dict):
+            address = source["location"].get("address")
+        _schema_address(address, item)
+        area = _number(source.get("floorSize"))
+        if area:
+            item.setdefault("area", area)
+        geo = source.get("geo")
+        if isinstance(geo, dict):
+            lat, lng = _number(geo.get("latitude")), _number(geo.get("longitude"))
+            if lat is not None and lng is not None:
+                item.setdefault("latitude", lat)
+                item.setdefault("longitude", lng)
+        for key in ("sku", "productID", "identifier", "mpn"):
+            if _text(source.get(key)):
+                item.setdefault("external_id", _text(source[key]))
+                break
+        category = _text(source.get("category"))
+        if category:
+            item.setdefault("category", category)
+        for schema_type in _types(source):
+            if schema_type in _SCHEMA_CATEGORIES:
+                item.setdefault("category", _SCHEMA_CATEGORIES[schema_type])
+
+    offers = node.get("offers")
+    if isinstance(offers, list):
+        offers = offers[0] if offers else None
+    for offer in ([offers] if isinstance(offers, dict) else []) + [node]:
+        price = (_number(offer.get("price")) or _number(offer.get("lowPrice"))
+                 or _number(offer.get("priceSpecification")))
+        if price:
+            item.setdefault("price", price)
+        url = _url(offer.get("url"), base_url)
+        if url:
+            item.setdefault("url", url)
+        for key in ("availabilityEnds", "validThrough", "endDate", "availabilityStarts", "startDate"):
+            if _text(offer.get(key)):
+                item.setdefault("auction_date", _text(offer[key]))
+                break
+    if not item.get("url") and isinstance(node.get("@id"), str) and node["@id"].startswith("http"):
+        item["url"] = node["@id"]
+    return item
+
+
+def _from_json_ld(html: str, base_url: str) -> List[Dict]:
+    items = []
+    for match in _JSON_LD.finditer(html):
+        data = _loads(match.group(1))
+        if data is None:
+            continue
+        for node in _schema_nodes(data):
+            item = _map_schema(node, base_url)
+            if _valid(item):
+                items.append(item)
+    return items
+
+
+def _microdata_value(element, base_url: str) -> Any:
+    if element.get("itemscope") is not None:
+        return _microdata_object(element, base_url)
+    if element.get("content") is not None:
+        return element.get("content")
+    tag = element.tag if isinstance(element.tag, str) else ""
+    if tag in ("a", "link", "area"):
+        return urljoin(base_url, element.get("href") or "")
+    if tag in ("img", "source", "video", "audio", "iframe", "embed"):
+        return urljoin(base_url, element.get("src") or element.get("data-src") or "")
+    if tag in ("time",) and element.get("datetime"):
+        return element.get("datetime")
+    return element.text_content()
+
+
+def _microdata_object(scope, base_url: str) -> Dict:
+    """Propriedades de um itemscope (as dos itemscopes aninhados ficam no objeto deles)."""
+    obj: Dict = {"@type": (scope.get("itemtype") or "").split()}
+    stack = list(scope)
+    while stack:
+        element = stack.pop(0)
+        if not isinstance(element.tag, str):
+            continue
+        prop = element.get("itemprop")
+        if prop:
+            value = _microdata_value(element, base_url)
+            for name in prop.split():
+                obj.setdefault(name, value)
+        if element.get("itemscope") is None:
+            stack[0:0] = list(element)
+    return obj
+
+
+def _from_microdata(html: str, base_url: str) -> List[Dict]:
+    if "itemscope" not in html:
+        return []
+    import lxml.html  # só para páginas com microdata
+    from lxml import etree
+    try:
+        root = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.debug(f"Microdata ilegível em {base_url}: {e}")
+        return []
+    items = []
+    for scope in root.xpath("//*[@itemscope and @itemtype and not(@itemprop)]"):
+        obj = _microdata_object(scope, base_url)
+        for node in _schema_nodes(obj):
+            item = _map_schema(node, base_url)
+            if _valid(item):
+                items.append(item)
+    return items
+
+
+# ==================== Next.js e estado inline ====================
+
+def _flatten(obj: Dict, depth: int = 0) -> Dict[str, Any]:
+    """Campos do objeto e dos sub-objetos comuns (product, address...), os de fora primeiro."""
+    flat: Dict[str, Any] = {}
+    nested = []
+    for key, value in obj.items():
+        normalized = _key(key)
+        if isinstance(value, dict) and normalized in _NESTED_KEYS and depth < 2:
+            nested.append(value)
+            continue
+        flat.setdefault(normalized, value)
+    for value in nested:
+        for key, inner in _flatten(value, depth + 1).items():
+            flat.setdefault(key, inner)
+    return flat
+
+
+def _map_generic(obj: Dict, base_url: str) -> Dict:
+    item: Dict = {}
+    for key, value in _flatten(obj).items():
+        name = _FIELD_BY_KEY.get(key)
+        if name is None or name in item or value in (None, "", [], {}):
+            continue
+        if name in ("price", "evaluated_price", "area"):
+            number = _number(value)
+            if number:
+                item[name] = number
+        elif name in ("url", "image_url"):
+            url = _url(value, base_url)
+            if url:
+                item[name] = url
+        elif name == "address" and isinstance(value, dict):
+            _schema_address(value, item)
+            for sub_key, sub_value in value.items():
+                sub_name = _FIELD_BY_KEY.get(_key(sub_key))
+                if sub_name in ("city", "state", "neighborhood") and _text(sub_value):
+                    item.setdefault(sub_name, _text(sub_value))
+        else:
+            text = _text(value)
+            if text:
+                item[name] = text[:500] if name == "title" else text
+    return item
+
+
+def _candidate_lists(node: Any, budget: List[int], depth: int = 0) -> Iterator[List[Dict]]:
+    """Listas de objetos (e dicts de entidades, como no Apollo) dentro do JSON."""
+    if depth > 15 or budget[0] <= 0:
+        return
+    budget[0] -= 1
+    if isinstance(node, list):
+        dicts = [entry for entry in node if isinstance(entry, dict)]
+        if len(dicts) >= MIN_STRUCTURED_ITEMS:
+            yield dicts
+        for entry in node:
+            if isinstance(entry, (dict, list)):
+                yield from _candidate_lists(entry, budget, depth + 1)
+    elif isinstance(node, dict):
+        values = [value for value in node.values() if isinstance(value, dict)]
+        if len(values) >= MIN_STRUCTURED_ITEMS and len(values) >= 0.8 * len(node):
+            yield values
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _candidate_lists(value, budget, depth + 1)
+
+
+def _listing_from_json(data: Any, base_url: str) -> List[Dict]:
+    """A lista do JSON que mais parece a listagem de imóveis, já mapeada."""
+    best: List[Dict] = []
+    for candidates in _candidate_lists(data, [_MAX_WALK_NODES]):
+        items = [_map_generic(obj, base_url) for obj in candidates]
+        items = [item for item in items if _valid(item)]
+        if len(items) < MIN_STRUCTURED_ITEMS or len(items) < 0.5 * len(candidates):
+            continue
+        # Menus e categorias também têm nome+link; listagem tem preço ou cara de imóvel
+        priced = sum(1 for item in items if item.get("price"))
+        worded = sum(1 for item in items if _PROPERTY_WORDS.search(item["title"]))
+        if priced < 0.5 * len(items) and worded < 0.5 * len(items):
+            continue
+        if len(items) > len(best):
+            best = items
+    return best
+
+
+def _from_next_data(html: str, base_url: str) -> List[Dict]:
+    match = _NEXT_DATA.search(html)
+    data = _loads(match.group(1)) if match else None
+    if not isinstance(data, dict):
+        return []
+    # A listagem está em props.pageProps; o resto é configuração do Next.js
+    page_props = (data.get("props") or {}).get("pageProps") or data.get("props") or data
+    return _listing_from_json(page_props, base_url)
+
+
+def _from_inline_state(html: str, base_url: str) -> List[Dict]:
+    decoder = json.JSONDecoder()
+    best: List[Dict] = []
+    for match in _INLINE_STATE.finditer(html):
+        start = match.end()
+        data = None
+        parsed = _JSON_PARSE.match(html, start)
+        if parsed:
+            literal = parsed.group(1)
+            if literal.startswith("'"):
+                literal = '"' + literal[1:-1].replace('\\\'', "'").replace('"', '\\"') + '"'
+            try:
+                data = json.loads(json.loads(literal))
+            except ValueError:
+                data = None
+        elif html[start:start + 1] in ("{", "["):
+            try:
+                data, _ = decoder.raw_decode(html, start)
+            except ValueError:
+                data = None  # JavaScript, não JSON (ex.: __NUXT__=(function(a,b){...}))
+        if data is not None:
+            items = _listing_from_json(data, base_url)
+            if len(items) > len(best):
+                best = items
+    return best
+
+
+# ==================== Extração ====================
+
+_EXTRACTORS = (
+    ("json_ld", _from_json_ld),
+    ("next_data", _from_next_data),
+    ("inline_state", _from_inline_state),
+    ("microdata", _from_microdata),
+)
+
+
+def extract_structured_data(html: str, base_url: str = "", min_items: int = MIN_STRUCTURED_ITEMS) -> StructuredResult:
+    """
+    Imóveis da página a partir de JSON-LD, __NEXT_DATA__, estado inline ou
+    microdata: o payload com mais imóveis, se tiver pelo menos min_items.
+    """
+    result = StructuredResult()
+    if not html:
+        return result
+    for kind, extractor in _EXTRACTORS:
+        try:
+            items = extractor(html, base_url)
+        except Exception as e:
+            logger.debug(f"Extração {kind} falhou em {base_url}: {e}")
+            continue
+        # Carrosséis e blocos repetidos: um item por URL/título
+        unique = list({item.get("url") or item["title"]: item for item in items}.values())
+        if len(unique) >= min_items and len(unique) > len(result.items):
+            result.items, result.kind = unique, kind
+    return result
+
+
+class StructuredDataExtractor:
+    """extract_structured_data com hits por leiloeiro e por tipo de payload."""
+
+    def __init__(self, min_items: int = MIN_STRUCTURED_ITEMS):
+        self.min_items = min_items
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+
+    def extract(self, html: str, url: str, source: str = "") -> Optional[List[Dict]]:
+        """Imóveis dos dados estruturados da página, ou None (o chamador segue para seletores/IA)."""
+        result = extract_structured_data(html, url, self.min_items)
+        with self._lock:
+            stats = self._stats[source or url]
+            stats["pages"] += 1
+            if result.kind:
+                stats["hits"] += 1
+                stats[result.kind] += 1
+                stats["items"] += len(result.items)
+        if not result.kind:
+            return None
+        logger.info(f"Dados estruturados ({result.kind}) em {url}: {len(result.items)} imóveis sem parsear o DOM")
+        return result.items
+
+    def get_stats(self) -> dict:
+        """Páginas, hits e tipos de payload por leiloeiro (mais hits primeiro)."""
+        with self._lock:
+            per_source = [{"source": source, **counts} for source, counts in self._stats.items()]
+        for entry in per_source:
+            entry.setdefault("hits", 0)
+            entry["hit_rate"] = round(entry["hits"] / entry["pages"], 3) if entry.get("pages") else 0.0
+        per_source.sort(key=lambda s: (-s["hits"], s["source"]))
+        pages = sum(s.get("pages", 0) for s in per_source)
+        hits = sum(s["hits"] for s in per_source)
+        return {
+            "enabled": STRUCTURED_DATA_ENABLED,
+            "pages": pages,
+            "hits": hits,
+            "hit_rate": round(hits / pages, 3) if pages else 0.0,
+            "by_kind": {kind: sum(s.get(kind, 0) for s in per_source) for kind, _ in _EXTRACTORS},
+            "per_source": per_source,
+        }
+
+
+# Instância global
+_structured_extractor: Optional[StructuredDataExtractor] = None
+
+
+def get_structured_extractor() -> StructuredDataExtractor:
+    """Obtém a instância global do extrator de dados estruturados."""
+    global _structured_extractor
+    if _structured_extractor is None:
+        _structured_extractor = StructuredDataExtractor()
+    return _structured_extractor
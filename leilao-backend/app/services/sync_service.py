@@ -21,6 +21,8 @@ from supabase import create_client, Client
 from app.scrapers.caixa_scraper import scrape_caixa
 from app.scrapers.generic_scraper import GenericScraper
 from app.utils.normalizer import normalize_category, normalize_state, normalize_city
+from app.services.saved_searches import get_saved_search_service
+from app.services.event_bus import publish_event
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,9 @@ logger = logging.getLogger(__name__)
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_KEY")
 
+# Publica progresso no event bus a cada N imóveis processados
+SYNC_PROGRESS_EVERY = int(os.getenv("SYNC_PROGRESS_EVERY", "500"))
+
 @dataclass
 class SyncReport:
     """Relatório de sincronização."""
@@ -74,6 +79,11 @@ class SyncService:
         self.supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
         self.generic_scraper = GenericScraper()
     
+    @staticmethod
+    def _publish(type: str, report: SyncReport, **extra) -> None:
+        """Publica o relatório parcial no tópico `sync` do event bus."""
+        publish_event("sync", type, {**report.to_dict(), **extra})
+    
     async def sync_all(
         self,
         include_caixa: bool = True,
@@ -92,6 +102,7 @@ class SyncService:
             Relatório de sincronização
         """
         report = SyncReport(start_time=datetime.utcnow())
+        self._publish("started", report)
         
         try:
             # 1. Sincroniza Caixa (prioridade máxima)
@@ -103,9 +114,11 @@ class SyncService:
                 await self._sync_auctioneers(report, limit=auctioneer_limit)
             
             # 3. Aplica deduplicação global
+            self._publish("progress", report, stage="deduplication")
             await self._deduplicate(report)
             
             # 4. Desativa imóveis antigos
+            self._publish("progress", report, stage="deactivation")
             await self._deactivate_old_properties(report)
             
         except Exception as e:
@@ -114,6 +127,7 @@ class SyncService:
             report.total_errors += 1
         
         report.end_time = datetime.utcnow()
+        self._publish("finished", report)
         
         logger.info(f"Sincronização concluída: {report.to_dict()}")
         
@@ -124,10 +138,12 @@ class SyncService:
         Sincroniza apenas dados da Caixa.
         """
         report = SyncReport(start_time=datetime.utcnow())
+        self._publish("started", report, caixa_only=True)
         
         await self._sync_caixa(report)
         
         report.end_time = datetime.utcnow()
+        self._publish("finished", report, caixa_only=True)
         return report
     
     async def _sync_caixa(self, report: SyncReport):
@@ -147,7 +163,9 @@ class SyncService:
             logger.info(f"Caixa: {len(properties)} imóveis extraídos")
             
             # Upsert no banco
-            for prop in properties:
+            for i, prop in enumerate(properties, 1):
+                if i % SYNC_PROGRESS_EVERY == 0:
+                    self._publish("progress", report, stage="caixa", processed=i, total=len(properties))
                 try:
                     result = await self._upsert_property(prop, source='caixa')
                     
@@ -166,12 +184,19 @@ class SyncService:
                     report.total_errors += 1
                     report.errors.append(f"Caixa {prop.get('id')}: {str(e)}")
             
+            # Alertas de buscas salvas (notifica só imóveis novos ou com preço alterado)
+            try:
+                await asyncio.to_thread(get_saved_search_service().process_properties, properties)
+            except Exception as e:
+                logger.error(f"Erro ao processar buscas salvas da Caixa: {e}")
+            
         except Exception as e:
             logger.error(f"Erro ao sincronizar Caixa: {e}")
             report.errors.append(f"Caixa: {str(e)}")
             report.total_errors += 1
         
         report.by_source['caixa'] = source_stats
+        self._publish("progress", report, stage="caixa", source='caixa')
         logger.info(f"Caixa sincronizada: {source_stats}")
     
     async def _sync_auctioneers(self, report: SyncReport, limit: Optional[int] = None):
@@ -255,6 +280,8 @@ class SyncService:
                 }).eq('id', auctioneer_id).execute()
             
             report.by_source[auctioneer_id] = source_stats
+            self._publish("progress", report, stage="auctioneers", source=auctioneer_id,
+                          auctioneer=auctioneer.get('name'))
     
     async def _upsert_property(self, prop: Dict[str, Any], source: str) -> str:
         """
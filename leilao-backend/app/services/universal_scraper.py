@@ -1,7 +1,6 @@
 import os
 import re
 import json
-import httpx
 import asyncio
 import logging
 import traceback
@@ -9,6 +8,13 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 
+from app.services.extraction_cache import EXTRACTION_CACHE_ENABLED, content_fingerprint, get_extraction_cache
+from app.services.selector_induction import SELECTOR_INDUCTION_ENABLED, get_selector_inducer, stable_external_id
+from app.services.structured_data import STRUCTURED_DATA_ENABLED, get_structured_extractor
+from app.utils.http_cache import cached_get
+from app.utils.html_slicer import AI_MAX_BATCHES, AI_PROMPT_MAX_TOKENS, pack_cards, slice_html, truncate_to_tokens
+from app.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -170,44 +176,44 @@ class UniversalScraper:
         """Tenta requisição HTTP direta"""
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url, headers=self.headers)
-                
-                if not response:
-                    logger.warning(f"Resposta vazia de {url}")
-                    return None
-                
-                if response.status_code != 200:
-                    logger.debug(f"Status code {response.status_code} de {url}")
-                    return None
-                
-                content_type = response.headers.get('content-type', '')
-                
-                # Se for JSON, processar diretamente
-                if 'application/json' in content_type:
-                    try:
-                        data = response.json()
-                        if data is None:
-                            logger.warning(f"JSON vazio de {url}")
-                            return None
-                        return self._parse_json_response(data, source, url)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Erro ao parsear JSON de {url}: {e}")
+            response = await cached_get(url, headers=self.headers, timeout=self.timeout, follow_redirects=True,
+                                        scope="universal_scraper")
+            
+            if not response:
+                logger.warning(f"Resposta vazia de {url}")
+                return None
+            
+            if response.status_code != 200:
+                logger.debug(f"Status code {response.status_code} de {url}")
+                return None
+            
+            content_type = response.headers.get('content-type', '')
+            
+            # Se for JSON, processar diretamente
+            if 'application/json' in content_type:
+                try:
+                    data = response.json()
+                    if data is None:
+                        logger.warning(f"JSON vazio de {url}")
                         return None
-                
-                # Se for HTML, usar IA para extrair
-                html = response.text
-                
-                if not html:
-                    logger.warning(f"HTML vazio de {url}")
-                    return None
-                
-                # Verificar se tem conteúdo de imóveis
-                if not self._has_property_content(html):
+                    return self._parse_json_response(data, source, url)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Erro ao parsear JSON de {url}: {e}")
                     return None
-                
-                return await self._extract_with_ai(html, source, url)
-                
+            
+            # Se for HTML, usar IA para extrair
+            html = response.text
+            
+            if not html:
+                logger.warning(f"HTML vazio de {url}")
+                return None
+            
+            # Verificar se tem conteúdo de imóveis
+            if not self._has_property_content(html):
+                return None
+            
+            return await self._extract_with_ai(html, source, url)
+            
         except Exception as e:
             logger.debug(f"Requisição direta falhou para {url}: {e}")
             logger.debug(traceback.format_exc())
@@ -223,32 +229,31 @@ class UniversalScraper:
             jina_url = f"https://r.jina.ai/{url}"
         
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                headers = {'Accept': 'text/plain'}
-                if JINA_API_KEY:
-                    headers['Authorization'] = f'Bearer {JINA_API_KEY}'
-                
-                response = await client.get(jina_url, headers=headers)
-                
-                if not response:
-                    logger.warning(f"Resposta vazia do Jina Reader para {url}")
-                    return None
-                
-                if response.status_code != 200:
-                    logger.debug(f"Jina Reader retornou status {response.status_code} para {url}")
-                    return None
-                
-                text = response.text
-                
-                if not text:
-                    logger.warning(f"Texto vazio do Jina Reader para {url}")
-                    return None
-                
-                if not self._has_property_content(text):
-                    return None
-                
-                return await self._extract_with_ai(text, source, url, is_markdown=True)
-                
+            headers = {'Accept': 'text/plain'}
+            if JINA_API_KEY:
+                headers['Authorization'] = f'Bearer {JINA_API_KEY}'
+            
+            response = await cached_get(jina_url, headers=headers, timeout=60.0, scope="jina")
+            
+            if not response:
+                logger.warning(f"Resposta vazia do Jina Reader para {url}")
+                return None
+            
+            if response.status_code != 200:
+                logger.debug(f"Jina Reader retornou status {response.status_code} para {url}")
+                return None
+            
+            text = response.text
+            
+            if not text:
+                logger.warning(f"Texto vazio do Jina Reader para {url}")
+                return None
+            
+            if not self._has_property_content(text):
+                return None
+            
+            return await self._extract_with_ai(text, source, url, is_markdown=True)
+            
         except Exception as e:
             logger.debug(f"Jina Reader falhou para {url}: {e}")
             logger.debug(traceback.format_exc())
@@ -403,17 +408,127 @@ class UniversalScraper:
             logger.warning(f"Conteúdo vazio para extração com IA de {url}")
             return []
         
+        # Listagem em JSON-LD/__NEXT_DATA__/estado inline/microdata: sem DOM nem IA
+        if STRUCTURED_DATA_ENABLED and not is_markdown:
+            items = await asyncio.to_thread(get_structured_extractor().extract, content, url, source)
+            if items:
+                properties = self._finalize_items(items, source, url)
+                filtered = self._filter_properties_by_category(properties, source)
+                logger.info(f"Filtro de categoria (dados estruturados): {len(properties)} -> {len(filtered)} imóveis")
+                return filtered
+        
+        # Página igual (fora scripts, timestamps, tokens) à da última extração: reaproveitar
+        content_hash = None
+        if EXTRACTION_CACHE_ENABLED:
+            content_hash = await asyncio.to_thread(content_fingerprint, content, is_markdown)
+            cached = await asyncio.to_thread(get_extraction_cache().get, url, content_hash, source)
+            if cached is not None:
+                logger.info(f"Conteúdo de {url} sem mudanças, reaproveitando {len(cached)} imóveis sem IA")
+                return cached
+        
+        # Site com seletores induzidos de extrações anteriores: extrair sem IA
+        use_selectors = SELECTOR_INDUCTION_ENABLED and not is_markdown
+        if use_selectors:
+            items = await asyncio.to_thread(get_selector_inducer().extract, content, url, source)
+            if items is not None:
+                properties = self._finalize_items(items, source, url)
+                filtered = self._filter_properties_by_category(properties, source)
+                logger.info(f"Seletores induzidos: {len(properties)} -> {len(filtered)} imóveis de {url} sem IA")
+                return filtered
+        
         if not OPENAI_API_KEY:
             logger.warning("OPENAI_API_KEY não configurada, pulando extração com IA")
             return []
         
-        # Limitar tamanho do conteúdo
-        content = content[:50000]
+        # Só os cards da listagem (ou o texto limpo), em lotes que cabem no prompt
+        chunks = await asyncio.to_thread(self._prompt_chunks, content, url, is_markdown)
+        if not chunks:
+            logger.warning(f"Nada para extrair com IA de {url} após limpar o HTML")
+            return []
+        
+        try:
+            results = await asyncio.gather(*(self._ask_ai(chunk, source) for chunk in chunks))
+            items = [item for batch in results if batch for item in batch]
+            properties = self._finalize_items(items, source, url)
+            
+            # Filtrar apenas imóveis (evitar veículos, máquinas, etc)
+            filtered = self._filter_properties_by_category(properties, source)
+            logger.info(f"Filtro de categoria: {len(properties)} -> {len(filtered)} imóveis")
+            
+            # Só guarda extrações completas (nenhum lote falhou) e não vazias
+            complete = all(batch is not None for batch in results)
+            if content_hash and complete and filtered:
+                await asyncio.to_thread(get_extraction_cache().put, url, content_hash, filtered, source)
+            
+            # Aprender seletores com os cards que a IA achou (todos, antes do filtro)
+            if use_selectors and complete:
+                await asyncio.to_thread(self._learn_selectors, content, url, properties, source)
+            
+            return filtered
+            
+        except Exception as e:
+            logger.error(f"Erro na extração com IA: {e}")
+            logger.error(traceback.format_exc())
+            return []
+    
+    def _finalize_items(self, items: List, source: str, url: str) -> List[Dict]:
+        """Adiciona source, prefixa external_id e torna absolutas as URLs dos itens extraídos."""
+        properties = []
+        for item in items:
+            if isinstance(item, dict):
+                item['source'] = source
+                
+                # Ajustar URLs
+                if item.get('image_url') and not item['image_url'].startswith('http'):
+                    item['image_url'] = urljoin(url, item['image_url'])
+                if item.get('url') and not item['url'].startswith('http'):
+                    item['url'] = urljoin(url, item['url'])
+                
+                # Sem código do lote: hash da URL/título, estável entre execuções
+                external_id = item.get('external_id') or stable_external_id(item) or hash(str(item))
+                item['external_id'] = f"{source}_{external_id}"
+                
+                properties.append(item)
+        return properties
+    
+    def _learn_selectors(self, content: str, url: str, properties: List[Dict], source: str) -> None:
+        """Conta a falha dos seletores ativos ou induz/valida seletores a partir da extração com IA."""
+        try:
+            inducer = get_selector_inducer()
+            inducer.record_fallback(url, properties)
+            inducer.learn(content, url, properties, source)
+        except Exception as e:
+            logger.warning(f"Erro na indução de seletores para {url}: {e}")
+            logger.debug(traceback.format_exc())
+    
+    def _prompt_chunks(self, content: str, url: str, is_markdown: bool) -> List[str]:
+        """Conteúdo de cada chamada à IA: cards compactados em lotes, ou o texto limpo da página."""
+        if is_markdown:
+            return [truncate_to_tokens(content, AI_PROMPT_MAX_TOKENS)]
+        
+        page = slice_html(content, url)
+        if not page.cards:
+            text = truncate_to_tokens(page.text, AI_PROMPT_MAX_TOKENS)
+            logger.info(f"Nenhum card detectado em {url}, enviando texto limpo "
+                        f"({page.original_chars} -> {len(text)} caracteres)")
+            return [text] if text else []
+        
+        batches = pack_cards(page.cards)
+        if len(batches) > AI_MAX_BATCHES:
+            logger.info(f"{url}: {len(batches)} lotes de cards, usando os {AI_MAX_BATCHES} primeiros")
+            batches = batches[:AI_MAX_BATCHES]
+        chunks = ["\n".join(batch) for batch in batches]
+        logger.info(f"{url}: {len(page.cards)} cards ({page.selector}), {len(chunks)} chamada(s) à IA, "
+                    f"{page.original_chars} -> {sum(len(c) for c in chunks)} caracteres")
+        return chunks
+    
+    async def _ask_ai(self, content: str, source: str) -> Optional[List]:
+        """Uma chamada ao gpt-4o-mini. Retorna os itens do JSON, ou None se a chamada falhar."""
         
         prompt = f"""Analise o conteúdo abaixo de um site de leilão de imóveis e extraia TODOS os imóveis listados.
 
 Conteúdo do site ({source}):
-{content[:30000]}
+{content}
 
 Para cada imóvel encontrado, extraia:
 - title: título ou descrição curta
@@ -434,93 +549,64 @@ Retorne APENAS um JSON array válido com os imóveis. Se não encontrar imóveis
 Exemplo: [{{"title": "...", "price": 100000, ...}}]"""
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {OPENAI_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "gpt-4o-mini",
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0.1,
-                        "max_tokens": 4000
-                    }
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"Erro na API OpenAI: {response.text}")
-                    return []
-                
-                result = response.json()
-                
-                # Verificar se a resposta é válida
-                if not result or not result.get('choices'):
-                    logger.error("Resposta vazia da OpenAI ou sem choices")
-                    return []
-                
-                if not result['choices'] or len(result['choices']) == 0:
-                    logger.error("Lista de choices vazia da OpenAI")
-                    return []
-                
-                message = result['choices'][0].get('message')
-                if not message:
-                    logger.error("Mensagem vazia na resposta da OpenAI")
-                    return []
-                
-                content = message.get('content')
-                if not content:
-                    logger.error("Conteúdo vazio na resposta da OpenAI")
-                    return []
-                
-                # Limpar resposta
-                content = content.strip()
-                if content.startswith('```json'):
-                    content = content[7:]
-                if content.startswith('```'):
-                    content = content[3:]
-                if content.endswith('```'):
-                    content = content[:-3]
-                content = content.strip()
-                
-                items = json.loads(content)
-                
-                if not isinstance(items, list):
-                    return []
-                
-                # Adicionar source e ajustar IDs
-                properties = []
-                for item in items:
-                    if isinstance(item, dict):
-                        item['source'] = source
-                        if not item.get('external_id'):
-                            item['external_id'] = f"{source}_{hash(str(item))}"
-                        else:
-                            item['external_id'] = f"{source}_{item['external_id']}"
-                        
-                        # Ajustar URLs
-                        if item.get('image_url') and not item['image_url'].startswith('http'):
-                            item['image_url'] = urljoin(url, item['image_url'])
-                        if item.get('url') and not item['url'].startswith('http'):
-                            item['url'] = urljoin(url, item['url'])
-                        
-                        properties.append(item)
-                
-                # Filtrar apenas imóveis (evitar veículos, máquinas, etc)
-                filtered = self._filter_properties_by_category(properties, source)
-                logger.info(f"Filtro de categoria: {len(properties)} -> {len(filtered)} imóveis")
-                
-                return filtered
-                
+            client = get_http_client(scope="openai")
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {OPENAI_API_KEY}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": "gpt-4o-mini",
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0.1,
+                    "max_tokens": 4000
+                },
+                timeout=60.0
+            )
+            
+            if response.status_code != 200:
+                logger.error(f"Erro na API OpenAI: {response.text}")
+                return None
+            
+            result = response.json()
+            
+            # Verificar se a resposta é válida
+            if not result or not result.get('choices'):
+                logger.error("Resposta vazia da OpenAI ou sem choices")
+                return None
+            
+            message = result['choices'][0].get('message')
+            if not message:
+                logger.error("Mensagem vazia na resposta da OpenAI")
+                return None
+            
+            content = message.get('content')
+            if not content:
+                logger.error("Conteúdo vazio na resposta da OpenAI")
+                return None
+            
+            # Limpar resposta
+            content = content.strip()
+            if content.startswith('```json'):
+                content = content[7:]
+            if content.startswith('```'):
+                content = content[3:]
+            if content.endswith('```'):
+                content = content[:-3]
+            content = content.strip()
+            
+            items = json.loads(content)
+            return items if isinstance(items, list) else []
+            
         except json.JSONDecodeError as e:
             logger.warning(f"Erro ao parsear JSON da IA: {e}")
             logger.debug(traceback.format_exc())
-            return []
+            return None
         except Exception as e:
-            logger.error(f"Erro na extração com IA: {e}")
+            logger.error(f"Erro na chamada à IA: {e}")
             logger.error(traceback.format_exc())
-            return []
+            return None
     
     async def _scrape_pagination(self, working_url: str, source: str, initial_count: int) -> List[Dict]:
         """Tenta buscar páginas adicionais a partir da URL que funcionou"""
@@ -691,20 +777,18 @@ Exemplo: [{{"title": "...", "price": 100000, ...}}]"""
         try:
             # Tentar fetch direto
             html = None
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url, headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                })
-                if response.status_code == 200 and len(response.text) > 1000:
-                    html = response.text
+            response = await cached_get(url, headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            }, timeout=30.0, follow_redirects=True, scope="universal_scraper")
+            if response.status_code == 200 and len(response.text) > 1000:
+                html = response.text
             
             # Fallback para Jina
             if not html:
-                async with httpx.AsyncClient(timeout=60.0) as client:
-                    jina_url = f"https://r.jina.ai/{url}"
-                    response = await client.get(jina_url, headers={"X-Return-Format": "html"})
-                    if response.status_code == 200:
-                        html = response.text
+                jina_url = f"https://r.jina.ai/{url}"
+                response = await cached_get(jina_url, headers={"X-Return-Format": "html"}, timeout=60.0, scope="jina")
+                if response.status_code == 200:
+                    html = response.text
             
             if not html:
                 return []
@@ -1,30 +1,58 @@
 # utils/__init__.py
-from .fetcher import MultiLayerFetcher, fetch_with_fallbacks
-from .image_extractor import ImageExtractor, extract_images
-from .date_parser import (
-    BrazilianDateParser,
-    parse_brazilian_date,
-    parse_all_dates,
-    find_auction_dates
-)
-# Importar do novo normalizer
-from .normalizer import (
-    normalize_category,
-    normalize_state,
-    normalize_city,
-    normalize_property
-)
-from .paginator import GenericPaginator, paginate_and_extract
-from .rate_limiter import RateLimiter, get_rate_limiter, rate_limited_fetch
-from .image_blacklist import (
-    ImageBlacklist,
-    is_blacklisted_image,
-    filter_images
-)
+#
+# Os submódulos são importados sob demanda (PEP 562): importar
+# app.utils.lazy ou app.utils.image_blacklist não carrega httpx, fetcher,
+# paginator etc. `from app.utils import X` continua funcionando.
+import importlib
+
+_EXPORTS = {
+    'MultiLayerFetcher': 'fetcher',
+    'fetch_with_fallbacks': 'fetcher',
+    'get_fetch_strategy': 'fetch_strategy',
+    'ImageExtractor': 'image_extractor',
+    'extract_images': 'image_extractor',
+    'BrazilianDateParser': 'date_parser',
+    'parse_brazilian_date': 'date_parser',
+    'parse_all_dates': 'date_parser',
+    'find_auction_dates': 'date_parser',
+    # Importar do novo normalizer
+    'normalize_category': 'normalizer',
+    'normalize_state': 'normalizer',
+    'normalize_city': 'normalizer',
+    'normalize_property': 'normalizer',
+    'GenericPaginator': 'paginator',
+    'paginate_and_extract': 'paginator',
+    'RateLimiter': 'rate_limiter',
+    'get_rate_limiter': 'rate_limiter',
+    'rate_limited_fetch': 'rate_limiter',
+    'ImageBlacklist': 'image_blacklist',
+    'is_blacklisted_image': 'image_blacklist',
+    'filter_images': 'image_blacklist',
+    'get_http_client': 'http_client',
+    'get_http_clients': 'http_client',
+    'cached_get': 'http_cache',
+    'get_http_cache': 'http_cache',
+    'slice_html': 'html_slicer',
+    'estimate_tokens': 'html_slicer',
+    'parse_html': 'html_parser',
+    'make_soup': 'html_parser',
+    'get_extraction_executor': 'extraction_executor',
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'MultiLayerFetcher',
     'fetch_with_fallbacks',
+    'get_fetch_strategy',
     'ImageExtractor',
     'extract_images',
     'BrazilianDateParser',
@@ -43,5 +71,14 @@ __all__ = [
     'ImageBlacklist',
     'is_blacklisted_image',
     'filter_images',
+    'get_http_client',
+    'get_http_clients',
+    'cached_get',
+    'get_http_cache',
+    'slice_html',
+    'estimate_tokens',
+    'parse_html',
+    'make_soup',
+    'get_extraction_executor',
 ]
 
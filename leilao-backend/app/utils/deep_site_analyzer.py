@@ -9,15 +9,15 @@ Execução: python -m app.utils.deep_site_analyzer
 """
 
 import asyncio
-import httpx
 import json
 import os
-import re
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+
+from app.utils.html_parser import HtmlDocument, find_all_by_class, find_by_class, find_by_text, parse_html
+from app.utils.http_client import get_http_client
 
 # Configurar logging
 logging.basicConfig(
@@ -69,16 +69,14 @@ class DeepSiteAnalyzer:
             for path in paths:
                 url = urljoin(website, path)
                 try:
-                    async with httpx.AsyncClient(
-                        timeout=self.timeout,
-                        follow_redirects=True,
-                        verify=False
-                    ) as client:
-                        response = await client.get(url, headers=self.headers)
-                        if response.status_code == 200 and len(response.text) > 5000:
-                            html = response.text
-                            working_url = url
-                            break
+                    client = get_http_client(verify=False, scope="deep_site_analyzer")
+                    response = await client.get(
+                        url, headers=self.headers, timeout=self.timeout, follow_redirects=True
+                    )
+                    if response.status_code == 200 and len(response.text) > 5000:
+                        html = response.text
+                        working_url = url
+                        break
                 except Exception as e:
                     logger.debug(f"Erro ao acessar {url}: {e}")
                     continue
@@ -87,8 +85,8 @@ class DeepSiteAnalyzer:
                 result['error'] = 'Nao foi possivel carregar HTML'
                 return result
             
-            # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
+            # Parse HTML: um documento só; os seletores de card são memorizados
+            soup = parse_html(html)
             
             # Identificar seletores
             selectors = self._identify_selectors(soup, html)
@@ -109,7 +107,7 @@ class DeepSiteAnalyzer:
         
         return result
     
-    def _identify_selectors(self, soup: BeautifulSoup, html: str) -> Dict:
+    def _identify_selectors(self, soup: HtmlDocument, html: str) -> Dict:
         """Identifica seletores CSS para elementos importantes."""
         
         selectors = {}
@@ -147,7 +145,7 @@ class DeepSiteAnalyzer:
         
         return selectors
     
-    def _find_card_selector(self, soup: BeautifulSoup) -> List[str]:
+    def _find_card_selector(self, soup: HtmlDocument) -> List[str]:
         """Encontra seletores para cards de propriedades."""
         
         candidates = []
@@ -164,7 +162,7 @@ class DeepSiteAnalyzer:
         ]
         
         for tag in ['div', 'article', 'li']:
-            elements = soup.find_all(tag, class_=re.compile('|'.join(patterns), re.I))
+            elements = find_all_by_class(soup, '|'.join(patterns), tags=[tag])
             if elements and len(elements) >= 2:
                 # Pegar a classe mais comum
                 classes = {}
@@ -181,7 +179,7 @@ class DeepSiteAnalyzer:
         
         return candidates[:5]
     
-    def _find_title_selector(self, soup: BeautifulSoup, card_selector: Optional[str] = None) -> Optional[str]:
+    def _find_title_selector(self, soup: HtmlDocument, card_selector: Optional[str] = None) -> Optional[str]:
         """Encontra seletor para título."""
         
         # Se temos card selector, procurar dentro dos cards
@@ -191,7 +189,7 @@ class DeepSiteAnalyzer:
                 for card in cards:
                     # Procurar h2, h3, h4, h1
                     for tag in ['h1', 'h2', 'h3', 'h4']:
-                        title = card.find(tag)
+                        title = card.select_one(tag)
                         if title:
                             if title.get('class'):
                                 return f"{tag}.{title.get('class')[0]}"
@@ -201,7 +199,7 @@ class DeepSiteAnalyzer:
         
         # Fallback: procurar em todo o documento
         for tag in ['h2', 'h3', 'h4']:
-            titles = soup.find_all(tag, limit=5)
+            titles = soup.select(tag)[:5]
             if titles:
                 for title in titles:
                     if title.get('class'):
@@ -210,7 +208,7 @@ class DeepSiteAnalyzer:
         
         return None
     
-    def _find_price_selector(self, soup: BeautifulSoup, card_selector: Optional[str] = None) -> Optional[str]:
+    def _find_price_selector(self, soup: HtmlDocument, card_selector: Optional[str] = None) -> Optional[str]:
         """Encontra seletor para preço."""
         
         price_patterns = [r'preco', r'price', r'valor', r'lance', r'custo']
@@ -224,13 +222,13 @@ class DeepSiteAnalyzer:
                     if 'R$' in text or 'reais' in text.lower():
                         # Procurar elemento com classe relacionada a preço
                         for pattern in price_patterns:
-                            elem = card.find(class_=re.compile(pattern, re.I))
+                            elem = find_by_class(card, pattern)
                             if elem:
                                 if elem.get('class'):
                                     return f".{elem.get('class')[0]}"
                         # Se não encontrou classe, procurar span/div com R$
                         for tag in ['span', 'div', 'p']:
-                            elem = card.find(tag, string=re.compile(r'R\$', re.I))
+                            elem = find_by_text(card, r'R\$', [tag])
                             if elem:
                                 if elem.get('class'):
                                     return f"{tag}.{elem.get('class')[0]}"
@@ -240,21 +238,21 @@ class DeepSiteAnalyzer:
         
         # Fallback: procurar em todo documento
         for pattern in price_patterns:
-            elem = soup.find(class_=re.compile(pattern, re.I))
+            elem = find_by_class(soup, pattern)
             if elem:
                 if elem.get('class'):
                     return f".{elem.get('class')[0]}"
         
         return None
     
-    def _find_link_selector(self, soup: BeautifulSoup, card_selector: Optional[str] = None) -> Optional[str]:
+    def _find_link_selector(self, soup: HtmlDocument, card_selector: Optional[str] = None) -> Optional[str]:
         """Encontra seletor para links."""
         
         if card_selector:
             try:
                 cards = soup.select(card_selector)[:3]
                 for card in cards:
-                    link = card.find('a', href=True)
+                    link = card.select_one('a[href]')
                     if link:
                         href = link.get('href', '')
                         if any(p in href.lower() for p in ['/imovel', '/lote', '/item', '/detalhes']):
@@ -266,14 +264,14 @@ class DeepSiteAnalyzer:
         
         return 'a[href]'
     
-    def _find_image_selector(self, soup: BeautifulSoup, card_selector: Optional[str] = None) -> Optional[str]:
+    def _find_image_selector(self, soup: HtmlDocument, card_selector: Optional[str] = None) -> Optional[str]:
         """Encontra seletor para imagens."""
         
         if card_selector:
             try:
                 cards = soup.select(card_selector)[:3]
                 for card in cards:
-                    img = card.find('img', src=True)
+                    img = card.select_one('img[src]')
                     if img:
                         if img.get('class'):
                             return f"img.{img.get('class')[0]}"
@@ -283,7 +281,7 @@ class DeepSiteAnalyzer:
         
         return 'img[src]'
     
-    def _find_location_selector(self, soup: BeautifulSoup, card_selector: Optional[str] = None) -> Optional[str]:
+    def _find_location_selector(self, soup: HtmlDocument, card_selector: Optional[str] = None) -> Optional[str]:
         """Encontra seletor para localização."""
         
         location_patterns = [r'local', r'location', r'endereco', r'cidade', r'cidade']
@@ -293,7 +291,7 @@ class DeepSiteAnalyzer:
                 cards = soup.select(card_selector)[:3]
                 for card in cards:
                     for pattern in location_patterns:
-                        elem = card.find(class_=re.compile(pattern, re.I))
+                        elem = find_by_class(card, pattern)
                         if elem:
                             if elem.get('class'):
                                 return f".{elem.get('class')[0]}"
@@ -302,7 +300,7 @@ class DeepSiteAnalyzer:
         
         return None
     
-    def _extract_sample_data(self, soup: BeautifulSoup, selectors: Dict, base_url: str) -> List[Dict]:
+    def _extract_sample_data(self, soup: HtmlDocument, selectors: Dict, base_url: str) -> List[Dict]:
         """Extrai dados de exemplo usando os seletores identificados."""
         
         samples = []
@@ -321,7 +319,7 @@ class DeepSiteAnalyzer:
                 title_sel = selectors.get('title')
                 if title_sel:
                     try:
-                        title_elem = card.select_one(title_sel) if title_sel != 'h2' else card.find('h2') or card.find('h3')
+                        title_elem = card.select_one(title_sel) if title_sel != 'h2' else card.select_one('h2') or card.select_one('h3')
                         if title_elem:
                             sample['title'] = title_elem.get_text(strip=True)[:100]
                     except:
@@ -340,7 +338,7 @@ class DeepSiteAnalyzer:
                 # Link
                 link_sel = selectors.get('link', 'a')
                 try:
-                    link_elem = card.select_one(link_sel) if link_sel != 'a' else card.find('a', href=True)
+                    link_elem = card.select_one(link_sel if link_sel != 'a' else 'a[href]')
                     if link_elem:
                         href = link_elem.get('href', '')
                         sample['link'] = urljoin(base_url, href)
@@ -350,7 +348,7 @@ class DeepSiteAnalyzer:
                 # Imagem
                 img_sel = selectors.get('image', 'img')
                 try:
-                    img_elem = card.select_one(img_sel) if img_sel != 'img' else card.find('img', src=True)
+                    img_elem = card.select_one(img_sel if img_sel != 'img' else 'img[src]')
                     if img_elem:
                         src = img_elem.get('src', '')
                         sample['image'] = urljoin(base_url, src)
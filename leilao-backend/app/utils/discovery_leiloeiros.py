@@ -19,6 +19,8 @@ from dataclasses import dataclass, asdict
 from urllib.parse import urlparse
 import logging
 
+from app.utils.http_client import get_http_client
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -110,63 +112,59 @@ class IntelligentDiscovery:
             url = f'https://{url}'
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                verify=False
-            ) as client:
-                
-                start_time = datetime.now()
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': 'text/html,application/xhtml+xml',
-                    'Accept-Language': 'pt-BR,pt;q=0.9',
-                }
-                
-                response = await client.get(url, headers=headers)
-                
-                analysis.http_status = response.status_code
-                analysis.response_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-                analysis.is_online = response.status_code == 200
-                
-                if not analysis.is_online:
-                    analysis.error = f"HTTP {response.status_code}"
-                    return analysis
-                
-                html = response.text.lower()
-                
-                # Detectar proteções
-                analysis.has_cloudflare = any(
-                    indicator in html or indicator in str(response.headers).lower()
-                    for indicator in self.CLOUDFLARE_INDICATORS
-                )
-                
-                analysis.has_captcha = 'captcha' in html or 'recaptcha' in html
-                
-                analysis.requires_javascript = any(
-                    indicator in html 
-                    for indicator in self.JAVASCRIPT_REQUIRED_INDICATORS
-                )
-                
-                # Identificar padrão de URLs
-                for pattern in self.PROPERTY_URL_PATTERNS:
-                    matches = re.findall(pattern, response.text)
-                    if matches:
-                        analysis.property_url_pattern = pattern
-                        break
-                
-                # Identificar seletores
-                analysis.selectors = self._identify_selectors(response.text)
-                
-                # Recomendar método
-                analysis.recommended_method, analysis.difficulty = self._recommend_method(analysis)
-                
-                logger.info(
-                    f"OK {analysis.name}: {analysis.recommended_method} "
-                    f"({analysis.difficulty}) - {analysis.response_time_ms}ms"
-                )
-                
+            client = get_http_client(verify=False, scope="discovery_leiloeiros")
+            
+            start_time = datetime.now()
+            
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Accept': 'text/html,application/xhtml+xml',
+                'Accept-Language': 'pt-BR,pt;q=0.9',
+            }
+            
+            response = await client.get(url, headers=headers, timeout=self.timeout, follow_redirects=True)
+            
+            analysis.http_status = response.status_code
+            analysis.response_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            analysis.is_online = response.status_code == 200
+            
+            if not analysis.is_online:
+                analysis.error = f"HTTP {response.status_code}"
+                return analysis
+            
+            html = response.text.lower()
+            
+            # Detectar proteções
+            analysis.has_cloudflare = any(
+                indicator in html or indicator in str(response.headers).lower()
+                for indicator in self.CLOUDFLARE_INDICATORS
+            )
+            
+            analysis.has_captcha = 'captcha' in html or 'recaptcha' in html
+            
+            analysis.requires_javascript = any(
+                indicator in html 
+                for indicator in self.JAVASCRIPT_REQUIRED_INDICATORS
+            )
+            
+            # Identificar padrão de URLs
+            for pattern in self.PROPERTY_URL_PATTERNS:
+                matches = re.findall(pattern, response.text)
+                if matches:
+                    analysis.property_url_pattern = pattern
+                    break
+            
+            # Identificar seletores
+            analysis.selectors = self._identify_selectors(response.text)
+            
+            # Recomendar método
+            analysis.recommended_method, analysis.difficulty = self._recommend_method(analysis)
+            
+            logger.info(
+                f"OK {analysis.name}: {analysis.recommended_method} "
+                f"({analysis.difficulty}) - {analysis.response_time_ms}ms"
+            )
+            
         except httpx.TimeoutException:
             analysis.error = "Timeout"
             analysis.is_online = False
@@ -0,0 +1,181 @@
+"""
+Executor de extração: parse de HTML e regex pesadas fora do event loop.
+
+O parse da listagem, ImageExtractor e o parser de datas rodavam dentro das
+corrotinas (GenericScraper._extract_properties_from_html no
+paginate_and_extract, ConfigurableScraper.scrape_batch): uma página grande
+travava todos os fetches concorrentes. Aqui:
+
+    items = await get_extraction_executor().run(extract_listing_page, html, url, config)
+
+- os jobs são funções de módulo (picklable) com o HTML como primeiro
+  argumento; rodam num pool de processos (EXTRACTION_WORKERS, padrão = nº
+  de CPUs). A concorrência de fetch continua sendo a do event loop e o
+  paralelismo de CPU é o número de workers;
+- os workers são aquecidos ao criar o pool: o initializer importa os
+  parsers, os extratores e as configurações embutidas dos scrapers, e cada
+  worker recebe um job vazio para já nascer pronto;
+- páginas pequenas (< EXTRACTION_INLINE_BYTES) rodam no próprio loop: o
+  custo de enviar o HTML ao worker seria maior que o parse;
+- com EXTRACTION_WORKERS=0 ou se o pool quebrar, o job roda em thread
+  (asyncio.to_thread), sem travar o loop mas disputando o GIL;
+- get_stats() reporta páginas por segundo por núcleo (jobs / segundos de
+  CPU gastos nos workers).
+"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", str(os.cpu_count() or 1)))
+EXTRACTION_INLINE_BYTES = int(os.getenv("EXTRACTION_INLINE_BYTES", str(32 * 1024)))
+# "spawn" evita herdar threads e clientes HTTP do processo da API via fork
+EXTRACTION_MP_CONTEXT = os.getenv("EXTRACTION_MP_CONTEXT", "spawn")
+
+# Importados pelo initializer de cada worker
+_WARM_MODULES = (
+    "app.utils.html_parser",
+    "app.utils.image_extractor",
+    "app.utils.date_parser",
+    "app.utils.normalizer",
+    "app.scrapers.generic_scraper",
+    "app.scrapers.configurable_scraper",
+)
+
+
+def _warm_worker() -> None:
+    """Initializer dos workers: importa parsers, extratores e configs."""
+    for module in _WARM_MODULES:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning(f"Worker de extração: falha ao importar {module}: {e}")
+
+
+def _noop() -> int:
+    return os.getpid()
+
+
+def _run_job(fn: Callable, args: Tuple) -> Tuple[Any, float]:
+    """Executa o job no worker e devolve (resultado, segundos de CPU)."""
+    started = time.process_time()
+    result = fn(*args)
+    return result, time.process_time() - started
+
+
+class ExtractionExecutor:
+    """Pool de processos para os jobs de extração dos scrapers async."""
+
+    def __init__(self, workers: int = EXTRACTION_WORKERS, inline_bytes: int = EXTRACTION_INLINE_BYTES):
+        self.workers = max(workers, 0)
+        self.inline_bytes = inline_bytes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "pool_jobs": 0,
+            "inline_jobs": 0,
+            "thread_jobs": 0,
+            "errors": 0,
+            "pool_restarts": 0,
+            "pool_cpu_seconds": 0.0,
+            "inline_cpu_seconds": 0.0,
+            "bytes": 0,
+        }
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if not self.workers:
+            return None
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context(EXTRACTION_MP_CONTEXT)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=context, initializer=_warm_worker
+                )
+                # Um job vazio por worker: todos sobem (e importam) agora
+                for _ in range(self.workers):
+                    self._pool.submit(_noop)
+                logger.info(f"Executor de extração: {self.workers} worker(s) ({EXTRACTION_MP_CONTEXT})")
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+                self._stats["pool_restarts"] += 1
+
+    async def run(self, fn: Callable, html: str, *args) -> Any:
+        """
+        Executa fn(html, *args) fora do event loop.
+
+        Args:
+            fn: Função de módulo (picklable) que faz o parse/extração
+            html: Conteúdo da página (define se vale a pena mandar ao pool)
+            *args: Demais argumentos de fn (picklable)
+        """
+        size = len(html or "")
+        self._stats["bytes"] += size
+
+        if size < self.inline_bytes:
+            result, cpu = _run_job(fn, (html, *args))
+            self._stats["inline_jobs"] += 1
+            self._stats["inline_cpu_seconds"] += cpu
+            return result
+
+        pool = self._get_pool()
+        if pool is not None:
+            loop = asyncio.get_running_loop()
+            try:
+                result, cpu = await loop.run_in_executor(pool, _run_job, fn, (html, *args))
+                self._stats["pool_jobs"] += 1
+                self._stats["pool_cpu_seconds"] += cpu
+                return result
+            except BrokenProcessPool:
+                logger.warning("Pool de extração quebrou; recriando e executando em thread")
+                self._stats["errors"] += 1
+                self._reset_pool()
+            except Exception:
+                self._stats["errors"] += 1
+                raise
+
+        self._stats["thread_jobs"] += 1
+        result, _ = await asyncio.to_thread(_run_job, fn, (html, *args))
+        return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        cpu = stats["pool_cpu_seconds"]
+        stats["workers"] = self.workers
+        stats["pool_running"] = self._pool is not None
+        stats["inline_bytes"] = self.inline_bytes
+        stats["pool_cpu_seconds"] = round(cpu, 3)
+        stats["inline_cpu_seconds"] = round(stats["inline_cpu_seconds"], 3)
+        stats["pages_per_sec_per_core"] = round(stats["pool_jobs"] / cpu, 1) if cpu else None
+        return stats
+
+
+# Instância global
+_executor: Optional[ExtractionExecutor] = None
+
+
+def get_extraction_executor() -> ExtractionExecutor:
+    """Obtém a instância global do executor de extração."""
+    global _executor
+    if _executor is None:
+        _executor = ExtractionExecutor()
+    return _executor
@@ -0,0 +1,342 @@
+"""
+Memória de estratégia de fetch por domínio para o MultiLayerFetcher.
+
+O MultiLayerFetcher tentava sempre direto -> headers avançados ->
+ScrapingBee -> Jina, nessa ordem: num site que só abre via ScrapingBee ou
+Jina, cada página pagava antes duas requisições falhas (e seus timeouts).
+Aqui cada domínio guarda, por camada, tentativas, sucessos, uma média
+móvel de sucesso (score) e de latência e qual camada funcionou por último:
+
+- plan() começa pela melhor camada conhecida (a mais barata com ao menos
+  FETCH_STRATEGY_MIN_SUCCESSES sucessos e score ainda bom; uma falha
+  isolada numa camada barata não manda o domínio para a ScrapingBee) e
+  deixa as demais como fallback: primeiro as mais caras, por último as
+  mais baratas que ela;
+- com probabilidade FETCH_STRATEGY_PROBE_RATE as camadas mais baratas que
+  a melhor são testadas antes dela, em ordem, parando na primeira que
+  funcionar, para descobrir quando o site deixa de exigir a camada cara;
+- o estado fica num SQLite (FETCH_STRATEGY_DB) e sobrevive a reinícios;
+  com FETCH_STRATEGY_DB vazio fica só em memória. A tabela é lida uma vez
+  na criação e as alterações são gravadas em lote por uma thread a cada
+  FETCH_STRATEGY_FLUSH_INTERVAL segundos: plan() e record() rodam no event
+  loop e só mexem na memória.
+
+As camadas são identificadas pelo valor de FetchLayer ("direct",
+"scrapingbee", ...) e a ordem recebida em plan() é a ordem de custo.
+"""
+
+import atexit
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.environ.get("DATA_DIR", "/tmp/leilohub_data")
+FETCH_STRATEGY_DB = os.getenv("FETCH_STRATEGY_DB", os.path.join(DATA_DIR, "fetch_strategy.db"))
+FETCH_STRATEGY_ENABLED = os.getenv("FETCH_STRATEGY_ENABLED", "true").lower() == "true"
+FETCH_STRATEGY_PROBE_RATE = float(os.getenv("FETCH_STRATEGY_PROBE_RATE", "0.05"))
+# Score mínimo para uma camada continuar sendo o ponto de partida
+FETCH_STRATEGY_MIN_SCORE = float(os.getenv("FETCH_STRATEGY_MIN_SCORE", "0.5"))
+# Sucessos mínimos para uma camada virar o ponto de partida
+FETCH_STRATEGY_MIN_SUCCESSES = int(os.getenv("FETCH_STRATEGY_MIN_SUCCESSES", "2"))
+# Segundos entre a primeira alteração pendente e a gravação no SQLite
+FETCH_STRATEGY_FLUSH_INTERVAL = float(os.getenv("FETCH_STRATEGY_FLUSH_INTERVAL", "5"))
+
+# Peso da última tentativa nas médias móveis de sucesso e latência
+_ALPHA = 0.3
+
+
+@dataclass
+class LayerStats:
+    """Histórico de uma camada num domínio."""
+    attempts: int = 0
+    successes: int = 0
+    score: float = 0.5            # média móvel de sucesso (0..1)
+    latency_ewma: float = 0.0     # segundos, só tentativas com sucesso
+    last_success_at: float = 0.0
+    last_failure_at: float = 0.0
+
+
+@dataclass
+class DomainStrategy:
+    """Camadas conhecidas de um domínio e a última que funcionou."""
+    layers: Dict[str, LayerStats] = field(default_factory=dict)
+    last_layer: str = ""
+    probes: int = 0
+    updated_at: float = 0.0
+
+    @classmethod
+    def from_json(cls, raw: str) -> "DomainStrategy":
+        data = json.loads(raw)
+        layers = {name: LayerStats(**stats) for name, stats in data.pop("layers", {}).items()}
+        return cls(layers=layers, **data)
+
+    def best_layer(self, layers: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Camada de partida: a mais barata que já funcionou várias vezes e
+        ainda tem score bom.
+
+        Args:
+            layers: Ordem de custo (sem ela, a ordem em que as camadas
+                apareceram no domínio, que segue a ordem padrão)
+        """
+        for name in layers if layers is not None else list(self.layers):
+            stats = self.layers.get(name)
+            if (stats and stats.successes >= FETCH_STRATEGY_MIN_SUCCESSES
+                    and stats.score >= FETCH_STRATEGY_MIN_SCORE):
+                return name
+        return None
+
+
+class FetchStrategy:
+    """Tabela persistente domínio -> camadas, consultada a cada fetch."""
+
+    def __init__(
+        self,
+        db_file: Optional[str] = None,
+        probe_rate: float = FETCH_STRATEGY_PROBE_RATE,
+        enabled: bool = FETCH_STRATEGY_ENABLED,
+        flush_interval: float = FETCH_STRATEGY_FLUSH_INTERVAL,
+    ):
+        self.db_file = FETCH_STRATEGY_DB if db_file is None else db_file
+        self.probe_rate = probe_rate
+        self.enabled = enabled
+        self.flush_interval = flush_interval
+        self._domains: Dict[str, DomainStrategy] = {}
+        self._dirty: Set[str] = set()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "plans": 0,
+            "plans_from_memory": 0,
+            "layers_skipped": 0,
+            "probes": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+        }
+        if self.db_file:
+            try:
+                self._init_db()
+                self._domains = self._read_all()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Estratégia de fetch: SQLite indisponível ({e}); usando memória")
+                self.db_file = ""
+
+    def _init_db(self) -> None:
+        directory = os.path.dirname(self.db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS fetch_strategy (
+                    domain TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=30.0, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlparse(url).netloc.lower() or url
+
+    def _read_all(self) -> Dict[str, DomainStrategy]:
+        """Todos os domínios gravados (linhas inválidas são ignoradas)."""
+        domains: Dict[str, DomainStrategy] = {}
+        with self._connect() as conn:
+            rows = conn.execute("SELECT domain, state FROM fetch_strategy").fetchall()
+        for domain, raw in rows:
+            try:
+                domains[domain] = DomainStrategy.from_json(raw)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Estratégia de fetch: estado inválido para {domain}: {e}")
+        return domains
+
+    def _load(self, domain: str) -> DomainStrategy:
+        """Estado do domínio (só memória). Chamar com o lock."""
+        state = self._domains.get(domain)
+        if state is None:
+            state = self._domains[domain] = DomainStrategy()
+        return state
+
+    def _mark_dirty(self, domain: str) -> None:
+        """Agenda a gravação do domínio. Chamar com o lock."""
+        if not self.db_file:
+            return
+        self._dirty.add(domain)
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Grava no SQLite os domínios alterados desde a última gravação."""
+        with self._lock:
+            self._flush_timer = None
+            pending = {
+                domain: json.dumps(asdict(self._domains[domain]))
+                for domain in self._dirty if domain in self._domains
+            }
+            self._dirty.clear()
+        if not pending or not self.db_file:
+            return
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO fetch_strategy (domain, state, updated_at) VALUES (?, ?, ?)",
+                    [(domain, raw, time.time()) for domain, raw in pending.items()],
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Estratégia de fetch: falha ao gravar {len(pending)} domínio(s): {e}")
+
+    def plan(self, url: str, layers: List[str]) -> List[str]:
+        """
+        Ordem das camadas para esta URL.
+
+        Args:
+            url: URL a buscar (a estratégia é por domínio)
+            layers: Camadas disponíveis, da mais barata para a mais cara
+        """
+        self._stats["plans"] += 1
+        if not self.enabled or len(layers) < 2:
+            return list(layers)
+
+        domain = self._domain(url)
+        with self._lock:
+            state = self._load(domain)
+            best = state.best_layer(layers)
+            if best not in layers or best == layers[0]:
+                return list(layers)
+
+            # Depois da melhor, as mais caras e por último as mais baratas
+            # (foram elas que falharam até a melhor ser descoberta)
+            index = layers.index(best)
+            cheaper = layers[:index]
+            self._stats["plans_from_memory"] += 1
+            if random.random() < self.probe_rate:
+                # Sonda as mais baratas, em ordem, antes da melhor conhecida;
+                # o fetcher para na primeira que funcionar
+                state.probes += 1
+                self._stats["probes"] += 1
+                logger.debug(f"Estratégia de fetch: {domain} sondando {', '.join(cheaper)} antes de {best}")
+                return list(layers)
+            self._stats["layers_skipped"] += len(cheaper)
+            return layers[index:] + cheaper
+
+    def record(self, url: str, layer: str, success: bool, latency: Optional[float] = None) -> None:
+        """Registra o resultado de uma tentativa numa camada."""
+        domain = self._domain(url)
+        now = time.time()
+        with self._lock:
+            state = self._load(domain)
+            stats = state.layers.setdefault(layer, LayerStats())
+            stats.attempts += 1
+            stats.score = (1 - _ALPHA) * stats.score + _ALPHA * (1.0 if success else 0.0)
+            if success:
+                stats.successes += 1
+                stats.last_success_at = now
+                if latency is not None:
+                    stats.latency_ewma = (
+                        latency if not stats.latency_ewma
+                        else (1 - _ALPHA) * stats.latency_ewma + _ALPHA * latency
+                    )
+                state.last_layer = layer
+            else:
+                stats.last_failure_at = now
+            state.updated_at = now
+            self._mark_dirty(domain)
+
+    def expected_latency(self, url: str, layer: str) -> Optional[float]:
+        """Latência média (s) da camada no domínio, se ela já funcionou lá."""
+        with self._lock:
+            stats = self._load(self._domain(url)).layers.get(layer)
+            return stats.latency_ewma if stats and stats.latency_ewma else None
+
+    def record_hedge(self, won: bool) -> None:
+        """Conta corridas entre camadas (won = a segunda camada chegou antes)."""
+        self._stats["hedges"] += 1
+        if won:
+            self._stats["hedge_wins"] += 1
+
+    def reset(self, domain: Optional[str] = None) -> None:
+        """Esquece um domínio (ou todos): o próximo fetch volta à ordem padrão."""
+        with self._lock:
+            if domain is None:
+                self._domains.clear()
+                self._dirty.clear()
+            else:
+                self._domains.pop(domain, None)
+                self._dirty.discard(domain)
+            if self.db_file:
+                with self._connect() as conn:
+                    if domain is None:
+                        conn.execute("DELETE FROM fetch_strategy")
+                    else:
+                        conn.execute("DELETE FROM fetch_strategy WHERE domain = ?", (domain,))
+
+    def _all_domains(self) -> Dict[str, DomainStrategy]:
+        domains: Dict[str, DomainStrategy] = {}
+        if self.db_file:
+            try:
+                domains = self._read_all()
+            except sqlite3.Error as e:
+                logger.warning(f"Estratégia de fetch: falha ao ler a tabela: {e}")
+        with self._lock:
+            domains.update(self._domains)
+        return domains
+
+    def get_stats(self) -> Dict[str, Any]:
+        domains = {}
+        for domain, state in sorted(self._all_domains().items()):
+            domains[domain] = {
+                "best_layer": state.best_layer(),
+                "last_layer": state.last_layer or None,
+                "probes": state.probes,
+                "layers": {
+                    name: {
+                        "attempts": stats.attempts,
+                        "successes": stats.successes,
+                        "success_rate": round(stats.successes / stats.attempts, 3) if stats.attempts else None,
+                        "score": round(stats.score, 3),
+                        "latency_ms": round(stats.latency_ewma * 1000) if stats.latency_ewma else None,
+                    }
+                    for name, stats in state.layers.items()
+                },
+            }
+        return {
+            **self._stats,
+            "enabled": self.enabled,
+            "persistent": bool(self.db_file),
+            "probe_rate": self.probe_rate,
+            "domains": domains,
+        }
+
+
+# Instância global
+_strategy: Optional[FetchStrategy] = None
+
+
+def get_fetch_strategy() -> FetchStrategy:
+    """Obtém a instância global da estratégia de fetch."""
+    global _strategy
+    if _strategy is None:
+        _strategy = FetchStrategy()
+        atexit.register(_strategy.flush)
+    return _strategy
@@ -6,24 +6,41 @@ Camadas:
 2. Headers avançados (simula browser real) - Grátis
 3. ScrapingBee (renderiza JS, bypassa proteções) - Pago
 4. Jina.ai Reader (converte para markdown limpo) - Grátis até 1M/mês
+
+A ordem é aprendida por domínio (app/utils/fetch_strategy.py): sites que só
+abrem via ScrapingBee ou Jina começam por ela, sem pagar as camadas que
+sempre falham.
 """
 
-import httpx
 import logging
 import asyncio
 import os
-from typing import Tuple, Optional
+import time
+from typing import List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from app.utils.fetch_strategy import FetchStrategy, get_fetch_strategy
+from app.utils.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
+# Segundos sem resposta da camada da vez antes de disparar a próxima em
+# paralelo (0 = sem hedge; com hedge a ScrapingBee pode ser chamada à toa).
+# É o piso: se a camada já tem latência conhecida no domínio, espera-se até
+# _HEDGE_LATENCY_FACTOR vezes essa latência
+FETCH_HEDGE_AFTER = float(os.getenv("FETCH_HEDGE_AFTER", "0"))
+_HEDGE_LATENCY_FACTOR = 2.0
+
 class FetchLayer(Enum):
     DIRECT = "direct"
     ADVANCED_HEADERS = "advanced_headers"
     SCRAPINGBEE = "scrapingbee"
     JINA_READER = "jina_reader"
 
+# Número da camada nos logs ([Layer N SUCCESS])
+_LAYER_NUMBERS = {layer: number for number, layer in enumerate(FetchLayer, start=1)}
+
 @dataclass
 class FetchResult:
     success: bool
@@ -41,11 +58,21 @@ class MultiLayerFetcher:
         self,
         scrapingbee_api_key: Optional[str] = None,
         timeout: float = 30.0,
-        min_content_length: int = 1000
+        min_content_length: int = 1000,
+        strategy: Optional[FetchStrategy] = None,
+        hedge_after: Optional[float] = None
     ):
         self.scrapingbee_api_key = scrapingbee_api_key or os.getenv("SCRAPINGBEE_API_KEY")
         self.timeout = timeout
         self.min_content_length = min_content_length
+        self.strategy = strategy or get_fetch_strategy()
+        self.hedge_after = FETCH_HEDGE_AFTER if hedge_after is None else hedge_after
+        self._layers = {
+            FetchLayer.DIRECT: self._layer1_direct_fetch,
+            FetchLayer.ADVANCED_HEADERS: self._layer2_advanced_headers,
+            FetchLayer.SCRAPINGBEE: self._layer3_scrapingbee,
+            FetchLayer.JINA_READER: self._layer4_jina_reader,
+        }
         
         # Headers que simulam um navegador real
         self.browser_headers = {
@@ -65,41 +92,30 @@ class MultiLayerFetcher:
     
     async def fetch(self, url: str) -> FetchResult:
         """
-        Tenta buscar a URL usando as 4 camadas em sequência.
-        Retorna assim que uma camada obtiver sucesso.
+        Busca a URL tentando as camadas até uma obter sucesso.
+
+        A ordem vem da estratégia do domínio: sites que já sabemos exigir
+        ScrapingBee ou Jina começam direto por ela; os demais seguem a ordem
+        padrão (1 a 4). Com hedge_after > 0, se a camada da vez não responder
+        nesse tempo a próxima é disparada em paralelo e vale a primeira com
+        conteúdo válido.
         """
-        
-        # CAMADA 1: Fetch direto
-        result = await self._layer1_direct_fetch(url)
-        if self._is_valid_result(result):
-            logger.info(f"[Layer 1 SUCCESS] {url} - {result.content_length} chars")
-            return result
-        logger.warning(f"[Layer 1 FAILED] {url} - {result.error}")
-        
-        # CAMADA 2: Headers avançados
-        result = await self._layer2_advanced_headers(url)
-        if self._is_valid_result(result):
-            logger.info(f"[Layer 2 SUCCESS] {url} - {result.content_length} chars")
-            return result
-        logger.warning(f"[Layer 2 FAILED] {url} - {result.error}")
-        
-        # CAMADA 3: ScrapingBee
-        if self.scrapingbee_api_key:
-            result = await self._layer3_scrapingbee(url)
-            if self._is_valid_result(result):
-                logger.info(f"[Layer 3 SUCCESS] {url} - {result.content_length} chars")
+        available = list(FetchLayer)
+        if not self.scrapingbee_api_key:
+            available.remove(FetchLayer.SCRAPINGBEE)
+            logger.debug(f"[Layer 3 SKIPPED] ScrapingBee API key not configured")
+
+        order = [FetchLayer(value) for value in self.strategy.plan(url, [layer.value for layer in available])]
+        result = None
+        while order:
+            layer = order.pop(0)
+            if self.hedge_after > 0 and order:
+                result, valid = await self._hedged_fetch(url, layer, order)
+            else:
+                result, valid = await self._try_layer(url, layer)
+            if valid:
                 return result
-            logger.warning(f"[Layer 3 FAILED] {url} - {result.error}")
-        else:
-            logger.info(f"[Layer 3 SKIPPED] ScrapingBee API key not configured")
-        
-        # CAMADA 4: Jina.ai Reader
-        result = await self._layer4_jina_reader(url)
-        if self._is_valid_result(result):
-            logger.info(f"[Layer 4 SUCCESS] {url} - {result.content_length} chars")
-            return result
-        logger.warning(f"[Layer 4 FAILED] {url} - {result.error}")
-        
+
         # Todas as camadas falharam
         return FetchResult(
             success=False,
@@ -108,7 +124,60 @@ class MultiLayerFetcher:
             content_length=0,
             error=f"All 4 layers failed for {url}"
         )
-    
+
+    async def _try_layer(self, url: str, layer: FetchLayer) -> Tuple[FetchResult, bool]:
+        """Executa uma camada, registra o resultado na estratégia e devolve (resultado, válido)."""
+        number = _LAYER_NUMBERS[layer]
+        started = time.monotonic()
+        result = await self._layers[layer](url)
+        latency = time.monotonic() - started
+        valid = self._is_valid_result(result)
+        self.strategy.record(url, layer.value, valid, latency)
+        if valid:
+            logger.info(f"[Layer {number} SUCCESS] {url} - {result.content_length} chars")
+        else:
+            logger.warning(f"[Layer {number} FAILED] {url} - {result.error}")
+        return result, valid
+
+    async def _hedged_fetch(self, url: str, layer: FetchLayer, pending: List[FetchLayer]) -> Tuple[FetchResult, bool]:
+        """
+        Corre a camada e, se ela passar de hedge_after (ou do dobro da sua
+        latência conhecida no domínio), a próxima de pending em paralelo
+        (removendo-a de pending). A perdedora é cancelada sem contar como
+        falha na estratégia.
+        """
+        hedge_after = self.hedge_after
+        expected = self.strategy.expected_latency(url, layer.value)
+        if expected:
+            hedge_after = max(hedge_after, expected * _HEDGE_LATENCY_FACTOR)
+
+        first = asyncio.create_task(self._try_layer(url, layer))
+        tasks = {first}
+        try:
+            done, tasks = await asyncio.wait(tasks, timeout=hedge_after)
+            if done:
+                return first.result()
+
+            second_layer = pending.pop(0)
+            second = asyncio.create_task(self._try_layer(url, second_layer))
+            logger.debug(f"[Hedge] {url} - {layer.value} passou de {hedge_after:.1f}s, disparando {second_layer.value}")
+            tasks = {first, second}
+            result = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result, valid = task.result()
+                    if valid:
+                        self.strategy.record_hedge(won=task is second)
+                        return result, True
+            self.strategy.record_hedge(won=False)
+            return result, False
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
     def _is_valid_result(self, result: FetchResult) -> bool:
         """Verifica se o resultado é válido (sucesso + conteúdo suficiente + não é Cloudflare)."""
         if not result.success:
@@ -132,29 +201,26 @@ class MultiLayerFetcher:
     async def _layer1_direct_fetch(self, url: str) -> FetchResult:
         """Camada 1: Fetch HTTP direto com User-Agent básico."""
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True
-            ) as client:
-                headers = {"User-Agent": self.browser_headers["User-Agent"]}
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code == 200:
-                    content = response.text
-                    return FetchResult(
-                        success=True,
-                        content=content,
-                        layer_used=FetchLayer.DIRECT,
-                        content_length=len(content)
-                    )
-                else:
-                    return FetchResult(
-                        success=False,
-                        content="",
-                        layer_used=FetchLayer.DIRECT,
-                        content_length=0,
-                        error=f"HTTP {response.status_code}"
-                    )
+            client = get_http_client(http2=False, scope="fetcher_direct")
+            headers = {"User-Agent": self.browser_headers["User-Agent"]}
+            response = await client.get(url, headers=headers, timeout=self.timeout, follow_redirects=True)
+            
+            if response.status_code == 200:
+                content = response.text
+                return FetchResult(
+                    success=True,
+                    content=content,
+                    layer_used=FetchLayer.DIRECT,
+                    content_length=len(content)
+                )
+            else:
+                return FetchResult(
+                    success=False,
+                    content="",
+                    layer_used=FetchLayer.DIRECT,
+                    content_length=0,
+                    error=f"HTTP {response.status_code}"
+                )
         except Exception as e:
             return FetchResult(
                 success=False,
@@ -167,29 +233,28 @@ class MultiLayerFetcher:
     async def _layer2_advanced_headers(self, url: str) -> FetchResult:
         """Camada 2: Fetch com headers completos de browser real."""
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                http2=True  # HTTP/2 para parecer mais com browser moderno
-            ) as client:
-                response = await client.get(url, headers=self.browser_headers)
-                
-                if response.status_code == 200:
-                    content = response.text
-                    return FetchResult(
-                        success=True,
-                        content=content,
-                        layer_used=FetchLayer.ADVANCED_HEADERS,
-                        content_length=len(content)
-                    )
-                else:
-                    return FetchResult(
-                        success=False,
-                        content="",
-                        layer_used=FetchLayer.ADVANCED_HEADERS,
-                        content_length=0,
-                        error=f"HTTP {response.status_code}"
-                    )
+            # HTTP/2 para parecer mais com browser moderno
+            client = get_http_client(http2=True, scope="fetcher_browser")
+            response = await client.get(
+                url, headers=self.browser_headers, timeout=self.timeout, follow_redirects=True
+            )
+            
+            if response.status_code == 200:
+                content = response.text
+                return FetchResult(
+                    success=True,
+                    content=content,
+                    layer_used=FetchLayer.ADVANCED_HEADERS,
+                    content_length=len(content)
+                )
+            else:
+                return FetchResult(
+                    success=False,
+                    content="",
+                    layer_used=FetchLayer.ADVANCED_HEADERS,
+                    content_length=0,
+                    error=f"HTTP {response.status_code}"
+                )
         except Exception as e:
             return FetchResult(
                 success=False,
@@ -212,25 +277,25 @@ class MultiLayerFetcher:
                 "wait": "3000",  # Espera 3s para JS carregar
             }
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(scrapingbee_url, params=params)
-                
-                if response.status_code == 200:
-                    content = response.text
-                    return FetchResult(
-                        success=True,
-                        content=content,
-                        layer_used=FetchLayer.SCRAPINGBEE,
-                        content_length=len(content)
-                    )
-                else:
-                    return FetchResult(
-                        success=False,
-                        content="",
-                        layer_used=FetchLayer.SCRAPINGBEE,
-                        content_length=0,
-                        error=f"ScrapingBee HTTP {response.status_code}"
-                    )
+            client = get_http_client(scope="scrapingbee")
+            response = await client.get(scrapingbee_url, params=params, timeout=60.0)
+            
+            if response.status_code == 200:
+                content = response.text
+                return FetchResult(
+                    success=True,
+                    content=content,
+                    layer_used=FetchLayer.SCRAPINGBEE,
+                    content_length=len(content)
+                )
+            else:
+                return FetchResult(
+                    success=False,
+                    content="",
+                    layer_used=FetchLayer.SCRAPINGBEE,
+                    content_length=0,
+                    error=f"ScrapingBee HTTP {response.status_code}"
+                )
         except Exception as e:
             return FetchResult(
                 success=False,
@@ -251,30 +316,30 @@ class MultiLayerFetcher:
         try:
             jina_url = f"https://r.jina.ai/{url}"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                headers = {
-                    "Accept": "text/html",
-                    "X-Return-Format": "html"  # Pede HTML ao invés de markdown
-                }
-                
-                response = await client.get(jina_url, headers=headers)
-                
-                if response.status_code == 200:
-                    content = response.text
-                    return FetchResult(
-                        success=True,
-                        content=content,
-                        layer_used=FetchLayer.JINA_READER,
-                        content_length=len(content)
-                    )
-                else:
-                    return FetchResult(
-                        success=False,
-                        content="",
-                        layer_used=FetchLayer.JINA_READER,
-                        content_length=0,
-                        error=f"Jina Reader HTTP {response.status_code}"
-                    )
+            client = get_http_client(scope="jina")
+            headers = {
+                "Accept": "text/html",
+                "X-Return-Format": "html"  # Pede HTML ao invés de markdown
+            }
+            
+            response = await client.get(jina_url, headers=headers, timeout=60.0)
+            
+            if response.status_code == 200:
+                content = response.text
+                return FetchResult(
+                    success=True,
+                    content=content,
+                    layer_used=FetchLayer.JINA_READER,
+                    content_length=len(content)
+                )
+            else:
+                return FetchResult(
+                    success=False,
+                    content="",
+                    layer_used=FetchLayer.JINA_READER,
+                    content_length=0,
+                    error=f"Jina Reader HTTP {response.status_code}"
+                )
         except Exception as e:
             return FetchResult(
                 success=False,
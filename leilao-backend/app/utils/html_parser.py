@@ -0,0 +1,315 @@
+"""
+Parser de HTML compartilhado pelos scrapers baseados em seletores.
+
+Os scrapers de seletor parseavam com BeautifulSoup(html, 'html.parser'), o
+construtor mais lento, e vários extratores parseavam de novo o mesmo HTML
+(cards, imagens, paginação). Aqui:
+
+    doc = parse_html(html)
+    for card in doc.select(card_selector):
+        title = card.select_one('h2, .titulo')
+        ...
+
+- backend: selectolax (Lexbor, em C) quando o pacote está instalado,
+  senão BeautifulSoup com lxml. HTML_PARSER_BACKEND força um deles;
+- a API é o subconjunto do BeautifulSoup que os scrapers usam: select,
+  select_one, get_text, get/attrs (com 'class' como lista), name, parent e
+  str() com o HTML do elemento. Com o backend lxml os elementos são os
+  próprios Tags do bs4;
+- ':contains()' / ':-soup-contains()' dos configs viram ':lexbor-contains()';
+- parse_html guarda os últimos documentos (HTML_PARSE_CACHE_SIZE): cards,
+  imagens e paginação da mesma página usam a mesma árvore, e o documento
+  memoriza o resultado de cada seletor. Quem precisa alterar a árvore
+  (decompose etc.) deve usar make_soup, que devolve uma árvore própria.
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Union
+
+from bs4 import BeautifulSoup
+from soupsieve import SelectorSyntaxError
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+except ImportError:  # opcional: sem ele, o backend é BeautifulSoup + lxml
+    LexborHTMLParser = None
+    SelectolaxError = None
+
+logger = logging.getLogger(__name__)
+
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "auto").lower()
+HTML_PARSE_CACHE_SIZE = int(os.getenv("HTML_PARSE_CACHE_SIZE", "8"))
+
+_CONTAINS = re.compile(r":(?:-soup-)?contains\(")
+_TEXT_ONLY_TAGS = ("script", "style", "noscript", "template")
+
+
+class SelectorError(ValueError):
+    """Seletor CSS inválido para o backend selectolax."""
+
+
+# Erros de seletor inválido nos dois backends
+SELECTOR_ERRORS = (SelectorError, SelectorSyntaxError, NotImplementedError)
+
+
+def _tree_builder() -> str:
+    try:
+        import lxml  # noqa: F401
+        return "lxml"
+    except ImportError:
+        return "html.parser"
+
+
+_BUILDER = _tree_builder()
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """BeautifulSoup com o construtor mais rápido disponível (lxml)."""
+    return BeautifulSoup(html, _BUILDER)
+
+
+@lru_cache(maxsize=512)
+def _lexbor_css(selector: str) -> str:
+    return _CONTAINS.sub(":lexbor-contains(", selector)
+
+
+class LexborElement:
+    """Elemento do selectolax com a interface de Tag usada pelos scrapers."""
+
+    __slots__ = ("_node", "_inclusive")
+
+    def __init__(self, node, inclusive: bool = False):
+        self._node = node
+        # O Lexbor inclui o próprio nó no resultado de css(); o bs4 só
+        # procura nos descendentes (exceto a partir da raiz do documento)
+        self._inclusive = inclusive
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._node.tag
+
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        attrs = {}
+        for key, value in self._node.attributes.items():
+            if key == "class":
+                attrs[key] = (value or "").split()
+            else:
+                attrs[key] = "" if value is None else value
+        return attrs
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attributes = self._node.attributes
+        if key not in attributes:
+            return default
+        value = attributes[key]
+        if key == "class":
+            return (value or "").split()
+        return "" if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def has_attr(self, key: str) -> bool:
+        return key in self._node.attributes
+
+    def _css(self, selector: str) -> list:
+        try:
+            nodes = self._node.css(_lexbor_css(selector))
+        except SelectolaxError as e:
+            raise SelectorError(f"{selector!r}: {e}") from e
+        if nodes and not self._inclusive and nodes[0].mem_id == self._node.mem_id:
+            nodes = nodes[1:]
+        return nodes
+
+    def select(self, selector: str) -> List["LexborElement"]:
+        return [LexborElement(node) for node in self._css(selector)]
+
+    def select_one(self, selector: str) -> Optional["LexborElement"]:
+        try:
+            node = self._node.css_first(_lexbor_css(selector))
+        except SelectolaxError as e:
+            raise SelectorError(f"{selector!r}: {e}") from e
+        if node is not None and not self._inclusive and node.mem_id == self._node.mem_id:
+            nodes = self._css(selector)
+            node = nodes[0] if nodes else None
+        return LexborElement(node) if node is not None else None
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        node = self._node
+        # Como o bs4, não inclui o conteúdo de <script>/<style>
+        if node.tag not in _TEXT_ONLY_TAGS and node.css_first(", ".join(_TEXT_ONLY_TAGS)) is not None:
+            node = node.clone()
+            node.strip_tags(list(_TEXT_ONLY_TAGS))
+        return node.text(deep=True, separator=separator, strip=strip, skip_empty=strip)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    @property
+    def parent(self) -> Optional["LexborElement"]:
+        parent = self._node.parent
+        if parent is None or not parent.is_element_node:
+            return None
+        return LexborElement(parent)
+
+    def __str__(self) -> str:
+        return self._node.html or ""
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, LexborElement) and self._node.mem_id == other._node.mem_id
+
+    def __hash__(self) -> int:
+        return self._node.mem_id
+
+    def __repr__(self) -> str:
+        return f"<LexborElement {self._node.tag}>"
+
+
+Element = Union[LexborElement, Any]
+
+
+class HtmlDocument:
+    """HTML parseado uma vez e compartilhado entre os extratores da página."""
+
+    def __init__(self, html: str, backend: str):
+        self.html = html
+        self.backend = backend
+        if backend == "selectolax":
+            parser = LexborHTMLParser(html)
+            self.root = LexborElement(parser.root, inclusive=True) if parser.root is not None else None
+        else:
+            self.root = make_soup(html)
+        self._selections: Dict[str, list] = {}
+        self._memo: Dict[str, Any] = {}
+
+    def select(self, selector: str) -> list:
+        """Elementos que casam com o seletor (resultado memorizado por seletor)."""
+        if self.root is None:
+            return []
+        result = self._selections.get(selector)
+        if result is None:
+            result = self._selections[selector] = self.root.select(selector)
+        return list(result)
+
+    def select_one(self, selector: str) -> Optional[Element]:
+        if self.root is None:
+            return None
+        if selector in self._selections:
+            result = self._selections[selector]
+            return result[0] if result else None
+        return self.root.select_one(selector)
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        if self.root is None:
+            return ""
+        return self.root.get_text(separator, strip=strip)
+
+    def memo(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Resultado derivado do documento, calculado uma vez por extrator."""
+        if key not in self._memo:
+            self._memo[key] = factory()
+        return self._memo[key]
+
+
+def _resolve_backend(backend: Optional[str]) -> str:
+    backend = (backend or HTML_PARSER_BACKEND).lower()
+    if backend in ("auto", "selectolax"):
+        if LexborHTMLParser is not None:
+            return "selectolax"
+        if backend == "selectolax":
+            logger.warning("selectolax não instalado; usando BeautifulSoup + lxml")
+    return "lxml"
+
+
+_cache: "OrderedDict[tuple, HtmlDocument]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> HtmlDocument:
+    """
+    Parseia o HTML (ou devolve o documento já parseado do mesmo HTML).
+
+    Args:
+        html: Conteúdo da página
+        backend: "selectolax", "lxml" ou None para HTML_PARSER_BACKEND
+
+    Returns:
+        HtmlDocument compartilhado; não deve ser alterado
+    """
+    backend = _resolve_backend(backend)
+    key = (backend, len(html), hash(html))
+    with _cache_lock:
+        doc = _cache.get(key)
+        if doc is not None and (doc.html is html or doc.html == html):
+            _cache.move_to_end(key)
+            return doc
+
+    doc = HtmlDocument(html, backend)
+    if HTML_PARSE_CACHE_SIZE > 0:
+        with _cache_lock:
+            _cache[key] = doc
+            while len(_cache) > HTML_PARSE_CACHE_SIZE:
+                _cache.popitem(last=False)
+    return doc
+
+
+def _class_matches(element: Element, pattern: Pattern) -> bool:
+    classes = element.get("class")
+    return bool(classes) and any(pattern.search(cls) for cls in classes)
+
+
+def _class_query(tags: Optional[Iterable[str]]) -> str:
+    return ", ".join(f"{tag}[class]" for tag in tags) if tags else "[class]"
+
+
+def find_all_by_class(node, pattern: Union[str, Pattern], tags: Optional[Iterable[str]] = None,
+                      limit: Optional[int] = None) -> list:
+    """
+    Equivalente a node.find_all(tags, class_=re.compile(pattern, re.I)).
+
+    Args:
+        node: HtmlDocument ou elemento
+        pattern: Regex testada contra cada classe do elemento
+        tags: Restringe às tags informadas
+        limit: Número máximo de elementos
+    """
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern, re.I)
+    found = []
+    for element in node.select(_class_query(tags)):
+        if _class_matches(element, pattern):
+            found.append(element)
+            if limit and len(found) >= limit:
+                break
+    return found
+
+
+def find_by_class(node, pattern: Union[str, Pattern], tags: Optional[Iterable[str]] = None) -> Optional[Element]:
+    """Primeiro elemento cuja classe casa com a regex (node.find(class_=...))."""
+    found = find_all_by_class(node, pattern, tags, limit=1)
+    return found[0] if found else None
+
+
+def find_by_text(node, pattern: Union[str, Pattern], tags: Iterable[str]) -> Optional[Element]:
+    """Primeiro elemento folha das tags cujo texto casa com a regex (node.find(tag, string=...))."""
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern, re.I)
+    for element in node.select(", ".join(tags)):
+        if element.select_one("*") is None and pattern.search(element.get_text()):
+            return element
+    return None
+
+
+def clear_parse_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,350 @@
+"""
+Pré-processamento de HTML para os prompts de extração com IA.
+
+Os extratores mandavam os primeiros 30-50 mil caracteres do HTML bruto,
+quase tudo menu, scripts e rodapé, e a listagem muitas vezes ficava de fora.
+Aqui o HTML passa por:
+
+1. remoção de nós sem conteúdo (script, style, svg, nav, header, footer,
+   select, comentários...);
+2. detecção dos cards da listagem: subárvores repetidas com a mesma
+   estrutura (mesma tag/classe e caminhos de tags parecidos), com texto e
+   preferencialmente preço;
+3. compactação de cada card em uma linha (texto + link + imagem).
+
+estimate_tokens/pack_cards dividem os cards em lotes que cabem no prompt.
+Sem cards detectáveis (página de detalhe, layout sem repetição), sobra o
+texto compactado da página.
+"""
+
+import logging
+import math
+import os
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+except ImportError:  # opcional: sem ele, estimate_tokens usa uma aproximação
+    tiktoken = None
+
+# Orçamento de tokens do conteúdo em cada prompt
+AI_PROMPT_MAX_TOKENS = int(os.getenv("AI_PROMPT_MAX_TOKENS", "6000"))
+# Cards por chamada (a resposta tem max_tokens=4000, ~130 tokens por imóvel)
+AI_CARDS_PER_BATCH = int(os.getenv("AI_CARDS_PER_BATCH", "25"))
+# Máximo de chamadas por página
+AI_MAX_BATCHES = int(os.getenv("AI_MAX_BATCHES", "4"))
+
+_NOISE_TAGS = (
+    "script", "style", "noscript", "svg", "iframe", "template", "head", "nav", "aside",
+    "select", "button", "input", "textarea", "canvas", "video", "audio",
+)
+_NOISE_XPATH = (
+    "//*[@role='navigation' or @role='banner' or @role='contentinfo' or @aria-hidden='true'"
+    " or contains(concat(' ', normalize-space(@class), ' '), ' slick-cloned ')]"
+)
+_IMAGE_ATTRS = ("data-src", "data-lazy", "data-lazy-src", "data-original", "src")
+
+MIN_CARD_CHARS = 40
+MAX_CARD_CHARS = 3000
+MIN_CARDS = 3
+# Similaridade mínima (Jaccard dos caminhos de tags) com o card de referência
+MIN_SIMILARITY = 0.5
+
+_PRICE = re.compile(r"R\$\s*\d|\d{1,3}(?:\.\d{3})+,\d{2}")
+_WHITESPACE = re.compile(r"\s+")
+_TOKEN_PIECES = re.compile(r"[^\W\d_]+|\d+|[^\w\s]+")
+_TRACKING_PARAMS = re.compile(r"(?<=[?&])(?:utm_\w+|gclid|fbclid)=[^&#]*&?")
+
+
+@dataclass
+class SlicedPage:
+    """Resultado do fatiamento: cards compactados ou, sem cards, o texto da página."""
+    cards: List[str] = field(default_factory=list)
+    text: str = ""
+    original_chars: int = 0
+    selector: Optional[str] = None
+
+    @property
+    def content(self) -> str:
+        return "\n".join(self.cards) if self.cards else self.text
+
+
+# ==================== Tokens ====================
+
+_encoding = None
+_encoding_failed = False
+
+
+def _get_encoding():
+    """Encoding do gpt-4o (o200k_base); carregado no primeiro uso, pode precisar de rede."""
+    global _encoding, _encoding_failed
+    if _encoding is None and tiktoken is not None and not _encoding_failed:
+        try:
+            _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken indisponível ({e}), usando estimativa de tokens")
+            _encoding_failed = True
+    return _encoding
+
+
+def estimate_tokens(text: str) -> int:
+    """Tokens do texto (tiktoken se instalado; senão estimativa por pedaços do BPE)."""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    # Palavras longas viram vários tokens, números ~3 dígitos por token,
+    # sequências de pontuação ('="', '/>', '://') ~2 caracteres por token
+    total = 0
+    for piece in _TOKEN_PIECES.findall(text):
+        if piece[0].isdigit():
+            total += math.ceil(len(piece) / 3)
+        elif piece[0].isalpha():
+            total += math.ceil(len(piece) / 5)
+        else:
+            total += math.ceil(len(piece) / 2)
+    return total
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Corta o texto para caber em max_tokens (aproximado, por busca binária)."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    # Nenhum token tem mais que ~16 caracteres; limita a busca
+    low, high = 0, min(len(text), max_tokens * 16)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+def pack_cards(cards: List[str], max_tokens: int = AI_PROMPT_MAX_TOKENS,
+               max_cards: int = AI_CARDS_PER_BATCH) -> List[List[str]]:
+    """Agrupa os cards em lotes de até max_tokens e max_cards, na ordem da página."""
+    batches: List[List[str]] = []
+    current: List[str] = []
+    used = 0
+    for card in cards:
+        tokens = estimate_tokens(card) + 1  # quebra de linha
+        if tokens > max_tokens:
+            card = truncate_to_tokens(card, max_tokens - 1)
+            tokens = max_tokens
+        if current and (used + tokens > max_tokens or len(current) >= max_cards):
+            batches.append(current)
+            current, used = [], 0
+        current.append(card)
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+# ==================== Limpeza ====================
+
+def _parse(html: str):
+    try:
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _drop(element) -> None:
+    if element.getparent() is not None:
+        # drop_tree mantém o tail (texto depois do elemento)
+        element.drop_tree()
+
+
+def _clean(root) -> None:
+    for element in list(root.iter(etree.Comment, etree.ProcessingInstruction)):
+        _drop(element)
+    for element in list(root.iter(*_NOISE_TAGS)):
+        _drop(element)
+    # header/footer do site; dentro de <article> costumam ser título/rodapé do card
+    for element in list(root.iter("header", "footer")):
+        if next(element.iterancestors("article"), None) is None:
+            _drop(element)
+    for element in root.xpath(_NOISE_XPATH):
+        _drop(element)
+
+
+def _text(element) -> str:
+    return _WHITESPACE.sub(" ", element.text_content()).strip()
+
+
+def _absolute(url: str, base_url: str) -> str:
+    """URL absoluta sem parâmetros de rastreamento (utm_*, gclid...)."""
+    url = _TRACKING_PARAMS.sub("", urljoin(base_url, url))
+    return url.rstrip("?&")
+
+
+def _image_url(element, base_url: str) -> Optional[str]:
+    for img in element.iter("img"):
+        for attr in _IMAGE_ATTRS:
+            src = (img.get(attr) or "").strip()
+            if src and not src.startswith("data:"):
+                return _absolute(src, base_url)
+    return None
+
+
+def _link_url(element, base_url: str) -> Optional[str]:
+    links = [element] if element.tag == "a" else []
+    links.extend(element.iter("a"))
+    for a in links:
+        href = (a.get("href") or "").strip()
+        if href and not href.startswith(("#", "javascript:", "mailto:", "tel:")):
+            return _absolute(href, base_url)
+    return None
+
+
+# ==================== Cards ====================
+
+def _key(element) -> str:
+    classes = (element.get("class") or "").split()
+    return f"{element.tag}.{classes[0]}" if classes else element.tag
+
+
+def _tag_paths(element, depth: int = 4) -> frozenset:
+    """Caminhos de tags (com a 1ª classe) da subárvore, até `depth` níveis."""
+    paths = set()
+    stack = [(element, "")]
+    while stack:
+        node, prefix = stack.pop()
+        for child in node:
+            if not isinstance(child.tag, str):
+                continue
+            path = f"{prefix}/{_key(child)}"
+            paths.add(path)
+            if path.count("/") < depth:
+                stack.append((child, path))
+    return frozenset(paths)
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _similar_members(members: List[Tuple[object, str]]) -> List[Tuple[object, str]]:
+    """Mantém os elementos estruturalmente parecidos com o mais típico do grupo."""
+    paths = [_tag_paths(element) for element, _ in members]
+    # Referência: o que tem mais caminhos em comum com os demais (amostra)
+    sample = paths[:30]
+    reference = max(range(len(sample)), key=lambda i: sum(_jaccard(sample[i], p) for p in sample))
+    return [m for m, p in zip(members, paths) if _jaccard(paths[reference], p) >= MIN_SIMILARITY]
+
+
+def _outermost(members: List[Tuple[object, str]]) -> List[Tuple[object, str]]:
+    """Remove membros aninhados dentro de outros membros do mesmo grupo."""
+    elements = {element for element, _ in members}
+    result = []
+    for element, text in members:
+        parent = element.getparent()
+        while parent is not None and parent not in elements:
+            parent = parent.getparent()
+        if parent is None:
+            result.append((element, text))
+    return result
+
+
+def find_cards(root) -> Tuple[Optional[str], List]:
+    """Elementos que formam os cards da listagem e a chave (tag.classe) do grupo."""
+    groups: Dict[str, List[Tuple[object, str]]] = defaultdict(list)
+    body = root.find("body")
+    for element in (body if body is not None else root).iter():
+        if not isinstance(element.tag, str) or element.tag in ("body", "html"):
+            continue
+        text = _text(element)
+        if not MIN_CARD_CHARS <= len(text) <= MAX_CARD_CHARS:
+            continue
+        if element.tag != "a" and element.find(".//a") is None and element.find(".//img") is None:
+            continue
+        groups[_key(element)].append((element, text))
+
+    best_key, best_members, best_score = None, [], 0.0
+    for key, members in groups.items():
+        if len(members) < MIN_CARDS:
+            continue
+        members = _outermost(_similar_members(members))
+        # Carrosséis repetem o mesmo card
+        unique = list({text: (element, text) for element, text in members}.values())
+        if len(unique) < MIN_CARDS:
+            continue
+        priced = sum(1 for _, text in unique if _PRICE.search(text))
+        # Texto total coberto, favorecendo grupos em que os cards têm preço
+        score = sum(len(text) for _, text in unique) * (0.25 + priced / len(unique))
+        if score > best_score:
+            best_key, best_members, best_score = key, unique, score
+    return best_key, [element for element, _ in best_members]
+
+
+def compact_card(element, base_url: str = "") -> str:
+    """Card em uma linha: textos separados por ' | ', link e imagem."""
+    parts = []
+    for fragment in element.itertext():
+        fragment = _WHITESPACE.sub(" ", fragment).strip()
+        if fragment and (not parts or parts[-1] != fragment):
+            parts.append(fragment)
+    line = " | ".join(parts)
+    link = _link_url(element, base_url)
+    if link:
+        line += f" | link: {link}"
+    image = _image_url(element, base_url)
+    if image:
+        line += f" | imagem: {image}"
+    return line
+
+
+def compact_text(root, base_url: str = "") -> str:
+    """Texto da página limpa, uma linha por bloco, com os links entre <>."""
+    for a in root.iter("a"):
+        href = (a.get("href") or "").strip()
+        if href and not href.startswith(("#", "javascript:")) and _text(a):
+            a.tail = f" <{_absolute(href, base_url)}> " + (a.tail or "")
+    lines = []
+    for fragment in root.itertext():
+        fragment = _WHITESPACE.sub(" ", fragment).strip()
+        if fragment:
+            lines.append(fragment)
+    return "\n".join(lines)
+
+
+def slice_html(html: str, base_url: str = "") -> SlicedPage:
+    """Limpa o HTML e extrai os cards compactados (ou o texto, se não houver cards)."""
+    page = SlicedPage(original_chars=len(html))
+    root = _parse(html) if html else None
+    if root is None:
+        page.text = html or ""
+        return page
+    _clean(root)
+    key, cards = find_cards(root)
+    if cards:
+        page.selector = key
+        page.cards = [compact_card(card, base_url) for card in cards]
+    else:
+        page.text = compact_text(root, base_url)
+    return page
+
+
+def page_text(html: str, base_url: str = "", max_tokens: Optional[int] = None) -> str:
+    """Texto limpo da página inteira, sem detecção de cards (páginas de detalhe)."""
+    root = _parse(html) if html else None
+    if root is None:
+        text = html or ""
+    else:
+        _clean(root)
+        text = compact_text(root, base_url)
+    return truncate_to_tokens(text, max_tokens) if max_tokens else text
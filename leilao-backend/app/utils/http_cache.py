@@ -0,0 +1,448 @@
+"""
+Cache HTTP em disco com GET condicional para páginas de listagem e detalhe.
+
+A maioria das listagens não muda entre as execuções de 6 em 6 horas, mas
+cada execução baixava (e extraía) tudo de novo. Com o cache:
+
+    response = await cached_get(url, headers=..., timeout=30.0, follow_redirects=True)
+    if response.unchanged:
+        items = get_http_cache().get_derived(url, response.content_hash)
+
+- o corpo de cada resposta 200 é guardado comprimido (zstd quando o pacote
+  `zstandard` está instalado, zlib caso contrário) junto com ETag,
+  Last-Modified e o sha256 do conteúdo;
+- na próxima busca o request leva If-None-Match / If-Modified-Since; um 304
+  devolve o corpo do disco com `unchanged=True`. Servidores sem
+  validadores que devolvem 200 com o mesmo hash também contam como
+  `unchanged`;
+- quem extrai dados da página pode guardar o resultado com set_derived()
+  e reaproveitá-lo enquanto o conteúdo não mudar, pulando a extração;
+- o cache sempre revalida com a origem (nunca serve sem perguntar), então
+  Cache-Control/Expires não são considerados;
+- a chave é a URL mais os headers do request que mudam o formato da
+  resposta (VARY_HEADERS): o Jina Reader devolve texto ou HTML para a
+  mesma URL conforme Accept / X-Return-Format;
+- despejo por idade (HTTP_CACHE_MAX_AGE, desde a última validação) e por
+  tamanho total (HTTP_CACHE_MAX_BYTES, removendo os menos usados).
+
+Funciona com o cliente compartilhado (cached_get, async) e com
+requests.Session (cached_get_sync, scrapers síncronos como o Superbid).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", "/tmp/http_cache")
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+HTTP_CACHE_MAX_AGE = float(os.getenv("HTTP_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+
+# Ao estourar o limite, despeja até ficar abaixo desta fração dele
+_EVICT_TARGET = 0.9
+
+# Headers do request que entram na chave (mudam o corpo para a mesma URL)
+VARY_HEADERS = ("accept", "accept-language", "x-return-format")
+
+
+def _compress(body: bytes) -> Tuple[str, bytes]:
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=3).compress(body)
+    return "zlib", zlib.compress(body, 6)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("entrada zstd no cache, mas o pacote zstandard não está instalado")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+@dataclass
+class CacheEntry:
+    """Metadados de uma URL em cache (o corpo fica em <key>.body)."""
+    key: str
+    url: str
+    final_url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_type: Optional[str]
+    encoding: Optional[str]
+    content_hash: str
+    codec: str
+    size: int
+    stored_at: float
+    validated_at: float
+    derived: Optional[Dict[str, Any]] = None
+
+    def validators(self) -> Dict[str, str]:
+        """Headers do GET condicional."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CachedResponse:
+    """Resposta servida pelo cache (200 da origem ou 304 revalidado)."""
+    status_code: int
+    content: bytes
+    url: str
+    encoding: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    content_hash: Optional[str] = None
+    # Conteúdo igual ao da última busca (304 ou 200 com o mesmo hash)
+    unchanged: bool = False
+    # A origem respondeu 304 e o corpo veio do disco
+    revalidated: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class HttpCache:
+    """Armazena corpos comprimidos + validadores por URL, com despejo por idade e tamanho."""
+
+    def __init__(
+        self,
+        directory: str = HTTP_CACHE_DIR,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+        max_age: float = HTTP_CACHE_MAX_AGE,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        # key -> (bytes em disco, último uso); carregado do diretório no 1º uso
+        self._index: Optional[Dict[str, Tuple[int, float]]] = None
+        self._total = 0
+        self.stats = {"requests": 0, "revalidated": 0, "unchanged": 0, "changed": 0,
+                      "stored": 0, "evicted": 0, "expired": 0, "errors": 0}
+
+    # ---- arquivos ----
+
+    @staticmethod
+    def key_for(url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """Chave da URL; sem VARY_HEADERS no request é o sha256 da URL."""
+        vary = {k.lower(): str(v) for k, v in (headers or {}).items() if k.lower() in VARY_HEADERS}
+        if vary:
+            url += "\n" + "\n".join(f"{name}: {vary[name]}" for name in sorted(vary))
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.{suffix}")
+
+    def _load_index(self) -> Dict[str, Tuple[int, float]]:
+        if self._index is not None:
+            return self._index
+        index = {}
+        if os.path.isdir(self.directory):
+            for sub in os.scandir(self.directory):
+                if not sub.is_dir():
+                    continue
+                for f in os.scandir(sub.path):
+                    if f.name.endswith(".body"):
+                        st = f.stat()
+                        index[f.name[:-5]] = (st.st_size, st.st_mtime)
+        self._index = index
+        self._total = sum(size for size, _ in index.values())
+        return index
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _remove(self, key: str) -> None:
+        for suffix in ("body", "json"):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+        size, _ = self._index.pop(key, (0, 0.0))
+        self._total -= size
+
+    def _write_meta(self, entry: CacheEntry) -> None:
+        self._write_atomic(self._path(entry.key, "json"), json.dumps(entry.__dict__).encode("utf-8"))
+
+    # ---- API ----
+
+    def lookup(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[CacheEntry]:
+        """Entrada válida para `url` + headers do request, ou None (ausente, expirada ou corrompida)."""
+        key = self.key_for(url, headers)
+        with self._lock:
+            index = self._load_index()
+            if key not in index:
+                return None
+            try:
+                with open(self._path(key, "json"), "rb") as f:
+                    entry = CacheEntry(**json.loads(f.read()))
+            except (OSError, ValueError, TypeError):
+                self._remove(key)
+                return None
+            if time.time() - entry.validated_at > self.max_age:
+                self.stats["expired"] += 1
+                self._remove(key)
+                return None
+            return entry
+
+    def read_body(self, entry: CacheEntry) -> Optional[bytes]:
+        try:
+            with open(self._path(entry.key, "body"), "rb") as f:
+                return _decompress(entry.codec, f.read())
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"Corpo em cache ilegível para {entry.url}: {e}")
+            with self._lock:
+                self.stats["errors"] += 1
+                self._load_index()
+                self._remove(entry.key)
+            return None
+
+    def store(self, url: str, final_url: str, headers: Dict[str, str], body: bytes,
+              encoding: Optional[str], previous: Optional[CacheEntry] = None,
+              request_headers: Optional[Dict[str, str]] = None) -> CacheEntry:
+        """Grava uma resposta 200. Reaproveita o corpo em disco se o hash não mudou."""
+        content_hash = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        key = self.key_for(url, request_headers)
+        with self._lock:
+            # O corpo antigo pode ter sido despejado desde o lookup
+            same = previous is not None and previous.content_hash == content_hash and key in self._load_index()
+        codec, data = (previous.codec, None) if same else _compress(body)
+
+        entry = CacheEntry(
+            key=key,
+            url=url,
+            final_url=final_url,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            content_type=headers.get("content-type"),
+            encoding=encoding,
+            content_hash=content_hash,
+            codec=codec,
+            size=len(body),
+            stored_at=previous.stored_at if same else now,
+            validated_at=now,
+            derived=previous.derived if same else None,
+        )
+        with self._lock:
+            index = self._load_index()
+            if data is not None:
+                self._write_atomic(self._path(key, "body"), data)
+                old_size, _ = index.get(key, (0, 0.0))
+                index[key] = (len(data), now)
+                self._total += len(data) - old_size
+                self.stats["stored"] += 1
+            elif key in index:
+                index[key] = (index[key][0], now)
+            self._write_meta(entry)
+            if self._total > self.max_bytes:
+                self._evict()
+        return entry
+
+    def touch(self, entry: CacheEntry, headers: Dict[str, str]) -> None:
+        """Registra um 304: atualiza validação e validadores novos, se vierem."""
+        entry.validated_at = time.time()
+        entry.etag = headers.get("etag") or entry.etag
+        entry.last_modified = headers.get("last-modified") or entry.last_modified
+        with self._lock:
+            index = self._load_index()
+            if entry.key in index:
+                index[entry.key] = (index[entry.key][0], entry.validated_at)
+            self._write_meta(entry)
+
+    def get_derived(self, url: str, content_hash: Optional[str], name: str = "items",
+                    headers: Optional[Dict[str, str]] = None) -> Optional[Any]:
+        """Resultado guardado por set_derived, se foi calculado sobre este conteúdo."""
+        entry = self.lookup(url, headers)
+        if entry is None or not entry.derived or entry.content_hash != content_hash:
+            return None
+        return entry.derived.get(name)
+
+    def set_derived(self, url: str, content_hash: Optional[str], value: Any, name: str = "items",
+                    headers: Optional[Dict[str, str]] = None) -> None:
+        """Associa um resultado derivado (ex.: imóveis extraídos) ao conteúdo em cache."""
+        entry = self.lookup(url, headers)
+        if entry is None or entry.content_hash != content_hash:
+            return
+        entry.derived = dict(entry.derived or {}, **{name: value})
+        try:
+            with self._lock:
+                self._write_meta(entry)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Resultado derivado não serializável para {url}: {e}")
+
+    def _evict(self) -> None:
+        """Remove as entradas menos usadas até ficar abaixo do alvo (com o lock)."""
+        target = self.max_bytes * _EVICT_TARGET
+        for key, _ in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total <= target:
+                break
+            self._remove(key)
+            self.stats["evicted"] += 1
+
+    def prune(self) -> int:
+        """Remove entradas expiradas e aplica o limite de tamanho. Retorna quantas saíram."""
+        removed = 0
+        cutoff = time.time() - self.max_age
+        with self._lock:
+            for key, (_, last_used) in list(self._load_index().items()):
+                if last_used < cutoff:
+                    self._remove(key)
+                    removed += 1
+            self.stats["expired"] += removed
+            before = self.stats["evicted"]
+            if self._total > self.max_bytes:
+                self._evict()
+            return removed + self.stats["evicted"] - before
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._load_index()):
+                self._remove(key)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            index = self._load_index()
+            requests = self.stats["requests"]
+            return {
+                **self.stats,
+                "unchanged_rate": round(self.stats["unchanged"] / requests, 3) if requests else 0.0,
+                "entries": len(index),
+                "bytes_on_disk": self._total,
+                "max_bytes": self.max_bytes,
+                "max_age_seconds": self.max_age,
+                "codec": "zstd" if zstandard is not None else "zlib",
+                "directory": self.directory,
+            }
+
+    # ---- resultado de uma busca ----
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _response_from_entry(self, entry: CacheEntry, headers: Dict[str, str]) -> Optional[CachedResponse]:
+        body = self.read_body(entry)
+        if body is None:
+            return None
+        self.touch(entry, headers)
+        self._count("revalidated")
+        self._count("unchanged")
+        return CachedResponse(
+            status_code=200, content=body, url=entry.final_url, encoding=entry.encoding,
+            headers={"content-type": entry.content_type or ""}, content_hash=entry.content_hash,
+            unchanged=True, revalidated=True,
+        )
+
+    def _response_from_origin(self, url: str, previous: Optional[CacheEntry], status: int,
+                              final_url: str, headers: Dict[str, str], body: bytes,
+                              encoding: Optional[str],
+                              request_headers: Optional[Dict[str, str]] = None) -> CachedResponse:
+        response = CachedResponse(status_code=status, content=body, url=final_url,
+                                  encoding=encoding, headers=headers)
+        if status != 200:
+            return response
+        entry = self.store(url, final_url, headers, body, encoding, previous, request_headers)
+        response.content_hash = entry.content_hash
+        response.unchanged = previous is not None and previous.content_hash == entry.content_hash
+        self._count("unchanged" if response.unchanged else "changed")
+        return response
+
+
+# Instância global
+_http_cache: Optional[HttpCache] = None
+
+
+def get_http_cache() -> HttpCache:
+    """Obtém a instância global do cache HTTP."""
+    global _http_cache
+    if _http_cache is None:
+        _http_cache = HttpCache()
+    return _http_cache
+
+
+async def cached_get(url: str, headers: Optional[Dict[str, str]] = None, verify: bool = True,
+                     scope: str = "http_cache", **kwargs) -> CachedResponse:
+    """
+    GET condicional pelo cliente compartilhado (`scope` escolhe o cookie jar).
+
+    `kwargs` vão para httpx (timeout, follow_redirects, params...). Erros de
+    rede propagam como no client.get.
+    """
+    from app.utils.http_client import get_http_client
+
+    client = get_http_client(verify=verify, scope=scope)
+    if not HTTP_CACHE_ENABLED:
+        r = await client.get(url, headers=headers, **kwargs)
+        return CachedResponse(r.status_code, r.content, str(r.url), r.encoding, dict(r.headers))
+
+    cache = get_http_cache()
+    cache._count("requests")
+    previous = await asyncio.to_thread(cache.lookup, url, headers)
+    request_headers = dict(headers or {})
+    if previous is not None:
+        request_headers.update(previous.validators())
+
+    r = await client.get(url, headers=request_headers, **kwargs)
+    if r.status_code == 304 and previous is not None:
+        cached = await asyncio.to_thread(cache._response_from_entry, previous, r.headers)
+        if cached is not None:
+            return cached
+        # Corpo sumiu do disco: busca de novo sem validadores
+        r = await client.get(url, headers=headers, **kwargs)
+        previous = None
+    return await asyncio.to_thread(
+        cache._response_from_origin, url, previous, r.status_code, str(r.url),
+        dict(r.headers), r.content, r.encoding, headers,
+    )
+
+
+def cached_get_sync(session, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> CachedResponse:
+    """GET condicional por um requests.Session (scrapers síncronos)."""
+    if not HTTP_CACHE_ENABLED:
+        r = session.get(url, headers=headers, **kwargs)
+        return CachedResponse(r.status_code, r.content, r.url, r.encoding, dict(r.headers))
+
+    cache = get_http_cache()
+    cache._count("requests")
+    previous = cache.lookup(url, headers)
+    request_headers = dict(headers or {})
+    if previous is not None:
+        request_headers.update(previous.validators())
+
+    r = session.get(url, headers=request_headers, **kwargs)
+    if r.status_code == 304 and previous is not None:
+        cached = cache._response_from_entry(previous, {k.lower(): v for k, v in r.headers.items()})
+        if cached is not None:
+            return cached
+        r = session.get(url, headers=headers, **kwargs)
+        previous = None
+    return cache._response_from_origin(
+        url, previous, r.status_code, r.url,
+        {k.lower(): v for k, v in r.headers.items()}, r.content, r.encoding, headers,
+    )
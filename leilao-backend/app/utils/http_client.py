@@ -0,0 +1,370 @@
+"""
+Registro de clientes HTTP compartilhados (httpx.AsyncClient).
+
+Antes cada fetcher abria um `httpx.AsyncClient` por request: nova conexão
+TCP, novo handshake TLS e nova resolução DNS a cada página. Agora:
+
+    client = get_http_client(scope="fetcher")
+    response = await client.get(url, headers=..., timeout=30.0, follow_redirects=True)
+
+- um pool de conexões (transport) por event loop e configuração (verify,
+  http2), reaproveitando conexões e sessões TLS entre todos os fetchers.
+  Conexões do httpx pertencem ao loop que as abriu, então threads com
+  `asyncio.run` próprio (scheduler, warm-up) recebem um pool separado;
+- sobre esse pool, um cliente por `scope` (fetcher, asaas, geocoding...):
+  cada scope tem o próprio cookie jar, então cookies de um site ou de uma
+  API não vazam para os requests de outro componente;
+- HTTP/1.1 por padrão, como os clientes anteriores; HTTP/2 quando pedido
+  (http2=True, ex.: camada 2 do MultiLayerFetcher) ou com HTTP_HTTP2=true,
+  se o pacote `h2` estiver instalado;
+- limites configuráveis: HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE,
+  HTTP_KEEPALIVE_EXPIRY e HTTP_MAX_PER_HOST (requests simultâneos por host);
+- cache de DNS com TTL (HTTP_DNS_TTL), compartilhado entre os loops;
+- contagem por host de requests, erros, bytes e latência, exposta em
+  get_stats() e nas métricas http_client_* do /metrics.
+
+Timeout, headers e follow_redirects continuam sendo passados por request;
+sem timeout explícito vale HTTP_DEFAULT_TIMEOUT (5 s, o padrão do httpx).
+Não feche o cliente retornado (`async with` / `aclose`): ele é do processo;
+o shutdown da aplicação chama `get_http_clients().aclose()`.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from app.services.metrics import get_metrics_registry
+
+logger = logging.getLogger(__name__)
+
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_MAX_PER_HOST = int(os.getenv("HTTP_MAX_PER_HOST", "10"))
+HTTP_DNS_TTL = float(os.getenv("HTTP_DNS_TTL", "300"))
+HTTP_DEFAULT_TIMEOUT = float(os.getenv("HTTP_DEFAULT_TIMEOUT", "5"))
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+HTTP_HTTP2 = os.getenv("HTTP_HTTP2", "false").lower() == "true" and HTTP2_AVAILABLE
+
+_metrics = get_metrics_registry()
+HTTP_CLIENT_REQUESTS = _metrics.counter(
+    "http_client_requests_total", "Requests de saída por host e status", ("host", "status")
+)
+HTTP_CLIENT_LATENCY = _metrics.histogram(
+    "http_client_request_duration_seconds", "Tempo até os headers da resposta, por host", ("host",)
+)
+HTTP_CLIENT_BYTES = _metrics.counter(
+    "http_client_response_bytes_total", "Bytes do corpo recebidos (antes da descompressão) por host", ("host",)
+)
+
+
+# ==================== DNS ====================
+
+class DNSCache:
+    """Resultados de getaddrinfo por (host, porta), válidos por `ttl` segundos."""
+
+    def __init__(self, ttl: float = HTTP_DNS_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        key = (host, port)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    def invalidate(self, host: str, port: int) -> None:
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _CachingNetworkBackend:
+    """
+    Envolve o network backend do httpcore resolvendo o host pelo DNSCache.
+
+    Só o connect_tcp muda: o SNI e a validação do certificado continuam
+    usando o nome do host (o httpcore passa server_hostname no start_tls).
+    """
+
+    def __init__(self, backend, dns: DNSCache):
+        self._backend = backend
+        self._dns = dns
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        try:
+            addresses = await self._dns.resolve(host, port)
+        except OSError:
+            # Deixa o backend original produzir o erro de resolução de sempre
+            return await self._backend.connect_tcp(host, port, timeout, local_address, socket_options)
+
+        last_error = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(address, port, timeout, local_address, socket_options)
+            except Exception as e:
+                last_error = e
+        self._dns.invalidate(host, port)
+        raise last_error
+
+    def __getattr__(self, name):
+        return getattr(self._backend, name)
+
+
+# ==================== Estatísticas ====================
+
+class HostStats:
+    """Contadores de um host."""
+
+    __slots__ = ("requests", "errors", "bytes", "latency_total", "latency_max", "statuses")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.statuses: Dict[str, int] = {}
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "avg_latency_ms": round(self.latency_total / self.requests * 1000, 1) if self.requests else 0.0,
+            "max_latency_ms": round(self.latency_max * 1000, 1),
+            "statuses": dict(self.statuses),
+        }
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """Corpo da resposta que conta bytes e libera o slot do host ao fechar."""
+
+    def __init__(self, stream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+        self._bytes = 0
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._bytes += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close(self._bytes)
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Transport com limite de requests simultâneos por host e medição."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, registry: "HttpClientRegistry", per_host: int):
+        self._transport = transport
+        self._registry = registry
+        self._per_host = max(1, per_host)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        sem = self._hosts.get(host)
+        if sem is None:
+            sem = self._hosts[host] = asyncio.Semaphore(self._per_host)
+
+        await sem.acquire()
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            sem.release()
+            self._registry._record(host, None, time.perf_counter() - start)
+            raise
+        self._registry._record(host, response.status_code, time.perf_counter() - start)
+
+        def on_close(nbytes: int) -> None:
+            sem.release()
+            self._registry._record_bytes(host, nbytes)
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountingStream(response.stream, on_close),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# ==================== Registro ====================
+
+class HttpClientRegistry:
+    """Pools httpx compartilhados por event loop, um cliente por scope, com estatísticas por host."""
+
+    def __init__(
+        self,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive: int = HTTP_MAX_KEEPALIVE,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+        per_host: int = HTTP_MAX_PER_HOST,
+        http2: bool = HTTP_HTTP2,
+        dns_ttl: float = HTTP_DNS_TTL,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.per_host = per_host
+        self.http2 = http2
+        self.dns = DNSCache(dns_ttl)
+        self._transports: Dict[Tuple[int, bool, bool], Tuple[asyncio.AbstractEventLoop, _InstrumentedTransport]] = {}
+        self._clients: Dict[Tuple[int, bool, bool, str], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._hosts: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    def client(self, verify: bool = True, http2: Optional[bool] = None, scope: str = "default") -> httpx.AsyncClient:
+        """
+        Cliente do loop atual para `scope` (deve ser chamado dentro do loop).
+
+        Clientes do mesmo loop e configuração dividem o pool de conexões;
+        cookies ficam no cliente, separados por scope.
+        """
+        loop = asyncio.get_running_loop()
+        http2 = self.http2 if http2 is None else (http2 and HTTP2_AVAILABLE)
+        key = (id(loop), verify, http2, scope)
+
+        entry = self._clients.get(key)
+        if entry is not None and entry[0] is loop and not entry[1].is_closed:
+            return entry[1]
+
+        with self._lock:
+            self._prune()
+            transport_key = key[:3]
+            shared = self._transports.get(transport_key)
+            if shared is None or shared[0] is not loop:
+                shared = self._transports[transport_key] = (loop, self._create_transport(verify, http2))
+            client = httpx.AsyncClient(transport=shared[1], timeout=HTTP_DEFAULT_TIMEOUT)
+            self._clients[key] = (loop, client)
+        return client
+
+    def _create_transport(self, verify: bool, http2: bool) -> "_InstrumentedTransport":
+        transport = httpx.AsyncHTTPTransport(verify=verify, http2=http2, limits=self.limits)
+        pool = getattr(transport, "_pool", None)
+        if pool is not None and hasattr(pool, "_network_backend"):
+            pool._network_backend = _CachingNetworkBackend(pool._network_backend, self.dns)
+        return _InstrumentedTransport(transport, self, self.per_host)
+
+    def _prune(self) -> None:
+        """Descarta clientes e pools de loops já encerrados (asyncio.run terminado)."""
+        for key, (loop, client) in list(self._clients.items()):
+            if loop.is_closed() or client.is_closed:
+                del self._clients[key]
+        for key, (loop, _) in list(self._transports.items()):
+            if loop.is_closed():
+                del self._transports[key]
+
+    async def aclose(self) -> None:
+        """Fecha os pools do loop atual (e seus clientes) e descarta os de loops encerrados."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            mine = [transport for owner, transport in self._transports.values() if owner is loop]
+            self._transports = {k: v for k, v in self._transports.items() if v[0] is not loop}
+            self._clients = {k: v for k, v in self._clients.items() if v[0] is not loop}
+            self._prune()
+        for transport in mine:
+            await transport.aclose()
+
+    # ---- estatísticas ----
+
+    def _host(self, host: str) -> HostStats:
+        stats = self._hosts.get(host)
+        if stats is None:
+            stats = self._hosts[host] = HostStats()
+        return stats
+
+    def _record(self, host: str, status: Optional[int], elapsed: float) -> None:
+        status_label = str(status) if status is not None else "error"
+        with self._lock:
+            stats = self._host(host)
+            stats.requests += 1
+            stats.latency_total += elapsed
+            stats.latency_max = max(stats.latency_max, elapsed)
+            stats.statuses[status_label] = stats.statuses.get(status_label, 0) + 1
+            if status is None or status >= 500:
+                stats.errors += 1
+        HTTP_CLIENT_REQUESTS.labels(host, status_label).inc()
+        HTTP_CLIENT_LATENCY.labels(host).observe(elapsed)
+
+    def _record_bytes(self, host: str, nbytes: int) -> None:
+        with self._lock:
+            self._host(host).bytes += nbytes
+        HTTP_CLIENT_BYTES.labels(host).inc(nbytes)
+
+    def get_stats(self, limit: int = 50) -> dict:
+        """Configuração, clientes abertos e os hosts com mais requests."""
+        with self._lock:
+            hosts = sorted(self._hosts.items(), key=lambda item: item[1].requests, reverse=True)[:limit]
+            return {
+                "http2": self.http2,
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "max_per_host": self.per_host,
+                "open_clients": sum(1 for loop, client in self._clients.values() if not loop.is_closed()),
+                "open_pools": sum(1 for loop, _ in self._transports.values() if not loop.is_closed()),
+                "scopes": sorted({key[3] for key in self._clients}),
+                "dns_cache": {"hits": self.dns.hits, "misses": self.dns.misses, "ttl": self.dns.ttl},
+                "hosts": {host: stats.to_dict() for host, stats in hosts},
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+            self.dns.hits = self.dns.misses = 0
+
+
+# Instância global
+_http_clients: Optional[HttpClientRegistry] = None
+
+
+def get_http_clients() -> HttpClientRegistry:
+    """Obtém a instância global do registro de clientes HTTP."""
+    global _http_clients
+    if _http_clients is None:
+        _http_clients = HttpClientRegistry()
+    return _http_clients
+
+
+def get_http_client(verify: bool = True, http2: Optional[bool] = None, scope: str = "default") -> httpx.AsyncClient:
+    """Atalho: cliente do loop atual para `scope` (cookie jar próprio, pool compartilhado)."""
+    return get_http_clients().client(verify=verify, http2=http2, scope=scope)
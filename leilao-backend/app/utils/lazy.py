@@ -0,0 +1,105 @@
+"""
+Objetos e imports preguiçosos para cold start rápido.
+
+No fly.io a máquina escala a partir de zero: o primeiro request espera o
+import de app.main. Subsistemas pesados (scrapers, Gemini, APScheduler,
+Supabase, psycopg) ficam atrás de um LazyObject e só são importados /
+construídos no primeiro uso.
+
+    scraper_orchestrator = lazy_import("app.services.scraper_orchestrator", "scraper_orchestrator")
+    scraper_orchestrator.run_all(...)   # importa o módulo aqui
+
+O proxy encaminha atributos, chamadas, len/iter/bool e isinstance (via
+__class__), então os pontos de uso não mudam.
+"""
+
+import importlib
+import threading
+from typing import Any, Callable
+
+_UNSET = object()
+
+
+class LazyObject:
+    """Proxy que constrói o objeto real na primeira utilização (thread-safe)."""
+
+    __slots__ = ("_factory", "_name", "_target", "_lock")
+
+    def __init__(self, factory: Callable[[], Any], name: str = ""):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_name", name or getattr(factory, "__name__", "lazy"))
+        object.__setattr__(self, "_target", _UNSET)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def resolve(self) -> Any:
+        """Retorna o objeto real, construindo-o se necessário."""
+        target = object.__getattribute__(self, "_target")
+        if target is _UNSET:
+            with object.__getattribute__(self, "_lock"):
+                target = object.__getattribute__(self, "_target")
+                if target is _UNSET:
+                    target = object.__getattribute__(self, "_factory")()
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    @property
+    def is_loaded(self) -> bool:
+        return object.__getattribute__(self, "_target") is not _UNSET
+
+    # isinstance(proxy, Cls) consulta __class__
+    @property
+    def __class__(self):
+        return type(self.resolve())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __bool__(self) -> bool:
+        return bool(self.resolve())
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __contains__(self, item) -> bool:
+        return item in self.resolve()
+
+    def __getitem__(self, key):
+        return self.resolve()[key]
+
+    def __eq__(self, other) -> bool:
+        return self.resolve() == other
+
+    def __hash__(self) -> int:
+        return hash(self.resolve())
+
+    def __repr__(self) -> str:
+        if self.is_loaded:
+            return repr(self.resolve())
+        return f"<LazyObject {object.__getattribute__(self, '_name')} (not loaded)>"
+
+
+def lazy_import(module: str, attr: str = None) -> LazyObject:
+    """
+    Proxy para `module` (ou `module.attr`) importado no primeiro uso.
+
+    Args:
+        module: Caminho do módulo (ex.: "app.services.scraper_orchestrator")
+        attr: Atributo do módulo; None = o próprio módulo
+    """
+    def load():
+        mod = importlib.import_module(module)
+        return getattr(mod, attr) if attr else mod
+
+    return LazyObject(load, name=f"{module}.{attr}" if attr else module)
@@ -15,7 +15,8 @@ Funciona com:
 
 import re
 import asyncio
-from typing import List, Optional, Set, Callable, Awaitable, Dict, Any
+import inspect
+from typing import List, Optional, Set, Callable, Awaitable, Dict, Any, Union
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
 from dataclasses import dataclass
 import logging
@@ -83,7 +84,7 @@ class GenericPaginator:
     def __init__(
         self,
         fetch_func: Callable[[str], Awaitable[str]],
-        extract_func: Callable[[str, str], List[Dict[str, Any]]],
+        extract_func: Callable[[str, str], Union[List[Dict[str, Any]], Awaitable[List[Dict[str, Any]]]]],
         max_pages: int = 50,
         delay: float = 1.0,
         max_empty_pages: int = 2
@@ -91,7 +92,7 @@ class GenericPaginator:
         """
         Args:
             fetch_func: Função assíncrona que busca HTML de uma URL
-            extract_func: Função que extrai itens do HTML (html, url) -> list
+            extract_func: Função (sync ou async) que extrai itens do HTML (html, url) -> list
             max_pages: Número máximo de páginas a processar
             delay: Delay entre requisições em segundos
             max_empty_pages: Número de páginas vazias antes de parar
@@ -146,6 +147,8 @@ class GenericPaginator:
                 
                 # Extrai itens
                 items = self.extract_func(html, current_url)
+                if inspect.isawaitable(items):
+                    items = await items
                 
                 if not items:
                     empty_pages_count += 1
@@ -421,7 +424,7 @@ class GenericPaginator:
 async def paginate_and_extract(
     start_url: str,
     fetch_func: Callable[[str], Awaitable[str]],
-    extract_func: Callable[[str, str], List[Dict[str, Any]]],
+    extract_func: Callable[[str, str], Union[List[Dict[str, Any]], Awaitable[List[Dict[str, Any]]]]],
     max_pages: int = 50,
     delay: float = 1.0
 ) -> List[Dict[str, Any]]:
@@ -431,7 +434,7 @@ async def paginate_and_extract(
     Args:
         start_url: URL inicial para começar a paginação
         fetch_func: Função assíncrona (url) -> html
-        extract_func: Função (html, url) -> list de items
+        extract_func: Função (sync ou async) (html, url) -> list de items
         max_pages: Máximo de páginas a processar
         delay: Delay entre páginas em segundos
         
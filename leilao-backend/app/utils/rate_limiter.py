@@ -1,191 +1,519 @@
 """
-RateLimiter - Controle de taxa de requisições com backoff exponencial.
+RateLimiter - Controle de taxa de requisições adaptativo por domínio.
 
 Evita:
 1. Bloqueio por excesso de requisições
 2. Bans permanentes de IP
 3. Sobrecarga do servidor alvo
+
+Cada domínio tem um token bucket e slots de concorrência próprios:
+
+- acquire() reserva um token e um slot numa seção crítica curta e só então
+  dorme até o token valer; nenhum lock é mantido durante a espera, então um
+  domínio lento não segura os demais;
+- a taxa e o número de slots se ajustam por AIMD: sucessos com latência
+  abaixo de RATE_LIMIT_LATENCY_TARGET somam RATE_LIMIT_INCREASE e um slot;
+  latência alta, 429/503 ou Retry-After multiplicam por
+  RATE_LIMIT_DECREASE (cada ajuste no máximo uma vez por janela);
+- Retry-After adia os próximos tokens do domínio (acquire espera); erros
+  consecutivos continuam bloqueando o domínio com backoff exponencial
+  (acquire devolve False);
+- com RATE_LIMIT_DB, o estado fica num SQLite compartilhado: processos em
+  paralelo (workers, scripts) respeitam o mesmo orçamento por domínio. As
+  transações rodam numa thread dedicada, fora do event loop, em ordem.
+
+Uso:
+    lease = await limiter.acquire(url)
+    if lease:
+        response = await client.get(url)
+        limiter.record_success(url, lease=lease)   # ou record_error(url, status_code=429, lease=lease)
+    # fetch cancelado: limiter.release(url, lease)
 """
 
 import asyncio
+import itertools
+import json
+import os
+import sqlite3
+import threading
 import time
-from typing import Dict, Optional
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
 import logging
 
 logger = logging.getLogger(__name__)
 
+RATE_LIMIT_MAX_RPS = float(os.getenv("RATE_LIMIT_MAX_RPS", "5.0"))
+RATE_LIMIT_MIN_RPS = float(os.getenv("RATE_LIMIT_MIN_RPS", "0.1"))
+RATE_LIMIT_MAX_CONCURRENCY = int(os.getenv("RATE_LIMIT_MAX_CONCURRENCY", "4"))
+RATE_LIMIT_LATENCY_TARGET = float(os.getenv("RATE_LIMIT_LATENCY_TARGET", "3.0"))
+RATE_LIMIT_INCREASE = float(os.getenv("RATE_LIMIT_INCREASE", "0.2"))
+RATE_LIMIT_DECREASE = float(os.getenv("RATE_LIMIT_DECREASE", "0.5"))
+# Vazio = estado em memória (só este processo)
+RATE_LIMIT_DB = os.getenv("RATE_LIMIT_DB", "")
+
+# Slot não devolvido (sem record_success/record_error) expira depois disso
+_LEASE_TIMEOUT = 120.0
+# Intervalo de nova tentativa quando todos os slots do domínio estão ocupados
+_SLOT_POLL = 0.05
+# Retry-After maior que isso bloqueia o domínio em vez de esperar
+_MAX_RETRY_WAIT = 60.0
+_THROTTLE_STATUS = (429, 503)
+
+
 @dataclass
 class DomainState:
     """Estado de rate limiting para um domínio específico."""
+    rate: float = 1.0                 # tokens por segundo
+    tokens: float = 1.0
+    refilled_at: float = 0.0
+    concurrency: float = 1.0          # slots (parte inteira)
+    leases: Dict[str, float] = field(default_factory=dict)  # lease -> expira em
+    retry_at: float = 0.0             # Retry-After: nenhum token antes disso
+    last_decrease: float = 0.0
+    last_increase: float = 0.0
+    latency_ewma: float = 0.0
     last_request_time: float = 0.0
     consecutive_errors: int = 0
     is_blocked: bool = False
     block_until: float = 0.0
     total_requests: int = 0
     total_errors: int = 0
+    total_throttled: int = 0
+
+
+class _MemoryStore:
+    """Estados por domínio em memória, protegidos por um lock curto."""
+
+    def __init__(self):
+        self._domains: Dict[str, DomainState] = {}
+        self._lock = threading.Lock()
+
+    def update(self, domain: str, factory: Callable[[], DomainState], fn: Callable[[DomainState], object]):
+        with self._lock:
+            state = self._domains.get(domain)
+            if state is None:
+                state = self._domains[domain] = factory()
+            return fn(state)
+
+    def items(self) -> Dict[str, DomainState]:
+        with self._lock:
+            return dict(self._domains)
+
+    def delete(self, domain: Optional[str] = None) -> None:
+        with self._lock:
+            if domain is None:
+                self._domains.clear()
+            else:
+                self._domains.pop(domain, None)
+
+
+class _SQLiteStore:
+    """Estados por domínio num SQLite compartilhado entre processos."""
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+        directory = os.path.dirname(db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rate_limits (
+                    domain TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_file, timeout=30.0, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def update(self, domain: str, factory: Callable[[], DomainState], fn: Callable[[DomainState], object]):
+        with self._connect() as conn:
+            # BEGIN IMMEDIATE: lê-modifica-grava atômico entre processos
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT state FROM rate_limits WHERE domain = ?", (domain,)).fetchone()
+                state = DomainState(**json.loads(row[0])) if row else factory()
+                result = fn(state)
+                conn.execute(
+                    "INSERT OR REPLACE INTO rate_limits (domain, state, updated_at) VALUES (?, ?, ?)",
+                    (domain, json.dumps(asdict(state)), time.time()),
+                )
+                conn.execute("COMMIT")
+                return result
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def items(self) -> Dict[str, DomainState]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT domain, state FROM rate_limits").fetchall()
+        return {domain: DomainState(**json.loads(state)) for domain, state in rows}
+
+    def delete(self, domain: Optional[str] = None) -> None:
+        with self._connect() as conn:
+            if domain is None:
+                conn.execute("DELETE FROM rate_limits")
+            else:
+                conn.execute("DELETE FROM rate_limits WHERE domain = ?", (domain,))
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Retry-After em segundos (aceita número ou data HTTP)."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
 
 class RateLimiter:
     """
-    Rate limiter com backoff exponencial por domínio.
+    Rate limiter adaptativo (token bucket + AIMD) com slots de concorrência
+    e backoff exponencial por domínio.
     """
-    
+
     def __init__(
         self,
         requests_per_second: float = 1.0,
         max_consecutive_errors: int = 3,
         base_backoff: float = 5.0,
         max_backoff: float = 300.0,  # 5 minutos máximo
+        max_requests_per_second: float = RATE_LIMIT_MAX_RPS,
+        min_requests_per_second: float = RATE_LIMIT_MIN_RPS,
+        max_concurrency: int = RATE_LIMIT_MAX_CONCURRENCY,
+        latency_target: float = RATE_LIMIT_LATENCY_TARGET,
+        db_file: Optional[str] = None,
     ):
         """
         Args:
-            requests_per_second: Máximo de requisições por segundo por domínio
+            requests_per_second: Taxa inicial por domínio
             max_consecutive_errors: Erros consecutivos antes de aplicar backoff
             base_backoff: Tempo base de backoff em segundos
             max_backoff: Tempo máximo de backoff em segundos
+            max_requests_per_second: Teto da taxa após os aumentos
+            min_requests_per_second: Piso da taxa após as reduções
+            max_concurrency: Teto de requisições simultâneas por domínio
+            latency_target: Latência (s) acima da qual a taxa é reduzida
+            db_file: SQLite compartilhado entre processos (None = RATE_LIMIT_DB)
         """
         self.requests_per_second = requests_per_second
-        self.min_interval = 1.0 / requests_per_second
         self.max_consecutive_errors = max_consecutive_errors
         self.base_backoff = base_backoff
         self.max_backoff = max_backoff
-        
-        self._domains: Dict[str, DomainState] = {}
-        self._lock = asyncio.Lock()
-    
+        self.max_rate = max(max_requests_per_second, requests_per_second)
+        self.min_rate = min(min_requests_per_second, requests_per_second)
+        self.max_concurrency = max(1, max_concurrency)
+        self.latency_target = latency_target
+
+        db_file = RATE_LIMIT_DB if db_file is None else db_file
+        self._store = _SQLiteStore(db_file) if db_file else _MemoryStore()
+        # SQLite: transações numa thread só (fora do event loop, na ordem das chamadas)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="rate-limiter") if db_file else None
+        )
+        # Slots deste processo (lease -> início), para medir a latência no record_*
+        self._pending: Dict[str, Dict[str, float]] = {}
+        self._lease_ids = itertools.count()
+
     def _get_domain(self, url: str) -> str:
         """Extrai o domínio de uma URL."""
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         return parsed.netloc.lower()
-    
-    def _get_state(self, domain: str) -> DomainState:
-        """Obtém ou cria o estado de um domínio."""
-        if domain not in self._domains:
-            self._domains[domain] = DomainState()
-        return self._domains[domain]
-    
-    async def acquire(self, url: str) -> bool:
-        """
-        Aguarda até que seja permitido fazer uma requisição.
-        
-        Returns:
-            True se pode prosseguir, False se o domínio está bloqueado
-        """
-        domain = self._get_domain(url)
-        
-        async with self._lock:
-            state = self._get_state(domain)
+
+    def _new_state(self) -> DomainState:
+        return DomainState(rate=self.requests_per_second, tokens=1.0, refilled_at=time.time())
+
+    def _update(self, domain: str, fn: Callable[[DomainState], object]):
+        return self._store.update(domain, self._new_state, fn)
+
+    async def _update_async(self, domain: str, fn: Callable[[DomainState], object]):
+        """_update sem bloquear o event loop (SQLite roda no executor)."""
+        if self._executor is None:
+            return self._update(domain, fn)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._update, domain, fn)
+
+    def _submit(self, domain: str, fn: Callable[[DomainState], object]) -> None:
+        """_update sem esperar o resultado: no event loop, o SQLite fica no executor."""
+        if self._executor is None:
+            self._update(domain, fn)
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._update(domain, fn)
+            return
+        def log_error(future):
+            if future.exception():
+                logger.warning(f"Rate limiter: falha ao gravar {domain}: {future.exception()}")
+        self._executor.submit(self._update, domain, fn).add_done_callback(log_error)
+
+    def _drop_lease(self, domain: str, lease: str) -> None:
+        """Devolve um slot sem registrar resultado (acquire cancelado)."""
+        self._pending.get(domain, {}).pop(lease, None)
+        self._submit(domain, lambda state: state.leases.pop(lease, None))
+
+    def _reserve_fn(self, domain: str, lease: str) -> Callable[[DomainState], Tuple[str, float]]:
+        """Seção crítica do acquire: ("blocked"|"busy"|"granted", espera)."""
+        def reserve(state: DomainState):
             now = time.time()
-            
+
             # Verifica se está bloqueado
             if state.is_blocked:
                 if now < state.block_until:
-                    remaining = state.block_until - now
-                    logger.warning(f"Domain {domain} is blocked for {remaining:.1f}s more")
-                    return False
-                else:
-                    # Desbloqueia
-                    state.is_blocked = False
-                    state.consecutive_errors = 0
-                    logger.info(f"Domain {domain} unblocked")
-            
-            # Calcula tempo de espera
-            time_since_last = now - state.last_request_time
-            wait_time = max(0, self.min_interval - time_since_last)
-            
-            if wait_time > 0:
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
-                await asyncio.sleep(wait_time)
-            
-            # Atualiza estado
-            state.last_request_time = time.time()
+                    return "blocked", state.block_until - now
+                # Desbloqueia
+                state.is_blocked = False
+                state.consecutive_errors = 0
+                logger.info(f"Domain {domain} unblocked")
+
+            # Slots expirados (quem pegou não chamou record_*)
+            for key, expires in list(state.leases.items()):
+                if expires < now:
+                    del state.leases[key]
+            if len(state.leases) >= int(state.concurrency):
+                return "busy", _SLOT_POLL
+
+            # Token bucket: o token pode ficar negativo = reserva no futuro
+            state.tokens = min(1.0, state.tokens + (now - state.refilled_at) * state.rate)
+            state.refilled_at = now
+            state.tokens -= 1.0
+            wait = max(0.0, -state.tokens / state.rate, state.retry_at - now)
+
+            state.leases[lease] = now + wait + _LEASE_TIMEOUT
+            state.last_request_time = now + wait
             state.total_requests += 1
-            
-            return True
-    
-    def record_success(self, url: str):
-        """Registra uma requisição bem-sucedida."""
+            return "granted", wait
+
+        return reserve
+
+    async def acquire(self, url: str) -> Optional[str]:
+        """
+        Aguarda até que seja permitido fazer uma requisição (token + slot).
+
+        Returns:
+            Id do slot (passar como lease= ao record_*), ou None se o domínio
+            está bloqueado
+        """
+        domain = self._get_domain(url)
+        lease = f"{os.getpid()}:{next(self._lease_ids)}"
+
+        while True:
+            reserving = asyncio.ensure_future(self._update_async(domain, self._reserve_fn(domain, lease)))
+            try:
+                status, wait = await asyncio.shield(reserving)
+            except asyncio.CancelledError:
+                # A transação segue no executor: devolve o slot se ela o concedeu
+                def release_if_granted(future):
+                    if not future.cancelled() and not future.exception() and future.result()[0] == "granted":
+                        self._drop_lease(domain, lease)
+                reserving.add_done_callback(release_if_granted)
+                raise
+            if status == "blocked":
+                logger.warning(f"Domain {domain} is blocked for {wait:.1f}s more")
+                return None
+            if status == "granted":
+                break
+            await asyncio.sleep(wait)
+
+        if wait > 0:
+            logger.debug(f"Rate limiting: waiting {wait:.2f}s for {domain}")
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._drop_lease(domain, lease)
+                raise
+        self._pending.setdefault(domain, {})[lease] = time.time()
+        return lease
+
+    def _release(self, domain: str, lease: Optional[str]) -> Tuple[Optional[str], Optional[float]]:
+        """Devolve o slot `lease` (sem lease: o mais antigo deste processo) e a latência medida."""
+        pending = self._pending.get(domain)
+        if not pending:
+            return lease, None
+        if lease is None:
+            lease = next(iter(pending))
+        started = pending.pop(lease, None)
+        return lease, None if started is None else time.time() - started
+
+    def release(self, url: str, lease: Optional[str]) -> None:
+        """Devolve o slot sem registrar sucesso nem erro (fetch cancelado)."""
+        if lease:
+            self._drop_lease(self._get_domain(url), lease)
+
+    @staticmethod
+    def _window(state: DomainState) -> float:
+        """Janela do AIMD: a latência média (no mínimo 1s)."""
+        return max(state.latency_ewma, 1.0)
+
+    def _decrease(self, state: DomainState, now: float, factor: float = RATE_LIMIT_DECREASE) -> bool:
+        """Redução multiplicativa, no máximo uma vez por janela."""
+        if now - state.last_decrease < self._window(state):
+            return False
+        state.rate = max(self.min_rate, state.rate * factor)
+        state.concurrency = max(1.0, state.concurrency * factor)
+        state.tokens = min(state.tokens, 0.0)
+        state.last_decrease = now
+        return True
+
+    def _increase(self, state: DomainState, now: float) -> bool:
+        """Aumento aditivo, no máximo uma vez por janela (e nunca logo após uma redução)."""
+        if now - max(state.last_increase, state.last_decrease) < self._window(state):
+            return False
+        state.rate = min(self.max_rate, state.rate + RATE_LIMIT_INCREASE)
+        state.concurrency = min(float(self.max_concurrency), state.concurrency + 1.0)
+        state.last_increase = now
+        return True
+
+    def record_success(self, url: str, latency: Optional[float] = None, lease: Optional[str] = None):
+        """
+        Registra uma requisição bem-sucedida.
+
+        Args:
+            url: URL buscada
+            latency: Latência em segundos (None = medida desde o acquire)
+            lease: Slot devolvido pelo acquire (None = o mais antigo deste processo)
+        """
         domain = self._get_domain(url)
-        state = self._get_state(domain)
-        state.consecutive_errors = 0
-    
-    def record_error(self, url: str, is_rate_limit: bool = False):
+        lease, measured = self._release(domain, lease)
+        latency = measured if latency is None else latency
+
+        def update(state: DomainState):
+            now = time.time()
+            state.leases.pop(lease, None)
+            state.consecutive_errors = 0
+            if latency is None:
+                return
+            state.latency_ewma = latency if not state.latency_ewma else 0.8 * state.latency_ewma + 0.2 * latency
+            if state.latency_ewma > self.latency_target:
+                if self._decrease(state, now):
+                    logger.info(f"Domain {domain}: latency {state.latency_ewma:.1f}s, rate -> {state.rate:.2f}/s")
+            else:
+                self._increase(state, now)
+
+        self._submit(domain, update)
+
+    def record_error(self, url: str, is_rate_limit: bool = False, status_code: Optional[int] = None,
+                     retry_after=None, lease: Optional[str] = None):
         """
         Registra um erro de requisição.
-        
+
         Args:
             url: URL que falhou
             is_rate_limit: True se o erro foi 429 (Too Many Requests)
+            status_code: Status HTTP (429/503 contam como rate limit)
+            retry_after: Valor do header Retry-After (segundos ou data HTTP)
+            lease: Slot devolvido pelo acquire (None = o mais antigo deste processo)
         """
         domain = self._get_domain(url)
-        state = self._get_state(domain)
-        
-        state.consecutive_errors += 1
-        state.total_errors += 1
-        
-        # Aplica backoff se excedeu limite de erros
-        if state.consecutive_errors >= self.max_consecutive_errors or is_rate_limit:
-            # Calcula tempo de backoff exponencial
-            backoff_multiplier = 2 ** (state.consecutive_errors - self.max_consecutive_errors)
-            backoff_time = min(
-                self.base_backoff * backoff_multiplier,
-                self.max_backoff
-            )
-            
-            if is_rate_limit:
-                # Rate limit é mais severo
-                backoff_time = min(backoff_time * 2, self.max_backoff)
-            
-            state.is_blocked = True
-            state.block_until = time.time() + backoff_time
-            
-            logger.warning(
-                f"Domain {domain} blocked for {backoff_time:.1f}s "
-                f"(consecutive errors: {state.consecutive_errors})"
-            )
-    
+        lease, _ = self._release(domain, lease)
+        is_rate_limit = is_rate_limit or status_code in _THROTTLE_STATUS
+        delay = parse_retry_after(retry_after)
+
+        def update(state: DomainState):
+            now = time.time()
+            state.leases.pop(lease, None)
+            state.consecutive_errors += 1
+            state.total_errors += 1
+
+            if is_rate_limit or delay is not None:
+                state.total_throttled += 1
+                self._decrease(state, now)
+                if delay is not None and delay <= _MAX_RETRY_WAIT:
+                    # Retry-After curto: segura os tokens e segue
+                    state.retry_at = max(state.retry_at, now + delay)
+                    logger.warning(f"Domain {domain}: Retry-After {delay:.0f}s, rate -> {state.rate:.2f}/s")
+                    return
+
+            # Aplica backoff se excedeu limite de erros
+            if state.consecutive_errors >= self.max_consecutive_errors or is_rate_limit:
+                # Calcula tempo de backoff exponencial
+                backoff_multiplier = 2 ** (state.consecutive_errors - self.max_consecutive_errors)
+                backoff_time = min(
+                    self.base_backoff * backoff_multiplier,
+                    self.max_backoff
+                )
+
+                if is_rate_limit:
+                    # Rate limit é mais severo
+                    backoff_time = min(max(backoff_time * 2, delay or 0.0), self.max_backoff)
+
+                state.is_blocked = True
+                state.block_until = now + backoff_time
+
+                logger.warning(
+                    f"Domain {domain} blocked for {backoff_time:.1f}s "
+                    f"(consecutive errors: {state.consecutive_errors})"
+                )
+
+        self._submit(domain, update)
+
+    def _state_stats(self, state: DomainState) -> Dict:
+        now = time.time()
+        return {
+            'total_requests': state.total_requests,
+            'total_errors': state.total_errors,
+            'throttled': state.total_throttled,
+            'error_rate': state.total_errors / max(1, state.total_requests),
+            'requests_per_second': round(state.rate, 3),
+            'concurrency': int(state.concurrency),
+            'in_flight': sum(1 for expires in state.leases.values() if expires >= now),
+            'latency_ms': round(state.latency_ewma * 1000),
+        }
+
     def get_stats(self, url: Optional[str] = None) -> Dict:
         """
         Retorna estatísticas de rate limiting.
-        
+
         Args:
             url: Se fornecido, retorna stats apenas para este domínio
         """
         if url:
             domain = self._get_domain(url)
-            state = self._get_state(domain)
+            state = self._update(domain, lambda state: DomainState(**asdict(state)))
             return {
                 'domain': domain,
-                'total_requests': state.total_requests,
-                'total_errors': state.total_errors,
                 'consecutive_errors': state.consecutive_errors,
-                'is_blocked': state.is_blocked,
-                'error_rate': state.total_errors / max(1, state.total_requests)
+                'is_blocked': state.is_blocked and state.block_until > time.time(),
+                **self._state_stats(state),
             }
-        
+
         return {
-            domain: {
-                'total_requests': state.total_requests,
-                'total_errors': state.total_errors,
-                'error_rate': state.total_errors / max(1, state.total_requests)
-            }
-            for domain, state in self._domains.items()
+            domain: self._state_stats(state)
+            for domain, state in self._store.items().items()
         }
-    
+
     def reset(self, url: Optional[str] = None):
         """
         Reseta o estado do rate limiter.
-        
+
         Args:
             url: Se fornecido, reseta apenas este domínio
         """
         if url:
             domain = self._get_domain(url)
-            if domain in self._domains:
-                del self._domains[domain]
+            self._store.delete(domain)
+            self._pending.pop(domain, None)
         else:
-            self._domains.clear()
+            self._store.delete()
+            self._pending.clear()
 
 
 # Instância global para uso compartilhado
@@ -205,31 +533,42 @@ async def rate_limited_fetch(
 ):
     """
     Wrapper para fetch com rate limiting.
-    
+
     Args:
         url: URL para buscar
         fetch_func: Função de fetch (síncrona ou assíncrona)
         rate_limiter: RateLimiter a usar (usa global se não fornecido)
     """
     limiter = rate_limiter or get_rate_limiter()
-    
+
     # Aguarda permissão
-    if not await limiter.acquire(url):
+    lease = await limiter.acquire(url)
+    if not lease:
         raise Exception(f"Domain temporarily blocked: {url}")
-    
+
     try:
         # Executa fetch
         if asyncio.iscoroutinefunction(fetch_func):
             result = await fetch_func(url)
         else:
             result = fetch_func(url)
-        
-        limiter.record_success(url)
-        return result
-        
     except Exception as e:
-        # Detecta se é rate limit (HTTP 429)
+        # Detecta se é rate limit (HTTP 429) e o Retry-After da resposta
+        response = getattr(e, 'response', None)
+        status_code = getattr(response, 'status_code', None)
+        retry_after = response.headers.get('Retry-After') if response is not None and hasattr(response, 'headers') else None
         is_rate_limit = '429' in str(e) or 'Too Many Requests' in str(e)
-        limiter.record_error(url, is_rate_limit)
+        limiter.record_error(url, is_rate_limit, status_code=status_code, retry_after=retry_after, lease=lease)
+        raise
+    except BaseException:
+        # Cancelado (wait_for, gather): só devolve o slot
+        limiter.release(url, lease)
         raise
 
+    # Respostas HTTP (httpx/requests) com 429/503 também reduzem a taxa
+    status_code = getattr(result, 'status_code', None)
+    if status_code in _THROTTLE_STATUS:
+        limiter.record_error(url, status_code=status_code, retry_after=result.headers.get('Retry-After'), lease=lease)
+    else:
+        limiter.record_success(url, lease=lease)
+    return result
@@ -9,7 +9,6 @@ Execução: python -m app.utils.tier1_config_generator
 """
 
 import asyncio
-import httpx
 import json
 import os
 import re
@@ -19,6 +18,8 @@ from typing import Dict, List, Optional, Any
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 
+from app.utils.http_client import get_http_client
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -61,40 +62,36 @@ class Tier1ConfigGenerator:
             return result
         
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                verify=False
-            ) as client:
-                response = await client.get(working_url, headers=self.headers)
-                
-                if response.status_code != 200:
-                    result['error'] = f'HTTP {response.status_code}'
-                    return result
-                
-                html = response.text
-                if not html or len(html) < 1000:
-                    result['error'] = 'HTML muito pequeno'
-                    return result
+            client = get_http_client(verify=False, scope="tier1_config_generator")
+            response = await client.get(working_url, headers=self.headers, timeout=self.timeout, follow_redirects=True)
+            
+            if response.status_code != 200:
+                result['error'] = f'HTTP {response.status_code}'
+                return result
+            
+            html = response.text
+            if not html or len(html) < 1000:
+                result['error'] = 'HTML muito pequeno'
+                return result
+            
+            soup = BeautifulSoup(html, 'html.parser')
+            
+            # Extrair propriedades de teste
+            card_selector = selectors.get('card')
+            if card_selector:
+                cards = soup.select(card_selector)[:10]  # Limitar a 10 para teste
                 
-                soup = BeautifulSoup(html, 'html.parser')
+                samples = []
+                for card in cards:
+                    prop = self._extract_property_test(card, selectors, website, name)
+                    if prop:
+                        samples.append(prop)
                 
-                # Extrair propriedades de teste
-                card_selector = selectors.get('card')
-                if card_selector:
-                    cards = soup.select(card_selector)[:10]  # Limitar a 10 para teste
-                    
-                    samples = []
-                    for card in cards:
-                        prop = self._extract_property_test(card, selectors, website, name)
-                        if prop:
-                            samples.append(prop)
-                    
-                    result['properties_found'] = len(samples)
-                    result['sample_properties'] = samples[:5]  # Top 5 exemplos
-                    result['success'] = len(samples) > 0
-                else:
-                    result['error'] = 'Seletor de card nao encontrado'
+                result['properties_found'] = len(samples)
+                result['sample_properties'] = samples[:5]  # Top 5 exemplos
+                result['success'] = len(samples) > 0
+            else:
+                result['error'] = 'Seletor de card nao encontrado'
         
         except Exception as e:
             result['error'] = str(e)[:200]
@@ -0,0 +1,8 @@
+-- Índice espacial para busca por raio (GET /api/properties/near)
+-- Data: 18/10/2026
+
+-- Pré-filtro por bounding box: latitude BETWEEN ... AND longitude BETWEEN ...
+-- Índice parcial: só imóveis geocodificados e não duplicados entram na busca
+CREATE INDEX IF NOT EXISTS idx_properties_lat_lng
+ON properties(latitude, longitude)
+WHERE latitude IS NOT NULL AND longitude IS NOT NULL AND is_duplicate = FALSE;
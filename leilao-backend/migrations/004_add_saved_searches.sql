@@ -0,0 +1,44 @@
+-- Buscas salvas (alertas) e fila de notificações
+-- Data: 18/10/2026
+
+CREATE TABLE IF NOT EXISTS saved_searches (
+    id UUID PRIMARY KEY,
+    user_id UUID NOT NULL,
+    name TEXT NOT NULL,
+    state VARCHAR(2),
+    city TEXT,
+    category TEXT,
+    auction_type TEXT,
+    min_value DOUBLE PRECISION,
+    max_value DOUBLE PRECISION,
+    min_discount DOUBLE PRECISION,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_saved_searches_user ON saved_searches(user_id);
+
+CREATE TABLE IF NOT EXISTS saved_search_notifications (
+    id BIGSERIAL PRIMARY KEY,
+    search_id UUID NOT NULL REFERENCES saved_searches(id) ON DELETE CASCADE,
+    user_id UUID NOT NULL,
+    property_id TEXT NOT NULL,
+    price DOUBLE PRECISION,
+    discount_percentage DOUBLE PRECISION,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    read_at TIMESTAMP
+);
+
+-- Um par (busca, imóvel) só é notificado de novo quando o preço muda.
+-- Dois índices parciais em vez de NULLS NOT DISTINCT (só PostgreSQL 15+):
+-- imóvel sem preço também é notificado uma única vez
+CREATE UNIQUE INDEX IF NOT EXISTS idx_saved_search_notifications_unique
+ON saved_search_notifications(search_id, property_id, price)
+WHERE price IS NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_saved_search_notifications_unique_no_price
+ON saved_search_notifications(search_id, property_id)
+WHERE price IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_saved_search_notifications_unread
+ON saved_search_notifications(user_id, created_at)
+WHERE read_at IS NULL;
@@ -0,0 +1,108 @@
+-- Change feed de imóveis (GET /api/properties/changes)
+-- Data: 18/10/2026
+
+-- Log de alterações escrito por trigger, então captura todas as escritas
+-- (add_property, upserts do SyncService via Supabase, desativações em lote).
+CREATE TABLE IF NOT EXISTS property_changes (
+    seq BIGSERIAL PRIMARY KEY,
+    -- Transação que gerou a alteração: o feed só entrega transações já
+    -- concluídas, então um seq menor que commita depois nunca é pulado
+    txid XID8 NOT NULL DEFAULT pg_current_xact_id(),
+    property_id VARCHAR(255) NOT NULL,
+    change_type VARCHAR(20) NOT NULL,  -- insert | update | price_drop | deactivate | reactivate | delete
+    first_auction_value DOUBLE PRECISION,
+    second_auction_value DOUBLE PRECISION,
+    previous_first_auction_value DOUBLE PRECISION,
+    previous_second_auction_value DOUBLE PRECISION,
+    is_active BOOLEAN,
+    changed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Cursor do feed: (txid, seq)
+CREATE INDEX IF NOT EXISTS idx_property_changes_cursor ON property_changes(txid, seq);
+
+
+-- Mantém previous_*_value e value_changed_at quando o lance muda
+-- (o upsert de add_property e o SyncService não preenchem esses campos)
+CREATE OR REPLACE FUNCTION track_property_value_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.first_auction_value IS DISTINCT FROM OLD.first_auction_value THEN
+        NEW.previous_first_auction_value := OLD.first_auction_value;
+        NEW.value_changed_at := NOW();
+    END IF;
+
+    IF NEW.second_auction_value IS DISTINCT FROM OLD.second_auction_value THEN
+        NEW.previous_second_auction_value := OLD.second_auction_value;
+        NEW.value_changed_at := NOW();
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_track_property_value_change ON properties;
+
+CREATE TRIGGER trigger_track_property_value_change
+    BEFORE UPDATE ON properties
+    FOR EACH ROW
+    EXECUTE FUNCTION track_property_value_change();
+
+
+-- Registra a alteração no log. Re-scrape sem mudança (só updated_at /
+-- last_seen_at) não gera entrada.
+CREATE OR REPLACE FUNCTION log_property_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    kind VARCHAR(20);
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO property_changes (
+            property_id, change_type, first_auction_value, second_auction_value,
+            previous_first_auction_value, previous_second_auction_value, is_active
+        ) VALUES (
+            OLD.id, 'delete', OLD.first_auction_value, OLD.second_auction_value,
+            OLD.previous_first_auction_value, OLD.previous_second_auction_value, FALSE
+        );
+        RETURN OLD;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        kind := 'insert';
+    ELSE
+        IF (to_jsonb(NEW) - ARRAY['updated_at', 'last_seen_at'])
+           = (to_jsonb(OLD) - ARRAY['updated_at', 'last_seen_at']) THEN
+            RETURN NEW;
+        END IF;
+
+        IF COALESCE(OLD.is_active, TRUE) AND NOT COALESCE(NEW.is_active, TRUE) THEN
+            kind := 'deactivate';
+        ELSIF NOT COALESCE(OLD.is_active, TRUE) AND COALESCE(NEW.is_active, TRUE) THEN
+            kind := 'reactivate';
+        ELSIF COALESCE(NEW.second_auction_value, NEW.first_auction_value)
+              < COALESCE(OLD.second_auction_value, OLD.first_auction_value) THEN
+            kind := 'price_drop';
+        ELSE
+            kind := 'update';
+        END IF;
+    END IF;
+
+    INSERT INTO property_changes (
+        property_id, change_type, first_auction_value, second_auction_value,
+        previous_first_auction_value, previous_second_auction_value, is_active
+    ) VALUES (
+        NEW.id, kind, NEW.first_auction_value, NEW.second_auction_value,
+        NEW.previous_first_auction_value, NEW.previous_second_auction_value, NEW.is_active
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_log_property_change ON properties;
+
+CREATE TRIGGER trigger_log_property_change
+    AFTER INSERT OR UPDATE OR DELETE ON properties
+    FOR EACH ROW
+    EXECUTE FUNCTION log_property_change();
+
+COMMENT ON TABLE property_changes IS 'Log de alterações de imóveis para sync incremental (GET /api/properties/changes)';
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark do pool de browsers (app/services/browser_pool.py).
+
+Simula --runs execuções de scrapers Playwright, alternando entre --sites
+sites; cada execução abre uma página e navega --pages vezes numa página
+local (data: URL, sem rede):
+
+  - launch por execução: o fluxo anterior (async_playwright().start(),
+    chromium.launch, new_context, new_page e fechar tudo no fim);
+  - pool: get_browser_pool().page(site), com browser e contexto do site
+    reaproveitados.
+
+Reporta o tempo por execução e o pico de RSS dos processos filhos
+(Chromium + driver). Requer o Chromium do Playwright instalado
+(playwright install chromium).
+
+Uso:
+    python scripts/benchmark_browser_pool.py [--runs 10] [--sites 3] [--pages 3]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from playwright.async_api import async_playwright
+
+from app.services.browser_pool import (
+    BROWSER_ARGS,
+    DEFAULT_CONTEXT_OPTIONS,
+    STEALTH_INIT_SCRIPT,
+    _children_rss_mb,
+    close_browser_pool,
+    get_browser_pool,
+)
+
+PAGE = "data:text/html," + "<div class='card'><h3>Apartamento</h3><span>R$ 100.000</span></div>" * 200
+
+
+async def navigate(page, pages: int) -> None:
+    for _ in range(pages):
+        await page.goto(PAGE)
+        await page.query_selector_all(".card")
+
+
+async def run_launch(site: str, pages: int) -> None:
+    playwright = await async_playwright().start()
+    browser = await playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+    context = await browser.new_context(**DEFAULT_CONTEXT_OPTIONS)
+    page = await context.new_page()
+    await page.add_init_script(STEALTH_INIT_SCRIPT)
+    await navigate(page, pages)
+    await page.close()
+    await context.close()
+    await browser.close()
+    await playwright.stop()
+
+
+async def run_pool(site: str, pages: int) -> None:
+    async with get_browser_pool().page(site) as page:
+        await navigate(page, pages)
+
+
+async def measure(label: str, run, args) -> None:
+    peak, times = 0.0, []
+    for i in range(args.runs):
+        start = time.perf_counter()
+        await run(f"site{i % args.sites}", args.pages)
+        times.append(time.perf_counter() - start)
+        peak = max(peak, _children_rss_mb() or 0.0)
+    first, rest = times[0], times[1:] or times
+    print(f"{label:<22} 1ª execução {first:5.2f} s   demais {sum(rest) / len(rest):5.2f} s/execução   "
+          f"total {sum(times):6.2f} s   pico RSS {peak:6.0f} MB")
+
+
+async def main_async(args) -> None:
+    await measure("launch por execução", run_launch, args)
+    await measure("pool", run_pool, args)
+    print(f"\npool: {get_browser_pool().get_stats()}")
+    await close_browser_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do pool de browsers")
+    parser.add_argument("--runs", type=int, default=10, help="Execuções de scraper simuladas")
+    parser.add_argument("--sites", type=int, default=3, help="Sites distintos (contextos)")
+    parser.add_argument("--pages", type=int, default=3, help="Navegações por execução")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
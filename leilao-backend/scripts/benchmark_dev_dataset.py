@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark da carga do dataset de desenvolvimento (backend em memória).
+
+Compara estratégias de carga de app/config/real_properties.ndjson:
+  - Property(**data): o que o antigo literal de real_data.py fazia;
+  - json.loads + Property.model_construct (sem validação, em Python);
+  - Property.model_validate_json por linha (caminho atual).
+Mede tempo (mediana) e memória alocada (tracemalloc), além do tempo de
+import do módulo em processo novo.
+
+Uso:
+    python scripts/benchmark_dev_dataset.py                 # 20 repetições
+    python scripts/benchmark_dev_dataset.py --repeat 50 --scale 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.property import Property
+from app.services.real_data import REAL_PROPERTIES_FILE, iter_real_properties
+
+
+def load_kwargs(lines):
+    """Caminho antigo: Property(**kwargs) para cada imóvel."""
+    return [Property(**json.loads(line)) for line in lines]
+
+
+def load_constructed(lines):
+    return [Property.model_construct(**json.loads(line)) for line in lines]
+
+
+def load_ndjson(path):
+    return list(iter_real_properties(path))
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def allocated_kib(fn):
+    tracemalloc.start()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / 1024, peak / 1024
+
+
+IMPORT_PROBE = """
+import resource, time
+import app.services
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t = time.perf_counter()
+from app.services.real_data import get_real_properties
+imported = time.perf_counter()
+get_real_properties()
+loaded = time.perf_counter()
+print((imported - t) * 1000, (loaded - imported) * 1000, (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss) / 1024)
+"""
+
+
+def cold_start() -> tuple:
+    """Import + primeira carga em processo novo, sem .pyc (como no Dockerfile)."""
+    out = subprocess.run(
+        [sys.executable, "-B", "-c", IMPORT_PROBE],
+        cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True,
+    )
+    return tuple(float(v) for v in out.stdout.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do dataset de desenvolvimento")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--scale", type=int, default=1, help="Multiplica o dataset (simula fixtures maiores)")
+    args = parser.parse_args()
+
+    lines = [line for line in Path(REAL_PROPERTIES_FILE).read_text(encoding="utf-8").splitlines() if line.strip()]
+    lines = lines * args.scale
+    path = REAL_PROPERTIES_FILE
+    if args.scale > 1:
+        path = str(Path("/tmp") / f"real_properties_x{args.scale}.ndjson")
+        Path(path).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    print(f"Imóveis: {len(lines)}  |  arquivo: {Path(path).stat().st_size / 1024:.0f} KiB")
+
+    strategies = [
+        ("Property(**data)", lambda: load_kwargs(lines)),
+        ("model_construct", lambda: load_constructed(lines)),
+        ("model_validate_json (atual)", lambda: load_ndjson(path)),
+    ]
+
+    print(f"\n{'':28} {'tempo':>10} {'retido':>12} {'pico':>12}")
+    results = {}
+    for name, fn in strategies:
+        fn()  # aquece (schema do pydantic, cache de arquivo)
+        elapsed = timed(fn, args.repeat)
+        current, peak = allocated_kib(fn)
+        results[name] = elapsed
+        print(f"{name:28} {elapsed:8.1f}ms {current:9.0f}KiB {peak:9.0f}KiB")
+
+    baseline = results["Property(**data)"]
+    print(f"Speedup vs Property(**data): {baseline / results['model_validate_json (atual)']:.1f}x")
+
+    samples = [cold_start() for _ in range(5)]
+    import_ms, load_ms, rss_mib = (statistics.median(col) for col in zip(*samples))
+    print(f"\nCold start (processo novo, sem .pyc): import {import_ms:.1f} ms, "
+          f"get_real_properties {load_ms:.1f} ms, RSS +{rss_mib:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark do executor de extração (app/utils/extraction_executor.py).
+
+Extrai as páginas de debug salvas (*_debug_*.html, scripts/debug_*.html)
+com o job do GenericScraper (extract_listing_page), repetidas até --pages:
+
+  - inline: o job roda na corrotina, como antes (uma página por vez);
+  - pool: as páginas vão ao executor ao mesmo tempo (como fetches
+    concorrentes) com --workers processos.
+
+Enquanto isso um ticker mede o maior atraso do event loop, que é quanto um
+fetch concorrente ficaria parado. Reporta páginas/s e páginas/s por núcleo.
+
+Uso:
+    python scripts/benchmark_extraction_executor.py [--pages 40] [--workers N]
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import sys
+import time
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.scrapers.generic_scraper import ScraperConfig, extract_listing_page
+from app.utils.extraction_executor import ExtractionExecutor
+
+CONFIG = ScraperConfig(name="Benchmark", base_url="https://example.com", listings_url_template="")
+
+
+async def ticker(stop: asyncio.Event, lags: list, interval: float = 0.01) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run_inline(pages: list) -> tuple:
+    stop, lags = asyncio.Event(), []
+    task = asyncio.create_task(ticker(stop, lags))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    cpu = time.process_time()
+    items = 0
+    for html, url in pages:
+        items += len(extract_listing_page(html, url, CONFIG))
+        await asyncio.sleep(0)  # o "próximo fetch"
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+    stop.set()
+    await task
+    return elapsed, cpu, items, max(lags, default=0)
+
+
+async def run_pool(pages: list, executor: ExtractionExecutor) -> tuple:
+    stop, lags = asyncio.Event(), []
+    task = asyncio.create_task(ticker(stop, lags))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(executor.run(extract_listing_page, html, url, CONFIG) for html, url in pages))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await task
+    return elapsed, executor.get_stats()["pool_cpu_seconds"], sum(len(r) for r in results), max(lags, default=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do executor de extração")
+    parser.add_argument("--pages", type=int, default=40, help="Páginas extraídas por modo")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processos do pool")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(str(ROOT / "*_debug_*.html")))
+    paths += sorted(glob.glob(str(ROOT / "scripts" / "debug_*.html")))
+    html = [Path(p).read_text(encoding="utf-8", errors="replace") for p in paths]
+    if not html:
+        print("Nenhum HTML de debug encontrado")
+        sys.exit(1)
+    pages = [(html[i % len(html)], f"https://example.com/imoveis?page={i}") for i in range(args.pages)]
+    total_kb = sum(len(h) for h, _ in pages) // 1024
+    print(f"{len(pages)} páginas ({total_kb} KB) de {len(html)} arquivos; {os.cpu_count()} CPU(s)")
+
+    elapsed, cpu, items, lag = asyncio.run(run_inline(pages))
+    print(f"inline:         {elapsed:6.2f} s  {len(pages) / elapsed:6.1f} pág/s  "
+          f"{len(pages) / cpu:6.1f} pág/s/núcleo  {items} itens  atraso máx. do loop {lag * 1000:7.1f} ms")
+
+    executor = ExtractionExecutor(workers=args.workers, inline_bytes=0)
+
+    async def warm():
+        executor._get_pool()
+        # Espera os workers subirem (spawn + imports) fora da medição
+        await asyncio.get_running_loop().run_in_executor(executor._get_pool(), os.getpid)
+
+    asyncio.run(warm())
+    elapsed, cpu, items, lag = asyncio.run(run_pool(pages, executor))
+    executor.shutdown()
+    print(f"pool ({args.workers} worker(s)): {elapsed:6.2f} s  {len(pages) / elapsed:6.1f} pág/s  "
+          f"{len(pages) / cpu:6.1f} pág/s/núcleo  {items} itens  atraso máx. do loop {lag * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark da estratégia de fetch por domínio (app/utils/fetch_strategy.py).
+
+Simula as camadas do MultiLayerFetcher sem rede, com latências (em
+segundos, divididas por --scale) e resultados por tipo de site:
+
+  aberto.com.br       direto responde em 0.3 s
+  cloudflare.com.br   direto 403 (0.5 s), headers avançados caem no
+                      challenge (0.8 s), ScrapingBee 4 s, Jina 2.5 s
+  timeout.com.br      direto e headers avançados estouram o timeout
+                      (30 s), Jina 3 s
+  lento.com.br        direto às vezes trava (8 s em 1 de 3 páginas,
+                      senão 1 s); Jina 2 s
+
+Cada site recebe --pages páginas em sequência com:
+
+  - ordem fixa: a ordem anterior (estratégia desligada);
+  - estratégia: começa pela melhor camada conhecida, sondando as mais
+    baratas em FETCH_STRATEGY_PROBE_RATE das páginas;
+  - estratégia + hedge: com --hedge-after, corre as duas primeiras
+    camadas quando a da vez demora.
+
+Uso:
+    python scripts/benchmark_fetch_strategy.py [--pages 20] [--scale 20] [--hedge-after 3]
+"""
+
+import argparse
+import asyncio
+import itertools
+import sys
+import time
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.utils.fetch_strategy import FetchStrategy
+from app.utils.fetcher import FetchLayer, FetchResult, MultiLayerFetcher
+
+PAGE = "<html><body>" + "<div class='card'>Imóvel</div>" * 100 + "</body></html>"
+CHALLENGE = "<html><title>Just a moment...</title>" + " " * 2000 + "</html>"
+
+# site -> camada -> [(latência, conteúdo ou None para erro)], usado em ciclo
+SITES = {
+    "aberto.com.br": {
+        FetchLayer.DIRECT: [(0.3, PAGE)],
+        FetchLayer.ADVANCED_HEADERS: [(0.3, PAGE)],
+        FetchLayer.SCRAPINGBEE: [(4.0, PAGE)],
+        FetchLayer.JINA_READER: [(2.5, PAGE)],
+    },
+    "cloudflare.com.br": {
+        FetchLayer.DIRECT: [(0.5, None)],
+        FetchLayer.ADVANCED_HEADERS: [(0.8, CHALLENGE)],
+        FetchLayer.SCRAPINGBEE: [(4.0, PAGE)],
+        FetchLayer.JINA_READER: [(2.5, PAGE)],
+    },
+    "timeout.com.br": {
+        FetchLayer.DIRECT: [(30.0, None)],
+        FetchLayer.ADVANCED_HEADERS: [(30.0, None)],
+        FetchLayer.SCRAPINGBEE: [(4.0, PAGE)],
+        FetchLayer.JINA_READER: [(3.0, PAGE)],
+    },
+    "lento.com.br": {
+        FetchLayer.DIRECT: [(8.0, PAGE), (1.0, PAGE), (1.0, PAGE)],
+        FetchLayer.ADVANCED_HEADERS: [(1.0, PAGE)],
+        FetchLayer.SCRAPINGBEE: [(4.0, PAGE)],
+        FetchLayer.JINA_READER: [(2.0, PAGE)],
+    },
+}
+
+
+class SimulatedFetcher(MultiLayerFetcher):
+    """MultiLayerFetcher com as camadas trocadas pela simulação."""
+
+    def __init__(self, scale: float, **kwargs):
+        super().__init__(scrapingbee_api_key="simulado", **kwargs)
+        self.scale = scale
+        self.calls = {layer: 0 for layer in FetchLayer}
+        self._cycles = {}
+        for layer in FetchLayer:
+            self._layers[layer] = self._simulated(layer)
+
+    def _simulated(self, layer: FetchLayer):
+        async def fetch(url: str) -> FetchResult:
+            site = url.split("/")[2]
+            cycle = self._cycles.setdefault((site, layer), itertools.cycle(SITES[site][layer]))
+            latency, content = next(cycle)
+            self.calls[layer] += 1
+            await asyncio.sleep(latency / self.scale)
+            if content is None:
+                return FetchResult(False, "", layer, 0, error="HTTP 403" if latency < 30 else "timeout")
+            return FetchResult(True, content, layer, len(content))
+        return fetch
+
+
+async def crawl(fetcher: SimulatedFetcher, pages: int) -> dict:
+    times = {}
+    for site in SITES:
+        elapsed = []
+        for page in range(pages):
+            start = time.perf_counter()
+            result = await fetcher.fetch(f"https://{site}/imoveis?page={page}")
+            assert result.success, result.error
+            elapsed.append((time.perf_counter() - start) * fetcher.scale)
+        times[site] = elapsed
+    return times
+
+
+def report(label: str, fetcher: SimulatedFetcher, times: dict, baseline: dict = None) -> None:
+    calls = ", ".join(f"{layer.value} {count}" for layer, count in fetcher.calls.items())
+    print(f"\n{label}  (chamadas: {calls})")
+    for site, elapsed in times.items():
+        mean = sum(elapsed) / len(elapsed)
+        p90 = sorted(elapsed)[int(len(elapsed) * 0.9) - 1]
+        line = f"  {site:<19} média {mean:5.2f} s  p90 {p90:5.2f} s"
+        if baseline:
+            base = sum(baseline[site]) / len(baseline[site])
+            line += f"  ({base / mean:4.1f}x vs ordem fixa)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da estratégia de fetch por domínio")
+    parser.add_argument("--pages", type=int, default=20, help="Páginas por site")
+    parser.add_argument("--scale", type=float, default=20.0, help="Divide as latências simuladas")
+    parser.add_argument("--hedge-after", type=float, default=3.0, help="Segundos (simulados) até o hedge")
+    args = parser.parse_args()
+
+    fixed = SimulatedFetcher(args.scale, strategy=FetchStrategy(db_file="", enabled=False), hedge_after=0)
+    baseline = asyncio.run(crawl(fixed, args.pages))
+    report("ordem fixa", fixed, baseline)
+
+    learned = SimulatedFetcher(args.scale, strategy=FetchStrategy(db_file=""), hedge_after=0)
+    report("estratégia por domínio", learned, asyncio.run(crawl(learned, args.pages)), baseline)
+
+    strategy = FetchStrategy(db_file="")
+    hedged = SimulatedFetcher(args.scale, strategy=strategy, hedge_after=args.hedge_after / args.scale)
+    report(f"estratégia + hedge após {args.hedge_after:g} s", hedged, asyncio.run(crawl(hedged, args.pages)), baseline)
+    stats = strategy.get_stats()
+    print(f"\n  sondagens {stats['probes']}, camadas puladas {stats['layers_skipped']}, "
+          f"hedges {stats['hedges']} (segunda camada venceu {stats['hedge_wins']})")
+    for domain, info in stats["domains"].items():
+        print(f"  {domain:<19} parte de {info['best_layer'] or 'direct (padrão)'}")
+
+
+if __name__ == "__main__":
+    main()
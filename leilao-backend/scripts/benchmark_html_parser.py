@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark do parser de HTML (app/utils/html_parser.py).
+
+Sobre o HTML de debug salvo (*_debug_*.html, scripts/debug_*.html,
+scripts/pestana_debug.html), mede para cada backend:
+
+  - parse: construir a árvore (BeautifulSoup html.parser, BeautifulSoup
+    lxml e selectolax);
+  - select: os seletores de card do UniversalScraperV2, os campos de cada
+    card (título, preço, link, imagem) e os seletores de paginação;
+  - página: o fluxo antigo (cada extrator parseando com html.parser: cards,
+    imagens e paginação) contra o novo (parse_html uma vez, compartilhado).
+
+Uso:
+    python scripts/benchmark_html_parser.py [--repeat 5]
+"""
+
+import argparse
+import glob
+import sys
+import time
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bs4 import BeautifulSoup
+
+from app.utils import html_parser
+from app.utils.html_parser import clear_parse_cache, parse_html
+
+CARD_SELECTORS = [
+    'div[class*="card"]',
+    'div[class*="item"]',
+    'div[class*="lote"]',
+    'article',
+    'div[class*="imovel"]',
+]
+FIELD_SELECTORS = [
+    'h2, h3, h4, [class*="title"]',
+    '[class*="price"], [class*="valor"]',
+    'a[href]',
+    'img[src]',
+]
+PAGINATION_SELECTORS = [
+    '.pagination a',
+    '[class*="pagination"] a',
+    'a[href*="page="]',
+    'a[href*="pagina="]',
+    'a[rel="next"]',
+    'a[class*="next"]',
+]
+
+BACKENDS = ["html.parser", "lxml", "selectolax"]
+
+
+def parse(html: str, backend: str):
+    if backend == "selectolax":
+        return html_parser.HtmlDocument(html, "selectolax")
+    return BeautifulSoup(html, backend)
+
+
+def select_all(root) -> int:
+    """Cards, campos de até 50 cards e paginação; devolve o número de elementos."""
+    found = 0
+    cards = []
+    for selector in CARD_SELECTORS:
+        cards = root.select(selector)
+        if cards:
+            break
+    for card in cards[:50]:
+        for selector in FIELD_SELECTORS:
+            if card.select_one(selector) is not None:
+                found += 1
+    for selector in PAGINATION_SELECTORS:
+        found += len(root.select(selector))
+    return found + len(cards)
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def page_old(html: str) -> None:
+    # ConfigurableScraper, fetch_missing_images e pagination_handler
+    # parseavam cada um a página com html.parser
+    for _ in range(3):
+        select_all(BeautifulSoup(html, "html.parser"))
+
+
+def page_new(html: str) -> None:
+    clear_parse_cache()
+    for _ in range(3):
+        select_all(parse_html(html))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do parser de HTML")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições (vale a melhor)")
+    args = parser.parse_args()
+
+    backends = [b for b in BACKENDS if b != "selectolax" or html_parser.LexborHTMLParser is not None]
+    paths = sorted(glob.glob(str(ROOT / "*_debug_*.html")))
+    paths += sorted(glob.glob(str(ROOT / "scripts" / "*debug*.html")))
+    if not paths:
+        print("Nenhum HTML de debug encontrado")
+        sys.exit(1)
+
+    print(f"Backend padrão de parse_html: {html_parser._resolve_backend(None)}")
+    header = f"{'arquivo':<28}{'KB':>6}" + "".join(f"{b + ' parse':>20}{'select':>9}" for b in backends)
+    print(header)
+    totals = {b: [0.0, 0.0] for b in backends}
+    page_totals = [0.0, 0.0]
+
+    for path in paths:
+        html = Path(path).read_text(encoding="utf-8", errors="replace")
+        row = f"{Path(path).name[:27]:<28}{len(html) // 1024:>6}"
+        counts = set()
+        for backend in backends:
+            parse_ms = best_of(args.repeat, lambda: parse(html, backend))
+            root = parse(html, backend)
+            select_ms = best_of(args.repeat, lambda: select_all(root))
+            counts.add(select_all(root))
+            totals[backend][0] += parse_ms
+            totals[backend][1] += select_ms
+            row += f"{parse_ms:>17.1f} ms{select_ms:>6.1f} ms"
+        print(row + ("" if len(counts) == 1 else f"  (elementos divergem: {sorted(counts)})"))
+        page_totals[0] += best_of(args.repeat, lambda: page_old(html))
+        page_totals[1] += best_of(args.repeat, lambda: page_new(html))
+
+    print()
+    base_parse, base_select = totals["html.parser"]
+    for backend in backends:
+        parse_ms, select_ms = totals[backend]
+        print(f"{backend:<12} parse {parse_ms:>8.1f} ms ({base_parse / parse_ms:>5.1f}x)   "
+              f"select {select_ms:>7.1f} ms ({base_select / select_ms:>5.1f}x)")
+    old, new = page_totals
+    print(f"\nPágina completa (3 extratores): html.parser reparseando {old:.1f} ms -> "
+          f"parse_html compartilhado {new:.1f} ms ({old / new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark do fatiamento de HTML para os prompts de extração (app/utils/html_slicer.py).
+
+Compara, para cada página salva (mega_debug_*.html, lance_debug_*.html):
+
+  antes:  o que UniversalScraper._extract_with_ai enviava (HTML bruto, 30 mil
+          primeiros caracteres);
+  depois: os cards compactados, em lotes de AI_PROMPT_MAX_TOKENS/AI_CARDS_PER_BATCH.
+
+Mostra tokens do conteúdo (estimate_tokens), imóveis da listagem que chegam
+ao prompt (cards cujo link aparece no conteúdo enviado), chamadas e tempo de
+pré-processamento. Com --live (e OPENAI_API_KEY), também faz as chamadas
+reais e mede a latência e os imóveis retornados.
+
+Uso:
+    python scripts/benchmark_html_slicing.py
+    python scripts/benchmark_html_slicing.py --files "scripts/debug_*.html"
+    OPENAI_API_KEY=... python scripts/benchmark_html_slicing.py --live
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Adiciona diretório raiz ao path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.utils.html_slicer import AI_MAX_BATCHES, estimate_tokens, pack_cards, slice_html
+
+BASE_URLS = {
+    "mega": "https://www.megaleiloes.com.br/",
+    "lance": "https://www.grupolance.com.br/",
+}
+# Recorte antigo do prompt
+RAW_PROMPT_CHARS = 30000
+
+
+def card_links(cards):
+    links = []
+    for card in cards:
+        for part in card.split(" | "):
+            if part.startswith("link: "):
+                path = urlparse(part[6:]).path
+                if path.strip("/"):
+                    links.append(path)
+    return links
+
+
+def listings_in(content: str, links) -> int:
+    return sum(1 for link in set(links) if link in content)
+
+
+def measure(path: str) -> dict:
+    html = Path(path).read_text(encoding="utf-8", errors="replace")
+    prefix = Path(path).name.split("_")[0]
+    base_url = BASE_URLS.get(prefix, "https://example.com/")
+
+    start = time.perf_counter()
+    page = slice_html(html, base_url)
+    batches = pack_cards(page.cards)[:AI_MAX_BATCHES] if page.cards else [[page.text]]
+    chunks = ["\n".join(batch) for batch in batches]
+    elapsed = time.perf_counter() - start
+
+    raw = html[:RAW_PROMPT_CHARS]
+    links = card_links(page.cards)
+    return {
+        "file": Path(path).name,
+        "html_chars": len(html),
+        "raw": raw,
+        "chunks": chunks,
+        "before_tokens": estimate_tokens(raw),
+        "after_tokens": sum(estimate_tokens(c) for c in chunks),
+        "before_listings": listings_in(raw, links),
+        "after_listings": sum(listings_in(c, links) for c in chunks),
+        "cards": len(page.cards),
+        "selector": page.selector or "-",
+        "slice_ms": elapsed * 1000,
+    }
+
+
+async def live(results):
+    from app.services.universal_scraper import UniversalScraper
+    scraper = UniversalScraper()
+    print(f"\n{'arquivo':28} {'antes s':>8} {'itens':>6} {'depois s':>9} {'itens':>6}")
+    for r in results:
+        start = time.perf_counter()
+        before = await scraper._ask_ai(r["raw"], r["file"]) or []
+        before_s = time.perf_counter() - start
+        start = time.perf_counter()
+        after = await asyncio.gather(*(scraper._ask_ai(c, r["file"]) for c in r["chunks"]))
+        after_s = time.perf_counter() - start
+        after_items = sum(len(batch or []) for batch in after)
+        print(f"{r['file']:28} {before_s:8.1f} {len(before):6} {after_s:9.1f} {after_items:6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do fatiamento de HTML para prompts")
+    parser.add_argument("--files", nargs="*", default=[str(ROOT / "mega_debug_*.html"), str(ROOT / "lance_debug_*.html")],
+                        help="Padrões glob das páginas salvas")
+    parser.add_argument("--live", action="store_true", help="Chama a OpenAI e mede latência (requer OPENAI_API_KEY)")
+    args = parser.parse_args()
+
+    paths = sorted(p for pattern in args.files for p in glob.glob(pattern))
+    if not paths:
+        print("Nenhuma página encontrada")
+        sys.exit(1)
+
+    results = [measure(p) for p in paths]
+
+    print(f"{'arquivo':28} {'HTML':>9} {'seletor':>14} {'cards':>6} {'tokens antes':>13} {'depois':>7} "
+          f"{'imóveis antes':>14} {'depois':>7} {'chamadas':>9} {'ms':>6}")
+    for r in results:
+        print(f"{r['file']:28} {r['html_chars']:>9,} {r['selector']:>14} {r['cards']:>6} {r['before_tokens']:>13,} "
+              f"{r['after_tokens']:>7,} {r['before_listings']:>14} {r['after_listings']:>7} "
+              f"{len(r['chunks']):>9} {r['slice_ms']:>6.1f}")
+
+    before = sum(r["before_tokens"] for r in results)
+    after = sum(r["after_tokens"] for r in results)
+    print(f"\nTokens de conteúdo: {before:,} -> {after:,} ({(after - before) / max(1, before):+.0%})")
+    print(f"Imóveis no prompt: {sum(r['before_listings'] for r in results)} -> "
+          f"{sum(r['after_listings'] for r in results)}")
+    listed = sum(r["after_listings"] for r in results)
+    if listed:
+        print(f"Tokens por imóvel enviado: {after / listed:.0f}")
+
+    if args.live:
+        if not os.getenv("OPENAI_API_KEY"):
+            print("\n--live requer OPENAI_API_KEY")
+            sys.exit(1)
+        asyncio.run(live(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark / teste do cache HTTP condicional (app/utils/http_cache.py).
+
+Sobe um servidor local que faz o papel de um site de leilões: serve as
+páginas de debug salvas (*_debug_*.html) como listagens, com ETag e
+Last-Modified (ou sem validadores, com --no-validators), e altera uma
+fração das páginas entre as execuções (--change).
+
+Executa duas passadas com cached_get num diretório de cache temporário e
+mostra, por passada: requests, 304s, páginas sem mudança, bytes recebidos
+pela rede e tempo. Depois verifica o despejo por tamanho com um limite
+pequeno.
+
+Uso:
+    python scripts/benchmark_http_cache.py
+    python scripts/benchmark_http_cache.py --pages 200 --change 0.1
+    python scripts/benchmark_http_cache.py --no-validators
+"""
+
+import argparse
+import asyncio
+import glob
+import hashlib
+import sys
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.utils import http_cache
+from app.utils.http_cache import HttpCache, cached_get
+
+
+def load_fixtures():
+    paths = sorted(glob.glob(str(ROOT / "*_debug_*.html")) + glob.glob(str(ROOT / "scripts" / "*debug*.html")))
+    bodies = [Path(p).read_bytes() for p in paths]
+    return bodies or [b"<html>" + b"<div class='card'>imovel</div>" * 5000 + b"</html>"]
+
+
+class StandInSite:
+    """Servidor local com validadores HTTP; `versions[i]` muda o conteúdo da página i."""
+
+    def __init__(self, fixtures, pages: int, validators: bool):
+        self.fixtures = fixtures
+        self.versions = [0] * pages
+        self.validators = validators
+        self.bytes_sent = 0
+        self.not_modified = 0
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                page = int(self.path.rsplit("/", 1)[-1])
+                body = site.body(page)
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                last_modified = formatdate(1_700_000_000 + site.versions[page] * 3600, usegmt=True)
+                if site.validators and (
+                    self.headers.get("If-None-Match") == etag
+                    or self.headers.get("If-Modified-Since") == last_modified
+                ):
+                    site.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                if site.validators:
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", last_modified)
+                self.end_headers()
+                self.wfile.write(body)
+                site.bytes_sent += len(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def body(self, page: int) -> bytes:
+        fixture = self.fixtures[page % len(self.fixtures)]
+        return fixture + f"<!-- pagina {page} v{self.versions[page]} -->".encode()
+
+
+async def run_pass(site: StandInSite, pages: int, concurrency: int) -> dict:
+    sent_before, nm_before = site.bytes_sent, site.not_modified
+    sem = asyncio.Semaphore(concurrency)
+    results = []
+
+    async def fetch(i):
+        async with sem:
+            results.append(await cached_get(f"{site.base}/listagem/{i}", timeout=30.0))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch(i) for i in range(pages)))
+    return {
+        "segundos": time.perf_counter() - start,
+        "ok": sum(1 for r in results if r.status_code == 200),
+        "304": site.not_modified - nm_before,
+        "sem_mudanca": sum(1 for r in results if r.unchanged),
+        "bytes_rede": site.bytes_sent - sent_before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do cache HTTP condicional")
+    parser.add_argument("--pages", type=int, default=100, help="Páginas de listagem simuladas")
+    parser.add_argument("--change", type=float, default=0.05, help="Fração de páginas alteradas entre passadas")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--no-validators", action="store_true", help="Servidor sem ETag/Last-Modified")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    site = StandInSite(fixtures, args.pages, validators=not args.no_validators)
+    print(f"{len(fixtures)} fixtures, {args.pages} páginas, validadores: {not args.no_validators}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = http_cache._http_cache = HttpCache(directory=tmp)
+
+        async def two_passes():
+            first = await run_pass(site, args.pages, args.concurrency)
+            changed = max(1, int(args.pages * args.change)) if args.change else 0
+            for i in range(changed):
+                site.versions[i] += 1
+            second = await run_pass(site, args.pages, args.concurrency)
+            return first, second, changed
+
+        first, second, changed = asyncio.run(two_passes())
+
+        print(f"\n{'':22} {'1ª passada':>12} {'2ª passada':>12}")
+        for key in ("ok", "304", "sem_mudanca", "bytes_rede"):
+            print(f"{key:22} {first[key]:>12,} {second[key]:>12,}")
+        print(f"{'segundos':22} {first['segundos']:>12.3f} {second['segundos']:>12.3f}")
+        print(f"\nPáginas alteradas: {changed}; esperado sem mudança: {args.pages - changed}")
+
+        stats = cache.get_stats()
+        ratio = first["bytes_rede"] / max(1, stats["bytes_on_disk"])
+        print(f"Entradas: {stats['entries']}, em disco: {stats['bytes_on_disk'] / 1024:.0f} KiB "
+              f"({stats['codec']}, ~{ratio:.1f}x)")
+
+        ok = second["sem_mudanca"] == args.pages - changed
+        print("Páginas sem mudança detectadas corretamente" if ok else "ERRO: contagem de páginas sem mudança")
+
+        # Despejo por tamanho: limite de ~1/4 do que está em disco
+        cache.max_bytes = stats["bytes_on_disk"] // 4
+        removed = cache.prune()
+        after = cache.get_stats()
+        evicted_ok = after["bytes_on_disk"] <= cache.max_bytes
+        print(f"Despejo: limite {cache.max_bytes / 1024:.0f} KiB -> {removed} removidas, "
+              f"{after['bytes_on_disk'] / 1024:.0f} KiB restantes ({'ok' if evicted_ok else 'ERRO'})")
+
+    site.server.shutdown()
+    sys.exit(0 if ok and evicted_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
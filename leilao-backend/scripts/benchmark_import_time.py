@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark de regressão do tempo de import da API (cold start).
+
+Executa `python -X importtime -c "import app.main"` em processos novos,
+reporta a mediana e os módulos mais caros e FALHA (exit 1) quando:
+  - a mediana passa do orçamento (--budget-ms);
+  - a mediana piora mais que --tolerance em relação ao baseline salvo;
+  - algum subsistema pesado que deveria ser lazy é importado no startup.
+
+Uso:
+    python scripts/benchmark_import_time.py                     # 5 execuções, orçamento padrão
+    python scripts/benchmark_import_time.py --runs 10 --budget-ms 1200
+    python scripts/benchmark_import_time.py --save-baseline     # grava scripts/import_time_baseline.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+DEFAULT_BASELINE = Path(__file__).parent / "import_time_baseline.json"
+
+# Orçamento de import de app.main (ms)
+DEFAULT_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+
+# Não podem ser importados por `import app.main` (ver app/utils/lazy.py)
+FORBIDDEN_AT_STARTUP = (
+    "apscheduler",
+    "google.generativeai",
+    "supabase",
+    "psycopg",
+    "playwright",
+    "selenium",
+    "openai",
+    "app.pipeline",
+    "app.services.scraper_orchestrator",
+    "app.services.discovery_orchestrator",
+    "app.services.autonomous_scheduler",
+    "app.services.sync_service",
+    "app.services.real_data",
+    "app.scrapers",
+)
+
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure_once(target: str) -> dict:
+    """Executa um import em processo novo e retorna {módulo: (self_us, cumulative_us, depth)}."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.strip().splitlines()[-5:])
+        raise SystemExit(f"Falha ao importar {target}:\n{tail}")
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de import time (cold start)")
+    parser.add_argument("--target", default="app.main", help="Módulo a importar")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Módulos mais caros a listar")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Piora máxima vs baseline (0.2 = 20%%)")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    # Primeira execução só aquece o cache de bytecode (__pycache__)
+    measure_once(args.target)
+    runs = [measure_once(args.target) for _ in range(args.runs)]
+    totals_ms = [run[args.target][1] / 1000 for run in runs]
+    median_ms = statistics.median(totals_ms)
+
+    print(f"import {args.target}: mediana {median_ms:.0f} ms "
+          f"(min {min(totals_ms):.0f} / max {max(totals_ms):.0f}, {args.runs} execuções)")
+
+    # Módulos de primeiro nível sob o alvo, pelo tempo acumulado da última execução
+    last = runs[-1]
+    top_level = sorted(
+        ((name, cumulative) for name, (_, cumulative, depth) in last.items() if depth == 1),
+        key=lambda item: -item[1],
+    )[:args.top]
+    print(f"\nTop {len(top_level)} imports diretos:")
+    for name, cumulative in top_level:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failures = []
+
+    loaded = set(last)
+    leaked = sorted(
+        name for name in loaded
+        if any(name == f or name.startswith(f + ".") for f in FORBIDDEN_AT_STARTUP)
+    )
+    if leaked:
+        roots = sorted({n for n in leaked if not any(n.startswith(o + ".") for o in leaked)})
+        failures.append(f"subsistemas pesados importados no startup: {', '.join(roots)}")
+
+    if median_ms > args.budget_ms:
+        failures.append(f"mediana {median_ms:.0f} ms acima do orçamento de {args.budget_ms:.0f} ms")
+
+    if args.baseline.exists() and not args.save_baseline:
+        baseline_ms = json.loads(args.baseline.read_text())["median_ms"]
+        limit_ms = baseline_ms * (1 + args.tolerance)
+        print(f"\nBaseline: {baseline_ms:.0f} ms (limite {limit_ms:.0f} ms)")
+        if median_ms > limit_ms:
+            failures.append(f"mediana {median_ms:.0f} ms piorou mais de {args.tolerance:.0%} vs baseline")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({"target": args.target, "median_ms": round(median_ms, 1)}, indent=2) + "\n")
+        print(f"\nBaseline salvo em {args.baseline}")
+
+    if failures:
+        print("\nFALHOU:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
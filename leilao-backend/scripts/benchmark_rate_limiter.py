@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark do rate limiter adaptativo (app/utils/rate_limiter.py).
+
+Simula três leiloeiros (sem rede), cada um com latência e capacidade
+próprias; acima da capacidade o "servidor" responde 429 com Retry-After:
+
+  rapido.com.br    50 ms, aguenta 8 req/s
+  limitado.com.br 100 ms, aguenta 2 req/s
+  lento.com.br    2.5 s,  aguenta 1 req/s
+
+Cada domínio recebe --requests requisições de 4 tarefas concorrentes:
+
+  - legado: a implementação anterior (1 req/s fixo por domínio, com um
+    asyncio.Lock global mantido durante o sleep);
+  - adaptativo: token bucket + slots + AIMD, em memória;
+  - compartilhado: dois processos com o mesmo RATE_LIMIT_DB (SQLite),
+    que juntos devem respeitar a capacidade de cada domínio.
+
+Uso:
+    python scripts/benchmark_rate_limiter.py [--requests 30]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.utils.rate_limiter import RateLimiter
+
+SITES = {
+    "rapido.com.br": (0.05, 8),
+    "limitado.com.br": (0.1, 2),
+    "lento.com.br": (2.5, 1),
+}
+TASKS_PER_DOMAIN = 4
+
+
+class LegacyRateLimiter:
+    """O RateLimiter anterior: intervalo fixo e lock global durante o sleep."""
+
+    def __init__(self, requests_per_second: float = 1.0):
+        self.min_interval = 1.0 / requests_per_second
+        self._last = defaultdict(float)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, url: str) -> str:
+        domain = url.split("/")[2]
+        async with self._lock:
+            wait = self.min_interval - (time.time() - self._last[domain])
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last[domain] = time.time()
+            return "legacy"
+
+    def record_success(self, url: str, latency=None, lease=None):
+        pass
+
+    def record_error(self, url: str, is_rate_limit: bool = False, status_code=None, retry_after=None, lease=None):
+        pass
+
+
+class FakeServer:
+    """Latência fixa e 429 acima de N requisições no último segundo."""
+
+    def __init__(self):
+        self.window = defaultdict(deque)
+        self.throttled = defaultdict(int)
+
+    async def get(self, url: str) -> int:
+        domain = url.split("/")[2]
+        latency, capacity = SITES[domain]
+        now = time.time()
+        window = self.window[domain]
+        while window and now - window[0] > 1.0:
+            window.popleft()
+        if len(window) >= capacity:
+            self.throttled[domain] += 1
+            await asyncio.sleep(0.01)
+            return 429
+        window.append(now)
+        await asyncio.sleep(latency)
+        return 200
+
+
+async def crawl(limiter, server: FakeServer, requests: int) -> dict:
+    done = {}
+
+    async def domain_run(domain: str):
+        queue = deque(f"https://{domain}/imovel/{i}" for i in range(requests))
+        start = time.time()
+
+        async def task():
+            while queue:
+                url = queue.popleft()
+                lease = await limiter.acquire(url)
+                if not lease:
+                    queue.append(url)
+                    await asyncio.sleep(0.5)
+                    continue
+                status = await server.get(url)
+                if status == 429:
+                    limiter.record_error(url, status_code=429, retry_after="1", lease=lease)
+                    queue.append(url)
+                else:
+                    limiter.record_success(url, lease=lease)
+
+        await asyncio.gather(*(task() for _ in range(TASKS_PER_DOMAIN)))
+        done[domain] = time.time() - start
+
+    await asyncio.gather(*(domain_run(domain) for domain in SITES))
+    return done
+
+
+def report(label: str, done: dict, server: FakeServer, requests: int, limiter=None) -> None:
+    print(f"\n{label}")
+    for domain, elapsed in done.items():
+        line = f"  {domain:<17} {requests} req em {elapsed:6.1f} s ({requests / elapsed:4.1f} req/s), 429: {server.throttled[domain]}"
+        if isinstance(limiter, RateLimiter):
+            stats = limiter.get_stats(f"https://{domain}/")
+            line += f"; taxa final {stats['requests_per_second']}/s, {stats['concurrency']} slot(s)"
+        print(line)
+
+
+def shared_worker(db_file: str, requests: int, queue) -> None:
+    server = FakeServer()
+    limiter = RateLimiter(db_file=db_file)
+    done = asyncio.run(crawl(limiter, server, requests))
+    queue.put((done, dict(server.throttled)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do rate limiter adaptativo")
+    parser.add_argument("--requests", type=int, default=30, help="Requisições por domínio")
+    args = parser.parse_args()
+
+    server = FakeServer()
+    done = asyncio.run(crawl(LegacyRateLimiter(), server, args.requests))
+    report("legado (1 req/s fixo, lock global)", done, server, args.requests)
+
+    server = FakeServer()
+    limiter = RateLimiter(db_file="")
+    done = asyncio.run(crawl(limiter, server, args.requests))
+    report("adaptativo (token bucket + AIMD)", done, server, args.requests, limiter)
+
+    # Dois processos, um orçamento: a taxa somada dos dois deve ficar perto
+    # da de um processo só (sem compartilhar, seria o dobro)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = os.path.join(tmp, "rate_limits.db")
+        queue = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=shared_worker, args=(db_file, args.requests // 2, queue))
+                   for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        results = [queue.get() for _ in workers]
+        for worker in workers:
+            worker.join()
+        limiter = RateLimiter(db_file=db_file)
+        print("\ncompartilhado (2 processos, SQLite)")
+        for domain in SITES:
+            elapsed = max(done[domain] for done, _ in results)
+            stats = limiter.get_stats(f"https://{domain}/")
+            print(f"  {domain:<17} {args.requests // 2 * 2} req em {elapsed:6.1f} s "
+                  f"({args.requests // 2 * 2 / elapsed:4.1f} req/s no total); "
+                  f"requisições registradas {stats['total_requests']}, taxa final {stats['requests_per_second']}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark do matching de buscas salvas (alertas).
+
+Simula N buscas salvas e um sync da Caixa com M imóveis, comparando o
+índice invertido + interval trees com a avaliação linear de todas as
+buscas para cada imóvel. Não acessa o banco.
+
+Uso:
+    python scripts/benchmark_saved_searches.py                       # 100k buscas x 20k imóveis
+    python scripts/benchmark_saved_searches.py --searches 10000 --properties 5000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.property import PropertyCategory, AuctionType
+from app.models.saved_search import SavedSearch
+from app.services.saved_searches import SavedSearchIndex
+from app.services.autocomplete_index import fold_text
+
+# (UF, cidades) - peso maior para SP/RJ/MG, como no dataset da Caixa
+LOCATIONS = [
+    ("SP", ["São Paulo", "Campinas", "Santos", "Ribeirão Preto", "Sorocaba", "Guarulhos"], 5),
+    ("RJ", ["Rio de Janeiro", "Niterói", "Nova Iguaçu", "Duque de Caxias"], 3),
+    ("MG", ["Belo Horizonte", "Uberlândia", "Contagem", "Juiz de Fora"], 3),
+    ("PR", ["Curitiba", "Londrina", "Maringá"], 2),
+    ("RS", ["Porto Alegre", "Caxias do Sul", "Pelotas"], 2),
+    ("BA", ["Salvador", "Feira de Santana"], 2),
+    ("GO", ["Goiânia", "Anápolis"], 1),
+    ("PE", ["Recife", "Olinda"], 1),
+]
+CATEGORIES = [PropertyCategory.APARTAMENTO, PropertyCategory.CASA, PropertyCategory.TERRENO, PropertyCategory.COMERCIAL]
+AUCTION_TYPES = [AuctionType.EXTRAJUDICIAL, AuctionType.JUDICIAL, AuctionType.VENDA_DIRETA]
+
+
+# Cauda de municípios menores por UF (o Brasil tem ~5.570 municípios)
+SMALL_CITIES_PER_STATE = 150
+
+
+def pick_location(rng):
+    state, cities, _ = rng.choices(LOCATIONS, weights=[w for _, _, w in LOCATIONS])[0]
+    if rng.random() < 0.6:
+        return state, rng.choice(cities)
+    return state, f"Município {state}-{int(rng.paretovariate(1.2)) % SMALL_CITIES_PER_STATE}"
+
+
+def generate_searches(n: int, rng) -> list:
+    searches = []
+    for i in range(n):
+        state, city = pick_location(rng)
+        max_value = rng.choice([None, 150_000, 200_000, 300_000, 500_000, 800_000])
+        searches.append(SavedSearch(
+            id=f"s{i}",
+            user_id=f"u{i % 20000}",
+            name=f"Busca {i}",
+            state=state if rng.random() < 0.9 else None,
+            city=city if rng.random() < 0.7 else None,
+            category=rng.choice(CATEGORIES) if rng.random() < 0.6 else None,
+            auction_type=rng.choice(AUCTION_TYPES) if rng.random() < 0.2 else None,
+            min_value=rng.choice([None, None, 50_000, 100_000]),
+            max_value=max_value,
+            min_discount=rng.choice([None, 20, 30, 40, 50]),
+        ))
+    return searches
+
+
+def generate_properties(n: int, rng) -> list:
+    props = []
+    for i in range(n):
+        state, city = pick_location(rng)
+        evaluation = rng.uniform(80_000, 1_500_000)
+        discount = rng.uniform(0, 70)
+        props.append({
+            "id": f"caixa-{i}",
+            "title": f"Imóvel {i}",
+            "state": state,
+            "city": city,
+            "category": rng.choice(CATEGORIES).value,
+            "auction_type": rng.choice(AUCTION_TYPES).value,
+            "first_auction_value": evaluation * (1 - discount / 100),
+            "discount_percentage": discount,
+        })
+    return props
+
+
+def linear_match(searches, prop) -> list:
+    """Avaliação ingênua: testa cada busca salva."""
+    price = prop.get("second_auction_value") or prop["first_auction_value"]
+    city = fold_text(prop["city"])
+    matches = []
+    for s in searches:
+        if s.state and s.state != prop["state"]:
+            continue
+        if s.city and fold_text(s.city) != city:
+            continue
+        if s.category and s.category.value != prop["category"]:
+            continue
+        if s.auction_type and s.auction_type.value != prop["auction_type"]:
+            continue
+        if s.min_value is not None and price < s.min_value:
+            continue
+        if s.max_value is not None and price > s.max_value:
+            continue
+        if s.min_discount is not None and prop["discount_percentage"] < s.min_discount:
+            continue
+        matches.append(s.id)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de buscas salvas")
+    parser.add_argument("--searches", type=int, default=100_000)
+    parser.add_argument("--properties", type=int, default=20_000)
+    parser.add_argument("--linear-sample", type=int, default=200, help="Imóveis avaliados no modo linear")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    searches = generate_searches(args.searches, rng)
+    props = generate_properties(args.properties, rng)
+
+    started = time.perf_counter()
+    index = SavedSearchIndex()
+    for search in searches:
+        index.add(search)
+    # As árvores são construídas sob demanda; força aqui para medir à parte
+    for bucket in index._buckets.values():
+        bucket._rebuild()
+    build_s = time.perf_counter() - started
+    print(f"Buscas: {args.searches:,} | buckets: {len(index._buckets):,} | build: {build_s:.2f}s")
+
+    started = time.perf_counter()
+    total_matches = sum(len(index.match(prop)) for prop in props)
+    index_s = time.perf_counter() - started
+    print(f"Índice : {args.properties:,} imóveis em {index_s:.2f}s "
+          f"({index_s / args.properties * 1e6:.0f} µs/imóvel) | {total_matches:,} matches")
+
+    sample = props[:args.linear_sample]
+    started = time.perf_counter()
+    for prop in sample:
+        expected = linear_match(searches, prop)
+        got = index.match(prop)
+        assert sorted(expected) == sorted(got), f"divergência em {prop['id']}"
+    linear_s = time.perf_counter() - started
+    per_prop = linear_s / len(sample)
+    print(f"Linear : {per_prop * 1000:.1f} ms/imóvel -> ~{per_prop * args.properties:.0f}s para o sync completo")
+    print(f"Speedup: {per_prop / (index_s / args.properties):.0f}x (resultados conferidos em {len(sample)} imóveis)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark da indução de seletores (app/services/selector_induction.py).
+
+Para cada site com duas páginas salvas (lance_debug_*.html, mega_debug_*.html),
+faz o ciclo do UniversalScraper sem chamar a IA:
+
+  1. "extração com IA" da 1ª página: os itens vêm dos cards do html_slicer
+     (título = maior trecho do card, preço = primeiro "R$", link e imagem),
+     no formato que o gpt-4o-mini devolve;
+  2. indução dos seletores a partir desses itens;
+  3. validação na 2ª página contra os itens "da IA" dela;
+  4. extração por seletor das duas páginas, comparada com as chamadas à IA
+     que ela evita (lotes de pack_cards).
+
+As configurações são salvas num diretório temporário, não em app/configs/sites.
+Com --live (e OPENAI_API_KEY), o passo 1 usa a IA de verdade.
+
+Uso:
+    python scripts/benchmark_selector_induction.py
+    OPENAI_API_KEY=... python scripts/benchmark_selector_induction.py --live
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adiciona diretório raiz ao path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.configs.config_manager import ConfigManager
+from app.services.selector_induction import SelectorInducer, extract_with_selectors, parse_prices
+from app.utils.html_slicer import AI_MAX_BATCHES, pack_cards, slice_html
+
+BASE_URLS = {
+    "mega": "https://www.megaleiloes.com.br/",
+    "lance": "https://www.grupolance.com.br/",
+}
+
+
+def simulated_ai_items(html: str, base_url: str) -> list:
+    """Itens no formato da IA montados a partir dos cards compactados."""
+    items = []
+    for card in slice_html(html, base_url).cards:
+        item = {}
+        texts = []
+        for part in card.split(" | "):
+            if part.startswith("link: "):
+                item["url"] = part[6:]
+            elif part.startswith("imagem: "):
+                item["image_url"] = part[8:]
+            else:
+                texts.append(part)
+        if texts:
+            item["title"] = max(texts, key=len)
+        prices = [v for text in texts if "R$" in text for v in parse_prices(text)]
+        if prices:
+            item["price"] = prices[0]
+        items.append(item)
+    return items
+
+
+async def live_ai_items(html: str, base_url: str, source: str) -> list:
+    from app.services.universal_scraper import UniversalScraper
+    scraper = UniversalScraper()
+    chunks = scraper._prompt_chunks(html, base_url, False)
+    results = await asyncio.gather(*(scraper._ask_ai(chunk, source) for chunk in chunks))
+    return [item for batch in results if batch for item in batch]
+
+
+def ai_calls(html: str, base_url: str) -> int:
+    page = slice_html(html, base_url)
+    return min(len(pack_cards(page.cards)), AI_MAX_BATCHES) if page.cards else 1
+
+
+def run_site(prefix: str, paths: list, inducer: SelectorInducer, live: bool) -> None:
+    base_url = BASE_URLS[prefix]
+    pages = [Path(p).read_text(encoding="utf-8", errors="replace") for p in paths[:2]]
+    # URLs distintas: a validação exige uma segunda página
+    urls = [f"{base_url}imoveis?pagina={i}" for i in (1, 2)]
+
+    print(f"\n== {prefix} ({', '.join(Path(p).name for p in paths[:2])})")
+    for html, url in zip(pages, urls):
+        if live:
+            items = asyncio.run(live_ai_items(html, url, prefix))
+        else:
+            items = simulated_ai_items(html, url)
+        start = time.perf_counter()
+        status = inducer.learn(html, url, items, prefix)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  {url}: {len(items)} itens da IA -> {status or 'sem seletores'} ({elapsed:.0f} ms)")
+
+    selectors = inducer.active_selectors(base_url)
+    if not selectors:
+        candidates = inducer.get_stats()["candidates"]
+        print(f"  Não validado. Candidatos: {candidates or '-'}")
+        return
+    print(f"  Seletores: {selectors}")
+    for html, url in zip(pages, urls):
+        start = time.perf_counter()
+        items, cards = extract_with_selectors(html, selectors, url)
+        elapsed = (time.perf_counter() - start) * 1000
+        with_price = sum(1 for item in items if item.get("price"))
+        print(f"  Extração por seletor: {cards} cards, {len(items)} imóveis ({with_price} com preço) "
+              f"em {elapsed:.0f} ms; {ai_calls(html, url)} chamada(s) à IA evitadas")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da indução de seletores")
+    parser.add_argument("--live", action="store_true", help="Extrai a 1ª rodada com a OpenAI (requer OPENAI_API_KEY)")
+    args = parser.parse_args()
+
+    if args.live and not os.getenv("OPENAI_API_KEY"):
+        print("--live requer OPENAI_API_KEY")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        inducer = SelectorInducer(ConfigManager(config_dir))
+        found = False
+        for prefix in BASE_URLS:
+            paths = sorted(glob.glob(str(ROOT / f"{prefix}_debug_*.html")))
+            if len(paths) >= 2:
+                found = True
+                run_site(prefix, paths, inducer, args.live)
+        if not found:
+            print("Nenhum par de páginas encontrado")
+            sys.exit(1)
+
+        stats = inducer.get_stats()
+        print(f"\nConfigurações salvas: {[c['site'] for c in stats['configs']]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,16 @@ import re
 import sys
 import logging
 import httpx
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from supabase import create_client
 from datetime import datetime
 from typing import Optional, List, Dict
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.html_parser import parse_html
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -98,7 +101,7 @@ def is_valid_image_url(url: str) -> bool:
 
 def extract_image_from_html(html: str, auctioneer_id: str = "default") -> Optional[str]:
     """Extrai URL de imagem do HTML usando múltiplos seletores."""
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = parse_html(html)
     
     # Obter seletores específicos do leiloeiro + padrão
     selectors = IMAGE_SELECTORS.get(auctioneer_id, []) + IMAGE_SELECTORS["default"]
@@ -120,7 +123,7 @@ def extract_image_from_html(html: str, auctioneer_id: str = "default") -> Option
             continue
     
     # Fallback: buscar qualquer imagem grande
-    all_imgs = soup.find_all('img')
+    all_imgs = soup.select('img')
     for img in all_imgs:
         src = img.get('src') or img.get('data-src')
         if src and is_valid_image_url(src):